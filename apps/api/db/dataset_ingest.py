@@ -0,0 +1,264 @@
+"""
+데이터셋 CSV 스트리밍 수집
+
+업로드 바이트를 청크 단위로 받아 임시 CSV에 기록하면서 동시에
+파싱 / 검증 / dataset_hash / 바이너리 사이드카를 증분 처리합니다.
+파일 크기와 무관하게 메모리 사용량은 배치 크기(batch_bytes) 수준으로 유지됩니다.
+
+증분 처리는 timestamp가 엄격한 오름차순인 일반적인 CSV를 전제로 하며,
+정렬되지 않은 행 / 벡터화 파서가 처리하지 않는 입력을 만나면 증분 처리를 멈추고
+스트림이 끝난 뒤 기존 경로(load_bars_from_csv → validate_bars → calculate_dataset_hash)로
+처리합니다. 어느 경로든 결과(해시 / 메타데이터)와 오류 메시지는 기존 업로드와 같습니다.
+"""
+
+import csv
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from engine.models.bar_array import BarArray
+from apps.api.db.utils import (
+    DatasetHasher,
+    DatasetSidecarBuilder,
+    calculate_dataset_hash,
+    load_bars_from_csv,
+    parse_csv_vectorized,
+    validate_bars,
+    validate_csv_header,
+    write_dataset_sidecar,
+)
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 파싱하는 최대 바이트 수 (완성된 행 단위로 자름)
+DEFAULT_BATCH_BYTES = 8 * 1024 * 1024
+
+
+class BarValidationError(ValueError):
+    """validate_bars 실패 (errors: 오류 메시지 리스트)"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__(f"봉 데이터 검증 실패: {errors}")
+
+
+@dataclass
+class IngestResult:
+    """수집 완료 결과 (DatasetRepository.create 인자)"""
+    dataset_hash: str
+    bars_count: int
+    start_timestamp: int
+    end_timestamp: int
+
+
+class CsvDatasetIngestor:
+    """
+    데이터셋 CSV 스트리밍 수집기
+
+    사용 순서: feed()를 청크마다 호출 → finish()로 해시 / 메타데이터 확정 →
+    최종 경로로 옮긴 뒤 write_sidecar(). 중간에 실패하면 abort()로 임시 파일 정리.
+
+    Attributes:
+        temp_path: 업로드 바이트를 기록하는 임시 CSV 경로
+        bytes_received: 지금까지 받은 바이트 수
+        rows_parsed: 증분 파싱한 데이터 행 수
+    """
+
+    def __init__(
+        self,
+        temp_path: str | Path,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        write_file: bool = True
+    ):
+        """
+        Args:
+            temp_path: 임시 CSV 경로 (최종 이름은 해시 확정 후 호출부가 결정)
+            batch_bytes: 한 번에 파싱하는 최대 바이트 수
+            write_file: False면 temp_path에 이미 저장된 CSV를 읽어 넣는 경우로 보고 기록하지 않음
+        """
+        self.temp_path = Path(temp_path)
+        self.batch_bytes = batch_bytes
+        self.bytes_received = 0
+        self.rows_parsed = 0
+
+        self._file = open(self.temp_path, "wb") if write_file else None
+        self._pending = bytearray()
+        self._header: Optional[bytes] = None
+        self._fieldnames: Optional[List[str]] = None
+        self._last_timestamp: Optional[int] = None
+        self._first_timestamp: Optional[int] = None
+        self._hasher = DatasetHasher()
+        self._sidecar: Optional[DatasetSidecarBuilder] = DatasetSidecarBuilder(
+            self.temp_path.with_name(self.temp_path.name + ".parts")
+        )
+        # 증분 처리를 포기하고 스트림 종료 후 전체 로드로 처리할지 여부
+        self._fallback = False
+        # 전체 로드 경로에서 읽은 봉 (사이드카 저장용)
+        self._loaded_bars: Optional[BarArray] = None
+
+    @property
+    def streaming(self) -> bool:
+        """증분 처리 중인지 여부 (False면 finish()에서 전체 로드)"""
+        return not self._fallback
+
+    # ------------------------------------------------------------------
+    # 스트림 입력
+    # ------------------------------------------------------------------
+
+    def feed(self, data: bytes) -> None:
+        """
+        업로드 청크 추가 (디스크 기록 + 완성된 행 증분 처리)
+
+        Raises:
+            ValueError: 헤더 / 봉 검증 실패 (load_bars_from_csv와 같은 메시지)
+        """
+        if not data:
+            return
+        if self._file is not None:
+            self._file.write(data)
+        self.bytes_received += len(data)
+        if self._fallback:
+            return
+
+        self._pending += data
+        if self._header is None and not self._read_header():
+            return
+        if len(self._pending) >= self.batch_bytes:
+            cut = self._pending.rfind(b"\n")
+            if cut >= 0:
+                batch = bytes(self._pending[:cut + 1])
+                del self._pending[:cut + 1]
+                self._process(batch)
+
+    def finish(self) -> IngestResult:
+        """
+        스트림 종료: 남은 행을 처리하고 해시 / 메타데이터 확정
+
+        Returns:
+            IngestResult
+
+        Raises:
+            ValueError: CSV 형식 / 봉 검증 실패 (load_bars_from_csv와 같은 메시지)
+            BarValidationError: validate_bars 실패 (정렬 / 중복 timestamp)
+        """
+        self._close_file()
+        if not self._fallback:
+            if self._header is None:
+                self._read_header(final=True)
+            if self._pending and not self._fallback:
+                self._process(bytes(self._pending))
+            self._pending = bytearray()
+
+        if self._fallback or self.rows_parsed == 0:
+            return self._finish_full_load()
+
+        return IngestResult(
+            dataset_hash=self._hasher.hexdigest(),
+            bars_count=self.rows_parsed,
+            start_timestamp=self._first_timestamp,
+            end_timestamp=self._last_timestamp,
+        )
+
+    def write_sidecar(self, file_path: str | Path) -> Path:
+        """
+        최종 CSV 경로 옆에 바이너리 사이드카 생성 (finish 이후, 파일 이동 후 호출)
+
+        Args:
+            file_path: 최종 데이터셋 CSV 경로
+
+        Returns:
+            Path: 사이드카 디렉토리
+        """
+        if self._loaded_bars is not None:
+            return write_dataset_sidecar(self._loaded_bars, file_path)
+        builder, self._sidecar = self._sidecar, None
+        return builder.finish(file_path)
+
+    def abort(self) -> None:
+        """임시 CSV / 사이드카 작업 파일 정리"""
+        self._close_file()
+        self._drop_sidecar()
+        self.temp_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # 내부 처리
+    # ------------------------------------------------------------------
+
+    def _read_header(self, final: bool = False) -> bool:
+        """첫 행(헤더)을 읽어 검증. 헤더가 아직 다 오지 않았으면 False"""
+        newline = self._pending.find(b"\n")
+        if newline < 0 and not final:
+            return False
+        line = bytes(self._pending if newline < 0 else self._pending[:newline + 1])
+        try:
+            fieldnames = next(csv.reader([line.decode("utf-8")]), None)
+        except (UnicodeDecodeError, csv.Error):
+            fieldnames = None
+        if not fieldnames or b'"' in line:
+            # 인코딩 오류 / 빈 첫 행 / 따옴표 헤더는 기존 로더가 판단 (같은 오류 메시지)
+            self._start_fallback()
+            return False
+
+        self._fieldnames = validate_csv_header(fieldnames)
+        self._header = line if line.endswith(b"\n") else line + b"\n"
+        del self._pending[:len(line)]
+        return True
+
+    def _process(self, batch: bytes) -> None:
+        """완성된 행 묶음 파싱 → 순서 확인 → 해시 / 사이드카에 추가"""
+        bars = parse_csv_vectorized(
+            io.BytesIO(self._header + batch), self._fieldnames, row_offset=self.rows_parsed
+        )
+        if bars is None:
+            self._start_fallback()
+            return
+
+        timestamps = bars.timestamps
+        previous = self._last_timestamp
+        if np.any(timestamps[1:] <= timestamps[:-1]) or (previous is not None and timestamps[0] <= previous):
+            # 정렬 / 중복 처리는 전체 로드 경로(정렬 후 validate_bars)와 동일해야 함
+            self._start_fallback()
+            return
+
+        self._hasher.update(bars)
+        self._sidecar.append(bars)
+        if self._first_timestamp is None:
+            self._first_timestamp = int(timestamps[0])
+        self._last_timestamp = int(timestamps[-1])
+        self.rows_parsed += len(bars)
+
+    def _start_fallback(self) -> None:
+        """증분 처리 중단 (스트림 종료 후 전체 로드)"""
+        if not self._fallback:
+            logger.info(f"스트리밍 파싱 중단, 업로드 완료 후 전체 로드: {self.temp_path}")
+        self._fallback = True
+        self._pending = bytearray()
+        self._drop_sidecar()
+
+    def _finish_full_load(self) -> IngestResult:
+        """기존 업로드 경로와 같은 순서로 로드 / 검증 / 해시"""
+        self._drop_sidecar()
+        bars, metadata = load_bars_from_csv(str(self.temp_path))
+        is_valid, errors = validate_bars(bars)
+        if not is_valid:
+            raise BarValidationError(errors)
+        self._loaded_bars = bars
+        return IngestResult(
+            dataset_hash=calculate_dataset_hash(bars),
+            bars_count=metadata["bars_count"],
+            start_timestamp=metadata["start_timestamp"],
+            end_timestamp=metadata["end_timestamp"],
+        )
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def _drop_sidecar(self) -> None:
+        if self._sidecar is not None:
+            self._sidecar.abort()
+            self._sidecar = None
@@ -9,6 +9,8 @@
 - TradeLegRepository: trade_legs 테이블 관리
 - MetricsRepository: metrics 테이블 관리
 - LeverageBracketRepository: leverage_brackets 테이블 관리
+- DatasetIngestJobRepository: dataset_ingest_jobs 테이블 관리
+- SweepRepository / SweepResultRepository: sweeps / sweep_results 테이블 관리
 """
 
 import json
@@ -274,7 +276,8 @@ class RunRepository:
         engine_version: str,
         initial_balance: float,
         status: str = "PENDING",
-        preset_id: Optional[int] = None
+        preset_id: Optional[int] = None,
+        priority: int = 0
     ) -> int:
         """
         Run 생성
@@ -286,19 +289,22 @@ class RunRepository:
             initial_balance: 초기 자산
             status: 상태 (기본값: PENDING)
             preset_id: 프리셋 ID (선택)
+            priority: 실행 대기열 우선순위 (클수록 먼저, 기본값: 0)
             
         Returns:
             int: 생성된 run_id
         """
         query = """
         INSERT INTO runs (
-            dataset_id, strategy_id, status, engine_version, initial_balance, preset_id
-        ) VALUES (?, ?, ?, ?, ?, ?)
+            dataset_id, strategy_id, status, engine_version, initial_balance, preset_id,
+            priority, queued_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """
         
         return self.db.execute_insert(
             query,
-            (dataset_id, strategy_id, status, engine_version, initial_balance, preset_id)
+            (dataset_id, strategy_id, status, engine_version, initial_balance, preset_id,
+             priority, int(time.time()))
         )
     
     def get_by_id(self, run_id: int) -> Optional[Dict[str, Any]]:
@@ -460,12 +466,14 @@ class RunRepository:
             (progress_percent, processed_bars, total_bars, run_id)
         )
     
-    def reset_for_rerun(self, run_id: int) -> int:
+    def reset_for_rerun(self, run_id: int, requeue: bool = True) -> int:
         """
         Run을 재실행하기 위해 결과 데이터를 삭제하고 상태를 초기화
         
         Args:
             run_id: Run ID
+            requeue: True면 대기열 맨 뒤로 이동 (queued_at 갱신),
+                     False면 기존 대기열 순서 유지 (중단된 Run 복구용)
             
         Returns:
             int: 업데이트된 행 수
@@ -505,11 +513,200 @@ class RunRepository:
             progress_percent = 0,
             processed_bars = 0,
             total_bars = 0,
-            run_artifacts = NULL
+            run_artifacts = NULL,
+            queued_at = CASE WHEN ? THEN ? ELSE queued_at END
         WHERE run_id = ?
         """
-        return self.db.execute_update(reset_query, (run_id,))
-    
+        return self.db.execute_update(
+            reset_query, (1 if requeue else 0, int(time.time()), run_id)
+        )
+
+    def get_pending_queue(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        실행 대기열 조회 (PENDING Run, 실행 순서대로)
+
+        정렬: priority 내림차순 → queued_at 오름차순 → run_id 오름차순
+
+        Args:
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            List[Dict[str, Any]]: 대기 중인 Run 목록
+        """
+        query = """
+        SELECT * FROM runs
+        WHERE status = 'PENDING'
+        ORDER BY priority DESC, COALESCE(queued_at, 0) ASC, run_id ASC
+        """
+        params: tuple = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+
+        results = self.db.execute_query(query, params)
+
+        runs = []
+        for row in results:
+            run = dict(row)
+            if run['run_artifacts']:
+                run['run_artifacts'] = json.loads(run['run_artifacts'])
+            runs.append(run)
+
+        return runs
+
+    def get_ids_by_status(self, status: str) -> List[int]:
+        """
+        상태별 run_id 목록 조회
+
+        Args:
+            status: 상태 (PENDING, RUNNING, ...)
+
+        Returns:
+            List[int]: run_id 목록 (오름차순)
+        """
+        query = "SELECT run_id FROM runs WHERE status = ? ORDER BY run_id"
+        return [row["run_id"] for row in self.db.execute_query(query, (status,))]
+
+    def claim_for_execution(self, run_id: int, started_at: int) -> bool:
+        """
+        PENDING Run을 RUNNING으로 전환 (실행 권한 획득)
+
+        조건부 UPDATE이므로 같은 Run을 두 워커가 동시에 실행하거나,
+        대기 중 취소된 Run을 실행하는 일이 없습니다.
+
+        Args:
+            run_id: Run ID
+            started_at: 시작 시각
+
+        Returns:
+            bool: 획득 성공 여부 (PENDING이 아니었으면 False)
+        """
+        query = """
+        UPDATE runs SET status = 'RUNNING', started_at = ?
+        WHERE run_id = ? AND status = 'PENDING'
+        """
+        return self.db.execute_update(query, (started_at, run_id)) == 1
+
+    def set_cache_key(self, run_id: int, cache_key: Optional[str]) -> int:
+        """
+        Run의 결과 캐시 키 기록
+
+        Args:
+            run_id: Run ID
+            cache_key: 캐시 키 (calculate_run_cache_key 결과)
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        query = "UPDATE runs SET cache_key = ? WHERE run_id = ?"
+        return self.db.execute_update(query, (cache_key, run_id))
+
+    def find_completed_by_cache_key(
+        self,
+        cache_key: str,
+        exclude_run_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        동일 캐시 키를 가진 COMPLETED Run 조회 (결과 복제 원본)
+
+        Args:
+            cache_key: 캐시 키
+            exclude_run_id: 제외할 Run ID (자기 자신)
+
+        Returns:
+            Optional[Dict[str, Any]]: 가장 먼저 완료된 Run (없으면 None)
+
+        Note:
+            metrics가 저장된 Run만 대상 (결과 저장 도중 실패한 Run 제외)
+        """
+        query = """
+        SELECT r.* FROM runs r
+        JOIN metrics m ON m.run_id = r.run_id
+        WHERE r.cache_key = ? AND r.status = 'COMPLETED' AND r.run_id != ?
+        ORDER BY r.run_id ASC
+        LIMIT 1
+        """
+        results = self.db.execute_query(
+            query, (cache_key, exclude_run_id if exclude_run_id is not None else -1)
+        )
+
+        if results:
+            row = dict(results[0])
+            if row['run_artifacts']:
+                row['run_artifacts'] = json.loads(row['run_artifacts'])
+            return row
+        return None
+
+    def clone_results(self, source_run_id: int, target_run_id: int) -> int:
+        """
+        원본 Run의 trades / trade_legs / metrics를 대상 Run으로 복제
+
+        Args:
+            source_run_id: 원본 Run ID
+            target_run_id: 대상 Run ID
+
+        Returns:
+            int: 복제된 trade 수
+
+        Note:
+            - 단일 트랜잭션으로 수행 (일부만 복제되는 일 없음)
+            - 대상 Run의 기존 결과는 먼저 삭제
+            - trade_id 순서를 유지하므로 조회 결과가 원본과 동일
+        """
+        trade_columns = (
+            "direction, entry_timestamp, entry_price, position_size, initial_risk, "
+            "stop_loss, take_profit_1, leverage, is_closed, total_pnl, balance_at_entry"
+        )
+        leg_columns = "exit_type, exit_timestamp, exit_price, qty_ratio, pnl"
+        metrics_columns = (
+            "trades_count, winning_trades, losing_trades, win_rate, tp1_hit_rate, "
+            "be_exit_rate, total_pnl, average_pnl, profit_factor, max_drawdown, "
+            "max_consecutive_wins, max_consecutive_losses, expectancy, score, grade"
+        )
+
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # 대상 Run 기존 결과 삭제
+            cursor.execute(
+                "DELETE FROM trade_legs WHERE trade_id IN "
+                "(SELECT trade_id FROM trades WHERE run_id = ?)",
+                (target_run_id,)
+            )
+            cursor.execute("DELETE FROM trades WHERE run_id = ?", (target_run_id,))
+            cursor.execute("DELETE FROM metrics WHERE run_id = ?", (target_run_id,))
+
+            # trades (+ 각 trade의 legs) 복제
+            cursor.execute(
+                "SELECT trade_id FROM trades WHERE run_id = ? ORDER BY trade_id",
+                (source_run_id,)
+            )
+            source_trade_ids = [row[0] for row in cursor.fetchall()]
+
+            for source_trade_id in source_trade_ids:
+                cursor.execute(
+                    f"INSERT INTO trades (run_id, {trade_columns}) "
+                    f"SELECT ?, {trade_columns} FROM trades WHERE trade_id = ?",
+                    (target_run_id, source_trade_id)
+                )
+                new_trade_id = cursor.lastrowid
+                cursor.execute(
+                    f"INSERT INTO trade_legs (trade_id, {leg_columns}) "
+                    f"SELECT ?, {leg_columns} FROM trade_legs WHERE trade_id = ? ORDER BY leg_id",
+                    (new_trade_id, source_trade_id)
+                )
+
+            # metrics 복제
+            cursor.execute(
+                f"INSERT INTO metrics (run_id, {metrics_columns}) "
+                f"SELECT ?, {metrics_columns} FROM metrics WHERE run_id = ?",
+                (target_run_id, source_run_id)
+            )
+
+            conn.commit()
+
+        return len(source_trade_ids)
+
     def delete(self, run_id: int) -> int:
         """
         Run 삭제 (관련된 모든 데이터를 함께 삭제)
@@ -669,6 +866,65 @@ class TradeRepository:
             return dict(results[0])
         return None
 
+    def load_trades(self, run_id: int) -> List[Trade]:
+        """
+        특정 Run의 거래를 엔진 Trade 객체(legs 포함)로 복원
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            List[Trade]: 진입 순서의 Trade 목록 (trade_id는 1부터 순번)
+
+        Note:
+            legs는 저장 순서(leg_id)대로 복원합니다. (TP1 → FINAL)
+        """
+        trade_rows = self.db.execute_query(
+            "SELECT * FROM trades WHERE run_id = ? ORDER BY entry_timestamp, trade_id",
+            (run_id,)
+        )
+        leg_rows = self.db.execute_query(
+            """
+            SELECT l.* FROM trade_legs l
+            JOIN trades t ON l.trade_id = t.trade_id
+            WHERE t.run_id = ?
+            ORDER BY l.leg_id
+            """,
+            (run_id,)
+        )
+
+        legs_by_trade: Dict[int, List[Dict[str, Any]]] = {}
+        for row in leg_rows:
+            legs_by_trade.setdefault(row['trade_id'], []).append(dict(row))
+
+        trades = []
+        for number, row in enumerate(trade_rows, start=1):
+            trade = Trade(
+                trade_id=number,
+                direction=row['direction'],
+                entry_price=row['entry_price'],
+                entry_timestamp=row['entry_timestamp'],
+                position_size=row['position_size'],
+                initial_risk=row['initial_risk'],
+                stop_loss=row['stop_loss'],
+                take_profit_1=row['take_profit_1'],
+                balance_at_entry=row['balance_at_entry'],
+                leverage=row['leverage'],
+                is_closed=bool(row['is_closed'])
+            )
+            for leg in legs_by_trade.get(row['trade_id'], []):
+                trade.add_leg(TradeLeg(
+                    trade_id=number,
+                    exit_type=leg['exit_type'],
+                    exit_timestamp=leg['exit_timestamp'],
+                    exit_price=leg['exit_price'],
+                    qty_ratio=leg['qty_ratio'],
+                    pnl=leg['pnl']
+                ))
+            trades.append(trade)
+
+        return trades
+
 
 class TradeLegRepository:
     """
@@ -1293,3 +1549,466 @@ class PresetRepository:
         results = self.db.execute_query(query)
         return results[0]['count'] if results else 0
 
+
+
+class DatasetIngestJobRepository:
+    """
+    dataset_ingest_jobs 테이블 관리 Repository
+
+    주요 기능:
+    - 업로드 수집 작업 생성, 진행 상태 업데이트, 조회
+    - 끝난 작업 정리 (테이블이 무한히 커지지 않도록)
+    """
+
+    # update()로 변경 가능한 컬럼
+    _UPDATABLE_COLUMNS = (
+        'status', 'bytes_processed', 'rows_processed', 'eta_seconds', 'progress_message',
+        'dataset_id', 'bars_count', 'error', 'status_code', 'details', 'elapsed_seconds'
+    )
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def create(
+        self,
+        job_id: str,
+        name: str,
+        filename: Optional[str],
+        bytes_total: int,
+        started_at: int
+    ) -> None:
+        """
+        수집 작업 생성 (PENDING)
+
+        Args:
+            job_id: 작업 ID
+            name: 데이터셋 이름
+            filename: 업로드 파일명
+            bytes_total: 업로드 크기 (bytes)
+            started_at: 생성 시각
+        """
+        query = """
+        INSERT INTO dataset_ingest_jobs (job_id, name, filename, status, bytes_total, started_at)
+        VALUES (?, ?, ?, 'PENDING', ?, ?)
+        """
+        self.db.execute_insert(query, (job_id, name, filename, bytes_total, started_at))
+
+    def update(self, job_id: str, **fields: Any) -> int:
+        """
+        작업 상태/진행률 업데이트
+
+        Args:
+            job_id: 작업 ID
+            **fields: 변경할 컬럼 (status, bytes_processed, rows_processed, eta_seconds, ...)
+
+        Returns:
+            int: 영향받은 행 수
+
+        Raises:
+            ValueError: 변경할 수 없는 컬럼인 경우
+        """
+        invalid = [column for column in fields if column not in self._UPDATABLE_COLUMNS]
+        if invalid:
+            raise ValueError(f"변경할 수 없는 컬럼: {invalid}")
+        if not fields:
+            return 0
+
+        if 'details' in fields and fields['details'] is not None:
+            fields['details'] = json.dumps(fields['details'], ensure_ascii=False)
+
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        query = f"UPDATE dataset_ingest_jobs SET {assignments} WHERE job_id = ?"
+        return self.db.execute_update(query, (*fields.values(), job_id))
+
+    def get_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        job_id로 작업 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보 (없으면 None)
+        """
+        results = self.db.execute_query(
+            "SELECT * FROM dataset_ingest_jobs WHERE job_id = ?", (job_id,)
+        )
+        if not results:
+            return None
+        job = dict(results[0])
+        if job.get('details'):
+            job['details'] = json.loads(job['details'])
+        return job
+
+    def delete_finished_before(self, started_before: int) -> int:
+        """
+        오래된 완료/실패 작업 삭제
+
+        Args:
+            started_before: 이 시각 이전에 시작된 작업만 삭제
+
+        Returns:
+            int: 삭제된 행 수
+        """
+        query = """
+        DELETE FROM dataset_ingest_jobs
+        WHERE status IN ('COMPLETED', 'FAILED') AND started_at < ?
+        """
+        return self.db.execute_delete(query, (started_before,))
+
+
+class SweepRepository:
+    """
+    sweeps 테이블 관리 Repository
+
+    주요 기능:
+    - 파라미터 스윕 생성, 조회, 상태/진행률 업데이트, 삭제
+    """
+
+    # JSON으로 저장되는 컬럼
+    _JSON_COLUMNS = ('htf_dataset_ids', 'strategy_template', 'param_space')
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def create(
+        self,
+        dataset_id: int,
+        strategy_template: Dict[str, Any],
+        param_space: Dict[str, Any],
+        initial_balance: float,
+        engine_version: str,
+        total_combinations: int,
+        preset_id: Optional[int] = None,
+        htf_dataset_ids: Optional[Dict[str, int]] = None,
+        name: Optional[str] = None
+    ) -> int:
+        """
+        스윕 생성 (PENDING)
+
+        Args:
+            dataset_id: 베이스 데이터셋 ID
+            strategy_template: 전략 정의 템플릿
+            param_space: 파라미터 경로 → 값 지정
+            initial_balance: 초기 자산
+            engine_version: 엔진 버전
+            total_combinations: 전체 조합 수
+            preset_id: 프리셋 ID (선택)
+            htf_dataset_ids: 상위 타임프레임 데이터셋 매핑 (선택)
+            name: 스윕 이름 (선택)
+
+        Returns:
+            int: 생성된 sweep_id
+        """
+        query = """
+        INSERT INTO sweeps (
+            name, dataset_id, htf_dataset_ids, strategy_template, param_space, preset_id,
+            initial_balance, engine_version, status, total_combinations, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'PENDING', ?, ?)
+        """
+
+        return self.db.execute_insert(
+            query,
+            (
+                name, dataset_id,
+                json.dumps(htf_dataset_ids or {}, ensure_ascii=False),
+                json.dumps(strategy_template, ensure_ascii=False),
+                json.dumps(param_space, ensure_ascii=False),
+                preset_id, initial_balance, engine_version, total_combinations,
+                int(time.time())
+            )
+        )
+
+    def get_by_id(self, sweep_id: int) -> Optional[Dict[str, Any]]:
+        """
+        sweep_id로 스윕 조회
+
+        Args:
+            sweep_id: 스윕 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 스윕 정보 (없으면 None)
+        """
+        results = self.db.execute_query("SELECT * FROM sweeps WHERE sweep_id = ?", (sweep_id,))
+        return self._parse_row(results[0]) if results else None
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """
+        모든 스윕 조회 (최신순)
+
+        Returns:
+            List[Dict[str, Any]]: 스윕 목록
+        """
+        results = self.db.execute_query("SELECT * FROM sweeps ORDER BY sweep_id DESC")
+        return [self._parse_row(row) for row in results]
+
+    def get_ids_by_status(self, status: str, limit: Optional[int] = None) -> List[int]:
+        """
+        상태별 sweep_id 목록 조회 (오래된 순, PENDING은 실행 대기열 순서)
+
+        Args:
+            status: 상태 (PENDING, RUNNING, ...)
+            limit: 최대 개수 (None이면 전체)
+
+        Returns:
+            List[int]: sweep_id 목록 (오름차순)
+        """
+        query = "SELECT sweep_id FROM sweeps WHERE status = ? ORDER BY sweep_id"
+        params: tuple = (status,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (status, limit)
+        return [row["sweep_id"] for row in self.db.execute_query(query, params)]
+
+    def claim_for_execution(self, sweep_id: int, started_at: int) -> bool:
+        """
+        PENDING 스윕을 RUNNING으로 전환 (실행 권한 획득)
+
+        Args:
+            sweep_id: 스윕 ID
+            started_at: 시작 시각
+
+        Returns:
+            bool: 획득 성공 여부 (PENDING이 아니었으면 False)
+        """
+        query = """
+        UPDATE sweeps SET status = 'RUNNING', started_at = ?
+        WHERE sweep_id = ? AND status = 'PENDING'
+        """
+        return self.db.execute_update(query, (started_at, sweep_id)) == 1
+
+    def complete_if_finished(self, sweep_id: int, completed_at: int) -> bool:
+        """
+        모든 조합 결과가 저장된 RUNNING 스윕을 COMPLETED로 전환
+
+        조합을 나눠 평가하는 여러 워커 중 마지막으로 끝난 쪽만 성공하는 조건부 UPDATE입니다.
+
+        Args:
+            sweep_id: 스윕 ID
+            completed_at: 완료 시각
+
+        Returns:
+            bool: 전환 여부
+        """
+        query = """
+        UPDATE sweeps SET status = 'COMPLETED', completed_at = ?
+        WHERE sweep_id = ? AND status = 'RUNNING'
+          AND completed_combinations >= total_combinations
+        """
+        return self.db.execute_update(query, (completed_at, sweep_id)) == 1
+
+    def update_status(
+        self,
+        sweep_id: int,
+        status: str,
+        started_at: Optional[int] = None,
+        completed_at: Optional[int] = None,
+        error: Optional[str] = None
+    ) -> int:
+        """
+        스윕 상태 업데이트
+
+        Args:
+            sweep_id: 스윕 ID
+            status: 상태 (PENDING, RUNNING, COMPLETED, FAILED, CANCELLED)
+            started_at: 시작 시각 (선택)
+            completed_at: 완료 시각 (선택)
+            error: 오류 메시지 (선택)
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        fields = ["status = ?"]
+        params: List[Any] = [status]
+
+        if started_at is not None:
+            fields.append("started_at = ?")
+            params.append(started_at)
+
+        if completed_at is not None:
+            fields.append("completed_at = ?")
+            params.append(completed_at)
+
+        if error is not None:
+            fields.append("error = ?")
+            params.append(error)
+
+        params.append(sweep_id)
+
+        query = f"UPDATE sweeps SET {', '.join(fields)} WHERE sweep_id = ?"
+        return self.db.execute_update(query, tuple(params))
+
+    def delete(self, sweep_id: int) -> int:
+        """
+        스윕 삭제 (결과 포함)
+
+        Args:
+            sweep_id: 스윕 ID
+
+        Returns:
+            int: 삭제된 sweeps 행 수
+        """
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM sweep_results WHERE sweep_id = ?", (sweep_id,))
+            cursor = conn.execute("DELETE FROM sweeps WHERE sweep_id = ?", (sweep_id,))
+            conn.commit()
+            return cursor.rowcount
+
+    def _parse_row(self, row) -> Dict[str, Any]:
+        """JSON 컬럼 파싱"""
+        sweep = dict(row)
+        for column in self._JSON_COLUMNS:
+            if sweep.get(column):
+                sweep[column] = json.loads(sweep[column])
+        return sweep
+
+
+class SweepResultRepository:
+    """
+    sweep_results 테이블 관리 Repository
+
+    주요 기능:
+    - 조합별 결과 일괄 저장 (진행률 동시 갱신)
+    - 지표 기준 top-K 조회
+    """
+
+    # top-K 정렬 허용 컬럼 → 정렬 방향 (max_drawdown은 절대값이므로 작을수록 좋음)
+    ORDER_COLUMNS = {
+        'score': 'DESC',
+        'total_pnl': 'DESC',
+        'profit_factor': 'DESC',
+        'win_rate': 'DESC',
+        'expectancy': 'DESC',
+        'max_drawdown': 'ASC',
+    }
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def add_batch(self, sweep_id: int, results: List[Dict[str, Any]]) -> int:
+        """
+        조합 결과 일괄 저장 + 스윕 진행률 갱신 (단일 트랜잭션)
+
+        Args:
+            sweep_id: 스윕 ID
+            results: 결과 리스트
+                {"combo_index", "params", "metrics" (Dict 또는 None), "error" (str 또는 None)}
+
+        Returns:
+            int: 저장된 결과 수
+        """
+        query = """
+        INSERT OR REPLACE INTO sweep_results (
+            sweep_id, combo_index, params, trades_count, win_rate, total_pnl,
+            profit_factor, max_drawdown, expectancy, score, grade, metrics, error
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        rows = []
+        for result in results:
+            metrics = result.get("metrics") or {}
+            rows.append((
+                sweep_id,
+                result["combo_index"],
+                json.dumps(result["params"], ensure_ascii=False),
+                metrics.get("trades_count"),
+                metrics.get("win_rate"),
+                metrics.get("total_pnl"),
+                metrics.get("profit_factor"),
+                metrics.get("max_drawdown"),
+                metrics.get("expectancy"),
+                metrics.get("score"),
+                metrics.get("grade"),
+                json.dumps(metrics, ensure_ascii=False) if metrics else None,
+                result.get("error"),
+            ))
+
+        with self.db.get_connection() as conn:
+            conn.executemany(query, rows)
+            conn.execute(
+                """
+                UPDATE sweeps SET completed_combinations = (
+                    SELECT COUNT(*) FROM sweep_results WHERE sweep_id = ?
+                ) WHERE sweep_id = ?
+                """,
+                (sweep_id, sweep_id)
+            )
+            conn.commit()
+
+        return len(rows)
+
+    def get_top(
+        self,
+        sweep_id: int,
+        top_k: int = 20,
+        order_by: str = 'score',
+        min_trades: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        지표 기준 상위 K개 결과 조회 (평가 실패 조합 제외)
+
+        Args:
+            sweep_id: 스윕 ID
+            top_k: 조회 개수
+            order_by: 정렬 컬럼 (ORDER_COLUMNS)
+            min_trades: 최소 거래 수
+
+        Returns:
+            List[Dict[str, Any]]: 결과 목록 (지표 값이 없는 결과는 맨 뒤, 동점은 combo_index 순)
+
+        Raises:
+            ValueError: 지원하지 않는 정렬 컬럼인 경우
+        """
+        if order_by not in self.ORDER_COLUMNS:
+            raise ValueError(
+                f"지원하지 않는 정렬 컬럼입니다: {order_by} (허용: {list(self.ORDER_COLUMNS)})"
+            )
+
+        query = f"""
+        SELECT * FROM sweep_results
+        WHERE sweep_id = ? AND error IS NULL AND trades_count >= ?
+        ORDER BY {order_by} IS NULL, {order_by} {self.ORDER_COLUMNS[order_by]}, combo_index ASC
+        LIMIT ?
+        """
+        results = self.db.execute_query(query, (sweep_id, min_trades, top_k))
+        return [self._parse_row(row) for row in results]
+
+    def get_errors(self, sweep_id: int, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        평가 실패 조합 조회
+
+        Args:
+            sweep_id: 스윕 ID
+            limit: 최대 개수
+
+        Returns:
+            List[Dict[str, Any]]: 실패 결과 목록 (combo_index 순)
+        """
+        query = """
+        SELECT * FROM sweep_results
+        WHERE sweep_id = ? AND error IS NOT NULL
+        ORDER BY combo_index ASC
+        LIMIT ?
+        """
+        results = self.db.execute_query(query, (sweep_id, limit))
+        return [self._parse_row(row) for row in results]
+
+    def get_combo_indices(self, sweep_id: int) -> List[int]:
+        """
+        결과가 저장된 조합 번호 조회 (중단된 스윕 재개용)
+
+        Args:
+            sweep_id: 스윕 ID
+
+        Returns:
+            List[int]: combo_index 목록 (오름차순)
+        """
+        query = "SELECT combo_index FROM sweep_results WHERE sweep_id = ? ORDER BY combo_index"
+        return [row["combo_index"] for row in self.db.execute_query(query, (sweep_id,))]
+
+    def _parse_row(self, row) -> Dict[str, Any]:
+        """JSON 컬럼 파싱"""
+        result = dict(row)
+        result['params'] = json.loads(result['params'])
+        if result.get('metrics'):
+            result['metrics'] = json.loads(result['metrics'])
+        return result
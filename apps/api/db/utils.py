@@ -2,27 +2,138 @@
 데이터베이스 유틸리티 함수
 
 이 모듈은 데이터베이스 작업을 위한 유틸리티 함수들을 제공합니다.
-- 해시 계산 (dataset_hash, strategy_hash)
+- 해시 계산 (dataset_hash, strategy_hash, Run 결과 캐시 키)
 - CSV 파일 처리
+- 데이터셋 바이너리 사이드카 (CSV 옆의 .npy 디렉토리, memmap 로드)
 - 데이터 검증
 """
 
 import hashlib
 import csv
+import logging
+import os
+import shutil
+import uuid
+import warnings
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, BinaryIO
 import json
 from datetime import datetime
 from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
 
 from engine.models.bar import Bar
+from engine.models.bar_array import OHLCV_COLUMNS, BarArray, find_invalid_bar
+
+logger = logging.getLogger(__name__)
 
 # CSV dt 컬럼: KST 벽시계 (docs/timezone.md)
 _KST = ZoneInfo("Asia/Seoul")
 
+# 사이드카 포맷 버전 (BarArray.save 레이아웃이 바뀌면 올려서 재생성)
+SIDECAR_FORMAT_VERSION = 1
+_SIDECAR_SUFFIX = ".bars"
+_SIDECAR_META = "meta.json"
+
+
+# 데이터셋 해시를 스트리밍으로 계산할 때 한 번에 직렬화하는 봉 수
+_DATASET_HASH_CHUNK = 1 << 16
+
+# direction(-1, 0, 1) → 해시 텍스트 바이트 (NUL은 직렬화 후 제거되는 패딩)
+_DIRECTION_ASCII = np.array([[45, 49], [0, 48], [0, 49]], dtype=np.uint8)
+
+
+def _bar_hash_text(bar: Bar) -> str:
+    """봉 하나의 해시 입력 텍스트 (dataset_hash 정의)"""
+    return f"{bar.timestamp},{bar.open},{bar.high},{bar.low},{bar.close},{bar.volume},{bar.direction}|"
+
+
+def _uint_ascii(values: np.ndarray) -> np.ndarray:
+    """0 이상 정수 배열 → 우측 정렬 10진 ASCII 행렬 (선행 0은 NUL)"""
+    width = len(str(int(values.max())))
+    out = np.empty((len(values), width), dtype=np.uint8)
+    remaining = values.astype(np.uint64)
+    for col in range(width - 1, -1, -1):
+        out[:, col] = (remaining % 10).astype(np.uint8) + 48
+        remaining //= 10
+    # 마지막 자리를 제외한 선행 '0' → NUL
+    leading = np.logical_and.accumulate(out[:, :-1] == 48, axis=1)
+    out[:, :-1][leading] = 0
+    return out
+
+
+def _hash_chunk_bytes(timestamps: np.ndarray, ohlcv: np.ndarray, direction: np.ndarray) -> bytes:
+    """
+    봉 청크의 해시 입력 텍스트를 배열 연산으로 생성 (_bar_hash_text를 이어붙인 것과 동일)
+
+    실수는 비트 패턴이 같은 값끼리 묶어 고유값만 repr (f-string 포맷과 동일)하고,
+    필드를 NUL 패딩된 고정 폭 행렬로 배치한 뒤 NUL을 제거해 이어붙입니다.
+    """
+    count = len(timestamps)
+    if timestamps.min() < 0 or not np.isin(direction, (-1, 0, 1)).all():
+        # 검증되지 않은 배열은 봉 단위 텍스트로 처리
+        return "".join(
+            f"{t},{o},{h},{l},{c},{v},{d}|"
+            for t, o, h, l, c, v, d in zip(
+                timestamps.tolist(), *ohlcv.tolist(), direction.tolist()
+            )
+        ).encode('utf-8')
+
+    values = np.ascontiguousarray(ohlcv.T).reshape(-1)
+    codes, uniques = pd.factorize(values.view(np.int64))
+    table = np.array(list(map(repr, uniques.view(np.float64).tolist())), dtype='S')
+    value_width = table.dtype.itemsize
+    table = table.view(np.uint8).reshape(len(uniques), value_width)
+    codes = codes.reshape(count, 5)
+
+    ts_ascii = _uint_ascii(timestamps)
+    ts_width = ts_ascii.shape[1]
+    matrix = np.empty((count, ts_width + 5 * (value_width + 1) + 4), dtype=np.uint8)
+    matrix[:, :ts_width] = ts_ascii
+    pos = ts_width
+    for col in range(5):
+        matrix[:, pos] = ord(',')
+        matrix[:, pos + 1:pos + 1 + value_width] = table[codes[:, col]]
+        pos += value_width + 1
+    matrix[:, pos] = ord(',')
+    matrix[:, pos + 1:pos + 3] = _DIRECTION_ASCII[direction.astype(np.int64) + 1]
+    matrix[:, pos + 3] = ord('|')
+    return matrix[matrix != 0].tobytes()
+
+
+class DatasetHasher:
+    """
+    dataset_hash 증분 계산기
+
+    timestamp 오름차순으로 이어지는 BarArray 조각을 차례로 받아, 전체를 한 번에
+    calculate_dataset_hash에 넣은 것과 같은 해시를 만듭니다 (스트리밍 업로드용).
+    """
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+
+    def update(self, bars: BarArray) -> None:
+        """
+        봉 조각 추가 (이전 조각의 마지막 timestamp보다 뒤여야 함, 호출부 보장)
+
+        Args:
+            bars: 정렬된 BarArray 조각
+        """
+        for start in range(0, len(bars), _DATASET_HASH_CHUNK):
+            end = start + _DATASET_HASH_CHUNK
+            self._hash.update(_hash_chunk_bytes(
+                bars.timestamps[start:end],
+                bars.ohlcv[:, start:end],
+                bars.direction[start:end],
+            ))
+
+    def hexdigest(self) -> str:
+        """SHA256 해시 (16진수 문자열)"""
+        return self._hash.hexdigest()
 
-def calculate_dataset_hash(bars: List[Bar]) -> str:
+
+def calculate_dataset_hash(bars: List[Bar] | BarArray) -> str:
     """
     봉 데이터로부터 dataset_hash 계산
     
@@ -30,23 +141,27 @@ def calculate_dataset_hash(bars: List[Bar]) -> str:
     - 동일한 봉 데이터 → 동일한 해시
     - timestamp 오름차순 정렬 보장
     
+    해시 입력은 정렬된 봉마다 "timestamp,open,high,low,close,volume,direction|"
+    (각 값의 f-string 표기)를 이어붙인 UTF-8 텍스트입니다. 전체 텍스트를 만들지 않고
+    청크 단위로 sha256에 공급하며, BarArray는 청크 텍스트를 배열 연산으로 생성합니다.
+    
     Args:
-        bars: 봉 데이터 리스트
+        bars: 봉 데이터 리스트 또는 BarArray
         
     Returns:
         str: SHA256 해시 (16진수 문자열)
     """
-    # timestamp 오름차순 정렬
-    sorted_bars = sorted(bars, key=lambda b: b.timestamp)
+    if isinstance(bars, BarArray):
+        hasher = DatasetHasher()
+        hasher.update(bars.sorted_by_timestamp())
+        return hasher.hexdigest()
     
-    # 모든 봉 데이터를 문자열로 결합
-    data_str = ""
-    for bar in sorted_bars:
-        # 각 봉의 모든 필드를 문자열로 변환하여 결합
-        data_str += f"{bar.timestamp},{bar.open},{bar.high},{bar.low},{bar.close},{bar.volume},{bar.direction}|"
-    
-    # SHA256 해시 계산
-    hash_obj = hashlib.sha256(data_str.encode('utf-8'))
+    hash_obj = hashlib.sha256()
+    # Bar 리스트는 필드 타입(int / float)이 표기에 영향을 주므로 봉 단위 텍스트 사용
+    sorted_bars = sorted(bars, key=lambda b: b.timestamp)
+    for start in range(0, len(sorted_bars), _DATASET_HASH_CHUNK):
+        chunk = sorted_bars[start:start + _DATASET_HASH_CHUNK]
+        hash_obj.update("".join(map(_bar_hash_text, chunk)).encode('utf-8'))
     return hash_obj.hexdigest()
 
 
@@ -72,10 +187,234 @@ def calculate_strategy_hash(definition: Dict[str, Any]) -> str:
     return hash_obj.hexdigest()
 
 
+# 캐시 키에 포함되는 프리셋 리스크 파라미터 (엔진 결과에 영향을 주는 값만)
+RUN_CACHE_PRESET_FIELDS = ("risk_percent", "risk_reward_ratio", "rebalance_interval")
+
+# 레버리지 테이블 해시에 포함되는 컬럼 (bracket_id / created_at 제외)
+_LEVERAGE_BRACKET_FIELDS = ("bracket_min", "bracket_max", "max_leverage", "m_margin_rate", "m_amount")
+
+
+def calculate_leverage_table_hash(brackets: List[Dict[str, Any]]) -> str:
+    """
+    레버리지 구간 테이블 버전 해시 계산
+
+    결정성 보장:
+    - 구간 값이 같으면 bracket_id / created_at이 달라도 동일한 해시
+    - bracket_min 오름차순 정렬 후 계산
+
+    Args:
+        brackets: leverage_brackets 행 리스트 (LeverageBracketRepository.get_all 결과)
+
+    Returns:
+        str: SHA256 해시 (16진수 문자열)
+    """
+    rows = sorted(
+        ([b[field] for field in _LEVERAGE_BRACKET_FIELDS] for b in brackets),
+        key=lambda row: row[0]
+    )
+    json_str = json.dumps(rows, ensure_ascii=False)
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+
+
+def calculate_run_cache_key(
+    dataset_hashes: Dict[str, str],
+    strategy_hash: str,
+    preset: Dict[str, Any],
+    initial_balance: float,
+    leverage_table_hash: str,
+    engine_version: str,
+    custom_indicator_hashes: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Run 결과 캐시 키 계산
+
+    엔진은 결정적이므로 아래 입력이 모두 같으면 결과(trades / legs / metrics)도 같습니다.
+    - role별 데이터셋 해시 (base + HTF)
+    - 전략 해시
+    - 프리셋 리스크 파라미터 (RUN_CACHE_PRESET_FIELDS) + 초기 자산
+    - 레버리지 테이블 해시
+    - 엔진 버전
+    - 전략이 참조하는 커스텀 지표의 코드 해시 (지표 코드는 전략 해시와 별개로 수정 가능)
+
+    Args:
+        dataset_hashes: role → dataset_hash 매핑 ({'base': ..., '1h': ...})
+        strategy_hash: 전략 해시
+        preset: 프리셋 정보 (리스크 파라미터 포함)
+        initial_balance: 초기 자산
+        leverage_table_hash: calculate_leverage_table_hash 결과
+        engine_version: 엔진 버전
+        custom_indicator_hashes: 커스텀 지표 타입 → 코드 해시 (없는 타입은 None)
+
+    Returns:
+        str: SHA256 해시 (16진수 문자열)
+    """
+    payload = {
+        "datasets": dataset_hashes,
+        "strategy": strategy_hash,
+        "preset": {field: preset[field] for field in RUN_CACHE_PRESET_FIELDS},
+        "initial_balance": initial_balance,
+        "leverage_table": leverage_table_hash,
+        "engine_version": engine_version,
+    }
+    if custom_indicator_hashes:
+        # 커스텀 지표가 없는 전략은 기존 캐시 키 유지
+        payload["custom_indicators"] = custom_indicator_hashes
+    json_str = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+
+
+# CSV 헤더 → 값 컬럼 (dt는 KST 벽시계 문자열)
+_CSV_HEADERS = ('dt', 'do', 'dh', 'dl', 'dc', 'dv', 'dd')
+_CSV_PRICE_HEADERS = ('do', 'dh', 'dl', 'dc', 'dv')
+_DIRECTION_VALUES = {'1': 1, '0': 0, '-1': -1}
+
+# 이 시각(KST 벽시계, 1988-10-09 서머타임 종료) 이후 Asia/Seoul은 고정 UTC+9
+_KST_FIXED_SINCE = int((datetime(1988, 10, 10) - datetime(1970, 1, 1)).total_seconds())
+_KST_OFFSET_SECONDS = 9 * 3600
+
+
+def _check_csv_header(path: Path) -> List[str]:
+    """CSV 헤더 검증 후 헤더 목록 반환 (두 로더가 같은 오류 메시지를 내도록 공유)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        fieldnames = csv.DictReader(f).fieldnames
+    return validate_csv_header(fieldnames)
+
+
+def validate_csv_header(fieldnames: Optional[List[str]]) -> List[str]:
+    """
+    CSV 헤더 검증 (필수 헤더: dt,do,dh,dl,dc,dv,dd)
+
+    Args:
+        fieldnames: csv.DictReader의 fieldnames (빈 파일이면 None)
+
+    Returns:
+        List[str]: fieldnames
+
+    Raises:
+        ValueError: 필수 헤더가 없는 경우
+    """
+    # load_bars_from_csv_reference와 같은 set 리터럴 (오류 메시지의 순서까지 동일하도록)
+    expected_headers = {'dt', 'do', 'dh', 'dl', 'dc', 'dv', 'dd'}
+    if not expected_headers.issubset(set(fieldnames or [])):
+        raise ValueError(
+            f"CSV 헤더가 잘못되었습니다. "
+            f"필요한 헤더: {expected_headers}, "
+            f"실제 헤더: {fieldnames}"
+        )
+    return fieldnames
+
+
+def _parse_csv_rows(path: Path) -> BarArray:
+    """
+    CSV를 행 단위로 파싱 (load_bars_from_csv_reference 결과를 BarArray로 변환)
+
+    벡터화 파서가 처리하지 못하는 입력(파싱 오류, 공백, 과거 KST 오프셋 등)은
+    참조 구현을 그대로 거치므로 오류 메시지와 행 번호도 참조 구현과 같습니다.
+    """
+    bars, _ = load_bars_from_csv_reference(str(path))
+    return BarArray.from_bars(bars)
+
+
+def parse_csv_vectorized(
+    source: Path | BinaryIO,
+    fieldnames: List[str],
+    row_offset: int = 0
+) -> Optional[BarArray]:
+    """
+    pandas.read_csv 기반 벡터화 파싱 (정렬하지 않음)
+
+    값 변환 / KST → epoch / Bar 검증을 배열 연산으로 처리합니다.
+    행 단위 파서와 결과가 다를 수 있는 입력이면 None을 반환해 _parse_csv_rows로 넘깁니다.
+      - 숫자 / dt / dd 변환 실패, 필드 수 불일치, 중복 헤더, 빈 행
+      - 1988-10-10 이전 dt (Asia/Seoul 오프셋이 +9 고정이 아님)
+    실수는 float_precision="round_trip"으로 float()와 같은 값으로 변환합니다
+    (dataset_hash가 값의 문자열 표현에 의존).
+
+    Args:
+        source: CSV 경로 또는 헤더 행을 포함한 바이트 스트림 (스트리밍 업로드의 일부 구간)
+        fieldnames: 검증된 헤더
+        row_offset: source 앞에 이미 처리된 데이터 행 수 (오류 행 번호 보정)
+
+    Raises:
+        ValueError: Bar 검증 실패 (행 단위 파서와 동일한 메시지 / 행 번호)
+    """
+    if len(set(fieldnames)) != len(fieldnames):
+        return None
+
+    try:
+        with warnings.catch_warnings():
+            # 필드 수가 헤더와 다른 행은 DictReader와 해석이 달라지므로 경고도 실패로 처리
+            warnings.simplefilter("error", pd.errors.ParserWarning)
+            frame = pd.read_csv(
+                source,
+                usecols=list(_CSV_HEADERS),
+                dtype={'dd': str, **{h: np.float64 for h in _CSV_PRICE_HEADERS}},
+                parse_dates=['dt'],
+                date_format='%Y-%m-%d %H:%M:%S',
+                index_col=False,
+                na_filter=False,
+                # 공백만 있는 행을 DictReader처럼 데이터 행으로 취급 (빈 행은 변환 실패 → 행 단위 파서)
+                skip_blank_lines=False,
+                float_precision="round_trip",
+                encoding='utf-8',
+                engine='c',
+            )
+    except (ValueError, UnicodeDecodeError, pd.errors.ParserError, pd.errors.ParserWarning):
+        return None
+    if len(frame) == 0:
+        return None
+
+    # int()와 달리 pandas는 "1.0" 등도 정수로 읽으므로 유효 값 문자열만 직접 매핑
+    direction = frame['dd'].map(_DIRECTION_VALUES)
+    if direction.isna().any():
+        return None
+
+    # dt: KST 벽시계 → epoch (고정 +9 구간만, 형식이 다른 값이 있으면 object 컬럼 / NaT)
+    wall_clock = frame['dt']
+    if not pd.api.types.is_datetime64_dtype(wall_clock) or wall_clock.isna().any():
+        return None
+    wall_seconds = wall_clock.to_numpy().astype('datetime64[s]').astype(np.int64)
+    if wall_seconds.min() < _KST_FIXED_SINCE:
+        return None
+
+    ts_array = wall_seconds - _KST_OFFSET_SECONDS
+    ohlcv = np.ascontiguousarray(frame[list(_CSV_PRICE_HEADERS)].to_numpy(dtype=np.float64).T)
+    direction_array = direction.to_numpy(dtype=np.int64)
+
+    invalid = find_invalid_bar(ts_array, ohlcv, direction_array)
+    if invalid is not None:
+        row_index, message = invalid
+        raise ValueError(f"CSV 데이터 파싱 오류 (행 {row_offset + row_index + 2}): {message}")
+
+    return BarArray(ts_array, *ohlcv, direction_array, validate=False)
+
+
+def _bars_result(
+    bars: BarArray,
+    include_df: bool
+) -> Tuple[BarArray, pd.DataFrame | Dict[str, Any]]:
+    """정렬된 BarArray → load_bars_from_csv 반환 형식"""
+    # DataFrame 생성 (지표 계산을 위해)
+    # index: DatetimeIndex (UNIX timestamp → datetime 변환)
+    # timestamp 컬럼은 제거하고 index로만 사용
+    df = bars.to_dataframe()
+    
+    # 메타데이터 계산
+    metadata = {
+        'bars_count': len(bars),
+        'start_timestamp': bars[0].timestamp,
+        'end_timestamp': bars[-1].timestamp,
+    }
+    
+    if include_df:
+        return bars, df, metadata
+    return bars, metadata
+
+
 def load_bars_from_csv(
     file_path: str,
     include_df: bool = False
-) -> Tuple[List[Bar], pd.DataFrame | Dict[str, Any]]:
+) -> Tuple[BarArray, pd.DataFrame | Dict[str, Any]]:
     """
     CSV 파일에서 봉 데이터 로드
     
@@ -89,6 +428,56 @@ def load_bars_from_csv(
     - dv: 거래량 (volume)
     - dd: 봉 방향 (direction: 1=상승, -1=하락, 0=보합)
     
+    pandas.read_csv 벡터화 파서를 먼저 사용하고, 행 단위 파서와 해석이 달라질 수 있는
+    입력(파싱 오류 등)만 행 단위 파서(load_bars_from_csv_reference와 동일)로 처리합니다.
+    
+    Args:
+        file_path: CSV 파일 경로
+        
+    Returns:
+        include_df=True  -> (BarArray, DataFrame, 메타데이터)
+        include_df=False -> (BarArray, 메타데이터)
+        
+        BarArray는 List[Bar]처럼 인덱스/순회 접근이 가능하며,
+        DataFrame의 OHLCV 컬럼은 BarArray 배열을 복사 없이 공유합니다.
+        
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않는 경우
+        ValueError: CSV 형식이 잘못된 경우
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {file_path}")
+    
+    fieldnames = _check_csv_header(path)
+    bars = parse_csv_vectorized(path, fieldnames)
+    if bars is None:
+        bars = _parse_csv_rows(path)
+    
+    # timestamp 오름차순 정렬 (안정 정렬)
+    return _bars_result(bars.sorted_by_timestamp(), include_df)
+
+
+def load_bars_from_csv_reference(
+    file_path: str,
+    include_df: bool = False
+) -> Tuple[List[Bar], pd.DataFrame | Dict[str, Any]]:
+    """
+    CSV 파일에서 봉 데이터 로드 (csv.DictReader + Bar 행 단위 참조 구현)
+    
+    벡터화 파서 도입 전 load_bars_from_csv를 그대로 유지한 것으로, load_bars_from_csv의
+    행 단위 폴백 경로와 동등성 테스트(tests/test_csv_loader_parity.py)의 기준입니다.
+    
+    CSV 형식:
+    - 헤더: dt,do,dh,dl,dc,dv,dd
+    - dt: 'YYYY-MM-DD HH:MM:SS' — **KST(Asia/Seoul)** 벽시계 (오름차순 정렬 필수)
+    - do: 시가 (open)
+    - dh: 고가 (high)
+    - dl: 저가 (low)
+    - dc: 종가 (close)
+    - dv: 거래량 (volume)
+    - dd: 봉 방향 (direction: 1=상승, -1=하락, 0=보합)
+    
     Args:
         file_path: CSV 파일 경로
         
@@ -172,7 +561,227 @@ def load_bars_from_csv(
     return bars, metadata
 
 
-def validate_bars(bars: List[Bar]) -> Tuple[bool, List[str]]:
+def sidecar_enabled() -> bool:
+    """데이터셋 사이드카 사용 여부 (ALGOFORGE_DATASET_SIDECAR, 기본 활성)"""
+    return os.getenv("ALGOFORGE_DATASET_SIDECAR", "1").lower() not in ("0", "false", "no", "off")
+
+
+def dataset_sidecar_path(file_path: str | Path) -> Path:
+    """
+    CSV에 대응하는 사이드카 디렉토리 경로
+
+    데이터셋 CSV는 {dataset_hash}.csv로 저장되므로 사이드카는 {dataset_hash}.bars/
+
+    Args:
+        file_path: 데이터셋 CSV 경로
+
+    Returns:
+        Path: 사이드카 디렉토리 (존재 여부와 무관)
+    """
+    path = Path(file_path)
+    return path.with_name(path.stem + _SIDECAR_SUFFIX)
+
+
+def _csv_signature(path: Path) -> Dict[str, int]:
+    """사이드카 유효성 확인용 CSV 파일 크기 / 수정 시각"""
+    stat = path.stat()
+    return {"csv_size": stat.st_size, "csv_mtime_ns": stat.st_mtime_ns}
+
+
+def write_dataset_sidecar(bars: BarArray, file_path: str | Path) -> Path:
+    """
+    봉 데이터를 CSV 옆에 바이너리 사이드카로 저장
+
+    BarArray.save 레이아웃(timestamps / ohlcv / direction .npy) + meta.json.
+    임시 디렉토리에 쓴 뒤 rename하므로 동시에 읽는 Run이 반쯤 쓰인 파일을 보지 않습니다.
+
+    Args:
+        bars: load_bars_from_csv 결과 (정렬 / 검증 완료)
+        file_path: 데이터셋 CSV 경로
+
+    Returns:
+        Path: 사이드카 디렉토리
+    """
+    csv_path = Path(file_path)
+    temp_dir = _sidecar_staging_dir(csv_path)
+    try:
+        bars.save(temp_dir)
+        return _publish_sidecar(temp_dir, csv_path)
+    finally:
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _sidecar_staging_dir(csv_path: Path) -> Path:
+    """사이드카를 조립할 임시 디렉토리 (완성 후 rename)"""
+    target = dataset_sidecar_path(csv_path)
+    return target.with_name(f"{target.name}.tmp_{uuid.uuid4().hex[:8]}")
+
+
+def _publish_sidecar(staging_dir: Path, csv_path: Path) -> Path:
+    """조립된 .npy 디렉토리에 meta.json을 쓰고 사이드카 위치로 rename"""
+    target = dataset_sidecar_path(csv_path)
+    meta = {"format_version": SIDECAR_FORMAT_VERSION, **_csv_signature(csv_path)}
+    with open(staging_dir / _SIDECAR_META, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    if target.exists():
+        shutil.rmtree(target, ignore_errors=True)
+    staging_dir.rename(target)
+    return target
+
+
+class DatasetSidecarBuilder:
+    """
+    봉 조각을 디스크에 이어 쓰고 마지막에 사이드카로 조립 (스트리밍 업로드용)
+
+    전체 배열을 메모리에 두지 않도록 컬럼별 원시 파일에 append한 뒤,
+    finish()에서 memmap으로 .npy 파일(BarArray.save 레이아웃)에 옮겨 담습니다.
+    """
+
+    _COLUMNS = ('timestamps', *OHLCV_COLUMNS, 'direction')
+    _COPY_CHUNK = 1 << 20
+
+    def __init__(self, work_dir: str | Path):
+        """
+        Args:
+            work_dir: 원시 컬럼 파일을 둘 작업 디렉토리 (finish / abort 후 삭제)
+        """
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._files = {name: open(self.work_dir / f"{name}.raw", "wb") for name in self._COLUMNS}
+
+    def append(self, bars: BarArray) -> None:
+        """봉 조각 추가 (timestamp 오름차순으로 이어져야 함, 호출부 보장)"""
+        self._files['timestamps'].write(np.ascontiguousarray(bars.timestamps, dtype=np.int64).tobytes())
+        for row, name in enumerate(OHLCV_COLUMNS):
+            self._files[name].write(np.ascontiguousarray(bars.ohlcv[row]).tobytes())
+        self._files['direction'].write(np.ascontiguousarray(bars.direction, dtype=np.int8).tobytes())
+        self.count += len(bars)
+
+    def finish(self, file_path: str | Path) -> Path:
+        """
+        사이드카 조립 후 CSV 옆에 배치
+
+        Args:
+            file_path: 최종 데이터셋 CSV 경로 (크기 / 수정 시각을 meta.json에 기록)
+
+        Returns:
+            Path: 사이드카 디렉토리
+        """
+        self._close_files()
+        csv_path = Path(file_path)
+        staging_dir = _sidecar_staging_dir(csv_path)
+        staging_dir.mkdir(parents=True)
+        try:
+            n = self.count
+            self._copy_columns(staging_dir / "timestamps.npy", ['timestamps'], np.int64, (n,))
+            self._copy_columns(staging_dir / "ohlcv.npy", list(OHLCV_COLUMNS), np.float64, (5, n))
+            self._copy_columns(staging_dir / "direction.npy", ['direction'], np.int8, (n,))
+            return _publish_sidecar(staging_dir, csv_path)
+        finally:
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        """작업 디렉토리 정리 (사이드카를 만들지 않음)"""
+        self._close_files()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _close_files(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+    def _copy_columns(self, target: Path, names: List[str], dtype, shape: Tuple[int, ...]) -> None:
+        """원시 컬럼 파일 → .npy (청크 단위 복사, 여러 컬럼이면 행으로 배치)"""
+        out = np.lib.format.open_memmap(target, mode='w+', dtype=dtype, shape=shape)
+        rows = out.reshape(len(names), -1)
+        for row, name in enumerate(names):
+            raw = np.memmap(self.work_dir / f"{name}.raw", dtype=dtype, mode='r', shape=(self.count,))
+            for start in range(0, self.count, self._COPY_CHUNK):
+                rows[row, start:start + self._COPY_CHUNK] = raw[start:start + self._COPY_CHUNK]
+            del raw
+        out.flush()
+        del out
+
+
+def remove_dataset_sidecar(file_path: str | Path) -> None:
+    """데이터셋 삭제 시 사이드카 디렉토리 제거 (없으면 무시)"""
+    shutil.rmtree(dataset_sidecar_path(file_path), ignore_errors=True)
+
+
+def _open_sidecar(csv_path: Path) -> Optional[BarArray]:
+    """유효한 사이드카가 있으면 memmap BarArray, 없거나 CSV와 맞지 않으면 None"""
+    sidecar = dataset_sidecar_path(csv_path)
+    try:
+        with open(sidecar / _SIDECAR_META, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format_version") != SIDECAR_FORMAT_VERSION:
+        return None
+    signature = _csv_signature(csv_path)
+    if any(meta.get(key) != value for key, value in signature.items()):
+        return None
+    try:
+        return BarArray.load(sidecar, mmap=True)
+    except (OSError, ValueError) as e:
+        logger.warning(f"데이터셋 사이드카 로드 실패, CSV로 대체: {sidecar}: {e}")
+        return None
+
+
+def load_dataset_bars(
+    file_path: str,
+    include_df: bool = False
+) -> Tuple[BarArray, pd.DataFrame | Dict[str, Any]]:
+    """
+    데이터셋 봉 로드 (사이드카 우선, 없으면 CSV 파싱 후 사이드카 백필)
+
+    load_bars_from_csv와 반환 형식이 같으며, 사이드카가 있으면 배열을
+    읽기 전용 memmap으로 열어 CSV 파싱을 생략합니다. 사이드카가 없거나
+    CSV가 바뀐 경우(크기 / 수정 시각 불일치) CSV를 읽고 사이드카를 다시 씁니다.
+    ALGOFORGE_DATASET_SIDECAR=0이면 항상 CSV를 읽습니다.
+
+    Args:
+        file_path: 데이터셋 CSV 경로
+        include_df: True면 DataFrame도 반환
+
+    Returns:
+        include_df=True  -> (BarArray, DataFrame, 메타데이터)
+        include_df=False -> (BarArray, 메타데이터)
+
+    Raises:
+        FileNotFoundError: CSV 파일이 존재하지 않는 경우
+        ValueError: CSV 형식이 잘못된 경우
+    """
+    if not sidecar_enabled():
+        return load_bars_from_csv(file_path, include_df=include_df)
+
+    csv_path = Path(file_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {file_path}")
+
+    bars = _open_sidecar(csv_path)
+    if bars is None:
+        bars, _ = load_bars_from_csv(file_path)
+        try:
+            write_dataset_sidecar(bars, csv_path)
+        except OSError as e:
+            # 사이드카는 캐시일 뿐이므로 쓰기 실패는 로드를 막지 않음
+            logger.warning(f"데이터셋 사이드카 저장 실패: {csv_path}: {e}")
+
+    metadata = {
+        'bars_count': len(bars),
+        'start_timestamp': int(bars.timestamps[0]),
+        'end_timestamp': int(bars.timestamps[-1]),
+    }
+    if include_df:
+        return bars, bars.to_dataframe(), metadata
+    return bars, metadata
+
+
+def validate_bars(bars: List[Bar] | BarArray) -> Tuple[bool, List[str]]:
     """
     봉 데이터 검증
     
@@ -182,7 +791,7 @@ def validate_bars(bars: List[Bar]) -> Tuple[bool, List[str]]:
     - OHLC 관계 유효성 (Bar 모델에서 검증됨)
     
     Args:
-        bars: 봉 데이터 리스트
+        bars: 봉 데이터 리스트 또는 BarArray
         
     Returns:
         Tuple[bool, List[str]]: (검증 성공 여부, 오류 메시지 리스트)
@@ -193,19 +802,21 @@ def validate_bars(bars: List[Bar]) -> Tuple[bool, List[str]]:
         errors.append("봉 데이터가 비어있습니다")
         return False, errors
     
-    # timestamp 오름차순 정렬 확인
-    for i in range(len(bars) - 1):
-        if bars[i].timestamp >= bars[i + 1].timestamp:
-            errors.append(
-                f"timestamp가 오름차순으로 정렬되지 않았습니다 "
-                f"(index {i}: {bars[i].timestamp} >= "
-                f"index {i+1}: {bars[i+1].timestamp})"
-            )
+    if isinstance(bars, BarArray):
+        timestamps = bars.timestamps
+    else:
+        timestamps = np.fromiter((bar.timestamp for bar in bars), dtype=np.int64, count=len(bars))
+    
+    # timestamp 오름차순 정렬 확인 (위반 위치만 추출)
+    for i in np.flatnonzero(timestamps[:-1] >= timestamps[1:]).tolist():
+        errors.append(
+            f"timestamp가 오름차순으로 정렬되지 않았습니다 "
+            f"(index {i}: {int(timestamps[i])} >= "
+            f"index {i+1}: {int(timestamps[i + 1])})"
+        )
     
     # timestamp 중복 확인
-    timestamps = [bar.timestamp for bar in bars]
-    unique_timestamps = set(timestamps)
-    if len(timestamps) != len(unique_timestamps):
+    if np.unique(timestamps).size != len(timestamps):
         errors.append("중복된 timestamp가 있습니다")
     
     return len(errors) == 0, errors
@@ -17,10 +17,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
 
-from apps.api.routers import datasets, strategies, runs, indicators, presets
+from apps.api.routers import datasets, strategies, runs, indicators, presets, sweeps
 from apps.api.utils.exceptions import AlgoForgeException
 from apps.api.utils.responses import error_response
 from apps.api.db.database import get_database
+from apps.api.run_executor import start_run_executor, stop_run_executor
 
 # 로거 설정
 logging.basicConfig(level=logging.INFO)
@@ -43,6 +44,7 @@ async def startup_event():
     API 서버 시작 시 초기화 작업
     - 데이터베이스 초기화
     - 필요한 디렉토리 생성
+    - Run 실행기(워커 프로세스 풀) 시작
     """
     logger.info("Initializing AlgoForge API...")
     
@@ -59,8 +61,21 @@ async def startup_event():
     datasets_dir.mkdir(exist_ok=True)
     logger.info(f"Datasets directory ready: {datasets_dir.absolute()}")
     
+    # Run 실행기 시작 (ALGOFORGE_RUN_WORKERS=0이면 BackgroundTasks 사용)
+    # 여러 워커 프로세스 중 리더 잠금을 잡은 하나만 실행기를 실행하고 나머지는 대기
+    start_run_executor(db.db_path)
+    
     logger.info("AlgoForge API initialization completed")
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    API 서버 종료 시 정리 작업
+    - Run 실행기 종료 (대기 중 Run은 PENDING으로 남아 다음 시작 시 재개)
+    """
+    stop_run_executor()
+
 # CORS 설정 (프론트엔드 연동용)
 app.add_middleware(
     CORSMiddleware,
@@ -135,6 +150,12 @@ app.include_router(
     tags=["presets"]
 )
 
+app.include_router(
+    sweeps.router,
+    prefix="/api/sweeps",
+    tags=["sweeps"]
+)
+
 
 # 루트 엔드포인트
 @app.get("/")
@@ -6,6 +6,7 @@ Dataset API Router
 
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -16,11 +17,23 @@ import uuid
 from pathlib import Path
 
 from apps.api.db.database import get_database
-from apps.api.db.repositories import DatasetRepository
-from apps.api.db.utils import load_bars_from_csv, calculate_dataset_hash, validate_bars
+from apps.api.db.repositories import DatasetRepository, DatasetIngestJobRepository
+from apps.api.db.utils import (
+    load_bars_from_csv,
+    calculate_dataset_hash,
+    validate_bars,
+    write_dataset_sidecar,
+    remove_dataset_sidecar,
+)
+from apps.api.db.dataset_ingest import BarValidationError, CsvDatasetIngestor
 from apps.api.schemas import DatasetCreate, DatasetResponse, DatasetList
 from apps.api.schemas.dataset import BinanceFetchRequest
-from apps.api.utils.exceptions import DatasetNotFoundError, InvalidDataError, DuplicateDataError
+from apps.api.utils.exceptions import (
+    AlgoForgeException,
+    DatasetNotFoundError,
+    InvalidDataError,
+    DuplicateDataError
+)
 from engine.data.binance.merger import fetch_binance_to_csv
 
 router = APIRouter()
@@ -30,6 +43,9 @@ logger = logging.getLogger(__name__)
 DATASET_DIR = Path("datasets")
 DATASET_DIR.mkdir(exist_ok=True)
 
+# 업로드 스트림을 읽는 단위 (파싱은 CsvDatasetIngestor의 배치 단위)
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
 # 바이낸스 아카이브 ZIP 캐시
 BINANCE_CACHE_DIR = Path("datasets/.binance_cache")
 BINANCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -38,9 +54,23 @@ BINANCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 # job_id -> {"status": "PENDING|RUNNING|COMPLETED|FAILED", "dataset_id": int?, "error": str?, "started_at": int, ...}
 _BINANCE_JOBS: Dict[str, Dict[str, Any]] = {}
 
+# 업로드 수집 작업 상태는 dataset_ingest_jobs 테이블에 저장 (어느 uvicorn 워커에서도 조회 가능)
+# 진행률 기록 최소 간격 (초) - 청크마다 DB에 쓰지 않도록
+INGEST_PROGRESS_INTERVAL_SECONDS = 0.5
+# 끝난 수집 작업 보관 기간 (초) - 새 작업 생성 시 이보다 오래된 작업 정리
+INGEST_JOB_RETENTION_SECONDS = 24 * 60 * 60
+
 _KST = ZoneInfo("Asia/Seoul")
 
 
+def _write_sidecar(bars, final_file_path: Path) -> None:
+    """등록 직후 바이너리 사이드카 생성 (실패해도 첫 Run 로드 시 다시 생성되므로 경고만)"""
+    try:
+        write_dataset_sidecar(bars, final_file_path)
+    except OSError as e:
+        logger.warning(f"데이터셋 사이드카 생성 실패: {final_file_path}: {e}")
+
+
 @router.post("", response_model=DatasetResponse, status_code=201)
 async def create_dataset(
     file: UploadFile = File(..., description="CSV 파일 (dt,do,dh,dl,dc,dv,dd)"),
@@ -76,70 +106,73 @@ async def create_dataset(
         if not file.filename.endswith('.csv'):
             raise InvalidDataError("CSV 파일만 업로드 가능합니다", {"filename": file.filename})
         
-        # 임시 파일로 저장
+        # 임시 파일로 스트리밍 저장 (청크마다 파싱 / 해시를 증분 처리, 메모리 사용량 일정)
         temp_file_path = DATASET_DIR / f"temp_{int(time.time())}_{file.filename}"
         logger.info(f"Saving file to: {temp_file_path}")
         
-        # 파일 저장
-        contents = await file.read()
-        if len(contents) == 0:
-            raise InvalidDataError("업로드된 파일이 비어있습니다")
-        
-        logger.info(f"File size: {len(contents)} bytes")
-        
-        with open(temp_file_path, "wb") as f:
-            f.write(contents)
-        
-        # CSV 파일 로드 및 검증
+        ingestor = CsvDatasetIngestor(temp_file_path)
         try:
-            # DF 반환이 필요하므로 include_df=True
-            bars, df, metadata = load_bars_from_csv(str(temp_file_path), include_df=True)
-        except Exception as e:
-            # 임시 파일 삭제
-            temp_file_path.unlink()
-            raise InvalidDataError(f"CSV 파일 로드 실패: {str(e)}")
-        
-        # 봉 데이터 검증
-        is_valid, errors = validate_bars(bars)
-        if not is_valid:
-            # 임시 파일 삭제
-            temp_file_path.unlink()
-            raise InvalidDataError(
-                "봉 데이터 검증 실패",
-                {"errors": errors}
-            )
-        
-        # 해시 계산
-        dataset_hash = calculate_dataset_hash(bars)
-        
-        # 데이터베이스 저장
-        db = get_database()
-        repo = DatasetRepository(db)
-        
-        # 중복 체크
-        existing = repo.get_by_hash(dataset_hash)
-        if existing:
+            try:
+                while True:
+                    chunk = await file.read(UPLOAD_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    await run_in_threadpool(ingestor.feed, chunk)
+                
+                if ingestor.bytes_received == 0:
+                    raise InvalidDataError("업로드된 파일이 비어있습니다")
+                
+                logger.info(f"File size: {ingestor.bytes_received} bytes")
+                
+                # CSV 파일 로드 및 검증 (남은 행 처리 + 해시 확정)
+                result = await run_in_threadpool(ingestor.finish)
+            except InvalidDataError:
+                raise
+            except BarValidationError as e:
+                raise InvalidDataError(
+                    "봉 데이터 검증 실패",
+                    {"errors": e.errors}
+                )
+            except Exception as e:
+                raise InvalidDataError(f"CSV 파일 로드 실패: {str(e)}")
+            
+            dataset_hash = result.dataset_hash
+            
+            # 데이터베이스 저장
+            db = get_database()
+            repo = DatasetRepository(db)
+            
+            # 중복 체크
+            existing = repo.get_by_hash(dataset_hash)
+            if existing:
+                raise DuplicateDataError(
+                    "동일한 데이터셋이 이미 존재합니다",
+                    {"existing_dataset_id": existing["dataset_id"]}
+                )
+        except Exception:
             # 임시 파일 삭제
-            temp_file_path.unlink()
-            raise DuplicateDataError(
-                "동일한 데이터셋이 이미 존재합니다",
-                {"existing_dataset_id": existing["dataset_id"]}
-            )
+            ingestor.abort()
+            raise
         
         # 최종 파일명 결정
         final_file_path = DATASET_DIR / f"{dataset_hash}.csv"
         
-        # 파일 이동
+        # 파일 이동 + 바이너리 사이드카 (Run 실행 시 CSV 파싱 생략)
         temp_file_path.rename(final_file_path)
+        try:
+            await run_in_threadpool(ingestor.write_sidecar, final_file_path)
+        except OSError as e:
+            ingestor.abort()
+            logger.warning(f"데이터셋 사이드카 생성 실패: {final_file_path}: {e}")
         
         # 데이터베이스에 저장
         dataset_id = repo.create(
             name=name,
             dataset_hash=dataset_hash,
             file_path=str(final_file_path),
-            bars_count=metadata["bars_count"],
-            start_timestamp=metadata["start_timestamp"],
-            end_timestamp=metadata["end_timestamp"],
+            bars_count=result.bars_count,
+            start_timestamp=result.start_timestamp,
+            end_timestamp=result.end_timestamp,
             description=description,
             timeframe=timeframe
         )
@@ -280,10 +313,11 @@ async def delete_dataset(dataset_id: int):
         if not dataset:
             raise DatasetNotFoundError(dataset_id)
         
-        # 파일 삭제
+        # 파일 삭제 (바이너리 사이드카 포함)
         file_path = Path(dataset["file_path"])
         if file_path.exists():
             file_path.unlink()
+        remove_dataset_sidecar(file_path)
         
         # 데이터베이스에서 삭제
         repo.delete(dataset_id)
@@ -299,6 +333,184 @@ async def delete_dataset(dataset_id: int):
         raise HTTPException(status_code=500, detail=f"데이터셋 삭제 실패: {str(e)}")
 
 
+# ---------------------------------------------------------------------------
+# 업로드 수집 (비동기)
+# ---------------------------------------------------------------------------
+
+def _run_ingest_job(
+    job_id: str,
+    temp_file_path: Path,
+    name: str,
+    description: Optional[str],
+    timeframe: str,
+) -> None:
+    """백그라운드에서 업로드된 CSV를 파싱·검증·해시하고 사이드카와 함께 dataset으로 등록."""
+    jobs = DatasetIngestJobRepository(get_database())
+    jobs.update(job_id, status="RUNNING", progress_message="CSV 파싱 중...")
+    ingestor: Optional[CsvDatasetIngestor] = None
+    bytes_total = jobs.get_by_id(job_id)["bytes_total"]
+    started = time.time()
+    last_progress_at = 0.0
+    try:
+        ingestor = CsvDatasetIngestor(temp_file_path, write_file=False)
+        try:
+            with open(temp_file_path, "rb") as f:
+                while True:
+                    chunk = f.read(UPLOAD_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    ingestor.feed(chunk)
+
+                    now = time.time()
+                    if now - last_progress_at < INGEST_PROGRESS_INTERVAL_SECONDS:
+                        continue
+                    last_progress_at = now
+                    elapsed = now - started
+                    processed = ingestor.bytes_received
+                    progress: Dict[str, Any] = {
+                        "bytes_processed": processed,
+                        "rows_processed": ingestor.rows_parsed,
+                    }
+                    if elapsed > 0 and processed < bytes_total:
+                        progress["eta_seconds"] = round(elapsed / processed * (bytes_total - processed), 1)
+                    jobs.update(job_id, **progress)
+
+            if not ingestor.streaming:
+                # 정렬되지 않은 CSV 등은 전체 로드 (기존 업로드와 동일한 검증)
+                jobs.update(job_id, progress_message="봉 데이터 검증 중 (전체 로드)...")
+            result = ingestor.finish()
+        except BarValidationError as e:
+            raise ValueError(f"봉 데이터 검증 실패: {e.errors}")
+        except ValueError as e:
+            raise ValueError(f"CSV 파일 로드 실패: {e}")
+        jobs.update(
+            job_id,
+            bytes_processed=ingestor.bytes_received,
+            rows_processed=result.bars_count,
+            eta_seconds=0.0
+        )
+
+        db = get_database()
+        repo = DatasetRepository(db)
+        existing = repo.get_by_hash(result.dataset_hash)
+        if existing:
+            # POST /datasets와 같이 중복 업로드는 실패 (409)
+            raise DuplicateDataError(
+                "동일한 데이터셋이 이미 존재합니다",
+                {"existing_dataset_id": existing["dataset_id"]}
+            )
+
+        # 파일 이동 + 바이너리 사이드카 (첫 Run부터 CSV 파싱 생략)
+        jobs.update(job_id, progress_message="데이터셋 저장 중...")
+        final_file_path = DATASET_DIR / f"{result.dataset_hash}.csv"
+        temp_file_path.rename(final_file_path)
+        try:
+            try:
+                ingestor.write_sidecar(final_file_path)
+            except OSError as e:
+                ingestor.abort()
+                logger.warning(f"데이터셋 사이드카 생성 실패: {final_file_path}: {e}")
+
+            dataset_id = repo.create(
+                name=name,
+                dataset_hash=result.dataset_hash,
+                file_path=str(final_file_path),
+                bars_count=result.bars_count,
+                start_timestamp=result.start_timestamp,
+                end_timestamp=result.end_timestamp,
+                description=description,
+                timeframe=timeframe
+            )
+        except Exception:
+            # 등록 실패: 이동한 CSV / 사이드카 정리
+            # (같은 데이터를 동시에 올린 다른 요청이 먼저 등록했다면 그 파일이므로 유지)
+            if repo.get_by_hash(result.dataset_hash) is None:
+                final_file_path.unlink(missing_ok=True)
+                remove_dataset_sidecar(final_file_path)
+            raise
+
+        jobs.update(
+            job_id,
+            status="COMPLETED",
+            dataset_id=dataset_id,
+            bars_count=result.bars_count,
+            progress_message=f"완료 ({result.bars_count:,}봉)"
+        )
+        logger.info(f"[ingest {job_id}] 완료 → dataset_id={dataset_id}, bars={result.bars_count}")
+
+    except Exception as e:
+        if isinstance(e, AlgoForgeException):
+            logger.warning(f"[ingest {job_id}] 실패: {e.message}")
+            failure = {"error": e.message, "status_code": e.status_code, "details": e.details}
+        else:
+            logger.error(f"[ingest {job_id}] 실패: {e}", exc_info=True)
+            failure = {"error": str(e), "status_code": 400 if isinstance(e, ValueError) else 500}
+        jobs.update(job_id, status="FAILED", **failure)
+        if ingestor is not None:
+            ingestor.abort()
+        else:
+            temp_file_path.unlink(missing_ok=True)
+    finally:
+        jobs.update(job_id, elapsed_seconds=round(time.time() - started, 3))
+
+
+@router.post("/ingest", status_code=202)
+async def create_dataset_ingest_job(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="CSV 파일 (dt,do,dh,dl,dc,dv,dd)"),
+    name: str = Form(..., description="데이터셋 이름"),
+    description: Optional[str] = Form(None, description="데이터셋 설명"),
+    timeframe: str = Form(default="5m", description="타임프레임")
+):
+    """데이터셋 업로드 후 파싱·검증·해시·사이드카 생성을 백그라운드에서 처리 (비동기).
+
+    요청은 파일을 디스크에 저장하는 즉시 반환되므로 대용량 업로드도 프록시 타임아웃에 걸리지 않습니다.
+    응답의 job_id로 `GET /datasets/ingest/jobs/{job_id}` 폴링하여 진행(bytes/rows/ETA)과
+    최종 dataset_id 확인. CSV 형식은 `POST /datasets`와 동일합니다.
+    """
+    if not file.filename:
+        raise InvalidDataError("파일명이 없습니다")
+    if not file.filename.endswith('.csv'):
+        raise InvalidDataError("CSV 파일만 업로드 가능합니다", {"filename": file.filename})
+
+    job_id = uuid.uuid4().hex[:12]
+    temp_file_path = DATASET_DIR / f"temp_ingest_{int(time.time())}_{job_id}.csv"
+    bytes_total = 0
+    try:
+        with open(temp_file_path, "wb") as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                await run_in_threadpool(f.write, chunk)
+                bytes_total += len(chunk)
+    except Exception:
+        temp_file_path.unlink(missing_ok=True)
+        raise
+    if bytes_total == 0:
+        temp_file_path.unlink(missing_ok=True)
+        raise InvalidDataError("업로드된 파일이 비어있습니다")
+
+    jobs = DatasetIngestJobRepository(get_database())
+    started_at = int(time.time())
+    jobs.delete_finished_before(started_at - INGEST_JOB_RETENTION_SECONDS)
+    jobs.create(job_id, name, file.filename, bytes_total, started_at)
+    background_tasks.add_task(_run_ingest_job, job_id, temp_file_path, name, description, timeframe)
+    return {"job_id": job_id, "status": "PENDING", "bytes_total": bytes_total}
+
+
+@router.get("/ingest/jobs/{job_id}")
+async def get_dataset_ingest_job(job_id: str):
+    """업로드 수집 작업 상태 조회.
+
+    끝난 작업은 INGEST_JOB_RETENTION_SECONDS 동안만 보관됩니다 (이후 404).
+    """
+    job = DatasetIngestJobRepository(get_database()).get_by_id(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"job_id 없음: {job_id}")
+    return job
+
+
 # ---------------------------------------------------------------------------
 # 바이낸스 자동 수집
 # ---------------------------------------------------------------------------
@@ -371,6 +583,7 @@ def _run_binance_fetch_job(
         job["progress_message"] = "데이터셋 저장 중..."
         final_file_path = DATASET_DIR / f"{dataset_hash}.csv"
         temp_file_path.rename(final_file_path)
+        _write_sidecar(bars, final_file_path)
 
         auto_name = req.name or (
             f"{req.symbol}_{req.market_type}_{req.timeframe}_"
@@ -25,6 +25,7 @@ from apps.api.utils.code_validator import (
 )
 from apps.api.utils.responses import success_response, error_response
 from apps.api.utils.chart_utils import generate_color_from_field
+from engine.utils.indicator_loader import invalidate_custom_indicator
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -246,6 +247,7 @@ def register_custom_indicator(indicator: CustomIndicatorCreate):
             logger.warning(f"저장된 chart_config를 찾을 수 없음: {indicator.type}")
     
     logger.info(f"커스텀 지표 등록 완료: {indicator.type} (ID: {indicator_id})")
+    invalidate_custom_indicator(indicator.type)
     
     # 5. 등록된 지표 반환
     return get_indicator(indicator.type)
@@ -377,6 +379,7 @@ def update_custom_indicator(indicator_type: str, update_data: CustomIndicatorUpd
         conn.commit()
     
     logger.info(f"커스텀 지표 수정 완료: {indicator_type}")
+    invalidate_custom_indicator(indicator_type)
     
     # 5. 수정된 지표 반환
     return get_indicator(indicator_type)
@@ -427,6 +430,7 @@ def delete_custom_indicator(indicator_type: str):
         conn.commit()
     
     logger.info(f"커스텀 지표 삭제 완료: {indicator_type}")
+    invalidate_custom_indicator(indicator_type)
 
 
 @router.post("/validate", response_model=IndicatorValidationResult)
@@ -11,9 +11,11 @@ import time
 import traceback
 import json
 import os
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional
 
-from apps.api.db.database import get_database
+from apps.api.db.database import Database, get_database
 from apps.api.db.repositories import (
     RunRepository,
     RunDatasetRepository,
@@ -22,13 +24,23 @@ from apps.api.db.repositories import (
     TradeRepository,
     TradeLegRepository,
     MetricsRepository,
-    PresetRepository
+    PresetRepository,
+    LeverageBracketRepository
+)
+from apps.api.db.utils import (
+    load_dataset_bars,
+    calculate_leverage_table_hash,
+    calculate_run_cache_key
 )
-from apps.api.db.utils import load_bars_from_csv
 from apps.api.schemas import (
     RunCreate,
     RunResponse,
     RunList,
+    RunQueueResponse,
+    RunRepriceRequest,
+    RunRepriceResponse,
+    RepriceResult,
+    RunProfileResponse,
     TradeResponse,
     TradeList,
     TradeLegResponse,
@@ -36,27 +48,260 @@ from apps.api.schemas import (
 )
 from apps.api.schemas.trade import ChartDataResponse, BarData
 from apps.api.utils.exceptions import RunNotFoundError, DatasetNotFoundError, StrategyNotFoundError, CancellationRequested
+from apps.api.run_executor import (
+    get_executor_max_workers,
+    get_run_executor,
+    run_executor_enabled,
+)
 
 from engine.core.backtest_engine import BacktestEngine
 from engine.core.metrics_calculator import MetricsCalculator
+from engine.core.repricer import reprice_trades
+from engine.utils.indicator_cache import PersistentIndicatorCache
+from engine.utils.indicator_chunking import ChunkingOptions
+from engine.utils.indicator_loader import calculate_code_hash
+from engine.utils.indicators import BUILTIN_INDICATOR_TYPES
+from engine.utils.leverage_loader import load_leverage_brackets_from_db
+from engine.utils.profiling import RunProfiler, span_of
 from engine.utils.strategy_parser import StrategyParser
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 # 엔진 버전
-ENGINE_VERSION = "1.0.0"
+ENGINE_VERSION = "1.1.0"
+
+# 디스크 지표 캐시 (datasets 디렉토리 아래, 크기 상한은 MB 단위 환경변수, 0이면 비활성화)
+INDICATOR_CACHE_DIR = Path("datasets") / ".indicator_cache"
+INDICATOR_CACHE_MB_ENV = "ALGOFORGE_INDICATOR_CACHE_MB"
+DEFAULT_INDICATOR_CACHE_MB = 1024
+
+
+def _open_indicator_cache(dataset_hashes: dict) -> Optional[PersistentIndicatorCache]:
+    """
+    디스크 지표 캐시 생성
+
+    Args:
+        dataset_hashes: 타임프레임 role → dataset_hash ({'base': ..., '1h': ...})
+
+    Returns:
+        Optional[PersistentIndicatorCache]: 비활성화되어 있으면 None
+    """
+    raw = os.getenv(INDICATOR_CACHE_MB_ENV)
+    max_mb = DEFAULT_INDICATOR_CACHE_MB
+    if raw is not None and raw.strip() != "":
+        try:
+            max_mb = int(raw)
+        except ValueError:
+            logger.warning(f"{INDICATOR_CACHE_MB_ENV}는 정수여야 합니다: {raw!r} (기본값 사용)")
+    if max_mb <= 0:
+        return None
+    return PersistentIndicatorCache(
+        INDICATOR_CACHE_DIR,
+        dataset_hashes,
+        max_bytes=max_mb * 1024 * 1024
+    )
+
+
+def _indicator_chunking() -> Optional[ChunkingOptions]:
+    """
+    내장 지표 청크 병렬 계산 설정 (ALGOFORGE_INDICATOR_CHUNKS 등 환경변수)
+
+    Returns:
+        Optional[ChunkingOptions]: 비활성화되어 있거나 설정이 잘못되면 None
+    """
+    try:
+        return ChunkingOptions.from_env()
+    except ValueError as e:
+        logger.warning(f"지표 청크 계산 설정 오류, 순차 계산합니다: {e}")
+        return None
+
+
+def _complete_from_cache(
+    db,
+    run: dict,
+    dataset: dict,
+    strategy: dict,
+    preset: dict,
+    role_to_dataset: dict,
+    profiler: Optional[RunProfiler] = None
+) -> bool:
+    """
+    결과 캐시 조회 및 복제
+
+    캐시 키(데이터셋 해시 + 전략 해시 + 프리셋 + 레버리지 테이블 + 엔진 버전)를
+    Run에 기록하고, 같은 키의 COMPLETED Run이 있으면 trades / legs / metrics를
+    복제한 뒤 COMPLETED로 변경합니다.
+
+    Args:
+        db: Database 인스턴스
+        run: Run 정보
+        dataset: 베이스 데이터셋 정보
+        strategy: 전략 정보
+        preset: 프리셋 정보 (리스크 파라미터)
+        role_to_dataset: role → dataset_id 매핑 (run_datasets)
+        profiler: 단계별 소요 시간 기록기 (선택, 적중 시 run_artifacts["profile"]에 기록)
+
+    Returns:
+        bool: 캐시로 완료했으면 True, 백테스트를 실행해야 하면 False
+
+    Note:
+        캐시 처리 중 오류(예: migration 012 미적용 DB)는 경고만 남기고
+        일반 실행으로 진행합니다.
+    """
+    run_id = run["run_id"]
+    try:
+        with span_of(profiler, "cache_lookup"):
+            source_run = _find_cached_run(db, run, dataset, strategy, preset, role_to_dataset)
+        if not source_run:
+            return False
+
+        run_repo = RunRepository(db)
+        with span_of(profiler, "clone_results"):
+            trades_count = run_repo.clone_results(source_run["run_id"], run_id)
+        if source_run.get("total_bars"):
+            run_repo.update_progress(run_id, source_run["total_bars"], source_run["total_bars"])
+        source_artifacts = source_run.get("run_artifacts") or {}
+        run_artifacts = {
+            "warnings": source_artifacts.get("warnings", []),
+            "trades_count": trades_count,
+            "cache_hit": True,
+            "cached_from_run_id": source_run["run_id"]
+        }
+        if profiler is not None:
+            run_artifacts["profile"] = profiler.to_dict()
+        run_repo.update_status(
+            run_id=run_id,
+            status="COMPLETED",
+            completed_at=int(time.time()),
+            run_artifacts=run_artifacts
+        )
+        logger.info(
+            f"Backtest served from cache: run_id={run_id}, "
+            f"source_run_id={source_run['run_id']}, trades={trades_count}"
+        )
+        return True
+
+    except Exception as e:
+        logger.warning(f"결과 캐시 처리 실패, 백테스트를 실행합니다 (run_id={run_id}): {str(e)}")
+        return False
+
 
+def _custom_indicator_hashes(db, definition: dict) -> dict:
+    """
+    전략이 참조하는 커스텀 지표 타입 → 코드 해시
+
+    PATCH /indicators/{type}로 코드가 바뀌어도 전략 해시는 그대로이므로
+    결과 캐시 키에 코드 해시를 포함합니다. (DB에 없는 타입은 None)
+
+    Returns:
+        dict: 커스텀 지표 타입 → SHA256 코드 해시
+    """
+    types = sorted({
+        indicator.get("type") for indicator in definition.get("indicators", [])
+        if indicator.get("type") not in BUILTIN_INDICATOR_TYPES
+    })
+    if not types:
+        return {}
+
+    rows = db.execute_query(
+        f"SELECT type, code FROM indicators WHERE implementation_type = 'custom' "
+        f"AND type IN ({', '.join('?' * len(types))})",
+        tuple(types)
+    )
+    hashes = {indicator_type: None for indicator_type in types}
+    for row in rows:
+        hashes[row["type"]] = calculate_code_hash(row["code"])
+    return hashes
+
+
+def _find_cached_run(
+    db,
+    run: dict,
+    dataset: dict,
+    strategy: dict,
+    preset: dict,
+    role_to_dataset: dict
+) -> Optional[dict]:
+    """
+    Run의 캐시 키를 기록하고 같은 키의 COMPLETED Run 조회
+
+    Returns:
+        Optional[dict]: 결과를 복제할 Run (없으면 None)
+    """
+    run_id = run["run_id"]
+    run_repo = RunRepository(db)
+    dataset_repo = DatasetRepository(db)
+
+    dataset_hashes = {"base": dataset["dataset_hash"]}
+    for role, ds_id in role_to_dataset.items():
+        if role == "base":
+            continue
+        htf_ds = dataset_repo.get_by_id(ds_id)
+        if not htf_ds:
+            # 실행 경로에서 FAILED 처리
+            return None
+        dataset_hashes[role] = htf_ds["dataset_hash"]
+
+    leverage_table_hash = calculate_leverage_table_hash(
+        LeverageBracketRepository(db).get_all()
+    )
+    # 청크 병렬 계산 지표는 순차 계산과 미세하게 다를 수 있으므로 결과 캐시를 분리
+    engine_version = run["engine_version"]
+    chunking = _indicator_chunking()
+    if chunking is not None:
+        engine_version = f"{engine_version}+{chunking.cache_tag}"
+    cache_key = calculate_run_cache_key(
+        dataset_hashes=dataset_hashes,
+        strategy_hash=strategy["strategy_hash"],
+        preset=preset,
+        initial_balance=float(run["initial_balance"]),
+        leverage_table_hash=leverage_table_hash,
+        engine_version=engine_version,
+        custom_indicator_hashes=_custom_indicator_hashes(db, strategy["definition"])
+    )
+    run_repo.set_cache_key(run_id, cache_key)
+
+    return run_repo.find_completed_by_cache_key(cache_key, exclude_run_id=run_id)
+
+
+def _schedule_run(run_id: int, background_tasks: BackgroundTasks) -> None:
+    """
+    PENDING Run 실행 예약
+
+    이 프로세스가 실행기 리더면 대기열 디스패치(워커 프로세스에서 실행),
+    다른 프로세스가 리더면 PENDING으로 두어 리더의 대기열 폴링에 맡기고,
+    실행기가 비활성화되어 있으면 기존처럼 Background Task로 실행합니다.
+
+    Args:
+        run_id: Run ID
+        background_tasks: FastAPI Background Tasks
+    """
+    executor = get_run_executor()
+    if executor is not None:
+        executor.dispatch()
+    elif not run_executor_enabled():
+        background_tasks.add_task(execute_backtest, run_id)
 
-def execute_backtest(run_id: int):
+
+def execute_backtest(run_id: int, db: Optional[Database] = None):
     """
-    백테스트 실행 (Background Task)
+    백테스트 실행 (Run 실행기 워커 또는 Background Task)
     
     Args:
         run_id: Run ID
+        db: Database 인스턴스 (None이면 get_database(), 워커 프로세스는 경로로 생성해 전달)
+    
+    Note:
+        PENDING → RUNNING 전환(claim)에 성공한 경우에만 실행합니다.
+        대기 중 취소되었거나 다른 워커가 이미 실행 중이면 아무것도 하지 않습니다.
+        
+        단계별 소요 시간과 카운터는 run_artifacts["profile"]에 기록됩니다.
+        (GET /api/runs/{run_id}/profile)
     """
+    profiler = RunProfiler()
     try:
-        db = get_database()
+        db = db or get_database()
         run_repo = RunRepository(db)
         run_dataset_repo = RunDatasetRepository(db)
         dataset_repo = DatasetRepository(db)
@@ -92,12 +337,10 @@ def execute_backtest(run_id: int):
                 'rebalance_interval': 50
             }
         
-        # 상태를 RUNNING으로 변경
-        run_repo.update_status(
-            run_id=run_id,
-            status="RUNNING",
-            started_at=int(time.time())
-        )
+        # 상태를 RUNNING으로 변경 (PENDING인 경우에만)
+        if not run_repo.claim_for_execution(run_id, started_at=int(time.time())):
+            logger.info(f"Run {run_id} is not pending (status={run['status']}), skipping")
+            return
         
         # Dataset 조회
         dataset = dataset_repo.get_by_id(run["dataset_id"])
@@ -123,12 +366,20 @@ def execute_backtest(run_id: int):
             )
             return
         
+        role_to_dataset = run_dataset_repo.get_for_run(run_id)
+
+        # 동일 입력의 완료된 Run이 있으면 결과를 복제하고 종료 (결정성 기반 캐시)
+        if _complete_from_cache(db, run, dataset, strategy, preset, role_to_dataset, profiler):
+            return
+
         # CSV 파일 로드 (DataFrame 포함)
-        bars, df, _ = load_bars_from_csv(dataset["file_path"], include_df=True)
+        with profiler.span("load_csv"):
+            bars, df, _ = load_dataset_bars(dataset["file_path"], include_df=True)
+        profiler.count("bars", len(bars))
 
         # 멀티 타임프레임(HTF) 데이터셋 로드 — run_datasets 정션 테이블에서 role별 조회
         htf_data = {}
-        role_to_dataset = run_dataset_repo.get_for_run(run_id)
+        dataset_hashes = {"base": dataset["dataset_hash"]}
         for role, ds_id in role_to_dataset.items():
             if role == "base":
                 continue
@@ -142,17 +393,27 @@ def execute_backtest(run_id: int):
                     run_artifacts={"error": f"HTF dataset not found (role={role}, id={ds_id})"}
                 )
                 return
-            htf_bars, htf_df, _ = load_bars_from_csv(htf_ds["file_path"], include_df=True)
+            with profiler.span("load_csv"):
+                htf_bars, htf_df, _ = load_dataset_bars(htf_ds["file_path"], include_df=True)
             htf_data[role] = (htf_bars, htf_df)
+            dataset_hashes[role] = htf_ds["dataset_hash"]
 
         # 전략 파서 생성 및 전략 함수 생성
         try:
+            indicator_cache = _open_indicator_cache(dataset_hashes)
             strategy_parser = StrategyParser(
                 strategy_definition=strategy["definition"],
                 bars=bars,
                 df=df,
-                htf_data=htf_data if htf_data else None
+                htf_data=htf_data if htf_data else None,
+                indicator_cache=indicator_cache,
+                profiler=profiler,
+                indicator_chunking=_indicator_chunking(),
+                dataset_hashes=dataset_hashes
             )
+            if indicator_cache is not None:
+                profiler.count("indicator_cache_hits", indicator_cache.hits)
+                profiler.count("indicator_cache_misses", indicator_cache.misses)
             strategy_func = strategy_parser.create_strategy_function()
             
             # 진출 조건 관련 설정 추출
@@ -167,6 +428,10 @@ def execute_backtest(run_id: int):
                 atr_trailing_config = strategy_parser.get_atr_trailing_config()
                 atr_value_getter = strategy_parser.get_atr_value
             
+            # 진입/진출 조건을 봉 루프 전에 배열로 컴파일
+            with profiler.span("signal_compile"):
+                compiled_signals = strategy_parser.compile_signals()
+            
         except Exception as e:
             logger.error(f"전략 파서 생성 실패: {str(e)}", exc_info=True)
             run_repo.update_status(
@@ -175,7 +440,8 @@ def execute_backtest(run_id: int):
                 completed_at=int(time.time()),
                 run_artifacts={
                     "error": f"전략 파서 생성 실패: {str(e)}",
-                    "traceback": traceback.format_exc()
+                    "traceback": traceback.format_exc(),
+                    "profile": profiler.to_dict()
                 }
             )
             return
@@ -202,6 +468,7 @@ def execute_backtest(run_id: int):
                 
                 # 진행률 업데이트
                 run_repo.update_progress(run_id, processed, total)
+                profiler.count("db_writes")
                 logger.debug(f"Progress updated: {run_id} - {processed}/{total} ({processed/total*100:.1f}%)")
             except CancellationRequested:
                 # 중지 예외는 다시 던짐
@@ -222,34 +489,52 @@ def execute_backtest(run_id: int):
             exit_checker=exit_checker,
             atr_trailing_config=atr_trailing_config,
             atr_value_getter=atr_value_getter,
-            timestamp_to_index=strategy_parser.timestamp_to_index
+            timestamp_to_index=strategy_parser.timestamp_to_index,
+            compiled_signals=compiled_signals
         )
         
-        trades = engine.run(bars)
+        with profiler.span("engine_run"):
+            trades = engine.run(bars)
+        profiler.count("processed_bars", engine.stats["processed_bars"])
+        profiler.count("strategy_func_calls", engine.stats["strategy_func_calls"])
+        profiler.count("compiled_signal_lookups", engine.stats["compiled_signal_lookups"])
+        profiler.count("get_value_calls", strategy_parser.get_value_call_count())
+        profiler.count("trades", len(trades))
         
         # Trades 및 TradeLeg 저장
-        for trade in trades:
-            # Trade 저장
-            db_trade_id = trade_repo.create_from_trade(run_id, trade)
-            
-            # TradeLeg 저장
-            for leg in trade.legs:
-                trade_leg_repo.create_from_trade_leg(db_trade_id, leg)
+        with profiler.span("persist_trades"):
+            for trade in trades:
+                # Trade 저장
+                db_trade_id = trade_repo.create_from_trade(run_id, trade)
+                
+                # TradeLeg 저장
+                for leg in trade.legs:
+                    trade_leg_repo.create_from_trade_leg(db_trade_id, leg)
+                
+                profiler.count("db_writes", 1 + len(trade.legs))
         
         # Metrics 계산 및 저장
-        calculator = MetricsCalculator()
-        metrics = calculator.calculate(trades)
-        metrics_repo.create_from_metrics(run_id, metrics)
+        with profiler.span("metrics"):
+            calculator = MetricsCalculator()
+            metrics = calculator.calculate(trades)
+            metrics_repo.create_from_metrics(run_id, metrics)
+        profiler.count("db_writes")
         
         # 상태를 COMPLETED로 변경
+        run_artifacts = {
+            "warnings": engine.warnings,
+            "trades_count": len(trades),
+            "profile": profiler.to_dict()
+        }
+        if strategy_parser.indicator_chunk_reports:
+            run_artifacts["indicator_chunking"] = [
+                report.to_dict() for report in strategy_parser.indicator_chunk_reports
+            ]
         run_repo.update_status(
             run_id=run_id,
             status="COMPLETED",
             completed_at=int(time.time()),
-            run_artifacts={
-                "warnings": engine.warnings,
-                "trades_count": len(trades)
-            }
+            run_artifacts=run_artifacts
         )
         
         logger.info(f"Backtest completed: run_id={run_id}, trades={len(trades)}")
@@ -264,7 +549,7 @@ def execute_backtest(run_id: int):
         
         # 상태를 FAILED로 변경
         try:
-            db = get_database()
+            db = db or get_database()
             run_repo = RunRepository(db)
             run_repo.update_status(
                 run_id=run_id,
@@ -272,7 +557,8 @@ def execute_backtest(run_id: int):
                 completed_at=int(time.time()),
                 run_artifacts={
                     "error": str(e),
-                    "traceback": traceback.format_exc()
+                    "traceback": traceback.format_exc(),
+                    "profile": profiler.to_dict()
                 }
             )
         except Exception as update_error:
@@ -350,7 +636,8 @@ async def create_run(run_create: RunCreate, background_tasks: BackgroundTasks):
             strategy_id=run_create.strategy_id,
             engine_version=ENGINE_VERSION,
             initial_balance=initial_balance,
-            preset_id=preset_id
+            preset_id=preset_id,
+            priority=run_create.priority
         )
 
         # 정션 테이블에 base + HTF 매핑 기록 (MTF 지원)
@@ -360,8 +647,8 @@ async def create_run(run_create: RunCreate, background_tasks: BackgroundTasks):
             htf_dataset_ids=htf_dataset_ids,
         )
 
-        # Background Task로 백테스트 실행
-        background_tasks.add_task(execute_backtest, run_id)
+        # 백테스트 실행 예약 (Run 실행기 대기열 또는 Background Task)
+        _schedule_run(run_id, background_tasks)
         
         # 생성된 Run 조회
         run = run_repo.get_by_id(run_id)
@@ -401,6 +688,34 @@ async def get_runs():
         raise HTTPException(status_code=500, detail=f"Run 목록 조회 실패: {str(e)}")
 
 
+@router.get("/queue", response_model=RunQueueResponse)
+async def get_run_queue():
+    """
+    Run 실행 대기열 조회
+    
+    Returns:
+        RunQueueResponse: 실행 중 / 대기 중 Run (대기 중은 실행 순서대로)
+    """
+    try:
+        db = get_database()
+        run_repo = RunRepository(db)
+        
+        running_ids = run_repo.get_ids_by_status("RUNNING")
+        running = [run_repo.get_by_id(run_id) for run_id in running_ids]
+        pending = run_repo.get_pending_queue()
+        
+        return RunQueueResponse(
+            executor_enabled=run_executor_enabled(),
+            max_workers=get_executor_max_workers(),
+            running=[RunResponse(**r) for r in running if r],
+            pending=[RunResponse(**r) for r in pending]
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get run queue: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Run 대기열 조회 실패: {str(e)}")
+
+
 @router.get("/{run_id}", response_model=RunResponse)
 async def get_run(run_id: int):
     """
@@ -516,6 +831,126 @@ async def get_run_metrics(run_id: int):
         raise HTTPException(status_code=500, detail=f"Metrics 조회 실패: {str(e)}")
 
 
+@router.get("/{run_id}/profile", response_model=RunProfileResponse)
+async def get_run_profile(run_id: int):
+    """
+    Run 실행 프로파일 조회
+    
+    단계별 소요 시간(CSV 로드, 커스텀 지표 로드, 지표 계산, 신호 컴파일, 봉 루프,
+    거래 저장, Metrics)과 카운터, bars/sec, 최대 RSS를 반환합니다.
+    
+    Args:
+        run_id: Run ID
+        
+    Returns:
+        RunProfileResponse: 실행 프로파일
+    """
+    try:
+        db = get_database()
+        run_repo = RunRepository(db)
+        
+        run = run_repo.get_by_id(run_id)
+        if not run:
+            raise RunNotFoundError(run_id)
+        
+        artifacts = run.get("run_artifacts") or {}
+        profile = artifacts.get("profile")
+        if not profile:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Run {run_id}의 프로파일이 없습니다 (상태: {run['status']})"
+            )
+        
+        return RunProfileResponse(
+            run_id=run_id,
+            status=run["status"],
+            engine_version=run["engine_version"],
+            cache_hit=bool(artifacts.get("cache_hit")),
+            **profile
+        )
+        
+    except RunNotFoundError:
+        raise
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get profile for run {run_id}: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"프로파일 조회 실패: {str(e)}")
+
+
+@router.post("/{run_id}/reprice", response_model=RunRepriceResponse)
+async def reprice_run(run_id: int, reprice_request: RunRepriceRequest):
+    """
+    완료된 Run을 다른 리스크 설정으로 재계산 (봉 루프 재실행 없음)
+    
+    risk_percent / rebalance_interval / initial_balance는 포지션 크기에만 영향을 주므로
+    저장된 거래 경로(진입·청산 시점과 가격)를 그대로 두고 포지션 크기, 레버리지,
+    PnL, Metrics만 다시 계산합니다. 결과는 저장하지 않습니다.
+    (TP1 가격을 바꾸는 risk_reward_ratio는 재계산 대상이 아님)
+    
+    Args:
+        run_id: Run ID
+        reprice_request: 비교할 설정 목록
+        
+    Returns:
+        RunRepriceResponse: 설정별 Metrics (잔고 소진 등 실패한 설정은 error)
+    """
+    try:
+        db = get_database()
+        run_repo = RunRepository(db)
+        
+        run = run_repo.get_by_id(run_id)
+        if not run:
+            raise RunNotFoundError(run_id)
+        
+        if run["status"] != "COMPLETED":
+            raise HTTPException(
+                status_code=400,
+                detail=f"완료된 Run만 재계산할 수 있습니다. 현재 상태: {run['status']}"
+            )
+        
+        trades = TradeRepository(db).load_trades(run_id)
+        
+        # 레버리지 구간은 엔진과 같은 방식으로 1회 로드 (실패 시 제약 없이 계산)
+        try:
+            leverage_brackets = load_leverage_brackets_from_db(db)
+        except Exception as e:
+            logger.warning(f"레버리지 테이블 로드 실패: {str(e)}. 레버리지 제약 없이 계산합니다.")
+            leverage_brackets = None
+        
+        calculator = MetricsCalculator()
+        results = []
+        for variant in reprice_request.variants:
+            initial_balance = variant.initial_balance or run["initial_balance"]
+            result = RepriceResult(
+                risk_percent=variant.risk_percent,
+                rebalance_interval=variant.rebalance_interval,
+                initial_balance=initial_balance
+            )
+            try:
+                repriced = reprice_trades(
+                    trades,
+                    initial_balance=initial_balance,
+                    risk_percent=variant.risk_percent,
+                    rebalance_interval=variant.rebalance_interval,
+                    leverage_brackets=leverage_brackets
+                )
+                result.metrics = asdict(calculator.calculate(repriced))
+            except ValueError as e:
+                result.error = str(e)
+            results.append(result)
+        
+        return RunRepriceResponse(run_id=run_id, trades_count=len(trades), results=results)
+        
+    except RunNotFoundError:
+        raise
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to reprice run {run_id}: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Run 재계산 실패: {str(e)}")
+
+
 @router.post("/{run_id}/rerun", response_model=RunResponse)
 async def rerun_run(run_id: int, background_tasks: BackgroundTasks):
     """
@@ -547,8 +982,8 @@ async def rerun_run(run_id: int, background_tasks: BackgroundTasks):
         # Run 결과 데이터 삭제 및 상태 초기화
         run_repo.reset_for_rerun(run_id)
         
-        # Background Task로 백테스트 실행
-        background_tasks.add_task(execute_backtest, run_id)
+        # 백테스트 실행 예약 (Run 실행기 대기열 또는 Background Task)
+        _schedule_run(run_id, background_tasks)
         
         # 초기화된 Run 조회
         run = run_repo.get_by_id(run_id)
@@ -586,21 +1021,23 @@ async def cancel_run(run_id: int):
         if not run:
             raise RunNotFoundError(run_id)
         
-        # RUNNING 상태가 아니면 중지 불가
-        if run["status"] != "RUNNING":
+        # 실행 중 또는 대기 중이 아니면 중지 불가
+        if run["status"] not in ("RUNNING", "PENDING"):
             raise HTTPException(
                 status_code=400,
                 detail=f"Run {run_id}는 실행 중이 아닙니다. 현재 상태: {run['status']}"
             )
         
         # 상태를 CANCELLED로 변경
+        # (RUNNING: 워커가 진행률 콜백에서 감지해 중단, PENDING: 대기열에서 제외)
         run_repo.update_status(
             run_id=run_id,
             status="CANCELLED",
             completed_at=int(time.time()),
             run_artifacts={
                 "cancelled_by_user": True,
-                "message": "사용자가 실행을 중지했습니다."
+                "message": "사용자가 실행을 중지했습니다." if run["status"] == "RUNNING"
+                           else "사용자가 대기 중인 실행을 취소했습니다."
             }
         )
         
@@ -702,24 +1139,23 @@ async def get_trade_chart_data(run_id: int, trade_id: int):
             raise HTTPException(status_code=404, detail=f"Strategy {run['strategy_id']}를 찾을 수 없습니다")
         
         # CSV 파일 로드
-        bars, df, _ = load_bars_from_csv(dataset["file_path"], include_df=True)
+        bars, df, _ = load_dataset_bars(dataset["file_path"], include_df=True)
         
-        # 전략 파서 생성 (지표 계산)
+        # 전략 파서 생성 (지표 계산, 디스크 지표 캐시 재사용)
+        # 차트에는 참조되지 않는 지표도 표시하므로 전체 계산
         strategy_parser = StrategyParser(
             strategy_definition=strategy["definition"],
             bars=bars,
-            df=df
+            df=df,
+            indicator_cache=_open_indicator_cache({"base": dataset["dataset_hash"]}),
+            prune_unreferenced_indicators=False,
+            indicator_chunking=_indicator_chunking()
         )
         
         # 진입 및 청산 시점의 인덱스 찾기
-        entry_idx = None
-        exit_idx = None
-        
-        for i, bar in enumerate(bars):
-            if bar.timestamp == trade["entry_timestamp"]:
-                entry_idx = i
-            if bar.timestamp == last_exit_timestamp:
-                exit_idx = i
+        # (timestamp는 유일하므로 파서의 timestamp → index 매핑 재사용)
+        entry_idx = strategy_parser.timestamp_to_index.get(trade["entry_timestamp"])
+        exit_idx = strategy_parser.timestamp_to_index.get(last_exit_timestamp)
         
         if entry_idx is None or exit_idx is None:
             raise HTTPException(
@@ -840,10 +1276,8 @@ async def get_trade_chart_data(run_id: int, trade_id: int):
                 
                 # 지표 값 추출
                 try:
-                    indicator_values = []
-                    for i in range(start_idx, end_idx + 1):
-                        value = strategy_parser.indicator_calc.get_value(column_name, i)
-                        indicator_values.append(value)
+                    column_values = strategy_parser.indicator_calc.get_array(column_name)
+                    indicator_values = column_values[start_idx:end_idx + 1].tolist()
                     
                     indicators_data[display_key] = indicator_values
                     
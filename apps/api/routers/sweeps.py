@@ -0,0 +1,440 @@
+"""
+Sweep API Router
+
+파라미터 스윕(전략 변형 일괄 평가) 생성, 조회, 중지 엔드포인트를 제공합니다.
+Run 실행기 워커에서 조합 청크를 나눠 병렬 평가하고(실행기 비활성화 시 Background Task에서
+순차 평가) 결과를 청크 단위로 저장합니다.
+"""
+
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
+import logging
+import time
+import traceback
+from typing import List, Optional, Tuple
+
+from apps.api.db.database import Database, get_database
+from apps.api.db.repositories import (
+    DatasetRepository,
+    StrategyRepository,
+    PresetRepository,
+    SweepRepository,
+    SweepResultRepository
+)
+from apps.api.db.utils import load_dataset_bars
+from apps.api.schemas import (
+    SweepCreate,
+    SweepResponse,
+    SweepList,
+    SweepResultResponse,
+    SweepResultList
+)
+from apps.api.utils.exceptions import DatasetNotFoundError, StrategyNotFoundError
+from apps.api.run_executor import get_run_executor, run_executor_enabled
+from apps.api.routers.runs import ENGINE_VERSION
+
+from engine.core.param_sweep import ParamSweepRunner, SweepTask
+from engine.utils.leverage_loader import load_leverage_brackets_from_db
+from engine.utils.param_grid import apply_params, expand_param_space, validate_param_space
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# 프리셋이 없을 때 기본값 (execute_backtest와 동일)
+_DEFAULT_PRESET = {
+    'risk_percent': 0.02,
+    'risk_reward_ratio': 1.5,
+    'rebalance_interval': 50
+}
+
+
+def _resolve_preset(preset_repo: PresetRepository, preset_id: Optional[int]) -> Optional[dict]:
+    """프리셋 조회 (preset_id가 없으면 기본 프리셋)"""
+    if preset_id is not None:
+        return preset_repo.get_by_id(preset_id)
+    return preset_repo.get_default()
+
+
+def _prepare_sweep(db: Database, sweep: dict) -> Tuple[ParamSweepRunner, List[dict], List[SweepTask]]:
+    """
+    데이터셋 / HTF / 레버리지 구간 로드 및 조합 전개
+
+    Args:
+        db: Database 인스턴스
+        sweep: 스윕 레코드
+
+    Returns:
+        Tuple: (순차 평가 ParamSweepRunner, 조합별 파라미터, 조합별 평가 작업)
+    """
+    dataset_repo = DatasetRepository(db)
+    preset = _resolve_preset(PresetRepository(db), sweep.get("preset_id")) or _DEFAULT_PRESET
+    base_preset = {field: preset[field] for field in _DEFAULT_PRESET}
+
+    dataset = dataset_repo.get_by_id(sweep["dataset_id"])
+    if not dataset:
+        raise ValueError(f"Dataset {sweep['dataset_id']} not found")
+    bars, _ = load_dataset_bars(dataset["file_path"])
+
+    htf_bars = {}
+    dataset_hashes = {"base": dataset["dataset_hash"]}
+    for role, ds_id in (sweep.get("htf_dataset_ids") or {}).items():
+        htf_ds = dataset_repo.get_by_id(ds_id)
+        if not htf_ds:
+            raise ValueError(f"HTF dataset not found (role={role}, id={ds_id})")
+        htf_bars[role], _ = load_dataset_bars(htf_ds["file_path"])
+        dataset_hashes[role] = htf_ds["dataset_hash"]
+
+    combinations = expand_param_space(sweep["param_space"])
+    tasks = []
+    for combo_index, params in enumerate(combinations):
+        definition, combo_preset = apply_params(sweep["strategy_template"], base_preset, params)
+        tasks.append((combo_index, definition, combo_preset))
+
+    # 레버리지 구간은 1회만 로드 (엔진과 동일하게 실패 시 제약 없이 실행)
+    try:
+        leverage_brackets = load_leverage_brackets_from_db(db)
+    except Exception as e:
+        logger.warning(f"레버리지 테이블 로드 실패: {str(e)}. 레버리지 제약 없이 실행합니다.")
+        leverage_brackets = None
+
+    # 조합 병렬 평가는 Run 실행기가 조합 청크를 워커에 나눠 제출하는 방식으로 수행
+    # (스윕 전용 프로세스 풀을 만들지 않아 Run과 같은 동시 실행 한도를 공유)
+    runner = ParamSweepRunner(
+        bars=bars,
+        initial_balance=sweep["initial_balance"],
+        htf_bars=htf_bars,
+        leverage_brackets=leverage_brackets,
+        max_workers=1,
+        dataset_hashes=dataset_hashes,
+    )
+    return runner, combinations, tasks
+
+
+def _evaluate_tasks(
+    db: Database,
+    sweep_id: int,
+    runner: ParamSweepRunner,
+    combinations: List[dict],
+    tasks: List[SweepTask]
+) -> bool:
+    """
+    조합 평가 후 결과를 청크 단위로 저장
+
+    Returns:
+        bool: 모든 조합을 평가했으면 True, 스윕이 중지(RUNNING이 아님)되었으면 False
+    """
+    sweep_repo = SweepRepository(db)
+    result_repo = SweepResultRepository(db)
+
+    def on_results(results):
+        for result in results:
+            result["params"] = combinations[result["combo_index"]]
+        result_repo.add_batch(sweep_id, results)
+
+    def should_stop() -> bool:
+        # 사용자 취소 또는 다른 청크의 실패
+        current = sweep_repo.get_by_id(sweep_id)
+        return current is None or current["status"] != "RUNNING"
+
+    return runner.run(tasks, on_results, should_stop)
+
+
+def _mark_sweep_failed(db: Optional[Database], sweep_id: int, error: Exception) -> None:
+    """스윕을 FAILED로 변경 (오류 메시지 + traceback 기록)"""
+    try:
+        db = db or get_database()
+        SweepRepository(db).update_status(
+            sweep_id,
+            status="FAILED",
+            completed_at=int(time.time()),
+            error=f"{str(error)}\n{traceback.format_exc()}"
+        )
+    except Exception as update_error:
+        logger.error(f"Failed to update sweep status: {str(update_error)}", exc_info=True)
+
+
+def execute_sweep(sweep_id: int, db: Optional[Database] = None):
+    """
+    파라미터 스윕 전체를 현재 프로세스에서 순차 실행 (Run 실행기 비활성화 시 Background Task)
+
+    데이터셋과 레버리지 구간은 한 번만 로드하고, 지표는 ParamSweepRunner의
+    공유 캐시로 (TF, 타입, 파라미터)별 한 번만 계산합니다.
+    조합 결과는 청크마다 저장되며 진행률(completed_combinations)도 함께 갱신됩니다.
+    Run 실행기가 있으면 이 함수 대신 execute_sweep_chunk로 조합을 나눠 병렬 평가합니다.
+
+    Args:
+        sweep_id: 스윕 ID
+        db: Database 인스턴스 (None이면 get_database())
+    """
+    try:
+        db = db or get_database()
+        sweep_repo = SweepRepository(db)
+
+        sweep = sweep_repo.get_by_id(sweep_id)
+        if not sweep:
+            logger.error(f"Sweep {sweep_id} not found")
+            return
+        # 조건부 전환: 대기 중 취소되었거나 이미 실행 중이면 건너뜀
+        if not sweep_repo.claim_for_execution(sweep_id, started_at=int(time.time())):
+            logger.info(f"Sweep {sweep_id} is not pending (status={sweep['status']}), skipping")
+            return
+
+        runner, combinations, tasks = _prepare_sweep(db, sweep)
+        if not _evaluate_tasks(db, sweep_id, runner, combinations, tasks):
+            logger.info(f"Sweep cancelled: sweep_id={sweep_id}")
+            return
+
+        sweep_repo.update_status(sweep_id, status="COMPLETED", completed_at=int(time.time()))
+        logger.info(
+            f"Sweep completed: sweep_id={sweep_id}, combinations={len(tasks)}, "
+            f"indicator cache hits={runner.indicator_cache.hits}"
+        )
+
+    except Exception as e:
+        logger.error(f"Sweep failed for {sweep_id}: {str(e)}", exc_info=True)
+        _mark_sweep_failed(db, sweep_id, e)
+
+
+def execute_sweep_chunk(sweep_id: int, combo_indices: List[int], db: Optional[Database] = None):
+    """
+    스윕 조합 일부 평가 (Run 실행기 워커)
+
+    Run 실행기가 스윕을 RUNNING으로 전환하고 남은 조합을 청크로 나눠 여러 워커에 제출합니다.
+    조합 결과를 모두 저장한 마지막 청크가 스윕을 COMPLETED로 전환하며,
+    한 청크가 실패하면 스윕이 FAILED가 되어 나머지 청크도 중지됩니다.
+
+    Args:
+        sweep_id: 스윕 ID
+        combo_indices: 평가할 조합 번호
+        db: Database 인스턴스 (None이면 get_database())
+    """
+    try:
+        db = db or get_database()
+        sweep_repo = SweepRepository(db)
+
+        sweep = sweep_repo.get_by_id(sweep_id)
+        if not sweep or sweep["status"] != "RUNNING":
+            logger.info(f"Sweep {sweep_id} is not running, skipping chunk")
+            return
+
+        runner, combinations, tasks = _prepare_sweep(db, sweep)
+        selected = set(combo_indices)
+        tasks = [task for task in tasks if task[0] in selected]
+        if not _evaluate_tasks(db, sweep_id, runner, combinations, tasks):
+            return
+
+        if sweep_repo.complete_if_finished(sweep_id, completed_at=int(time.time())):
+            logger.info(f"Sweep completed: sweep_id={sweep_id}, combinations={len(combinations)}")
+
+    except Exception as e:
+        logger.error(f"Sweep chunk failed for {sweep_id}: {str(e)}", exc_info=True)
+        _mark_sweep_failed(db, sweep_id, e)
+
+
+@router.post("", response_model=SweepResponse, status_code=201)
+async def create_sweep(sweep_create: SweepCreate, background_tasks: BackgroundTasks):
+    """
+    파라미터 스윕 생성 및 실행 트리거
+
+    Args:
+        sweep_create: 스윕 생성 요청 데이터
+        background_tasks: FastAPI Background Tasks
+
+    Returns:
+        SweepResponse: 생성된 스윕 정보
+    """
+    try:
+        db = get_database()
+        sweep_repo = SweepRepository(db)
+        dataset_repo = DatasetRepository(db)
+        preset_repo = PresetRepository(db)
+
+        if not dataset_repo.get_by_id(sweep_create.dataset_id):
+            raise DatasetNotFoundError(sweep_create.dataset_id)
+
+        htf_dataset_ids = sweep_create.htf_dataset_ids or {}
+        for tf, htf_ds_id in htf_dataset_ids.items():
+            htf_ds = dataset_repo.get_by_id(htf_ds_id)
+            if not htf_ds:
+                raise DatasetNotFoundError(htf_ds_id)
+            if htf_ds.get("timeframe") != tf:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"HTF dataset {htf_ds_id}의 timeframe은 '{htf_ds.get('timeframe')}'인데 "
+                           f"요청에서는 '{tf}'로 매핑되어 있습니다."
+                )
+
+        # 전략 템플릿: strategy_id 또는 직접 지정 (둘 중 하나)
+        if (sweep_create.strategy_id is None) == (sweep_create.strategy_template is None):
+            raise HTTPException(
+                status_code=400,
+                detail="strategy_id와 strategy_template 중 하나만 지정해야 합니다"
+            )
+        if sweep_create.strategy_id is not None:
+            strategy = StrategyRepository(db).get_by_id(sweep_create.strategy_id)
+            if not strategy:
+                raise StrategyNotFoundError(sweep_create.strategy_id)
+            template = strategy["definition"]
+        else:
+            template = sweep_create.strategy_template
+
+        preset = _resolve_preset(preset_repo, sweep_create.preset_id)
+        if sweep_create.preset_id is not None and not preset:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Preset {sweep_create.preset_id}를 찾을 수 없습니다"
+            )
+
+        # 조합 전개 및 경로 검증 (잘못된 파라미터 공간은 400)
+        try:
+            validate_param_space(template, sweep_create.param_space)
+            total_combinations = len(expand_param_space(sweep_create.param_space))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        sweep_id = sweep_repo.create(
+            dataset_id=sweep_create.dataset_id,
+            strategy_template=template,
+            param_space=sweep_create.param_space,
+            initial_balance=preset['initial_balance'] if preset else 1000.0,
+            engine_version=ENGINE_VERSION,
+            total_combinations=total_combinations,
+            preset_id=preset['preset_id'] if preset else None,
+            htf_dataset_ids=htf_dataset_ids,
+            name=sweep_create.name
+        )
+
+        # Run과 같은 실행기 대기열 사용 (다른 프로세스가 리더면 리더의 폴링에 맡김)
+        executor = get_run_executor()
+        if executor is not None:
+            executor.dispatch()
+        elif not run_executor_enabled():
+            background_tasks.add_task(execute_sweep, sweep_id)
+
+        logger.info(f"Sweep created: ID={sweep_id}, combinations={total_combinations}")
+
+        return SweepResponse(**sweep_repo.get_by_id(sweep_id))
+
+    except (DatasetNotFoundError, StrategyNotFoundError, HTTPException):
+        raise
+    except Exception as e:
+        logger.error(f"Failed to create sweep: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"스윕 생성 실패: {str(e)}")
+
+
+@router.get("", response_model=SweepList)
+async def get_sweeps():
+    """
+    스윕 목록 조회
+
+    Returns:
+        SweepList: 스윕 목록
+    """
+    try:
+        sweeps = SweepRepository(get_database()).get_all()
+        return SweepList(sweeps=[SweepResponse(**s) for s in sweeps], total=len(sweeps))
+
+    except Exception as e:
+        logger.error(f"Failed to get sweeps: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"스윕 목록 조회 실패: {str(e)}")
+
+
+@router.get("/{sweep_id}", response_model=SweepResponse)
+async def get_sweep(sweep_id: int):
+    """
+    스윕 상세 조회 (진행률 포함)
+
+    Args:
+        sweep_id: 스윕 ID
+
+    Returns:
+        SweepResponse: 스윕 정보
+    """
+    sweep = SweepRepository(get_database()).get_by_id(sweep_id)
+    if not sweep:
+        raise HTTPException(status_code=404, detail=f"Sweep {sweep_id}를 찾을 수 없습니다")
+    return SweepResponse(**sweep)
+
+
+@router.get("/{sweep_id}/results", response_model=SweepResultList)
+async def get_sweep_results(
+    sweep_id: int,
+    top_k: int = Query(default=20, ge=1, le=1000, description="조회 개수"),
+    order_by: str = Query(default="score", description="정렬 지표"),
+    min_trades: int = Query(default=0, ge=0, description="최소 거래 수"),
+    include_errors: bool = Query(default=False, description="평가 실패 조합 포함 여부")
+):
+    """
+    스윕 top-K 결과 조회 (실행 중에도 현재까지의 결과로 조회 가능)
+
+    Args:
+        sweep_id: 스윕 ID
+        top_k: 조회 개수
+        order_by: 정렬 지표 (score, total_pnl, profit_factor, win_rate, expectancy, max_drawdown)
+        min_trades: 최소 거래 수
+        include_errors: True면 평가 실패 조합을 뒤에 덧붙임
+
+    Returns:
+        SweepResultList: 정렬된 결과
+    """
+    db = get_database()
+    sweep = SweepRepository(db).get_by_id(sweep_id)
+    if not sweep:
+        raise HTTPException(status_code=404, detail=f"Sweep {sweep_id}를 찾을 수 없습니다")
+
+    result_repo = SweepResultRepository(db)
+    try:
+        results = result_repo.get_top(sweep_id, top_k=top_k, order_by=order_by, min_trades=min_trades)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if include_errors:
+        results += result_repo.get_errors(sweep_id)
+
+    return SweepResultList(
+        sweep_id=sweep_id,
+        order_by=order_by,
+        results=[SweepResultResponse(**r) for r in results],
+        completed_combinations=sweep["completed_combinations"],
+        total_combinations=sweep["total_combinations"]
+    )
+
+
+@router.post("/{sweep_id}/cancel", response_model=SweepResponse)
+async def cancel_sweep(sweep_id: int):
+    """
+    스윕 중지 (이미 저장된 결과는 유지)
+
+    Args:
+        sweep_id: 스윕 ID
+
+    Returns:
+        SweepResponse: 중지된 스윕 정보
+    """
+    sweep_repo = SweepRepository(get_database())
+    sweep = sweep_repo.get_by_id(sweep_id)
+    if not sweep:
+        raise HTTPException(status_code=404, detail=f"Sweep {sweep_id}를 찾을 수 없습니다")
+    if sweep["status"] not in ("RUNNING", "PENDING"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sweep {sweep_id}는 실행 중이 아닙니다. 현재 상태: {sweep['status']}"
+        )
+
+    sweep_repo.update_status(sweep_id, status="CANCELLED", completed_at=int(time.time()))
+    logger.info(f"Sweep cancelled by user: ID={sweep_id}")
+    return SweepResponse(**sweep_repo.get_by_id(sweep_id))
+
+
+@router.delete("/{sweep_id}", status_code=204)
+async def delete_sweep(sweep_id: int):
+    """
+    스윕 삭제 (결과 포함)
+
+    Args:
+        sweep_id: 스윕 ID
+    """
+    sweep_repo = SweepRepository(get_database())
+    if not sweep_repo.get_by_id(sweep_id):
+        raise HTTPException(status_code=404, detail=f"Sweep {sweep_id}를 찾을 수 없습니다")
+    sweep_repo.delete(sweep_id)
+    logger.info(f"Sweep deleted: ID={sweep_id}")
+    return None
@@ -0,0 +1,672 @@
+"""
+Run 실행기 (프로세스 풀)
+
+백테스트 봉 루프는 CPU 바운드라 API 프로세스에서 실행하면 GIL을 점유해
+조회 API가 멈춥니다. 이 모듈은 백테스트와 파라미터 스윕을 별도 워커 프로세스 풀에서 실행합니다.
+
+구조:
+- 대기열: runs 테이블의 PENDING Run (priority DESC → queued_at ASC → run_id ASC),
+  그 다음 sweeps 테이블의 스윕 조합 청크 (sweep_id ASC)
+- 디스패처: 빈 워커 슬롯만큼 대기열에서 꺼내 풀에 제출 (슬롯이 빌 때마다 Run 우선)
+  (Run/스윕 생성 및 재실행 시, 워커 완료 시, 시작 시 호출)
+- Run 워커: claim_for_execution으로 PENDING → RUNNING 전환에 성공한 경우에만 실행
+- 스윕: 디스패처가 PENDING → RUNNING으로 전환하고 결과가 없는 조합을 청크로 나눠
+  빈 슬롯마다 하나씩 제출 (조합 병렬 평가도 Run과 같은 동시 실행 한도를 공유).
+  마지막 청크가 끝나면 워커가 COMPLETED로 전환
+- 진행률/중지: 기존과 동일하게 DB(progress, CANCELLED 상태)로 공유
+- 복구: 시작 시 RUNNING으로 남은 Run/스윕(이전 프로세스 비정상 종료)을 PENDING으로 되돌림
+  (스윕은 결과가 저장되지 않은 조합만 다시 평가)
+
+배포 단위 실행기 1개:
+- uvicorn --workers N처럼 API 프로세스가 여러 개여도 실행기(풀)는 하나만 동작합니다.
+  DB 파일 옆 잠금 파일(ExecutorLeaderLock)을 잡은 프로세스만 리더가 되어
+  복구 / 디스패치를 수행하고, 나머지는 대기 모드로 잠금을 주기적으로 재시도합니다.
+- 잠금은 리더 프로세스가 종료될 때 OS가 해제하므로, 복구 대상 RUNNING Run은
+  항상 종료된 프로세스가 남긴 것입니다 (다른 프로세스가 실행 중인 Run을 되돌리지 않음).
+- 대기 모드 프로세스에서 생성된 Run은 PENDING으로 남고 리더가 대기열 폴링으로 실행합니다.
+
+설정:
+- ALGOFORGE_RUN_WORKERS: 배포 전체의 워커 프로세스 수 (기본값: min(2, CPU 코어 수), 0이면 비활성화)
+  비활성화 시 Run은 기존처럼 FastAPI BackgroundTasks로 실행됩니다.
+
+프로세스 수:
+- 커스텀 지표 샌드박스(engine/utils/indicator_sandbox.py)는 프로세스마다 따로 생성되므로,
+  커스텀 지표를 쓰는 Run을 실행한 워커는 각자 ALGOFORGE_SANDBOX_WORKERS(기본 2)개를 더 띄웁니다.
+- 최대 프로세스 수 ≈ uvicorn 워커 수 + RUN_WORKERS × (1 + SANDBOX_WORKERS)
+  (API 프로세스가 직접 커스텀 지표를 계산하면 그 프로세스의 샌드박스도 추가)
+  예: --workers 2, 기본값 → 2 + 2 × 3 = 8. 코어 수보다 많으면 RUN_WORKERS를 줄이세요.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from apps.api.db.database import Database
+from apps.api.db.repositories import RunRepository, SweepRepository, SweepResultRepository
+
+logger = logging.getLogger(__name__)
+
+# 워커 수 환경변수
+RUN_WORKERS_ENV = "ALGOFORGE_RUN_WORKERS"
+
+# 기본 워커 수 상한 (워커마다 샌드박스 프로세스가 더 붙으므로 코어 수 전체를 쓰지 않음)
+DEFAULT_RUN_WORKERS = 2
+
+# 스윕 조합 청크 최대 크기 (ParamSweepRunner와 같은 기준: 워커당 약 4청크)
+SWEEP_CHUNK_MAX_COMBOS = 32
+
+# 리더가 대기열을 확인하는 주기 (다른 API 프로세스에서 생성된 Run 실행)
+QUEUE_POLL_SECONDS = 1.0
+
+# 대기 모드 프로세스가 리더 잠금을 재시도하는 주기
+LEADER_RETRY_SECONDS = 5.0
+
+
+def _execute_in_worker(run_id: int, db_path: str) -> None:
+    """
+    워커 프로세스 진입점
+
+    get_database()는 테스트 환경에서 DB 파일을 초기화할 수 있으므로
+    전달받은 경로로 Database를 직접 생성합니다.
+
+    Args:
+        run_id: Run ID
+        db_path: 데이터베이스 파일 경로
+    """
+    from apps.api.routers.runs import execute_backtest
+
+    execute_backtest(run_id, db=Database(db_path))
+
+
+def _execute_sweep_chunk_in_worker(sweep_id: int, combo_indices: List[int], db_path: str) -> int:
+    """
+    스윕 조합 청크 워커 프로세스 진입점 (_execute_in_worker와 같은 이유로 경로로 DB 생성)
+
+    Args:
+        sweep_id: 스윕 ID
+        combo_indices: 평가할 조합 번호
+        db_path: 데이터베이스 파일 경로
+
+    Returns:
+        int: 워커 프로세스 PID (완료 로그용)
+    """
+    from apps.api.routers.sweeps import execute_sweep_chunk
+
+    execute_sweep_chunk(sweep_id, combo_indices, db=Database(db_path))
+    return os.getpid()
+
+
+def get_configured_workers() -> int:
+    """
+    환경변수에서 워커 수 조회
+
+    Returns:
+        int: 워커 수 (0이면 실행기 비활성화, 미설정 시 min(DEFAULT_RUN_WORKERS, CPU 코어 수))
+
+    Raises:
+        ValueError: 정수가 아니거나 음수인 경우
+    """
+    raw = os.getenv(RUN_WORKERS_ENV)
+    if raw is None or raw.strip() == "":
+        return min(DEFAULT_RUN_WORKERS, os.cpu_count() or 1)
+
+    try:
+        workers = int(raw)
+    except ValueError:
+        raise ValueError(f"{RUN_WORKERS_ENV}는 정수여야 합니다: {raw!r}")
+    if workers < 0:
+        raise ValueError(f"{RUN_WORKERS_ENV}는 0 이상이어야 합니다: {workers}")
+    return workers
+
+
+class ExecutorLeaderLock:
+    """
+    실행기 리더 잠금 (DB 파일 옆 `<db>.executor.lock`, 배포당 한 프로세스만 획득)
+
+    OS 파일 잠금(flock / msvcrt.locking)이므로 프로세스가 어떻게 종료되든
+    잠금이 해제되어 다른 프로세스가 리더를 이어받을 수 있습니다.
+
+    Attributes:
+        path: 잠금 파일 경로
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+        """
+        self.path = Path(str(Path(db_path).resolve()) + ".executor.lock")
+        self._file = None
+
+    @property
+    def held(self) -> bool:
+        """이 객체가 잠금을 보유 중인지 여부"""
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        """
+        잠금 획득 시도 (대기하지 않음)
+
+        Returns:
+            bool: 획득했거나 이미 보유 중이면 True
+        """
+        if self._file is not None:
+            return True
+
+        f = open(self.path, "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            f.close()
+            return False
+
+        # 진단용 소유자 PID 기록
+        f.seek(0)
+        f.truncate()
+        f.write(f"{os.getpid()}\n")
+        f.flush()
+        self._file = f
+        return True
+
+    def release(self) -> None:
+        """잠금 해제"""
+        f, self._file = self._file, None
+        if f is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            f.close()
+
+
+class RunExecutor:
+    """
+    runs / sweeps 테이블 대기열 기반 프로세스 풀 실행기
+
+    Attributes:
+        db_path: 데이터베이스 파일 경로 (워커 프로세스에 전달)
+        max_workers: 최대 동시 실행 수
+    """
+
+    def __init__(self, db_path: str, max_workers: int, poll_interval: Optional[float] = None):
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로
+            max_workers: 워커 프로세스 수 (1 이상)
+            poll_interval: 대기열 폴링 주기 (초, None이면 폴링하지 않음)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+
+        self.db_path = str(Path(db_path).resolve())
+        self.max_workers = max_workers
+        db = Database(self.db_path)
+        self._run_repo = RunRepository(db)
+        self._sweep_repo = SweepRepository(db)
+        self._result_repo = SweepResultRepository(db)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # ("run", run_id) 또는 ("sweep", sweep_id, 첫 조합 번호) → Future
+        self._in_flight: Dict[tuple, Future] = {}
+        # RUNNING 스윕 → 아직 제출하지 않은 조합 청크 (시작 순서 유지)
+        self._sweep_chunks: Dict[int, List[List[int]]] = {}
+        self._stopped = False
+        self._poll_interval = poll_interval
+        self._poll_stop = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        # 완료 콜백은 풀 관리 스레드에서 호출되므로 후속 처리는 별도 스레드에서 수행
+        # (관리 스레드가 풀 내부 락을 쥔 채 콜백을 부를 수 있어 교착 방지)
+        self._callback_thread = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="run-executor"
+        )
+
+    def start(self) -> None:
+        """중단된 Run 복구 후 풀 생성 및 대기열 디스패치"""
+        recovered = self.recover_interrupted_runs()
+        if recovered:
+            logger.warning(f"Recovered interrupted runs: {recovered}")
+        recovered_sweeps = self.recover_interrupted_sweeps()
+        if recovered_sweeps:
+            logger.warning(f"Recovered interrupted sweeps: {recovered_sweeps}")
+
+        with self._lock:
+            self._stopped = False
+            self._pool = self._create_pool()
+
+        logger.info(f"Run executor started: workers={self.max_workers}")
+        self.dispatch()
+
+        if self._poll_interval is not None:
+            self._poll_stop.clear()
+            self._poll_thread = threading.Thread(
+                target=self._poll_queue, name="run-executor-poll", daemon=True
+            )
+            self._poll_thread.start()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        실행기 종료
+
+        대기 중(아직 워커에 넘어가지 않은) 작업은 취소되며 PENDING으로 남아
+        다음 시작 시 다시 실행됩니다. 실행 중인 Run은 끝까지 실행됩니다.
+
+        Args:
+            wait: 실행 중인 Run이 끝날 때까지 대기 여부
+        """
+        self._poll_stop.set()
+        with self._lock:
+            self._stopped = True
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+        poll_thread = self._poll_thread
+        if wait and poll_thread is not None and poll_thread is not threading.current_thread():
+            poll_thread.join()
+        logger.info("Run executor stopped")
+
+    def recover_interrupted_runs(self) -> list:
+        """
+        RUNNING 상태로 남은 Run을 PENDING으로 복구
+
+        실행기 시작 전에 리더 잠금을 잡은 프로세스에서만 호출되므로 RUNNING Run은
+        이전 리더 프로세스가 종료되면서 남긴 것입니다. 부분 저장된 결과를 지우고
+        대기열 순서를 유지한 채 다시 대기열에 넣습니다.
+
+        Returns:
+            list: 복구된 run_id 목록
+        """
+        run_ids = self._run_repo.get_ids_by_status("RUNNING")
+        for run_id in run_ids:
+            self._run_repo.reset_for_rerun(run_id, requeue=False)
+        return run_ids
+
+    def recover_interrupted_sweeps(self) -> list:
+        """
+        RUNNING 상태로 남은 스윕을 PENDING으로 복구
+        (저장된 조합 결과는 유지, 다시 시작할 때 나머지 조합만 청크로 나눔)
+
+        Returns:
+            list: 복구된 sweep_id 목록
+        """
+        sweep_ids = self._sweep_repo.get_ids_by_status("RUNNING")
+        for sweep_id in sweep_ids:
+            self._sweep_repo.update_status(sweep_id, status="PENDING")
+        return sweep_ids
+
+    def dispatch(self) -> int:
+        """
+        빈 워커 슬롯만큼 대기열의 Run / 스윕 조합 청크를 풀에 제출 (Run 우선)
+
+        Returns:
+            int: 이번에 제출한 작업 수
+        """
+        submitted = 0
+        with self._lock:
+            if self._stopped or self._pool is None:
+                return 0
+
+            free_slots = self.max_workers - len(self._in_flight)
+            if free_slots <= 0:
+                return 0
+
+            # 실행 중(아직 claim 전)인 Run이 PENDING으로 보일 수 있으므로 여유 있게 조회
+            queue = self._run_repo.get_pending_queue(limit=free_slots + len(self._in_flight))
+            for run in queue:
+                if submitted >= free_slots:
+                    break
+                job = ("run", run["run_id"])
+                if job in self._in_flight:
+                    continue
+                if not self._submit(job, _execute_in_worker, run["run_id"]):
+                    break
+                submitted += 1
+            else:
+                submitted += self._dispatch_sweep_chunks(free_slots - submitted)
+
+        if submitted:
+            logger.debug(f"Dispatched {submitted} job(s)")
+        return submitted
+
+    def _dispatch_sweep_chunks(self, free_slots: int) -> int:
+        """
+        스윕 조합 청크 제출 (self._lock 보유 상태에서 호출)
+
+        진행 중인 스윕의 남은 청크를 먼저 제출하고, 슬롯이 남으면 다음 PENDING 스윕을 시작합니다.
+
+        Args:
+            free_slots: 빈 워커 슬롯 수
+
+        Returns:
+            int: 제출한 청크 수
+        """
+        submitted = 0
+        while submitted < free_slots:
+            if not self._sweep_chunks and not self._start_next_sweep():
+                break
+
+            sweep_id, chunks = next(iter(self._sweep_chunks.items()))
+            sweep = self._sweep_repo.get_by_id(sweep_id)
+            if sweep is None or sweep["status"] != "RUNNING":
+                # 취소 / 실패한 스윕의 남은 청크는 버림
+                del self._sweep_chunks[sweep_id]
+                continue
+
+            while chunks and submitted < free_slots:
+                chunk = chunks[0]
+                if not self._submit(("sweep", sweep_id, chunk[0]), _execute_sweep_chunk_in_worker, sweep_id, chunk):
+                    return submitted
+                chunks.pop(0)
+                submitted += 1
+            if not chunks:
+                del self._sweep_chunks[sweep_id]
+        return submitted
+
+    def _start_next_sweep(self) -> bool:
+        """
+        다음 PENDING 스윕을 RUNNING으로 전환하고 결과가 없는 조합을 청크로 나눠 대기
+
+        Returns:
+            bool: 청크를 대기시킨 스윕이 있으면 True
+        """
+        while True:
+            pending = self._sweep_repo.get_ids_by_status("PENDING", limit=1)
+            if not pending:
+                return False
+            sweep_id = pending[0]
+            if not self._sweep_repo.claim_for_execution(sweep_id, started_at=int(time.time())):
+                continue
+
+            sweep = self._sweep_repo.get_by_id(sweep_id)
+            stored = set(self._result_repo.get_combo_indices(sweep_id))
+            remaining = [i for i in range(sweep["total_combinations"]) if i not in stored]
+            if not remaining:
+                # 이전 프로세스가 모든 조합을 저장한 뒤 종료된 경우
+                self._sweep_repo.complete_if_finished(sweep_id, completed_at=int(time.time()))
+                continue
+
+            size = max(1, min(SWEEP_CHUNK_MAX_COMBOS, len(remaining) // (self.max_workers * 4)))
+            self._sweep_chunks[sweep_id] = [
+                remaining[i:i + size] for i in range(0, len(remaining), size)
+            ]
+            logger.info(
+                f"Sweep started: sweep_id={sweep_id}, combinations={len(remaining)}, "
+                f"chunks={len(self._sweep_chunks[sweep_id])}"
+            )
+            return True
+
+    def _submit(self, job: tuple, fn, *args) -> bool:
+        """
+        워커 풀에 작업 제출 (self._lock 보유 상태에서 호출)
+
+        Returns:
+            bool: 제출 성공 여부 (풀이 깨졌으면 False)
+        """
+        pool = self._pool
+        try:
+            future = pool.submit(fn, *args, self.db_path)
+        except BrokenProcessPool:
+            # 풀 교체는 실패한 작업의 완료 콜백에서 처리
+            logger.warning("Run worker pool is broken; dispatch deferred")
+            return False
+        self._in_flight[job] = future
+        future.add_done_callback(
+            lambda f, job=job, pool=pool: self._callback_thread.submit(
+                self._on_done, job, f, pool
+            )
+        )
+        return True
+
+    def status(self) -> Dict[str, object]:
+        """
+        실행기 상태
+
+        Returns:
+            Dict: max_workers, running_run_ids / running_sweep_ids (워커에 제출된 작업)
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running_run_ids": sorted(job[1] for job in self._in_flight if job[0] == "run"),
+                "running_sweep_ids": sorted({job[1] for job in self._in_flight if job[0] == "sweep"}),
+            }
+
+    def _poll_queue(self) -> None:
+        """대기열 폴링 (다른 API 프로세스에서 생성된 Run 디스패치)"""
+        while not self._poll_stop.wait(self._poll_interval):
+            try:
+                self.dispatch()
+            except Exception as e:
+                logger.error(f"Run queue poll failed: {str(e)}", exc_info=True)
+
+    def _on_done(self, job: tuple, future: Future, pool: ProcessPoolExecutor) -> None:
+        """워커 완료 콜백: 슬롯 반환, 워커 비정상 종료 처리, 다음 작업 디스패치"""
+        with self._lock:
+            self._in_flight.pop(job, None)
+
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is not None:
+            # execute_backtest / execute_sweep은 예외를 내부에서 처리하므로 여기 오는 것은
+            # 워커 프로세스 자체의 비정상 종료 (메모리 부족, 강제 종료 등).
+            # 풀이 깨지면 어느 작업이 원인인지 알 수 없어 같은 풀의 실행 중 작업은 모두 FAILED
+            logger.error(f"Run worker failed: {job[0]}_id={job[1]}: {error}")
+            self._mark_failed(job, error)
+            if isinstance(error, BrokenProcessPool):
+                self._replace_broken_pool(pool)
+        elif job[0] == "sweep":
+            logger.info(
+                f"Sweep chunk finished: sweep_id={job[1]}, first_combo={job[2]}, "
+                f"worker_pid={future.result()}"
+            )
+
+        self.dispatch()
+
+    def _mark_failed(self, job: tuple, error: BaseException) -> None:
+        """워커 비정상 종료 시 RUNNING/PENDING Run 또는 스윕을 FAILED로 변경"""
+        kind, job_id = job[0], job[1]
+        message = f"워커 프로세스 비정상 종료: {error}"
+        try:
+            if kind == "sweep":
+                sweep = self._sweep_repo.get_by_id(job_id)
+                if sweep and sweep["status"] in ("PENDING", "RUNNING"):
+                    self._sweep_repo.update_status(
+                        job_id, status="FAILED", completed_at=int(time.time()), error=message
+                    )
+                return
+
+            run = self._run_repo.get_by_id(job_id)
+            if run and run["status"] in ("PENDING", "RUNNING"):
+                self._run_repo.update_status(
+                    run_id=job_id,
+                    status="FAILED",
+                    completed_at=int(time.time()),
+                    run_artifacts={"error": message}
+                )
+        except Exception as e:
+            logger.error(f"Failed to update {kind} status: {str(e)}", exc_info=True)
+
+    def _replace_broken_pool(self, broken: ProcessPoolExecutor) -> None:
+        """깨진 프로세스 풀을 새 풀로 교체 (같은 풀의 여러 Run 실패 시 한 번만)"""
+        with self._lock:
+            if self._stopped or self._pool is not broken:
+                return
+            self._pool = self._create_pool()
+
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Run worker pool was broken and has been recreated")
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """워커 프로세스 풀 생성 (API 프로세스의 스레드 상태를 물려받지 않도록 spawn 사용)"""
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+
+# 싱글톤 인스턴스 (리더 프로세스에서만 생성)
+_executor_instance: Optional[RunExecutor] = None
+# 리더 잠금 (한 번 획득하면 프로세스 종료까지 유지: 종료 중에도 실행 중인 Run이 끝날 때까지 리더)
+_leader_lock: Optional[ExecutorLeaderLock] = None
+# 배포 전체 워커 수 (0이면 실행기 비활성화)
+_max_workers = 0
+_state_lock = threading.Lock()
+# 대기 모드 스레드 중지 이벤트 (start마다 새로 생성)
+_standby_stop: Optional[threading.Event] = None
+_standby_thread: Optional[threading.Thread] = None
+
+
+def start_run_executor(db_path: str, max_workers: Optional[int] = None) -> Optional[RunExecutor]:
+    """
+    Run 실행기 시작 (API 서버 startup에서 호출)
+
+    리더 잠금을 획득하면 실행기를 시작하고, 다른 프로세스가 리더면
+    대기 모드(잠금 재시도 스레드)로 전환합니다.
+
+    Args:
+        db_path: 데이터베이스 파일 경로
+        max_workers: 워커 수 (None이면 get_configured_workers)
+
+    Returns:
+        Optional[RunExecutor]: 시작된 실행기 (워커 수 0이거나 대기 모드면 None)
+    """
+    global _leader_lock, _max_workers, _standby_stop, _standby_thread
+    if max_workers is None:
+        max_workers = get_configured_workers()
+
+    stop_run_executor()
+    _max_workers = max_workers
+    if max_workers == 0:
+        logger.info("Run executor disabled (BackgroundTasks fallback)")
+        return None
+
+    with _state_lock:
+        lock = ExecutorLeaderLock(db_path)
+        if _leader_lock is not None and _leader_lock.path == lock.path:
+            lock = _leader_lock
+        elif _leader_lock is not None:
+            _leader_lock.release()
+        _leader_lock = lock
+
+    if _try_become_leader(lock, db_path, max_workers):
+        return _executor_instance
+
+    logger.info(f"Run executor standby: another process holds {lock.path}")
+    _standby_stop = threading.Event()
+    _standby_thread = threading.Thread(
+        target=_standby_loop,
+        args=(lock, db_path, max_workers, _standby_stop),
+        name="run-executor-standby",
+        daemon=True
+    )
+    _standby_thread.start()
+    return None
+
+
+def _try_become_leader(lock: ExecutorLeaderLock, db_path: str, max_workers: int) -> bool:
+    """리더 잠금 획득 시 실행기 시작"""
+    global _executor_instance
+    if not lock.try_acquire():
+        return False
+
+    executor = RunExecutor(db_path, max_workers, poll_interval=QUEUE_POLL_SECONDS)
+    with _state_lock:
+        _executor_instance = executor
+    executor.start()
+    return True
+
+
+def _standby_loop(
+    lock: ExecutorLeaderLock,
+    db_path: str,
+    max_workers: int,
+    stop: threading.Event
+) -> None:
+    """대기 모드: 리더 프로세스가 종료될 때까지 잠금 재시도"""
+    while not stop.wait(LEADER_RETRY_SECONDS):
+        try:
+            if _try_become_leader(lock, db_path, max_workers):
+                logger.info("Run executor took over leadership")
+                return
+        except Exception as e:
+            logger.error(f"Run executor takeover failed: {str(e)}", exc_info=True)
+
+
+def stop_run_executor(wait: bool = False) -> None:
+    """
+    Run 실행기 종료 (API 서버 shutdown에서 호출)
+
+    리더 잠금은 프로세스가 종료될 때 해제됩니다. 종료 중에도 워커에서 실행 중인 Run이
+    끝날 때까지 다른 프로세스가 리더가 되어 그 Run을 복구(재실행)하지 않도록 하기 위함입니다.
+
+    Args:
+        wait: 실행 중인 Run이 끝날 때까지 대기 여부
+            (True면 진행 중인 리더 승계와 대기열 폴링 스레드도 끝날 때까지 대기)
+    """
+    global _executor_instance, _max_workers
+    if _standby_stop is not None:
+        _standby_stop.set()
+    standby_thread = _standby_thread
+    if wait and standby_thread is not None and standby_thread is not threading.current_thread():
+        # 승계 중이면 실행기 시작(복구 / 디스패치)이 끝난 뒤 종료
+        standby_thread.join()
+    with _state_lock:
+        executor, _executor_instance = _executor_instance, None
+        _max_workers = 0
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def get_run_executor() -> Optional[RunExecutor]:
+    """
+    이 프로세스에서 실행 중인 Run 실행기 반환
+
+    Returns:
+        Optional[RunExecutor]: 실행기 (시작되지 않았거나 비활성화 / 대기 모드면 None)
+    """
+    return _executor_instance
+
+
+def run_executor_enabled() -> bool:
+    """
+    실행기 사용 여부 (이 프로세스가 리더가 아니어도 True)
+
+    True면 PENDING Run은 리더 프로세스의 실행기가 실행하므로
+    BackgroundTasks로 실행하지 않습니다.
+
+    Returns:
+        bool: start_run_executor가 워커 수 1 이상으로 호출되었는지 여부
+    """
+    return _max_workers > 0
+
+
+def get_executor_max_workers() -> int:
+    """
+    배포 전체의 워커 수 (실행기 비활성화면 0)
+
+    Returns:
+        int: 워커 수
+    """
+    return _max_workers
@@ -16,7 +16,13 @@ from .run import (
     RunCreate,
     RunResponse,
     RunList,
-    RunStatus
+    RunQueueResponse,
+    RunStatus,
+    RepriceVariant,
+    RunRepriceRequest,
+    RepriceResult,
+    RunRepriceResponse,
+    RunProfileResponse
 )
 from .trade import (
     TradeResponse,
@@ -32,6 +38,13 @@ from .preset import (
     PresetResponse,
     PresetList
 )
+from .sweep import (
+    SweepCreate,
+    SweepResponse,
+    SweepList,
+    SweepResultResponse,
+    SweepResultList
+)
 
 __all__ = [
     'DatasetCreate',
@@ -43,7 +56,13 @@ __all__ = [
     'RunCreate',
     'RunResponse',
     'RunList',
+    'RunQueueResponse',
     'RunStatus',
+    'RepriceVariant',
+    'RunRepriceRequest',
+    'RepriceResult',
+    'RunRepriceResponse',
+    'RunProfileResponse',
     'TradeResponse',
     'TradeList',
     'TradeLegResponse',
@@ -52,4 +71,9 @@ __all__ = [
     'PresetUpdate',
     'PresetResponse',
     'PresetList',
+    'SweepCreate',
+    'SweepResponse',
+    'SweepList',
+    'SweepResultResponse',
+    'SweepResultList',
 ]
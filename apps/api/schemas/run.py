@@ -37,6 +37,7 @@ class RunCreate(BaseModel):
         description="상위 타임프레임 데이터셋 매핑 ({'1h': 7, '1d': 8} 형식). "
                     "base와 동일한 종목·기간이어야 하며, 각 타임프레임 봉은 오름차순 정렬 전제."
     )
+    priority: int = Field(default=0, description="실행 대기열 우선순위 (클수록 먼저, 같으면 FIFO)")
 
 
 class RunResponse(BaseModel):
@@ -59,9 +60,77 @@ class RunResponse(BaseModel):
     processed_bars: Optional[int] = Field(default=None, description="처리된 봉 개수")
     total_bars: Optional[int] = Field(default=None, description="전체 봉 개수")
 
+    # 실행 대기열 필드
+    priority: Optional[int] = Field(default=None, description="실행 대기열 우선순위")
+    queued_at: Optional[int] = Field(default=None, description="실행 대기열 진입 시각")
+
 
 class RunList(BaseModel):
     """Run 목록 응답 스키마"""
     runs: list[RunResponse]
     total: int
 
+
+class RunQueueResponse(BaseModel):
+    """Run 실행 대기열 응답 스키마"""
+    executor_enabled: bool = Field(..., description="프로세스 풀 실행기 사용 여부")
+    max_workers: int = Field(..., description="최대 동시 실행 수 (실행기 비활성화 시 0)")
+    running: list[RunResponse] = Field(..., description="실행 중인 Run")
+    pending: list[RunResponse] = Field(..., description="대기 중인 Run (실행 순서대로)")
+
+
+
+class RepriceVariant(BaseModel):
+    """포지션 크기 재계산 설정 (거래 경로에 영향을 주지 않는 리스크 파라미터)"""
+    risk_percent: float = Field(..., gt=0, le=1, description="거래당 최대 손실 비율 (0~1)")
+    rebalance_interval: int = Field(..., ge=1, description="잔고 재평가 주기 (거래 수)")
+    initial_balance: Optional[float] = Field(
+        default=None, gt=0, description="초기 자산 (없으면 Run의 초기 자산)"
+    )
+
+
+class RunRepriceRequest(BaseModel):
+    """완료된 Run 재계산 요청 스키마"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "variants": [
+                    {"risk_percent": 0.01, "rebalance_interval": 50},
+                    {"risk_percent": 0.03, "rebalance_interval": 20}
+                ]
+            }
+        }
+    )
+
+    variants: list[RepriceVariant] = Field(..., min_length=1, max_length=100, description="비교할 설정 목록")
+
+
+class RepriceResult(BaseModel):
+    """설정별 재계산 결과"""
+    risk_percent: float
+    rebalance_interval: int
+    initial_balance: float
+    metrics: Optional[Dict[str, Any]] = Field(default=None, description="재계산된 Metrics")
+    error: Optional[str] = Field(default=None, description="재계산 실패 사유 (예: 잔고 소진)")
+
+
+class RunRepriceResponse(BaseModel):
+    """완료된 Run 재계산 응답 스키마"""
+    run_id: int
+    trades_count: int
+    results: list[RepriceResult]
+
+
+class RunProfileResponse(BaseModel):
+    """Run 실행 프로파일 응답 스키마"""
+    run_id: int
+    status: RunStatus
+    engine_version: str
+    cache_hit: bool = Field(default=False, description="결과 캐시로 완료된 Run 여부")
+    spans: Dict[str, float] = Field(..., description="단계 이름 → 소요 시간(초), 실행 순서")
+    counters: Dict[str, int] = Field(
+        ..., description="bars, processed_bars, strategy_func_calls, get_value_calls, db_writes 등"
+    )
+    total_seconds: float = Field(..., description="실행 전체 소요 시간(초)")
+    bars_per_second: Optional[float] = Field(default=None, description="봉 루프 처리 속도 (bars / engine_run)")
+    peak_rss_bytes: Optional[int] = Field(default=None, description="실행 프로세스 최대 RSS (측정 불가 시 None)")
@@ -0,0 +1,95 @@
+"""
+Sweep Schemas
+"""
+
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional, Dict, Any
+
+from .run import RunStatus
+
+
+class SweepCreate(BaseModel):
+    """파라미터 스윕 생성 요청 스키마"""
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "name": "EMA 기간 스윕",
+                "dataset_id": 1,
+                "strategy_id": 1,
+                "preset_id": 1,
+                "param_space": {
+                    "indicators.ema_fast.params.period": {"start": 5, "stop": 30, "step": 5},
+                    "preset.risk_reward_ratio": [1.5, 2.0, 3.0]
+                }
+            }
+        }
+    )
+
+    name: Optional[str] = Field(default=None, description="스윕 이름")
+    dataset_id: int = Field(..., description="베이스 타임프레임 데이터셋 ID")
+    strategy_id: Optional[int] = Field(
+        default=None, description="템플릿으로 사용할 전략 ID (strategy_template과 둘 중 하나)"
+    )
+    strategy_template: Optional[Dict[str, Any]] = Field(
+        default=None, description="전략 정의 템플릿 (strategy_id와 둘 중 하나)"
+    )
+    param_space: Dict[str, Any] = Field(
+        ...,
+        description="파라미터 경로 → 값 리스트 또는 {'start', 'stop', 'step'} 범위 (stop 포함)"
+    )
+    preset_id: Optional[int] = Field(default=None, description="기준 프리셋 ID (없으면 기본 프리셋 사용)")
+    htf_dataset_ids: Optional[Dict[str, int]] = Field(
+        default=None, description="상위 타임프레임 데이터셋 매핑 ({'1h': 7} 형식)"
+    )
+
+
+class SweepResponse(BaseModel):
+    """파라미터 스윕 응답 스키마"""
+    model_config = ConfigDict(from_attributes=True)
+
+    sweep_id: int
+    name: Optional[str] = None
+    dataset_id: int
+    htf_dataset_ids: Optional[Dict[str, int]] = None
+    strategy_template: Dict[str, Any]
+    param_space: Dict[str, Any]
+    preset_id: Optional[int] = None
+    initial_balance: float
+    engine_version: str
+    status: RunStatus
+    total_combinations: int
+    completed_combinations: int
+    created_at: int
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
+    error: Optional[str] = None
+
+
+class SweepList(BaseModel):
+    """파라미터 스윕 목록 응답 스키마"""
+    sweeps: list[SweepResponse]
+    total: int
+
+
+class SweepResultResponse(BaseModel):
+    """조합별 스윕 결과 응답 스키마"""
+    combo_index: int
+    params: Dict[str, Any]
+    trades_count: Optional[int] = None
+    win_rate: Optional[float] = None
+    total_pnl: Optional[float] = None
+    profit_factor: Optional[float] = None
+    max_drawdown: Optional[float] = None
+    expectancy: Optional[float] = None
+    score: Optional[float] = None
+    grade: Optional[str] = None
+    error: Optional[str] = None
+
+
+class SweepResultList(BaseModel):
+    """스윕 top-K 결과 응답 스키마"""
+    sweep_id: int
+    order_by: str
+    results: list[SweepResultResponse]
+    completed_combinations: int
+    total_combinations: int
@@ -0,0 +1,41 @@
+"""
+Migration 012: runs.cache_key 컬럼 추가 (결정적 실행 결과 캐시)
+"""
+import sqlite3
+from pathlib import Path
+
+
+def apply_migration():
+    db_path = Path(__file__).parent / "algoforge.db"
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(runs)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "cache_key" in columns:
+            print("Migration 012 이미 적용됨.")
+            return
+
+        print("runs.cache_key 컬럼 추가 중...")
+        cursor.executescript("""
+            ALTER TABLE runs ADD COLUMN cache_key TEXT;
+            CREATE INDEX IF NOT EXISTS idx_runs_cache_key ON runs(cache_key);
+        """)
+
+        conn.commit()
+        print("[SUCCESS] Migration 012 적용 완료")
+
+    except Exception as e:
+        print(f"[ERROR] Migration 실패: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    apply_migration()
@@ -0,0 +1,44 @@
+"""
+Migration 013: runs 실행 대기열 컬럼 추가 (priority, queued_at)
+"""
+import sqlite3
+from pathlib import Path
+
+
+def apply_migration():
+    db_path = Path(__file__).parent / "algoforge.db"
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(runs)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "priority" in columns and "queued_at" in columns:
+            print("Migration 013 이미 적용됨.")
+            return
+
+        print("runs 대기열 컬럼 추가 중...")
+        if "priority" not in columns:
+            cursor.execute("ALTER TABLE runs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+        if "queued_at" not in columns:
+            cursor.execute("ALTER TABLE runs ADD COLUMN queued_at INTEGER")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_queue ON runs(status, priority, queued_at)"
+        )
+
+        conn.commit()
+        print("[SUCCESS] Migration 013 적용 완료")
+
+    except Exception as e:
+        print(f"[ERROR] Migration 실패: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    apply_migration()
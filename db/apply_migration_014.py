@@ -0,0 +1,41 @@
+"""
+Migration 014: 파라미터 스윕 테이블 추가 (sweeps, sweep_results)
+"""
+import sqlite3
+from pathlib import Path
+
+
+def apply_migration():
+    db_path = Path(__file__).parent / "algoforge.db"
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        return
+
+    migration_path = Path(__file__).parent / "migrations" / "014_add_sweeps.sql"
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='sweep_results'"
+        )
+        if cursor.fetchone():
+            print("Migration 014 이미 적용됨.")
+            return
+
+        print("sweeps / sweep_results 테이블 생성 중...")
+        cursor.executescript(migration_path.read_text(encoding="utf-8"))
+
+        conn.commit()
+        print("[SUCCESS] Migration 014 적용 완료")
+
+    except Exception as e:
+        print(f"[ERROR] Migration 실패: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    apply_migration()
@@ -0,0 +1,41 @@
+"""
+Migration 015: 업로드 수집 작업 테이블 추가 (dataset_ingest_jobs)
+"""
+import sqlite3
+from pathlib import Path
+
+
+def apply_migration():
+    db_path = Path(__file__).parent / "algoforge.db"
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        return
+
+    migration_path = Path(__file__).parent / "migrations" / "015_add_dataset_ingest_jobs.sql"
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='dataset_ingest_jobs'"
+        )
+        if cursor.fetchone():
+            print("Migration 015 이미 적용됨.")
+            return
+
+        print("dataset_ingest_jobs 테이블 생성 중...")
+        cursor.executescript(migration_path.read_text(encoding="utf-8"))
+
+        conn.commit()
+        print("[SUCCESS] Migration 015 적용 완료")
+
+    except Exception as e:
+        print(f"[ERROR] Migration 실패: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    apply_migration()
@@ -0,0 +1,8 @@
+-- runs.cache_key: 결정적 실행 결과 캐시 키
+-- 동일 입력 (데이터셋 해시 + 전략 해시 + 프리셋 리스크 파라미터 + 레버리지 테이블 + 엔진 버전)
+-- → 동일 결과이므로, 같은 cache_key의 COMPLETED Run 결과를 복제해 재실행을 생략
+-- 하위호환성: 기존 row는 NULL (캐시 대상 아님)
+
+ALTER TABLE runs ADD COLUMN cache_key TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_runs_cache_key ON runs(cache_key);
@@ -0,0 +1,8 @@
+-- runs 실행 대기열 컬럼: 프로세스 풀 실행기(RunExecutor)가 PENDING Run을 꺼내는 순서
+--   priority DESC → queued_at ASC → run_id ASC
+-- 하위호환성: 기존 row는 priority 0, queued_at NULL (run_id 순)
+
+ALTER TABLE runs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE runs ADD COLUMN queued_at INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_runs_queue ON runs(status, priority, queued_at);
@@ -0,0 +1,45 @@
+-- 파라미터 스윕: 전략 템플릿 + 파라미터 범위의 조합을 일괄 평가
+CREATE TABLE IF NOT EXISTS sweeps (
+    sweep_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    dataset_id INTEGER NOT NULL,
+    htf_dataset_ids TEXT,  -- JSON ({"1h": 7})
+    strategy_template TEXT NOT NULL,  -- JSON (전략 정의 템플릿)
+    param_space TEXT NOT NULL,  -- JSON (경로 → 값 리스트 또는 범위)
+    preset_id INTEGER,
+    initial_balance REAL NOT NULL,
+    engine_version TEXT NOT NULL,
+    status TEXT NOT NULL,  -- PENDING, RUNNING, COMPLETED, FAILED, CANCELLED
+    total_combinations INTEGER NOT NULL,
+    completed_combinations INTEGER NOT NULL DEFAULT 0,
+    created_at INTEGER NOT NULL,
+    started_at INTEGER,
+    completed_at INTEGER,
+    error TEXT,
+    FOREIGN KEY (dataset_id) REFERENCES datasets(dataset_id) ON DELETE RESTRICT,
+    FOREIGN KEY (preset_id) REFERENCES run_config_presets(preset_id) ON DELETE RESTRICT
+);
+
+-- 스윕 조합별 결과 (top-K 조회용 score 인덱스)
+CREATE TABLE IF NOT EXISTS sweep_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sweep_id INTEGER NOT NULL,
+    combo_index INTEGER NOT NULL,
+    params TEXT NOT NULL,  -- JSON (경로 → 값)
+    trades_count INTEGER,
+    win_rate REAL,
+    total_pnl REAL,
+    profit_factor REAL,
+    max_drawdown REAL,
+    expectancy REAL,
+    score REAL,
+    grade TEXT,
+    metrics TEXT,  -- JSON (전체 Metrics)
+    error TEXT,  -- 평가 실패 시 오류 메시지
+    UNIQUE (sweep_id, combo_index),
+    FOREIGN KEY (sweep_id) REFERENCES sweeps(sweep_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_sweeps_dataset ON sweeps(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_sweep_results_score ON sweep_results(sweep_id, score DESC);
+CREATE INDEX IF NOT EXISTS idx_sweep_results_total_pnl ON sweep_results(sweep_id, total_pnl DESC);
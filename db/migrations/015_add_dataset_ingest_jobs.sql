@@ -0,0 +1,21 @@
+-- 업로드 수집 작업 (POST /datasets/ingest): 모든 API 워커에서 진행 상태 조회
+CREATE TABLE IF NOT EXISTS dataset_ingest_jobs (
+    job_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    filename TEXT,
+    status TEXT NOT NULL,  -- PENDING, RUNNING, COMPLETED, FAILED
+    bytes_total INTEGER NOT NULL,
+    bytes_processed INTEGER NOT NULL DEFAULT 0,
+    rows_processed INTEGER NOT NULL DEFAULT 0,
+    eta_seconds REAL,
+    progress_message TEXT,
+    dataset_id INTEGER,
+    bars_count INTEGER,
+    error TEXT,
+    status_code INTEGER,  -- 실패 시 POST /datasets와 같은 HTTP 상태 (중복은 409)
+    details TEXT,  -- JSON (실패 상세)
+    started_at INTEGER NOT NULL,
+    elapsed_seconds REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_dataset_ingest_jobs_started ON dataset_ingest_jobs(started_at);
@@ -111,6 +111,9 @@ CREATE TABLE IF NOT EXISTS runs (
     processed_bars INTEGER DEFAULT 0,  -- 처리된 봉 개수
     total_bars INTEGER DEFAULT 0,  -- 전체 봉 개수
     preset_id INTEGER,  -- Run 수행 옵션 프리셋 ID
+    cache_key TEXT,  -- 결정적 실행 결과 캐시 키 (동일 입력 → 동일 결과)
+    priority INTEGER NOT NULL DEFAULT 0,  -- 실행 대기열 우선순위 (클수록 먼저)
+    queued_at INTEGER,  -- 실행 대기열 진입 시각 (같은 우선순위는 FIFO)
     FOREIGN KEY (dataset_id) REFERENCES datasets(dataset_id) ON DELETE RESTRICT,
     FOREIGN KEY (strategy_id) REFERENCES strategies(strategy_id) ON DELETE RESTRICT,
     FOREIGN KEY (preset_id) REFERENCES run_config_presets(preset_id) ON DELETE RESTRICT
@@ -230,10 +233,80 @@ CREATE TABLE IF NOT EXISTS run_datasets (
 CREATE INDEX IF NOT EXISTS idx_run_datasets_run ON run_datasets(run_id);
 CREATE INDEX IF NOT EXISTS idx_run_datasets_dataset ON run_datasets(dataset_id);
 
+-- 파라미터 스윕: 전략 템플릿 + 파라미터 범위의 조합을 일괄 평가
+CREATE TABLE IF NOT EXISTS sweeps (
+    sweep_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT,
+    dataset_id INTEGER NOT NULL,
+    htf_dataset_ids TEXT,  -- JSON ({"1h": 7})
+    strategy_template TEXT NOT NULL,  -- JSON (전략 정의 템플릿)
+    param_space TEXT NOT NULL,  -- JSON (경로 → 값 리스트 또는 범위)
+    preset_id INTEGER,
+    initial_balance REAL NOT NULL,
+    engine_version TEXT NOT NULL,
+    status TEXT NOT NULL,  -- PENDING, RUNNING, COMPLETED, FAILED, CANCELLED
+    total_combinations INTEGER NOT NULL,
+    completed_combinations INTEGER NOT NULL DEFAULT 0,
+    created_at INTEGER NOT NULL,
+    started_at INTEGER,
+    completed_at INTEGER,
+    error TEXT,
+    FOREIGN KEY (dataset_id) REFERENCES datasets(dataset_id) ON DELETE RESTRICT,
+    FOREIGN KEY (preset_id) REFERENCES run_config_presets(preset_id) ON DELETE RESTRICT
+);
+
+-- 스윕 조합별 결과 (top-K 조회용 score 인덱스)
+CREATE TABLE IF NOT EXISTS sweep_results (
+    result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sweep_id INTEGER NOT NULL,
+    combo_index INTEGER NOT NULL,
+    params TEXT NOT NULL,  -- JSON (경로 → 값)
+    trades_count INTEGER,
+    win_rate REAL,
+    total_pnl REAL,
+    profit_factor REAL,
+    max_drawdown REAL,
+    expectancy REAL,
+    score REAL,
+    grade TEXT,
+    metrics TEXT,  -- JSON (전체 Metrics)
+    error TEXT,  -- 평가 실패 시 오류 메시지
+    UNIQUE (sweep_id, combo_index),
+    FOREIGN KEY (sweep_id) REFERENCES sweeps(sweep_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_sweeps_dataset ON sweeps(dataset_id);
+CREATE INDEX IF NOT EXISTS idx_sweep_results_score ON sweep_results(sweep_id, score DESC);
+CREATE INDEX IF NOT EXISTS idx_sweep_results_total_pnl ON sweep_results(sweep_id, total_pnl DESC);
+
+-- 업로드 수집 작업 (POST /datasets/ingest): 모든 API 워커에서 진행 상태 조회
+CREATE TABLE IF NOT EXISTS dataset_ingest_jobs (
+    job_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    filename TEXT,
+    status TEXT NOT NULL,  -- PENDING, RUNNING, COMPLETED, FAILED
+    bytes_total INTEGER NOT NULL,
+    bytes_processed INTEGER NOT NULL DEFAULT 0,
+    rows_processed INTEGER NOT NULL DEFAULT 0,
+    eta_seconds REAL,
+    progress_message TEXT,
+    dataset_id INTEGER,
+    bars_count INTEGER,
+    error TEXT,
+    status_code INTEGER,  -- 실패 시 POST /datasets와 같은 HTTP 상태 (중복은 409)
+    details TEXT,  -- JSON (실패 상세)
+    started_at INTEGER NOT NULL,
+    elapsed_seconds REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_dataset_ingest_jobs_started ON dataset_ingest_jobs(started_at);
+
 -- 인덱스
 CREATE INDEX IF NOT EXISTS idx_runs_dataset ON runs(dataset_id);
 CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs(strategy_id);
 CREATE INDEX IF NOT EXISTS idx_runs_preset ON runs(preset_id);
+CREATE INDEX IF NOT EXISTS idx_runs_cache_key ON runs(cache_key);
+CREATE INDEX IF NOT EXISTS idx_runs_queue ON runs(status, priority, queued_at);
 CREATE INDEX IF NOT EXISTS idx_trades_run ON trades(run_id);
 CREATE INDEX IF NOT EXISTS idx_trade_legs_trade ON trade_legs(trade_id);
 CREATE INDEX IF NOT EXISTS idx_leverage_brackets_min ON leverage_brackets(bracket_min);
@@ -4,5 +4,5 @@ AlgoForge 백테스트 엔진
 결정적(deterministic)이고 재현 가능한 백테스트 엔진
 """
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
@@ -1,12 +1,19 @@
 """
 백테스트 엔진 모듈
 """
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Sequence, TYPE_CHECKING
+import numpy as np
 from ..models.bar import Bar
+from ..models.bar_array import BarArray, timestamps_of
 from ..models.position import Position, Direction
 from ..models.trade import Trade
 from ..models.trade_leg import TradeLeg, ExitType
 from .risk_manager import RiskManager
+from ..utils.range_query import PriceRangeIndex
+from ..utils.leverage_loader import LeverageBracket
+
+if TYPE_CHECKING:
+    from ..utils.signal_compiler import CompiledSignals
 
 
 class BacktestEngine:
@@ -24,7 +31,7 @@ class BacktestEngine:
     """
     
     # 엔진 버전 (결정성 보장을 위해 명시)
-    VERSION = "1.0.0"
+    VERSION = "1.1.0"
     
     def __init__(
         self, 
@@ -38,7 +45,9 @@ class BacktestEngine:
         exit_checker: Optional[Callable[[int, str], bool]] = None,
         atr_trailing_config: Optional[Dict[str, Any]] = None,
         atr_value_getter: Optional[Callable[[int], Optional[float]]] = None,
-        timestamp_to_index: Optional[Dict[int, int]] = None
+        timestamp_to_index: Optional[Dict[int, int]] = None,
+        compiled_signals: Optional["CompiledSignals"] = None,
+        leverage_brackets: Optional[List[LeverageBracket]] = None
     ):
         """
         Args:
@@ -62,6 +71,12 @@ class BacktestEngine:
                 입력: (bar_index: int)
                 출력: Optional[float]
             timestamp_to_index: timestamp → bar_index 매핑 (선택)
+            compiled_signals: 미리 컴파일된 신호 배열 (선택)
+                StrategyParser.compile_signals() 결과. 지정하면 봉마다
+                strategy_func / exit_checker / atr_value_getter를 호출하지 않고
+                배열에서 직접 조회 (결과는 동일)
+            leverage_brackets: 미리 로드한 레버리지 구간 (선택)
+                여러 번 실행할 때 db_conn 대신 전달하면 매번 DB를 조회하지 않음
         """
         if initial_balance <= 0:
             raise ValueError("초기 잔고는 0보다 커야 합니다")
@@ -75,7 +90,8 @@ class BacktestEngine:
             initial_balance, 
             risk_percent=risk_percent,
             risk_reward_ratio=risk_reward_ratio,
-            db_conn=db_conn
+            db_conn=db_conn,
+            leverage_brackets=leverage_brackets
         )
         self.progress_callback = progress_callback
         self.rebalance_interval = rebalance_interval
@@ -85,6 +101,7 @@ class BacktestEngine:
         self.atr_trailing_config = atr_trailing_config
         self.atr_value_getter = atr_value_getter
         self.timestamp_to_index = timestamp_to_index or {}
+        self.compiled_signals = compiled_signals
         
         # 상태 관리
         self.current_position: Optional[Position] = None
@@ -94,15 +111,39 @@ class BacktestEngine:
         # 거래 완료 카운터 (잔고 재평가용)
         self.completed_trades_count = 0
         
+        # 현재 열린 거래 (포지션과 짝을 이루는 Trade, O(1) 참조)
+        self._open_trade: Optional[Trade] = None
+        
+        # 완료된 거래별 실현 PnL (거래 종료 순서 = trades 순서, 잔고 재평가용)
+        # 재평가 시 내장 sum()으로 합산하므로 기존 sum(t.calculate_total_pnl() for t in trades)와
+        # 비트 단위로 같고, 거래마다 PnL을 다시 계산하지 않음
+        self._closed_trade_pnls: List[float] = []
+        
         # 경고 메시지 저장 (run_artifacts에 기록될 내용)
         self.warnings: List[str] = []
+        
+        # 실행 통계 (프로파일링용)
+        # - processed_bars: 실제로 처리한 봉 수 (건너뛴 봉 제외)
+        # - strategy_func_calls: strategy_func 호출 수 (compiled_signals 사용 시 0)
+        # - compiled_signal_lookups: compiled_signals 신호 조회 수
+        self.stats: Dict[str, int] = {
+            'processed_bars': 0,
+            'strategy_func_calls': 0,
+            'compiled_signal_lookups': 0,
+        }
+        
+        # 진행률 콜백 주기 (run()에서 설정)
+        self._progress_interval = 1
+        
+        # SL / TP1 도달 봉 탐색용 구간 인덱스 (compiled_signals 사용 시 run()에서 생성)
+        self._price_index: Optional[PriceRangeIndex] = None
     
-    def run(self, bars: List[Bar]) -> List[Trade]:
+    def run(self, bars: Sequence[Bar]) -> List[Trade]:
         """
         백테스트 실행
         
         Args:
-            bars: 봉 데이터 리스트 (timestamp 오름차순 정렬 필수)
+            bars: 봉 데이터 리스트 또는 BarArray (timestamp 오름차순 정렬 필수)
         
         Returns:
             거래 목록
@@ -114,34 +155,159 @@ class BacktestEngine:
         if not bars:
             raise ValueError("bars가 비어있습니다")
         
-        # timestamp 오름차순 정렬 확인
-        for i in range(len(bars) - 1):
-            if bars[i].timestamp >= bars[i + 1].timestamp:
-                raise ValueError(
-                    f"bars는 timestamp 오름차순으로 정렬되어야 합니다 "
-                    f"(index {i}: {bars[i].timestamp} >= "
-                    f"index {i+1}: {bars[i+1].timestamp})"
-                )
+        # timestamp 오름차순 정렬 확인 (BarArray는 Bar 생성 없이 배열로 확인)
+        timestamps = timestamps_of(bars)
+        unsorted = np.flatnonzero(timestamps[:-1] >= timestamps[1:])
+        if len(unsorted) > 0:
+            i = int(unsorted[0])
+            raise ValueError(
+                f"bars는 timestamp 오름차순으로 정렬되어야 합니다 "
+                f"(index {i}: {int(timestamps[i])} >= "
+                f"index {i+1}: {int(timestamps[i + 1])})"
+            )
         
         total_bars = len(bars)
         
+        if self.compiled_signals is not None and len(self.compiled_signals) != total_bars:
+            raise ValueError(
+                f"compiled_signals 길이({len(self.compiled_signals)})가 "
+                f"bars 길이({total_bars})와 다릅니다"
+            )
+        
+        # 진행률 콜백 주기 (업데이트 빈도: 1% 단위 또는 최소 100개 봉마다)
+        self._progress_interval = max(1, total_bars // 100)
+        
+        # 진입 후보 봉 인덱스 (무포지션 구간 건너뛰기용)
+        candidates = None
+        if self.compiled_signals is not None:
+            candidates = self.compiled_signals.candidate_indices
+            self._price_index = self._build_price_index(bars)
+        
         # 봉 단위 처리
-        for idx, bar in enumerate(bars):
-            self._process_bar(bar)
+        idx = 0
+        while idx < total_bars:
+            # 상태를 바꾸지 않는 봉은 건너뛰어도 결과 동일
+            # - 포지션 없음: 다음 진입 후보 봉까지 이동
+            # - 포지션 보유: 다음 SL / TP1 / 지표 진출 / 반대 신호 봉까지 이동
+            if candidates is not None:
+                if self.current_position is None:
+                    next_idx = self._next_candidate_index(candidates, idx, total_bars)
+                else:
+                    next_idx = self._next_position_event_index(idx, total_bars)
+                if next_idx > idx:
+                    self._report_progress_range(idx, next_idx, total_bars)
+                    idx = next_idx
+                    if idx >= total_bars:
+                        break
             
-            # 진행률 콜백 호출 (업데이트 빈도: 1% 단위 또는 최소 100개 봉마다)
-            if self.progress_callback:
-                update_interval = max(1, total_bars // 100)
-                # 마지막 봉이거나 업데이트 주기에 도달한 경우
-                if (idx + 1) % update_interval == 0 or (idx + 1) == total_bars:
-                    self.progress_callback(idx + 1, total_bars)
+            self._process_bar(bars[idx], idx)
+            self.stats['processed_bars'] += 1
+            self._report_progress_range(idx, idx + 1, total_bars)
+            idx += 1
         
         return self.trades
     
-    def _process_bar(self, bar: Bar) -> None:
+    @staticmethod
+    def _next_candidate_index(candidates: np.ndarray, start: int, total_bars: int) -> int:
+        """
+        start 이상인 첫 진입 후보 봉 인덱스 (없으면 total_bars)
+        """
+        pos = int(np.searchsorted(candidates, start, side='left'))
+        if pos >= len(candidates):
+            return total_bars
+        return int(candidates[pos])
+    
+    @staticmethod
+    def _build_price_index(bars: Sequence[Bar]) -> PriceRangeIndex:
+        """저가/고가 배열로 구간 인덱스 생성 (BarArray는 복사 없이 사용)"""
+        if isinstance(bars, BarArray):
+            return PriceRangeIndex(bars.low, bars.high)
+        return PriceRangeIndex(
+            np.fromiter((b.low for b in bars), dtype=np.float64, count=len(bars)),
+            np.fromiter((b.high for b in bars), dtype=np.float64, count=len(bars)),
+        )
+    
+    def _next_position_event_index(self, start: int, total_bars: int) -> int:
+        """
+        포지션 보유 중 start 이상에서 상태가 바뀔 수 있는 첫 봉 인덱스
+        
+        후보 (가장 이른 봉):
+        - SL 도달 (LONG: low <= SL, SHORT: high >= SL)
+        - TP1 도달 (TP1 전에만)
+        - 지표 기반 진출 조건 충족 (exit_checker 사용 시)
+        - 반대 방향 신호
+        
+        ATR Trailing(TP1 이후)처럼 매 봉 상태가 갱신되거나, 컴파일되지 않은
+        exit_checker를 써야 하는 경우에는 start를 반환 (봉 단위 처리)
+        """
+        pos = self.current_position
+        compiled = self.compiled_signals
+        price_index = self._price_index
+        if pos is None or compiled is None or price_index is None:
+            return start
+        
+        # 봉마다 trailing_stop이 갱신되므로 건너뛸 수 없음
+        if pos.tp1_hit and self.atr_trailing_config:
+            return start
+        
+        exit_indices = None
+        if self.exit_checker:
+            exit_indices = compiled.exit_indices(pos.direction)
+            if exit_indices is None:
+                # 컴파일되지 않은 진출 조건은 봉마다 평가해야 함
+                return start
+        
+        if pos.direction == 'LONG':
+            next_idx = price_index.first_low_at_or_below(start, pos.stop_loss)
+            if not pos.tp1_hit:
+                next_idx = min(
+                    next_idx,
+                    price_index.first_high_at_or_above(start, pos.take_profit_1)
+                )
+            opposite = compiled.signal_indices('SHORT')
+        else:  # SHORT
+            next_idx = price_index.first_high_at_or_above(start, pos.stop_loss)
+            if not pos.tp1_hit:
+                next_idx = min(
+                    next_idx,
+                    price_index.first_low_at_or_below(start, pos.take_profit_1)
+                )
+            opposite = compiled.signal_indices('LONG')
+        
+        next_idx = min(next_idx, self._next_candidate_index(opposite, start, total_bars))
+        if exit_indices is not None:
+            next_idx = min(next_idx, self._next_candidate_index(exit_indices, start, total_bars))
+        
+        return min(next_idx, total_bars)
+    
+    def _report_progress_range(self, start: int, end: int, total_bars: int) -> None:
+        """
+        봉 [start, end) 처리 완료에 해당하는 진행률 콜백 호출
+        
+        봉을 하나씩 처리할 때와 동일한 (processed, total) 순서로 호출합니다.
+        (processed % 주기 == 0 이거나 마지막 봉인 경우)
+        """
+        if not self.progress_callback or end <= start:
+            return
+        
+        interval = self._progress_interval
+        # start+1 이상인 첫 주기 배수
+        first = ((start + interval) // interval) * interval
+        for processed in range(first, end + 1, interval):
+            self.progress_callback(processed, total_bars)
+        
+        # 마지막 봉이 주기 배수가 아니면 별도 호출
+        if end == total_bars and total_bars % interval != 0:
+            self.progress_callback(total_bars, total_bars)
+    
+    def _process_bar(self, bar: Bar, bar_index: Optional[int] = None) -> None:
         """
         봉 처리 (핵심 로직)
         
+        Args:
+            bar: 현재 봉
+            bar_index: 현재 봉 인덱스 (compiled_signals 조회용, 선택)
+        
         처리 순서:
         1. 기존 포지션 관리
         2. SL / TP1 / Reverse 판정 (우선순위 적용)
@@ -161,7 +327,7 @@ class BacktestEngine:
             self.current_position.tp1_occurred_this_bar = False
             
             # 2. SL / TP1 / Reverse 판정 (우선순위 적용)
-            exit_type = self._check_exit_conditions(bar)
+            exit_type = self._check_exit_conditions(bar, bar_index)
             
             # 3. 포지션 종료 처리
             if exit_type:
@@ -175,9 +341,30 @@ class BacktestEngine:
         # - REVERSE/BE 청산 후에는 재진입 불가 (TP1 발생 후이므로)
         if not self.current_position:
             if closed_exit_type is None or closed_exit_type == 'SL':
-                self._check_entry_signal(bar)
+                self._check_entry_signal(bar, bar_index)
+    
+    def _get_signal(
+        self,
+        bar: Bar,
+        bar_index: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        현재 봉의 전략 신호 조회
+        
+        compiled_signals와 bar_index가 있으면 배열에서 조회하고,
+        없으면 strategy_func를 호출합니다.
+        """
+        if self.compiled_signals is not None and bar_index is not None:
+            self.stats['compiled_signal_lookups'] += 1
+            return self.compiled_signals.signal_at(bar_index)
+        self.stats['strategy_func_calls'] += 1
+        return self.strategy_func(bar)
     
-    def _check_exit_conditions(self, bar: Bar) -> Optional[ExitType]:
+    def _check_exit_conditions(
+        self,
+        bar: Bar,
+        bar_index: Optional[int] = None
+    ) -> Optional[ExitType]:
         """
         청산 조건 체크
         
@@ -201,7 +388,7 @@ class BacktestEngine:
         
         # TP1 후 ATR Trailing이 활성화되어 있으면 trailing_stop 업데이트
         if pos.tp1_hit and self.atr_trailing_config:
-            self._update_trailing_stop(bar, pos)
+            self._update_trailing_stop(bar, pos, bar_index)
         
         # 1. Stop Loss 체크 (최우선) - trailing_stop도 고려
         if self._check_stop_loss(bar, pos):
@@ -216,7 +403,7 @@ class BacktestEngine:
             return None
         
         # 3. 지표 기반 진출 조건 체크
-        if self._check_indicator_exit(bar, pos):
+        if self._check_indicator_exit(bar, pos, bar_index):
             # 지표 기반 진출은 EXIT_INDICATOR로 청산
             # TP1 후면 BE로, 아니면 REVERSE로 처리 (기존 exit_type 재활용)
             if pos.tp1_hit:
@@ -227,7 +414,7 @@ class BacktestEngine:
         # 4. Reverse Signal 체크
         # 중요: TP1 발생 봉에서는 reverse 평가 안 함
         if not pos.tp1_occurred_this_bar:
-            if self._check_reverse_signal(bar, pos):
+            if self._check_reverse_signal(bar, pos, bar_index):
                 # TP1 후 잔여 포지션이면 BE 청산
                 if pos.tp1_hit:
                     return 'BE'
@@ -236,7 +423,12 @@ class BacktestEngine:
         
         return None
     
-    def _update_trailing_stop(self, bar: Bar, pos: Position) -> None:
+    def _update_trailing_stop(
+        self,
+        bar: Bar,
+        pos: Position,
+        bar_index: Optional[int] = None
+    ) -> None:
         """
         ATR Trailing Stop 업데이트
         
@@ -247,17 +439,31 @@ class BacktestEngine:
         Args:
             bar: 현재 봉
             pos: 현재 포지션
+            bar_index: 현재 봉 인덱스 (선택)
         """
-        if not self.atr_trailing_config or not self.atr_value_getter:
+        if not self.atr_trailing_config:
             return
         
-        # 봉 인덱스 가져오기
-        bar_index = self.timestamp_to_index.get(bar.timestamp)
-        if bar_index is None:
-            return
+        compiled_atr = (
+            self.compiled_signals.atr_values
+            if self.compiled_signals is not None and bar_index is not None
+            else None
+        )
+        
+        if compiled_atr is not None:
+            atr_value = float(compiled_atr[bar_index])
+        else:
+            if not self.atr_value_getter:
+                return
+            
+            # 봉 인덱스 가져오기
+            bar_index = self.timestamp_to_index.get(bar.timestamp)
+            if bar_index is None:
+                return
+            
+            # ATR 값 가져오기
+            atr_value = self.atr_value_getter(bar_index)
         
-        # ATR 값 가져오기
-        atr_value = self.atr_value_getter(bar_index)
         if atr_value is None or atr_value <= 0:
             return
         
@@ -291,13 +497,19 @@ class BacktestEngine:
                 # stop_loss도 함께 업데이트
                 pos.stop_loss = pos.trailing_stop
     
-    def _check_indicator_exit(self, bar: Bar, pos: Position) -> bool:
+    def _check_indicator_exit(
+        self,
+        bar: Bar,
+        pos: Position,
+        bar_index: Optional[int] = None
+    ) -> bool:
         """
         지표 기반 진출 조건 체크
         
         Args:
             bar: 현재 봉
             pos: 현재 포지션
+            bar_index: 현재 봉 인덱스 (선택)
         
         Returns:
             bool: 진출 조건 충족 여부
@@ -305,6 +517,14 @@ class BacktestEngine:
         if not self.exit_checker:
             return False
         
+        # 컴파일된 진출 마스크가 있으면 배열에서 조회
+        if (
+            self.compiled_signals is not None
+            and bar_index is not None
+            and self.compiled_signals.exit_long_mask is not None
+        ):
+            return self.compiled_signals.exit_at(bar_index, pos.direction)
+        
         # 봉 인덱스 가져오기
         bar_index = self.timestamp_to_index.get(bar.timestamp)
         if bar_index is None:
@@ -372,10 +592,7 @@ class BacktestEngine:
             pos: 현재 포지션
         """
         # 현재 trade 가져오기
-        current_trade = next(
-            (t for t in self.trades if t.trade_id == pos.trade_id), 
-            None
-        )
+        current_trade = self._find_open_trade(pos)
         if not current_trade:
             self.warnings.append(
                 f"timestamp={bar.timestamp}: "
@@ -408,18 +625,39 @@ class BacktestEngine:
         # 3. 플래그 설정 (이 봉에서는 reverse 평가 안 함)
         pos.tp1_occurred_this_bar = True
     
-    def _check_reverse_signal(self, bar: Bar, pos: Position) -> bool:
+    def _find_open_trade(self, pos: Position) -> Optional[Trade]:
+        """
+        포지션에 해당하는 Trade 조회
+        
+        진입 시 보관한 참조를 우선 사용하고(O(1)), 외부에서 포지션을
+        직접 설정한 경우에만 trades를 검색합니다.
+        """
+        trade = self._open_trade
+        if trade is not None and trade.trade_id == pos.trade_id:
+            return trade
+        return next(
+            (t for t in self.trades if t.trade_id == pos.trade_id), 
+            None
+        )
+    
+    def _check_reverse_signal(
+        self,
+        bar: Bar,
+        pos: Position,
+        bar_index: Optional[int] = None
+    ) -> bool:
         """
         반대 방향 신호 체크
         
         Args:
             bar: 현재 봉
             pos: 현재 포지션
+            bar_index: 현재 봉 인덱스 (선택)
         
         Returns:
             반대 방향 신호 발생 여부
         """
-        signal = self.strategy_func(bar)
+        signal = self._get_signal(bar, bar_index)
         
         if signal is None:
             return False
@@ -453,10 +691,7 @@ class BacktestEngine:
             return
         
         # 현재 trade 가져오기
-        current_trade = next(
-            (t for t in self.trades if t.trade_id == pos.trade_id), 
-            None
-        )
+        current_trade = self._find_open_trade(pos)
         if not current_trade:
             self.warnings.append(
                 f"timestamp={bar.timestamp}: "
@@ -489,6 +724,10 @@ class BacktestEngine:
         
         # 포지션 초기화
         self.current_position = None
+        self._open_trade = None
+        
+        # 실현 PnL 기록 (거래 종료 순서 = trades 순서)
+        self._closed_trade_pnls.append(current_trade.calculate_total_pnl())
         
         # 거래 완료 카운터 증가
         self.completed_trades_count += 1
@@ -496,20 +735,21 @@ class BacktestEngine:
         # 설정된 주기마다 잔고 재평가
         if self.completed_trades_count % self.rebalance_interval == 0:
             # 현재 잔고 = 초기 자산 + 모든 완료된 거래의 누적 PnL
-            total_pnl = sum(t.calculate_total_pnl() for t in self.trades)
+            total_pnl = sum(self._closed_trade_pnls)
             current_balance = self.initial_balance + total_pnl
             
             # RiskManager의 잔고 업데이트
             self.risk_manager.update_balance(current_balance)
     
-    def _check_entry_signal(self, bar: Bar) -> None:
+    def _check_entry_signal(self, bar: Bar, bar_index: Optional[int] = None) -> None:
         """
         신규 진입 신호 체크 및 처리
         
         Args:
             bar: 현재 봉
+            bar_index: 현재 봉 인덱스 (선택)
         """
-        signal = self.strategy_func(bar)
+        signal = self._get_signal(bar, bar_index)
         
         if signal is None:
             return
@@ -628,6 +868,7 @@ class BacktestEngine:
             leverage=leverage  # 사용한 레버리지 저장
         )
         self.trades.append(trade)
+        self._open_trade = trade
         
         # trade_id 증가
         self.trade_id_counter += 1
@@ -0,0 +1,341 @@
+"""
+파라미터 스윕 실행 모듈
+
+하나의 데이터셋에 대해 전략 변형(조합) 여러 개를 평가합니다.
+
+- 데이터셋은 한 번만 로드: 워커 프로세스에는 .npy memmap으로 공유
+- 지표는 (TF, 타입, 파라미터)별로 한 번만 계산: 모든 조합의 지표를 먼저 계산한
+  IndicatorCache를 .npy memmap으로 공유
+- 조합은 청크 단위로 워커 프로세스에 분배, 결과는 청크마다 콜백으로 전달
+
+DB에 의존하지 않으며 결과 저장은 호출부(API)가 담당합니다.
+"""
+
+import logging
+import multiprocessing
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.bar_array import BarArray
+from ..utils.indicator_cache import IndicatorCache
+from ..utils.indicator_planner import build_indicator_plan
+from ..utils.leverage_loader import LeverageBracket
+from ..utils.strategy_parser import BASE_TF, StrategyParser
+from .backtest_engine import BacktestEngine
+from .metrics_calculator import MetricsCalculator
+
+logger = logging.getLogger(__name__)
+
+# (combo_index, 전략 정의, 프리셋)
+SweepTask = Tuple[int, Dict[str, Any], Dict[str, Any]]
+
+# 워커 프로세스 상태 (initializer에서 설정)
+_worker_state: Dict[str, Any] = {}
+
+
+def evaluate_combination(
+    definition: Dict[str, Any],
+    preset: Dict[str, Any],
+    initial_balance: float,
+    bars: BarArray,
+    htf_bars: Optional[Dict[str, BarArray]] = None,
+    indicator_cache: Optional[IndicatorCache] = None,
+    leverage_brackets: Optional[List[LeverageBracket]] = None,
+    dataset_hashes: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    전략 변형 하나를 백테스트하고 Metrics를 반환
+
+    Args:
+        definition: 전략 정의
+        preset: risk_percent, risk_reward_ratio, rebalance_interval
+        initial_balance: 초기 자산
+        bars: 베이스 봉
+        htf_bars: 상위 타임프레임 봉 (role → BarArray)
+        indicator_cache: 지표 캐시 (공유)
+        leverage_brackets: 레버리지 구간 (없으면 레버리지 제약 없음)
+        dataset_hashes: 타임프레임 → 데이터셋 해시 (있으면 HTF 인덱스 매핑을 조합 간 재사용)
+
+    Returns:
+        Dict[str, Any]: Metrics 필드 딕셔너리
+    """
+    htf_data = {tf: (tf_bars, None) for tf, tf_bars in (htf_bars or {}).items()}
+    parser = StrategyParser(
+        strategy_definition=definition,
+        bars=bars,
+        htf_data=htf_data or None,
+        indicator_cache=indicator_cache,
+        dataset_hashes=dataset_hashes,
+    )
+
+    engine = BacktestEngine(
+        initial_balance=initial_balance,
+        strategy_func=parser.create_strategy_function(),
+        risk_percent=preset['risk_percent'],
+        risk_reward_ratio=preset['risk_reward_ratio'],
+        rebalance_interval=preset['rebalance_interval'],
+        exit_checker=parser.create_exit_checker() if parser.has_indicator_based_exit() else None,
+        atr_trailing_config=parser.get_atr_trailing_config() if parser.has_atr_trailing() else None,
+        atr_value_getter=parser.get_atr_value if parser.has_atr_trailing() else None,
+        timestamp_to_index=parser.timestamp_to_index,
+        compiled_signals=parser.compile_signals(),
+        leverage_brackets=leverage_brackets,
+    )
+    trades = engine.run(bars)
+    return asdict(MetricsCalculator().calculate(trades))
+
+
+class ParamSweepRunner:
+    """
+    전략 변형 일괄 평가기
+
+    Attributes:
+        bars: 베이스 봉
+        htf_bars: 상위 타임프레임 봉 (role → BarArray)
+        initial_balance: 초기 자산
+        leverage_brackets: 레버리지 구간
+        max_workers: 워커 프로세스 수 (1 이하면 현재 프로세스에서 순차 실행)
+        indicator_cache: 조합 간 공유되는 지표 캐시
+        dataset_hashes: 타임프레임 → 데이터셋 해시 (HTF 인덱스 매핑 캐시 키)
+    """
+
+    def __init__(
+        self,
+        bars: BarArray,
+        initial_balance: float,
+        htf_bars: Optional[Dict[str, BarArray]] = None,
+        leverage_brackets: Optional[List[LeverageBracket]] = None,
+        max_workers: int = 1,
+        chunk_size: Optional[int] = None,
+        dataset_hashes: Optional[Dict[str, str]] = None
+    ):
+        """
+        Args:
+            bars: 베이스 봉 (BarArray)
+            initial_balance: 초기 자산
+            htf_bars: 상위 타임프레임 봉 (선택)
+            leverage_brackets: 레버리지 구간 (선택)
+            max_workers: 워커 프로세스 수
+            chunk_size: 워커 작업 단위 조합 수 (None이면 자동)
+            dataset_hashes: 타임프레임 → 데이터셋 해시 (선택)
+        """
+        if initial_balance <= 0:
+            raise ValueError("초기 잔고는 0보다 커야 합니다")
+
+        self.bars = BarArray.from_bars(bars)
+        self.htf_bars = {tf: BarArray.from_bars(b) for tf, b in (htf_bars or {}).items()}
+        self.initial_balance = initial_balance
+        self.leverage_brackets = leverage_brackets
+        self.max_workers = max(1, max_workers)
+        self.chunk_size = chunk_size
+        self.indicator_cache = IndicatorCache()
+        self.dataset_hashes = dict(dataset_hashes) if dataset_hashes else None
+
+    def warm_indicator_cache(self, definitions: List[Dict[str, Any]]) -> int:
+        """
+        모든 조합의 지표를 (TF, 타입, 파라미터)별로 한 번씩 미리 계산
+
+        조합별 지표 계산 계획(참조되는 지표 + source 의존 지표)을 모아
+        정규화 정의가 같은 지표는 하나로 합칩니다.
+
+        Args:
+            definitions: 조합별 전략 정의
+
+        Returns:
+            int: 캐시된 고유 지표 수
+        """
+        # 정규화 키 → 사전 계산용 지표 정의 (의존 순서 유지)
+        warm_ids: Dict[str, str] = {}
+        indicators: List[Dict[str, Any]] = []
+        dependencies: Dict[str, List[str]] = {}
+        pending = False
+        for definition in definitions:
+            try:
+                plan = build_indicator_plan(definition)
+            except ValueError:
+                # 조합 평가 시 오류로 기록됨
+                continue
+
+            plan_keys = {}
+            for step in plan.steps:
+                for indicator_id in [step.indicator_id] + step.aliases:
+                    plan_keys[indicator_id] = step.key
+                if step.key in warm_ids:
+                    continue
+
+                warm_id = f"__sweep_{len(warm_ids)}"
+                warm_ids[step.key] = warm_id
+                indicator = dict(step.definition, id=warm_id, timeframe=step.tf)
+                dependencies[warm_id] = []
+                if step.source is not None:
+                    source_id = warm_ids[plan_keys[step.source[0]]]
+                    indicator["params"] = dict(indicator["params"], source=source_id + step.source[1])
+                    dependencies[warm_id] = dependencies[source_id] + [source_id]
+                indicators.append(indicator)
+
+                cache_key = IndicatorCache.make_key(step.tf, step.cache_definition)
+                pending = pending or cache_key not in self.indicator_cache
+
+        if pending:
+            # 고유 지표만 모은 전략 정의 하나로 계산 (커스텀 지표 로드도 1회)
+            try:
+                self._warm(indicators)
+            except Exception:
+                # 계산할 수 없는 지표가 섞여 있으면 지표별로 (의존 지표 포함) 계산
+                # (실패한 지표는 캐시하지 않고, 해당 조합 평가 시 오류로 기록됨)
+                by_id = {indicator["id"]: indicator for indicator in indicators}
+                for indicator in indicators:
+                    try:
+                        self._warm(
+                            [by_id[dep] for dep in dependencies[indicator["id"]]] + [indicator]
+                        )
+                    except Exception as e:
+                        logger.warning(f"[스윕] 지표 사전 계산 실패: {indicator.get('type')}: {e}")
+
+        logger.info(f"[스윕] 지표 캐시: 고유 지표 {len(self.indicator_cache)}개")
+        return len(self.indicator_cache)
+
+    def _warm(self, indicators: List[Dict[str, Any]]) -> None:
+        """지표만 있는 전략 정의를 파싱해 캐시 채우기 (참조 여부와 무관하게 모두 계산)"""
+        StrategyParser(
+            strategy_definition={"indicators": indicators},
+            bars=self.bars,
+            htf_data={tf: (b, None) for tf, b in self.htf_bars.items()} or None,
+            indicator_cache=self.indicator_cache,
+            prune_unreferenced_indicators=False,
+        )
+
+    def run(
+        self,
+        tasks: List[SweepTask],
+        on_results: Callable[[List[Dict[str, Any]]], None],
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> bool:
+        """
+        조합 평가 실행
+
+        Args:
+            tasks: (combo_index, 전략 정의, 프리셋) 리스트
+            on_results: 결과 콜백 (청크마다 호출)
+                각 결과: {"combo_index", "metrics" (Dict 또는 None), "error" (str 또는 None)}
+            should_stop: 중지 여부 확인 함수 (청크마다 호출, True면 남은 작업 취소)
+
+        Returns:
+            bool: 모든 조합을 평가했으면 True, 중지되었으면 False
+        """
+        self.warm_indicator_cache([definition for _, definition, _ in tasks])
+
+        chunks = self._chunk(tasks)
+        if self.max_workers == 1 or len(chunks) == 1:
+            for chunk in chunks:
+                if should_stop and should_stop():
+                    return False
+                on_results(_evaluate_chunk(
+                    chunk, self.bars, self.htf_bars, self.indicator_cache,
+                    self.initial_balance, self.leverage_brackets, self.dataset_hashes,
+                ))
+            return True
+
+        with tempfile.TemporaryDirectory(prefix="algoforge_sweep_") as shared_dir:
+            self._write_shared(Path(shared_dir))
+            return self._run_parallel(chunks, shared_dir, on_results, should_stop)
+
+    def _run_parallel(
+        self,
+        chunks: List[List[SweepTask]],
+        shared_dir: str,
+        on_results: Callable[[List[Dict[str, Any]]], None],
+        should_stop: Optional[Callable[[], bool]]
+    ) -> bool:
+        """워커 프로세스 풀로 청크 분배 (제출은 워커 수의 2배까지만 유지)"""
+        pending_chunks = list(reversed(chunks))
+        in_flight = set()
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                shared_dir, sorted(self.htf_bars), self.initial_balance,
+                self.leverage_brackets, self.dataset_hashes,
+            ),
+        ) as pool:
+            while pending_chunks or in_flight:
+                if should_stop and should_stop():
+                    for future in in_flight:
+                        future.cancel()
+                    return False
+
+                while pending_chunks and len(in_flight) < self.max_workers * 2:
+                    in_flight.add(pool.submit(_evaluate_chunk_in_worker, pending_chunks.pop()))
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    on_results(future.result())
+
+        return True
+
+    def _write_shared(self, directory: Path) -> None:
+        """워커 공유용 봉 / 지표 캐시 저장"""
+        self.bars.save(directory / "bars" / BASE_TF)
+        for tf, tf_bars in self.htf_bars.items():
+            tf_bars.save(directory / "bars" / tf)
+        self.indicator_cache.save(str(directory / "indicators"))
+
+    def _chunk(self, tasks: List[SweepTask]) -> List[List[SweepTask]]:
+        """작업을 청크로 분할 (워커당 약 4청크, 청크당 최대 32조합)"""
+        size = self.chunk_size or max(1, min(32, len(tasks) // (self.max_workers * 4) or 1))
+        return [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+
+def _evaluate_chunk(
+    chunk: List[SweepTask],
+    bars: BarArray,
+    htf_bars: Dict[str, BarArray],
+    indicator_cache: IndicatorCache,
+    initial_balance: float,
+    leverage_brackets: Optional[List[LeverageBracket]],
+    dataset_hashes: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """청크 평가 (조합별 오류는 결과에 기록하고 계속 진행)"""
+    results = []
+    for combo_index, definition, preset in chunk:
+        try:
+            metrics = evaluate_combination(
+                definition, preset, initial_balance, bars,
+                htf_bars, indicator_cache, leverage_brackets, dataset_hashes,
+            )
+            results.append({"combo_index": combo_index, "metrics": metrics, "error": None})
+        except Exception as e:
+            logger.warning(f"[스윕] 조합 {combo_index} 평가 실패: {e}")
+            results.append({"combo_index": combo_index, "metrics": None, "error": str(e)})
+    return results
+
+
+def _init_worker(
+    shared_dir: str,
+    htf_roles: List[str],
+    initial_balance: float,
+    leverage_brackets: Optional[List[LeverageBracket]],
+    dataset_hashes: Optional[Dict[str, str]] = None
+) -> None:
+    """워커 프로세스 초기화: 공유 봉 / 지표 캐시를 memmap으로 열기"""
+    root = Path(shared_dir)
+    _worker_state["bars"] = BarArray.load(root / "bars" / BASE_TF)
+    _worker_state["htf_bars"] = {tf: BarArray.load(root / "bars" / tf) for tf in htf_roles}
+    _worker_state["indicator_cache"] = IndicatorCache.load(str(root / "indicators"))
+    _worker_state["initial_balance"] = initial_balance
+    _worker_state["leverage_brackets"] = leverage_brackets
+    _worker_state["dataset_hashes"] = dataset_hashes
+
+
+def _evaluate_chunk_in_worker(chunk: List[SweepTask]) -> List[Dict[str, Any]]:
+    """워커 프로세스 작업 진입점"""
+    state = _worker_state
+    return _evaluate_chunk(
+        chunk, state["bars"], state["htf_bars"], state["indicator_cache"],
+        state["initial_balance"], state["leverage_brackets"], state["dataset_hashes"],
+    )
@@ -0,0 +1,151 @@
+"""
+포지션 크기 재계산(reprice) 모듈
+
+BacktestEngine에서 risk_percent / rebalance_interval / initial_balance / 레버리지
+구간은 포지션 크기에만 영향을 주고, 진입·청산 시점과 가격(거래 경로)은 바꾸지
+않습니다. (TP1 가격을 정하는 risk_reward_ratio는 경로를 바꾸므로 제외)
+
+따라서 완료된 Run의 거래 경로만 있으면 봉 루프를 다시 돌지 않고 새 리스크
+설정으로 position_size, leverage, leg PnL, Metrics를 다시 계산할 수 있습니다.
+
+- 잔고는 rebalance_interval 거래마다만 바뀌므로 구간 단위로 일괄(NumPy) 계산
+- 구간 경계의 잔고는 엔진과 같은 방식(완료 거래 PnL 리스트의 내장 sum())으로 계산
+- 같은 설정으로 재계산하면 엔진 결과와 비트 단위로 동일
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from ..models.trade import Trade
+from ..models.trade_leg import TradeLeg
+from ..utils.leverage_loader import LeverageBracket
+from .risk_manager import RiskManager
+
+
+def reprice_trades(
+    trades: List[Trade],
+    initial_balance: float,
+    risk_percent: float,
+    rebalance_interval: int,
+    leverage_brackets: Optional[List[LeverageBracket]] = None
+) -> List[Trade]:
+    """
+    거래 경로를 유지한 채 새 리스크 설정으로 거래 재계산
+
+    Args:
+        trades: 완료된 Run의 거래 목록 (진입 순서, legs 포함)
+        initial_balance: 초기 자산
+        risk_percent: 거래당 최대 손실 비율
+        rebalance_interval: 잔고 재평가 주기 (거래 수)
+        leverage_brackets: 레버리지 구간 (없으면 레버리지 제약 없음)
+
+    Returns:
+        List[Trade]: position_size / balance_at_entry / leverage / leg PnL이
+            재계산된 새 거래 목록 (입력은 변경하지 않음)
+
+    Raises:
+        ValueError: 설정 값이 잘못되었거나, 마지막 거래 외에 열린 거래가 있거나,
+            잔고 소진으로 포지션 크기가 0 이하가 되는 경우 (엔진에서도 실행 실패)
+    """
+    if rebalance_interval < 1:
+        raise ValueError("rebalance_interval은 1 이상이어야 합니다")
+
+    risk_manager = RiskManager(
+        initial_balance,
+        risk_percent=risk_percent,
+        leverage_brackets=leverage_brackets
+    )
+
+    n = len(trades)
+    if n == 0:
+        return []
+
+    # 동시에 하나의 포지션만 보유하므로 열린 거래는 마지막 하나뿐
+    if any(not trade.is_closed for trade in trades[:-1]):
+        raise ValueError("마지막 거래 외에 종료되지 않은 거래가 있어 거래 경로로 사용할 수 없습니다")
+
+    entry_prices = np.array([t.entry_price for t in trades], dtype=np.float64)
+    stop_losses = np.array([t.stop_loss for t in trades], dtype=np.float64)
+    is_long = np.array([t.direction == 'LONG' for t in trades], dtype=bool)
+
+    # leg는 거래당 최대 2개: 슬롯별 (청산가, 수량 비율) 배열
+    exit_prices = np.zeros((2, n), dtype=np.float64)
+    qty_ratios = np.zeros((2, n), dtype=np.float64)
+    for i, trade in enumerate(trades):
+        for slot, leg in enumerate(trade.legs):
+            exit_prices[slot, i] = leg.exit_price
+            qty_ratios[slot, i] = leg.qty_ratio
+    has_leg = qty_ratios > 0
+    price_moves = np.where(is_long, exit_prices - entry_prices, entry_prices - exit_prices)
+
+    position_sizes = np.empty(n, dtype=np.float64)
+    leverages = np.empty(n, dtype=np.float64)
+    balances = np.empty(n, dtype=np.float64)
+    leg_pnls = np.zeros((2, n), dtype=np.float64)
+
+    closed_pnls: List[float] = []
+    for start in range(0, n, rebalance_interval):
+        end = min(start + rebalance_interval, n)
+        segment = slice(start, end)
+
+        # 구간 내 거래는 같은 잔고로 포지션 크기 계산
+        sizes, _, segment_leverages = risk_manager.calculate_position_sizes(
+            entry_prices[segment], stop_losses[segment]
+        )
+        if np.any(sizes <= 0):
+            # 엔진에서도 Position 생성이 실패하는 설정 (잔고 소진)
+            i = start + int(np.flatnonzero(sizes <= 0)[0])
+            raise ValueError(
+                f"거래 {i + 1}번째 진입 시 포지션 크기가 0 이하입니다 "
+                f"(잔고={risk_manager.current_balance})"
+            )
+        position_sizes[segment] = sizes
+        leverages[segment] = segment_leverages
+        balances[segment] = risk_manager.current_balance
+
+        # 엔진과 같은 연산 순서: 가격 변화 × (포지션 크기 × 수량 비율)
+        leg_pnls[:, segment] = np.where(
+            has_leg[:, segment],
+            price_moves[:, segment] * (sizes * qty_ratios[:, segment]),
+            0.0
+        )
+
+        # 완료 거래 PnL 기록 → 다음 구간 잔고
+        for i in range(start, end):
+            if trades[i].is_closed:
+                closed_pnls.append(_total_pnl(leg_pnls[:, i], has_leg[:, i]))
+        risk_manager.update_balance(initial_balance + sum(closed_pnls))
+
+    repriced = []
+    for i, trade in enumerate(trades):
+        new_trade = Trade(
+            trade_id=trade.trade_id,
+            direction=trade.direction,
+            entry_price=trade.entry_price,
+            entry_timestamp=trade.entry_timestamp,
+            position_size=float(position_sizes[i]),
+            initial_risk=trade.initial_risk,
+            stop_loss=trade.stop_loss,
+            take_profit_1=trade.take_profit_1,
+            balance_at_entry=float(balances[i]),
+            leverage=float(leverages[i]),
+            is_closed=trade.is_closed
+        )
+        for slot, leg in enumerate(trade.legs):
+            new_trade.legs.append(TradeLeg(
+                trade_id=leg.trade_id,
+                exit_type=leg.exit_type,
+                exit_timestamp=leg.exit_timestamp,
+                exit_price=leg.exit_price,
+                qty_ratio=leg.qty_ratio,
+                pnl=float(leg_pnls[slot, i])
+            ))
+        repriced.append(new_trade)
+
+    return repriced
+
+
+def _total_pnl(leg_pnls: np.ndarray, has_leg: np.ndarray) -> float:
+    """Trade.calculate_total_pnl()과 같은 순서의 leg PnL 합계"""
+    return sum(float(pnl) for pnl, present in zip(leg_pnls, has_leg) if present)
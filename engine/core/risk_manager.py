@@ -2,6 +2,7 @@
 리스크 관리 모듈
 """
 from typing import Tuple, List, Optional, Any
+import numpy as np
 from ..models.position import Position, Direction
 from ..utils.leverage_loader import (
     LeverageBracket, 
@@ -24,7 +25,8 @@ class RiskManager:
         initial_balance: float, 
         risk_percent: float = 0.02,
         risk_reward_ratio: float = 1.5,
-        db_conn: Optional[Any] = None
+        db_conn: Optional[Any] = None,
+        leverage_brackets: Optional[List[LeverageBracket]] = None
     ):
         """
         Args:
@@ -32,6 +34,7 @@ class RiskManager:
             risk_percent: 1 트레이드 최대 손실 비율 (기본 2% = 0.02, 프리셋에서 설정)
             risk_reward_ratio: 리스크 대비 보상 비율 (기본 1.5, 프리셋에서 설정)
             db_conn: 데이터베이스 연결 객체 (레버리지 데이터 로드용, 선택)
+            leverage_brackets: 미리 로드한 레버리지 구간 (선택, 지정하면 db_conn 대신 사용)
         """
         if initial_balance <= 0:
             raise ValueError("초기 잔고는 0보다 커야 합니다")
@@ -50,8 +53,8 @@ class RiskManager:
         self.current_balance = initial_balance
         
         # 레버리지 구간 테이블 로드 (DB에서)
-        self.leverage_brackets: Optional[List[LeverageBracket]] = None
-        if db_conn:
+        self.leverage_brackets: Optional[List[LeverageBracket]] = leverage_brackets
+        if leverage_brackets is None and db_conn:
             try:
                 self.leverage_brackets = load_leverage_brackets_from_db(db_conn)
             except Exception as e:
@@ -273,6 +276,70 @@ class RiskManager:
             return float(position_size), risk, float(leverage)
         return float(position_size), risk
     
+    def calculate_position_sizes(
+        self,
+        entry_prices: np.ndarray,
+        stop_losses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        현재 잔고 기준 포지션 크기 일괄 계산 (calculate_position_size의 배열 버전)
+        
+        Args:
+            entry_prices: 진입 가격 배열
+            stop_losses: 손절 가격 배열
+        
+        Returns:
+            (position_sizes, risks, leverages) float64 배열
+            
+        Note:
+            레버리지 구간이 없으면 NumPy로 일괄 계산하며, 결과는 원소마다
+            calculate_position_size를 호출한 것과 비트 단위로 동일합니다.
+            (np.rint와 round()는 모두 짝수 반올림)
+            레버리지 구간이 있으면 구간 탐색 로직을 그대로 쓰기 위해 원소별로 계산합니다.
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        stop_losses = np.asarray(stop_losses, dtype=np.float64)
+        
+        if np.any(entry_prices <= 0):
+            raise ValueError("entry_price는 양수여야 합니다")
+        
+        if np.any(stop_losses <= 0):
+            raise ValueError("stop_loss는 양수여야 합니다")
+        
+        if self.leverage_brackets:
+            results = [
+                self.calculate_position_size(float(entry), float(stop), return_leverage=True)
+                for entry, stop in zip(entry_prices, stop_losses)
+            ]
+            if not results:
+                empty = np.empty(0, dtype=np.float64)
+                return empty, empty.copy(), empty.copy()
+            sizes, risks, leverages = (np.array(col, dtype=np.float64) for col in zip(*results))
+            return sizes, risks, leverages
+        
+        risks = np.abs(entry_prices - stop_losses)
+        zero_risk = risks == 0
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position_size_raw = (self.current_balance * self.risk_percent) / risks
+        
+        # 반올림 후 0이 되는 경우 최소 1 계약
+        position_sizes = np.rint(position_size_raw) + 0.0  # -0.0 → 0.0 (round()는 int 반환)
+        position_sizes[(position_sizes == 0) & (position_size_raw > 0)] = 1.0
+        
+        # 레버리지 = 명목가치 / 잔고 (정수 내림, 최소 1x, 잔고 0 이하면 1x)
+        if self.current_balance <= 0:
+            leverages = np.ones_like(position_sizes)
+        else:
+            leverages = np.trunc((position_sizes * entry_prices) / self.current_balance)
+            leverages = np.maximum(leverages, 1.0)
+        
+        # risk == 0: position_size = 0, leverage = 1.0 (호출자가 진입 스킵)
+        position_sizes[zero_risk] = 0.0
+        leverages[zero_risk] = 1.0
+        
+        return position_sizes, risks, leverages
+    
     def calculate_tp1_price(
         self, 
         entry_price: float, 
@@ -3,12 +3,14 @@
 """
 
 from .bar import Bar
+from .bar_array import BarArray
 from .position import Position, Direction
 from .trade import Trade
 from .trade_leg import TradeLeg, ExitType
 
 __all__ = [
     'Bar',
+    'BarArray',
     'Position',
     'Direction',
     'Trade',
@@ -0,0 +1,353 @@
+"""
+컬럼형 봉 배열(BarArray) 데이터 모델
+
+List[Bar] 대신 연속된 NumPy 배열로 봉 데이터를 보관합니다.
+  - timestamp: int64
+  - open / high / low / close / volume: float64 (하나의 (5, n) 블록)
+  - direction: int8
+
+검증은 Bar.__post_init__과 동일한 규칙을 벡터화하여 한 번에 수행하고,
+인덱스 접근 시에만 Bar 객체를 생성하므로 기존 호출부(bars[i].close,
+for bar in bars, len(bars))는 그대로 동작합니다.
+"""
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+import pandas as pd
+
+from .bar import Bar
+
+
+# OHLCV 블록의 행 순서
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def find_invalid_bar(
+    timestamps: np.ndarray,
+    ohlcv: np.ndarray,
+    direction: np.ndarray
+) -> Optional[Tuple[int, str]]:
+    """
+    Bar.__post_init__ 검증 규칙을 벡터화하여 첫 번째 오류 행을 찾습니다.
+
+    Args:
+        timestamps: (n,) 정수 배열
+        ohlcv: (5, n) 실수 배열 (open, high, low, close, volume 순)
+        direction: (n,) 정수 배열 (int8 변환 전 값)
+
+    Returns:
+        None (오류 없음) 또는 (행 인덱스, Bar와 동일한 오류 메시지)
+    """
+    if len(timestamps) == 0:
+        return None
+
+    open_, high, low, close, volume = ohlcv
+
+    # Bar.__post_init__의 검사 순서와 동일해야 함 (같은 행에서는 먼저 걸린 메시지)
+    checks = (
+        (timestamps < 0, "timestamp는 0 이상이어야 합니다"),
+        (high < low, "high는 low보다 크거나 같아야 합니다"),
+        (~((low <= open_) & (open_ <= high)), "open은 low와 high 사이에 있어야 합니다"),
+        (~((low <= close) & (close <= high)), "close는 low와 high 사이에 있어야 합니다"),
+        (volume < 0, "volume은 0 이상이어야 합니다"),
+        (~np.isin(direction, (-1, 0, 1)), "direction은 -1, 0, 1 중 하나여야 합니다"),
+    )
+
+    invalid_any = np.zeros(len(timestamps), dtype=bool)
+    for mask, _ in checks:
+        invalid_any |= mask
+
+    if not invalid_any.any():
+        return None
+
+    row = int(np.argmax(invalid_any))
+    for mask, message in checks:
+        if mask[row]:
+            return row, message
+    return None  # pragma: no cover
+
+
+def timestamps_of(bars: Sequence[Bar]) -> np.ndarray:
+    """
+    Bar 리스트 또는 BarArray의 timestamp 배열 (BarArray는 복사 없음)
+
+    Args:
+        bars: Bar 리스트 또는 BarArray
+
+    Returns:
+        int64 배열
+    """
+    if isinstance(bars, BarArray):
+        return bars.timestamps
+    return np.fromiter((b.timestamp for b in bars), dtype=np.int64, count=len(bars))
+
+
+class BarArray(Sequence[Bar]):
+    """
+    컬럼형 봉 배열
+
+    Attributes:
+        timestamps: 봉 시작 시간 배열 (int64, UNIX 초)
+        ohlcv: (5, n) float64 블록 (open, high, low, close, volume)
+        direction: 봉 방향 배열 (int8)
+
+    Note:
+        배열은 읽기 전용입니다. to_dataframe()은 OHLCV 블록을 복사 없이 공유합니다.
+    """
+
+    __slots__ = ('timestamps', 'ohlcv', 'direction')
+
+    def __init__(
+        self,
+        timestamps: Sequence[int],
+        open: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[float],
+        direction: Sequence[int],
+        validate: bool = True
+    ):
+        """
+        Args:
+            timestamps ~ direction: 컬럼별 값 (길이 동일)
+            validate: Bar 검증 규칙 적용 여부 (기본 True)
+
+        Raises:
+            ValueError: 길이가 다르거나 검증에 실패한 경우
+        """
+        ts = np.asarray(timestamps, dtype=np.int64)
+        ohlcv = np.empty((5, len(ts)), dtype=np.float64)
+        for row, values in enumerate((open, high, low, close, volume)):
+            values = np.asarray(values, dtype=np.float64)
+            if values.shape != ts.shape:
+                raise ValueError(
+                    f"{OHLCV_COLUMNS[row]} 길이({len(values)})가 "
+                    f"timestamps 길이({len(ts)})와 다릅니다"
+                )
+            ohlcv[row] = values
+
+        dir_raw = np.asarray(direction, dtype=np.int64)
+        if dir_raw.shape != ts.shape:
+            raise ValueError(
+                f"direction 길이({len(dir_raw)})가 timestamps 길이({len(ts)})와 다릅니다"
+            )
+
+        if validate:
+            invalid = find_invalid_bar(ts, ohlcv, dir_raw)
+            if invalid is not None:
+                row, message = invalid
+                raise ValueError(f"봉 데이터 검증 오류 (index {row}): {message}")
+
+        self._init_arrays(ts, ohlcv, dir_raw.astype(np.int8))
+
+    def _init_arrays(
+        self,
+        timestamps: np.ndarray,
+        ohlcv: np.ndarray,
+        direction: np.ndarray
+    ) -> None:
+        """검증이 끝난 배열을 읽기 전용으로 보관"""
+        for arr in (timestamps, ohlcv, direction):
+            arr.setflags(write=False)
+        self.timestamps = timestamps
+        self.ohlcv = ohlcv
+        self.direction = direction
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        timestamps: np.ndarray,
+        ohlcv: np.ndarray,
+        direction: np.ndarray
+    ) -> "BarArray":
+        """검증 없이 배열로부터 생성 (내부용: 슬라이스, 정렬 결과)"""
+        obj = cls.__new__(cls)
+        obj._init_arrays(timestamps, ohlcv, direction)
+        return obj
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[Bar]) -> "BarArray":
+        """
+        Bar 리스트로부터 생성 (Bar는 이미 검증되었으므로 재검증 안 함)
+
+        Args:
+            bars: Bar 리스트
+
+        Returns:
+            BarArray
+        """
+        if isinstance(bars, BarArray):
+            return bars
+        return cls(
+            timestamps=[b.timestamp for b in bars],
+            open=[b.open for b in bars],
+            high=[b.high for b in bars],
+            low=[b.low for b in bars],
+            close=[b.close for b in bars],
+            volume=[b.volume for b in bars],
+            direction=[b.direction for b in bars],
+            validate=False,
+        )
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드 (.npy)
+    # ------------------------------------------------------------------
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """
+        배열을 디렉토리에 .npy 파일로 저장 (timestamps / ohlcv / direction)
+
+        Args:
+            directory: 저장 디렉토리 (없으면 생성)
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in self.__slots__:
+            np.save(path / f"{name}.npy", getattr(self, name), allow_pickle=False)
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "BarArray":
+        """
+        save()로 저장한 BarArray 로드 (저장 시 검증된 데이터이므로 재검증 안 함)
+
+        Args:
+            directory: 저장 디렉토리
+            mmap: True면 읽기 전용 memmap으로 열기 (여러 프로세스가 페이지 공유)
+
+        Returns:
+            BarArray
+        """
+        path = Path(directory)
+        mmap_mode = 'r' if mmap else None
+        arrays = [
+            np.load(path / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+            for name in cls.__slots__
+        ]
+        return cls._from_arrays(*arrays)
+
+    # ------------------------------------------------------------------
+    # 컬럼 접근
+    # ------------------------------------------------------------------
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.ohlcv[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.ohlcv[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.ohlcv[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.ohlcv[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.ohlcv[4]
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 사용량 (바이트)"""
+        return self.timestamps.nbytes + self.ohlcv.nbytes + self.direction.nbytes
+
+    def is_sorted(self) -> bool:
+        """timestamp가 엄격한 오름차순인지 여부"""
+        return bool(np.all(self.timestamps[1:] > self.timestamps[:-1]))
+
+    def sorted_by_timestamp(self) -> "BarArray":
+        """
+        timestamp 오름차순으로 정렬된 BarArray 반환 (안정 정렬, 이미 정렬이면 self)
+        """
+        if np.all(self.timestamps[1:] >= self.timestamps[:-1]):
+            return self
+        order = np.argsort(self.timestamps, kind='stable')
+        return BarArray._from_arrays(
+            self.timestamps[order],
+            np.ascontiguousarray(self.ohlcv[:, order]),
+            self.direction[order],
+        )
+
+    # ------------------------------------------------------------------
+    # 변환
+    # ------------------------------------------------------------------
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        지표 계산용 OHLCV DataFrame 생성
+
+        open~volume 컬럼은 BarArray의 OHLCV 블록을 복사 없이 공유합니다.
+        direction은 기존 DataFrame과 동일하게 int64 컬럼으로 제공합니다.
+
+        Returns:
+            index: DatetimeIndex, columns: open, high, low, close, volume, direction
+        """
+        df = pd.DataFrame(
+            self.ohlcv.T,
+            columns=list(OHLCV_COLUMNS),
+            index=pd.to_datetime(self.timestamps, unit='s'),
+            copy=False,
+        )
+        df['direction'] = self.direction.astype(np.int64)
+        return df
+
+    def to_bars(self) -> List[Bar]:
+        """Bar 리스트로 변환"""
+        return list(self)
+
+    def _bar_at(self, i: int) -> Bar:
+        ohlcv = self.ohlcv
+        return Bar(
+            timestamp=int(self.timestamps[i]),
+            open=float(ohlcv[0, i]),
+            high=float(ohlcv[1, i]),
+            low=float(ohlcv[2, i]),
+            close=float(ohlcv[3, i]),
+            volume=float(ohlcv[4, i]),
+            direction=int(self.direction[i]),
+        )
+
+    # ------------------------------------------------------------------
+    # Sequence 프로토콜
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> Bar: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BarArray": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bar, "BarArray"]:
+        if isinstance(index, slice):
+            return BarArray._from_arrays(
+                self.timestamps[index],
+                self.ohlcv[:, index],
+                self.direction[index],
+            )
+        n = len(self.timestamps)
+        i = int(index)
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError(f"BarArray 인덱스 범위 초과: {index} (길이 {n})")
+        return self._bar_at(i)
+
+    def __iter__(self) -> Iterator[Bar]:
+        for i in range(len(self.timestamps)):
+            yield self._bar_at(i)
+
+    def __repr__(self) -> str:
+        if len(self) == 0:
+            return "BarArray(len=0)"
+        return (
+            f"BarArray(len={len(self)}, "
+            f"start={int(self.timestamps[0])}, end={int(self.timestamps[-1])})"
+        )
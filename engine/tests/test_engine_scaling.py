@@ -0,0 +1,105 @@
+"""
+백테스트 엔진 거래 수 확장성 테스트
+
+검증 포인트:
+  1) 재평가 잔고가 초기 자산 + sum(t.calculate_total_pnl())과 비트 단위로 동일
+  2) 거래당 PnL 계산은 청산 시 한 번 (재평가마다 전체 거래를 다시 계산하지 않음)
+  3) 거래 수에 따른 실행 시간 (머신 부하에 따라 달라지므로 출력만 하고 검증하지 않음)
+"""
+
+import math
+import time
+from typing import List
+
+import pytest
+
+from engine.core.backtest_engine import BacktestEngine
+from engine.models.bar import Bar
+from engine.models.trade import Trade
+
+
+def _churn_bars(n: int) -> List[Bar]:
+    """매 봉 SL 청산 후 즉시 재진입하도록 구성한 봉 (봉마다 거래 1개)"""
+    bars = []
+    for i in range(n):
+        close = 100.0 + (i % 7) * 0.25
+        bars.append(Bar(timestamp=1_000_000 + i * 60, open=close, high=close + 1.0,
+                        low=close - 10.0, close=close, volume=1.0, direction=1))
+    return bars
+
+
+def _always_long(bar: Bar):
+    return {"direction": "LONG", "stop_loss": bar.close - 5.0}
+
+
+def _run(n_bars: int, rebalance_interval: int = 1) -> BacktestEngine:
+    engine = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=_always_long,
+        rebalance_interval=rebalance_interval,
+    )
+    engine.run(_churn_bars(n_bars))
+    return engine
+
+
+@pytest.mark.unit
+def test_rebalance_balance_matches_full_sum():
+    """재평가 잔고 = 초기 자산 + 전체 거래 PnL 합 (기존 계산식과 동일)"""
+    engine = _run(500, rebalance_interval=7)
+    closed = [t for t in engine.trades if t.is_closed]
+    assert len(closed) >= 490
+
+    # 마지막 재평가 시점까지의 거래로 잔고 재계산
+    last_rebalance = (len(closed) // 7) * 7
+    expected = engine.initial_balance + sum(
+        t.calculate_total_pnl() for t in closed[:last_rebalance]
+    )
+    assert engine.risk_manager.current_balance == expected
+    assert math.isfinite(expected)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n_bars", [500, 2000])
+def test_trade_pnl_computed_once_per_closed_trade(n_bars, monkeypatch):
+    """재평가 비용이 누적 거래 수에 비례하지 않음 (거래당 calculate_total_pnl 1회)"""
+    calls = []
+    original = Trade.calculate_total_pnl
+
+    def counting(trade):
+        calls.append(trade.trade_id)
+        return original(trade)
+
+    monkeypatch.setattr(Trade, "calculate_total_pnl", counting)
+    engine = _run(n_bars)
+
+    closed = [t for t in engine.trades if t.is_closed]
+    assert len(closed) >= n_bars - 1
+    assert sorted(calls) == sorted(t.trade_id for t in closed)
+
+
+@pytest.mark.slow
+def test_run_time_scales_linearly_with_trade_count():
+    """거래 수 4배 → 실행 시간 약 4배 (2차 증가면 16배), 타이밍은 출력만
+
+    재평가마다 완료 거래 PnL 리스트를 sum()하므로 기본 주기(50거래)로 측정합니다.
+    """
+    small_bars, large_bars = 5_000, 20_000
+
+    # 워밍업
+    _run(500)
+
+    def best_of(n_bars: int, repeat: int = 3) -> float:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            engine = _run(n_bars, rebalance_interval=50)
+            times.append(time.perf_counter() - start)
+            assert len(engine.trades) >= n_bars - 1
+        return min(times)
+
+    small = best_of(small_bars)
+    large = best_of(large_bars)
+    ratio = large / small
+
+    print(f"\n[scaling] {small_bars} bars: {small:.3f}s, {large_bars} bars: {large:.3f}s, "
+          f"ratio={ratio:.2f}")
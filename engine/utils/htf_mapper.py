@@ -13,13 +13,24 @@
 결정성:
   - 입력(bars, tf_interval)이 같으면 출력(매핑 배열)이 동일
   - 난수/시스템시간 사용 없음
+
+캐시:
+  - 매핑은 (베이스 데이터셋 해시, HTF 데이터셋 해시, HTF 길이)로 결정되므로
+    get_htf_index_map은 해시가 주어지면 프로세스 내에서 재사용 (스윕 / 반복 Run)
+  - 캐시된 배열은 읽기 전용 (공유 중 수정 방지)
 """
 
 from __future__ import annotations
 
-from typing import List
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
 
 from engine.models.bar import Bar
+from engine.models.bar_array import timestamps_of
 
 
 # 지원 타임프레임의 초 단위 길이 (바이낸스 표준과 일치)
@@ -49,10 +60,10 @@ def interval_to_seconds(tf: str) -> int:
 
 
 def build_htf_index_map(
-    base_bars: List[Bar],
-    htf_bars: List[Bar],
+    base_bars: Sequence[Bar],
+    htf_bars: Sequence[Bar],
     htf_interval_sec: int,
-) -> List[int]:
+) -> np.ndarray:
     """base bar별로 "이미 닫힌 HTF 봉의 인덱스"를 반환하는 배열 생성.
 
     규칙:
@@ -61,15 +72,15 @@ def build_htf_index_map(
       - 아직 어떤 HTF 봉도 닫히지 않았으면 -1 (값 조회 시 None 처리)
       - base/htf 모두 timestamp 오름차순 전제
 
-    복잡도: O(N + M) 투포인터
+    복잡도: O(N log M) — HTF 닫힘 시각 배열에 searchsorted (Python 루프 없음)
 
     Args:
-        base_bars: 베이스 타임프레임 봉 (정렬됨)
-        htf_bars: 상위 타임프레임 봉 (정렬됨)
+        base_bars: 베이스 타임프레임 봉 (정렬됨, List[Bar] 또는 BarArray)
+        htf_bars: 상위 타임프레임 봉 (정렬됨, List[Bar] 또는 BarArray)
         htf_interval_sec: HTF 봉의 길이(초). interval_to_seconds("1h") 등으로 구함.
 
     Returns:
-        길이 == len(base_bars) 인 정수 배열. 각 원소는 해당 base bar 시점에
+        길이 == len(base_bars) 인 int32 배열. 각 원소는 해당 base bar 시점에
         "이미 완전히 닫힌" htf_bars의 최대 인덱스(없으면 -1).
     """
     if htf_interval_sec <= 0:
@@ -77,23 +88,72 @@ def build_htf_index_map(
 
     n = len(base_bars)
     m = len(htf_bars)
-    mapping: List[int] = [-1] * n
-
     if n == 0 or m == 0:
-        return mapping
+        return np.full(n, -1, dtype=np.int32)
+
+    # BarArray면 Bar 객체 생성 없이 timestamp 배열만 사용
+    base_timestamps = np.asarray(timestamps_of(base_bars), dtype=np.int64)
+    htf_close_times = np.asarray(timestamps_of(htf_bars), dtype=np.int64) + htf_interval_sec
+
+    # 닫힘 시각 <= base_ts 인 HTF 봉 개수 - 1 = 마지막으로 닫힌 HTF 인덱스
+    mapping = np.searchsorted(htf_close_times, base_timestamps, side="right") - 1
+    return mapping.astype(np.int32)
+
+
+# (베이스 해시, HTF 해시, HTF 길이) → 읽기 전용 매핑 배열 (LRU)
+_map_cache: "OrderedDict[Tuple[str, str, int], np.ndarray]" = OrderedDict()
+_map_cache_lock = threading.Lock()
+
+
+def _map_cache_size() -> int:
+    """캐시 최대 항목 수 (ALGOFORGE_HTF_MAP_CACHE_SIZE, 기본 32, 0이면 비활성)"""
+    return max(0, int(os.getenv("ALGOFORGE_HTF_MAP_CACHE_SIZE", "32")))
 
-    j = -1  # 마지막으로 확정(닫힘)된 HTF 인덱스
-    for i, b in enumerate(base_bars):
-        base_ts = b.timestamp
-        # j+1부터 전진하며, 닫힘 조건을 만족하는 동안 j를 밀어올림
-        while j + 1 < m and htf_bars[j + 1].timestamp + htf_interval_sec <= base_ts:
-            j += 1
-        mapping[i] = j
 
+def get_htf_index_map(
+    base_bars: Sequence[Bar],
+    htf_bars: Sequence[Bar],
+    htf_interval_sec: int,
+    base_hash: Optional[str] = None,
+    htf_hash: Optional[str] = None,
+) -> np.ndarray:
+    """build_htf_index_map + 데이터셋 해시 기반 캐시.
+
+    해시가 둘 다 주어지면 (base_hash, htf_hash, htf_interval_sec)로 캐시하고,
+    하나라도 없으면 매번 새로 계산한다.
+
+    Returns:
+        int32 매핑 배열 (캐시된 경우 읽기 전용)
+    """
+    max_entries = _map_cache_size()
+    if base_hash is None or htf_hash is None or max_entries == 0:
+        return build_htf_index_map(base_bars, htf_bars, htf_interval_sec)
+
+    key = (base_hash, htf_hash, int(htf_interval_sec))
+    with _map_cache_lock:
+        mapping = _map_cache.get(key)
+        if mapping is not None:
+            _map_cache.move_to_end(key)
+    if mapping is not None and len(mapping) == len(base_bars):
+        return mapping
+
+    mapping = build_htf_index_map(base_bars, htf_bars, htf_interval_sec)
+    mapping.setflags(write=False)
+    with _map_cache_lock:
+        _map_cache[key] = mapping
+        _map_cache.move_to_end(key)
+        while len(_map_cache) > max_entries:
+            _map_cache.popitem(last=False)
     return mapping
 
 
-def resolve_htf_index(mapping: List[int], base_index: int) -> int:
+def clear_htf_index_map_cache() -> None:
+    """HTF 매핑 캐시 비우기 (테스트 / 데이터셋 삭제 시)"""
+    with _map_cache_lock:
+        _map_cache.clear()
+
+
+def resolve_htf_index(mapping: Sequence[int], base_index: int) -> int:
     """매핑 배열에서 base_index에 해당하는 HTF 인덱스를 안전하게 조회.
 
     Returns:
@@ -101,4 +161,4 @@ def resolve_htf_index(mapping: List[int], base_index: int) -> int:
     """
     if base_index < 0 or base_index >= len(mapping):
         raise IndexError(f"base_index {base_index} 범위 초과 (len={len(mapping)})")
-    return mapping[base_index]
+    return int(mapping[base_index])
@@ -0,0 +1,461 @@
+"""
+지표 계산 결과 캐시 모듈
+
+동일한 (타임프레임, 지표 타입, 파라미터)의 지표는 지표 ID와 무관하게 같은
+값을 가지므로, 한 번 계산한 컬럼을 여러 StrategyParser가 재사용할 수 있습니다.
+
+- IndicatorCache: 메모리 캐시. 파라미터 스윕처럼 같은 데이터셋에 대해 전략 변형을
+  반복 평가할 때 사용
+    - 키: 타임프레임 + 지표 타입 + 파라미터 (JSON 정렬 직렬화)
+    - 값: 지표 ID 기준 컬럼 접미사 → 배열
+          (단일 출력 지표는 {"": 값}, MACD 등 다중 출력은 {"": main, "_signal": ..., ...})
+    - save / load: 디렉토리에 .npy로 저장하고 memmap으로 열어 여러 프로세스가
+      같은 페이지를 공유 (읽기 전용)
+    - 주의: 하나의 데이터셋(타임프레임별 봉)에 대해서만 유효합니다.
+- PersistentIndicatorCache: 디스크 캐시. Run / 재실행 / 차트 조회 간에 재사용
+    - 키: 데이터셋 해시 + 타임프레임 + 지표 타입 + 파라미터 + 커스텀 지표 코드 해시
+      (source로 쓰인 지표는 정규화 파라미터에 포함, indicator_planner 참고)
+    - 값: 엔트리 디렉토리의 .npy 파일 (memmap으로 로드)
+    - 전체 크기 상한을 넘으면 가장 오래 사용하지 않은 엔트리부터 삭제 (LRU)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .indicator_planner import indicator_types
+from .indicators import BUILTIN_INDICATOR_TYPES, IndicatorCalculator
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILE = "index.json"
+
+# 디스크 캐시 형식 / 내장 지표 계산 방식 버전 (계산 결과가 바뀌면 올림)
+INDICATOR_CACHE_VERSION = 2
+
+# 디스크 캐시 기본 크기 상한 (1 GiB)
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _new_indicator_columns(
+    calc: IndicatorCalculator,
+    indicator_id: str,
+    columns_before: set
+) -> Optional[List[str]]:
+    """
+    방금 계산된 지표 컬럼 목록 (캐시할 수 없으면 None)
+
+    지표 ID로 시작하지 않는 컬럼을 만든 지표(비정형 커스텀 지표)는
+    ID를 바꿔 복원할 수 없으므로 캐시하지 않습니다.
+    """
+    new_columns = [col for col in calc.columns if col not in columns_before]
+    if not new_columns or any(not str(col).startswith(indicator_id) for col in new_columns):
+        logger.debug(f"지표 캐시 제외: {indicator_id} (컬럼: {new_columns})")
+        return None
+    return new_columns
+
+
+class IndicatorCache:
+    """
+    (타임프레임, 지표 정의) → 계산된 컬럼 캐시
+
+    Attributes:
+        hits: 캐시 적중 수
+        misses: 캐시 미스 수
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(tf: str, indicator_def: Dict[str, Any]) -> str:
+        """
+        캐시 키 생성 (지표 ID 제외)
+
+        Args:
+            tf: 타임프레임 ("base", "1h", ...)
+            indicator_def: 지표 정의 (type, params, 청크 계산이면 chunking)
+
+        Returns:
+            str: 정렬된 JSON 문자열
+        """
+        key = {
+            "tf": tf,
+            "type": indicator_def.get("type"),
+            "params": indicator_def.get("params", {}),
+        }
+        if indicator_def.get("chunking"):
+            # 청크 병렬 계산 결과는 순차 계산 결과와 따로 저장
+            key["chunking"] = indicator_def["chunking"]
+        return json.dumps(key, sort_keys=True, ensure_ascii=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def restore(self, calc: IndicatorCalculator, tf: str, indicator_def: Dict[str, Any]) -> bool:
+        """
+        캐시된 컬럼을 calculator의 DataFrame에 지표 ID 이름으로 복원
+
+        Args:
+            calc: 대상 IndicatorCalculator
+            tf: 타임프레임
+            indicator_def: 지표 정의
+
+        Returns:
+            bool: 캐시 적중 여부 (False면 직접 계산 필요)
+        """
+        columns = self._entries.get(self.make_key(tf, indicator_def))
+        if columns is None:
+            self.misses += 1
+            return False
+
+        indicator_id = indicator_def["id"]
+        for suffix, values in columns.items():
+            calc.set_column(indicator_id + suffix, values)
+        self.hits += 1
+        return True
+
+    def capture(
+        self,
+        calc: IndicatorCalculator,
+        tf: str,
+        indicator_def: Dict[str, Any],
+        columns_before: set
+    ) -> None:
+        """
+        방금 계산된 지표 컬럼을 캐시에 저장
+
+        Args:
+            calc: 계산을 수행한 IndicatorCalculator
+            tf: 타임프레임
+            indicator_def: 지표 정의
+            columns_before: 계산 전 DataFrame 컬럼 집합
+
+        Note:
+            지표 ID로 시작하지 않는 컬럼을 만든 지표(비정형 커스텀 지표)는
+            ID를 바꿔 복원할 수 없으므로 캐시하지 않습니다.
+        """
+        indicator_id = indicator_def["id"]
+        new_columns = _new_indicator_columns(calc, indicator_id, columns_before)
+        if new_columns is None:
+            return
+
+        self._entries[self.make_key(tf, indicator_def)] = {
+            str(col)[len(indicator_id):]: np.asarray(calc.get_column(col))
+            for col in new_columns
+        }
+
+    def save(self, directory: str) -> None:
+        """
+        캐시를 디렉토리에 .npy 파일로 저장
+
+        Args:
+            directory: 저장 디렉토리 (없으면 생성)
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+
+        index = []
+        for entry_no, (key, columns) in enumerate(self._entries.items()):
+            files = {}
+            for column_no, (suffix, values) in enumerate(columns.items()):
+                file_name = f"{entry_no}_{column_no}.npy"
+                np.save(path / file_name, np.ascontiguousarray(values), allow_pickle=False)
+                files[suffix] = file_name
+            index.append({"key": key, "files": files})
+
+        (path / _INDEX_FILE).write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "IndicatorCache":
+        """
+        save()로 저장한 캐시 로드
+
+        Args:
+            directory: 저장 디렉토리
+            mmap: True면 읽기 전용 memmap으로 열기 (프로세스 간 페이지 공유)
+
+        Returns:
+            IndicatorCache: 로드된 캐시
+        """
+        path = Path(directory)
+        index = json.loads((path / _INDEX_FILE).read_text(encoding="utf-8"))
+
+        cache = cls()
+        mmap_mode = "r" if mmap else None
+        for entry in index:
+            cache._entries[entry["key"]] = {
+                suffix: np.load(path / file_name, mmap_mode=mmap_mode, allow_pickle=False)
+                for suffix, file_name in entry["files"].items()
+            }
+        return cache
+
+
+class PersistentIndicatorCache:
+    """
+    데이터셋 해시 기반 디스크 지표 캐시
+
+    IndicatorCache와 같은 restore / capture 인터페이스를 제공하므로
+    StrategyParser의 indicator_cache로 그대로 사용할 수 있습니다.
+    엔트리는 원자적으로(임시 디렉토리 → rename) 기록되어 여러 워커 프로세스가
+    같은 디렉토리를 동시에 사용해도 안전합니다.
+
+    Attributes:
+        directory: 캐시 루트 디렉토리
+        dataset_hashes: 타임프레임 → 데이터셋 해시 ({"base": ..., "1h": ...})
+        max_bytes: 전체 크기 상한 (바이트)
+        hits: 캐시 적중 수
+        misses: 캐시 미스 수
+        writes: 새로 기록한 엔트리 수
+        evictions: LRU로 삭제한 엔트리 수
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        dataset_hashes: Dict[str, str],
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ):
+        """
+        Args:
+            directory: 캐시 루트 디렉토리 (없으면 첫 기록 시 생성)
+            dataset_hashes: 타임프레임 → 데이터셋 해시 (없는 TF의 지표는 캐시하지 않음)
+            max_bytes: 전체 크기 상한 (바이트)
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes는 0보다 커야 합니다: {max_bytes}")
+
+        self.directory = Path(directory)
+        self.dataset_hashes = dict(dataset_hashes)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def make_key(
+        self,
+        calc: IndicatorCalculator,
+        tf: str,
+        indicator_def: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        캐시 키 생성 (지표 ID 제외)
+
+        Args:
+            calc: 지표를 계산할 IndicatorCalculator (커스텀 지표 코드 해시 조회용)
+            tf: 타임프레임
+            indicator_def: 지표 정의 (type, params, 청크 계산이면 chunking)
+
+        Returns:
+            Optional[str]: SHA256 해시 (데이터셋 해시나 커스텀 지표 코드 해시를
+                알 수 없어 캐시할 수 없으면 None)
+        """
+        dataset_hash = self.dataset_hashes.get(tf)
+        if dataset_hash is None:
+            return None
+
+        # 커스텀 지표(다른 지표의 source로 쓰인 경우 포함)는 코드 해시를 키에 포함
+        code_hashes = {}
+        for indicator_type in indicator_types(indicator_def):
+            if indicator_type in BUILTIN_INDICATOR_TYPES:
+                continue
+            code_hash = calc.custom_indicator_hashes.get(indicator_type)
+            if code_hash is None:
+                return None
+            code_hashes[indicator_type] = code_hash
+
+        key = {
+            "version": INDICATOR_CACHE_VERSION,
+            "dataset": dataset_hash,
+            "tf": tf,
+            "type": indicator_def.get("type"),
+            "params": indicator_def.get("params", {}),
+            "code": code_hashes or None,
+        }
+        if indicator_def.get("chunking"):
+            # 청크 병렬 계산 결과는 순차 계산 결과와 따로 저장
+            key["chunking"] = indicator_def["chunking"]
+        payload = json.dumps(key, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def restore(self, calc: IndicatorCalculator, tf: str, indicator_def: Dict[str, Any]) -> bool:
+        """
+        디스크에 캐시된 컬럼을 memmap으로 열어 calculator에 복원
+
+        Args:
+            calc: 대상 IndicatorCalculator
+            tf: 타임프레임
+            indicator_def: 지표 정의
+
+        Returns:
+            bool: 캐시 적중 여부 (False면 직접 계산 필요)
+        """
+        key = self.make_key(calc, tf, indicator_def)
+        columns = self._read_entry(key, len(calc.index)) if key is not None else None
+        if columns is None:
+            self.misses += 1
+            return False
+
+        indicator_id = indicator_def["id"]
+        for suffix, values in columns.items():
+            calc.set_column(indicator_id + suffix, values)
+        self._touch(self.directory / key)
+        self.hits += 1
+        return True
+
+    def capture(
+        self,
+        calc: IndicatorCalculator,
+        tf: str,
+        indicator_def: Dict[str, Any],
+        columns_before: set
+    ) -> None:
+        """
+        방금 계산된 지표 컬럼을 디스크에 기록
+
+        Args:
+            calc: 계산을 수행한 IndicatorCalculator
+            tf: 타임프레임
+            indicator_def: 지표 정의
+            columns_before: 계산 전 DataFrame 컬럼 집합
+
+        Note:
+            기록 실패(디스크 오류, 숫자가 아닌 컬럼 등)는 경고만 남기고 무시합니다.
+        """
+        key = self.make_key(calc, tf, indicator_def)
+        if key is None:
+            return
+
+        indicator_id = indicator_def["id"]
+        new_columns = _new_indicator_columns(calc, indicator_id, columns_before)
+        if new_columns is None:
+            return
+
+        entry = self.directory / key
+        if entry.exists():
+            return
+
+        tmp_dir = self.directory / f".tmp-{key}-{os.getpid()}-{uuid.uuid4().hex}"
+        try:
+            tmp_dir.mkdir(parents=True)
+            files = {}
+            for column_no, col in enumerate(new_columns):
+                file_name = f"{column_no}.npy"
+                values = np.ascontiguousarray(np.asarray(calc.get_column(col)))
+                np.save(tmp_dir / file_name, values, allow_pickle=False)
+                files[str(col)[len(indicator_id):]] = file_name
+            index = {
+                "tf": tf,
+                "type": indicator_def.get("type"),
+                "params": indicator_def.get("params", {}),
+                "length": len(calc.index),
+                "files": files,
+            }
+            (tmp_dir / _INDEX_FILE).write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+            os.rename(tmp_dir, entry)
+        except OSError as e:
+            # 다른 프로세스가 먼저 기록한 경우도 여기로 옴 (rename 대상이 이미 존재)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not entry.exists():
+                logger.warning(f"지표 디스크 캐시 기록 실패: {indicator_id}: {e}")
+            return
+        except ValueError as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            logger.debug(f"지표 디스크 캐시 제외: {indicator_id}: {e}")
+            return
+
+        self.writes += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 엔트리부터 삭제
+
+        Returns:
+            int: 삭제한 엔트리 수
+        """
+        entries = []
+        total_bytes = 0
+        for entry in self._iter_entries():
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                last_used = (entry / _INDEX_FILE).stat().st_mtime
+            except OSError:
+                # 다른 프로세스가 삭제 중
+                continue
+            entries.append((last_used, entry, size))
+            total_bytes += size
+
+        removed = 0
+        for _, entry, size in sorted(entries, key=lambda item: item[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_bytes -= size
+            removed += 1
+
+        if removed:
+            self.evictions += removed
+            logger.info(f"지표 디스크 캐시 정리: {removed}개 삭제 (현재 {total_bytes} bytes)")
+        return removed
+
+    def size_bytes(self) -> int:
+        """캐시 전체 크기 (바이트)"""
+        total = 0
+        for entry in self._iter_entries():
+            try:
+                total += sum(f.stat().st_size for f in entry.iterdir())
+            except OSError:
+                continue
+        return total
+
+    def _iter_entries(self) -> List[Path]:
+        """기록이 완료된 엔트리 디렉토리 목록 (임시 디렉토리 제외)"""
+        if not self.directory.is_dir():
+            return []
+        return [
+            entry for entry in self.directory.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+
+    def _read_entry(self, key: str, length: int) -> Optional[Dict[str, np.ndarray]]:
+        """엔트리 로드 (없거나 손상되었으면 None)"""
+        entry = self.directory / key
+        try:
+            index = json.loads((entry / _INDEX_FILE).read_text(encoding="utf-8"))
+            columns = {
+                suffix: np.load(entry / file_name, mmap_mode="r", allow_pickle=False)
+                for suffix, file_name in index["files"].items()
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"손상된 지표 디스크 캐시 엔트리 삭제: {entry}: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        if any(len(values) != length for values in columns.values()):
+            logger.warning(f"지표 디스크 캐시 길이 불일치, 무시합니다: {entry}")
+            return None
+        return columns
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        """LRU 기준 시각 갱신"""
+        try:
+            os.utime(entry / _INDEX_FILE)
+        except OSError:
+            pass
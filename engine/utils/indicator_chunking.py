@@ -0,0 +1,373 @@
+"""
+지표 청크 병렬 계산 모듈
+
+수년치 1m / 3m 데이터의 내장 지표를 베이스 시계열 N개 구간(청크)으로 나눠
+프로세스 풀에서 병렬 계산한 뒤 이어 붙입니다. 봉 루프는 그대로 순차 실행됩니다.
+
+- 각 청크는 앞쪽에 워밍업 구간을 겹쳐 계산하고 워밍업 부분은 버립니다.
+    - EMA / RSI / ATR: warmup_factor × period (재귀 평활의 초기값 영향이 사라질 때까지)
+    - ADX: warmup_factor × 2 × period (이중 평활)
+    - MACD: warmup_factor × (slow_period + signal_period)
+    - SMA / CCI: period (유한 창이므로 순차 계산과 같은 값)
+  같은 배치에서 계산한 다른 지표 출력을 source로 쓰면 source 지표의 워밍업을
+  더합니다 (체인 누적, chain_warmups). 같은 청크에서 계산하는 지표들은
+  가장 긴 누적 워밍업을 함께 사용합니다.
+- 재귀 지표는 워밍업 이후에도 순차 계산과 아주 작은 차이가 남을 수 있으므로
+  verify 모드에서 순차 계산과의 최대 편차를 컬럼별로 보고합니다.
+  (청크 수 / 워밍업 배수가 같으면 결과는 항상 같음 - 결정적)
+- 커스텀 지표는 워밍업을 알 수 없으므로 대상이 아닙니다.
+
+환경변수 (Run 실행 시):
+- ALGOFORGE_INDICATOR_CHUNKS: 청크(프로세스) 수 (없거나 1 이하면 비활성화)
+- ALGOFORGE_INDICATOR_WARMUP_FACTOR: 워밍업 배수 (기본 10)
+- ALGOFORGE_INDICATOR_CHUNK_MIN_BARS: 청크 계산을 적용할 최소 봉 수 (기본 500000)
+- ALGOFORGE_INDICATOR_CHUNK_VERIFY: "1"이면 순차 계산과의 편차 보고
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .indicators import IndicatorCalculator
+
+logger = logging.getLogger(__name__)
+
+CHUNKS_ENV = "ALGOFORGE_INDICATOR_CHUNKS"
+WARMUP_FACTOR_ENV = "ALGOFORGE_INDICATOR_WARMUP_FACTOR"
+MIN_BARS_ENV = "ALGOFORGE_INDICATOR_CHUNK_MIN_BARS"
+VERIFY_ENV = "ALGOFORGE_INDICATOR_CHUNK_VERIFY"
+
+# 청크 계산 입력으로 항상 전달하는 가격 컬럼
+_PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# 지표 타입별 기본 기간 (IndicatorCalculator와 같은 값)
+_DEFAULT_PERIODS = {"ema": 20, "sma": 20, "rsi": 14, "atr": 14, "adx": 14, "cci": 20}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name}는 정수여야 합니다: {raw!r}")
+
+
+@dataclass(frozen=True)
+class ChunkingOptions:
+    """
+    청크 병렬 계산 설정
+
+    Attributes:
+        chunks: 청크(프로세스) 수
+        warmup_factor: 재귀 지표 워밍업 배수 (period 기준)
+        min_bars: 이 봉 수 이상인 TF에만 적용
+        verify: True면 순차 계산과의 최대 편차를 함께 계산
+    """
+    chunks: int = 4
+    warmup_factor: int = 10
+    min_bars: int = 500_000
+    verify: bool = False
+
+    def __post_init__(self):
+        if self.chunks < 2:
+            raise ValueError(f"chunks는 2 이상이어야 합니다: {self.chunks}")
+        if self.warmup_factor < 1:
+            raise ValueError(f"warmup_factor는 1 이상이어야 합니다: {self.warmup_factor}")
+        if self.min_bars < 0:
+            raise ValueError(f"min_bars는 0 이상이어야 합니다: {self.min_bars}")
+
+    @classmethod
+    def from_env(cls) -> Optional["ChunkingOptions"]:
+        """
+        환경변수에서 설정 로드
+
+        Returns:
+            Optional[ChunkingOptions]: ALGOFORGE_INDICATOR_CHUNKS가 없거나 1 이하면 None
+        """
+        chunks = _env_int(CHUNKS_ENV, 0)
+        if chunks <= 1:
+            return None
+        defaults = cls(chunks=chunks)
+        return cls(
+            chunks=chunks,
+            warmup_factor=_env_int(WARMUP_FACTOR_ENV, defaults.warmup_factor),
+            min_bars=_env_int(MIN_BARS_ENV, defaults.min_bars),
+            verify=os.getenv(VERIFY_ENV, "0").strip().lower() in ("1", "true", "yes", "on"),
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        """캐시 키 구분자 (청크 계산 결과는 순차 계산 결과와 따로 캐시)"""
+        return f"chunks={self.chunks},warmup={self.warmup_factor}"
+
+
+@dataclass
+class ChunkReport:
+    """
+    청크 계산 결과 보고
+
+    Attributes:
+        tf: 타임프레임
+        indicator_ids: 계산한 지표 ID
+        chunks: 실제 사용한 청크 수
+        warmup_bars: 청크별 워밍업 봉 수
+        seconds: 청크 계산 + 이어 붙이기 소요 시간
+        max_abs_deviation: 컬럼 → 순차 계산과의 최대 절대 편차 (verify 모드에서만)
+        max_rel_deviation: 컬럼 → 최대 상대 편차 (verify 모드에서만)
+    """
+    tf: str
+    indicator_ids: List[str]
+    chunks: int
+    warmup_bars: int
+    seconds: float
+    max_abs_deviation: Dict[str, float] = field(default_factory=dict)
+    max_rel_deviation: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tf": self.tf,
+            "indicator_ids": self.indicator_ids,
+            "chunks": self.chunks,
+            "warmup_bars": self.warmup_bars,
+            "seconds": round(self.seconds, 6),
+            "max_abs_deviation": self.max_abs_deviation or None,
+            "max_rel_deviation": self.max_rel_deviation or None,
+        }
+
+
+def indicator_warmup(indicator_def: Dict[str, Any], warmup_factor: int) -> int:
+    """
+    지표 하나의 청크 워밍업 봉 수
+
+    Args:
+        indicator_def: 내장 지표 정의 (type, params)
+        warmup_factor: 재귀 지표 워밍업 배수
+
+    Returns:
+        int: 워밍업 봉 수
+
+    Raises:
+        ValueError: 내장 지표가 아닌 경우
+    """
+    indicator_type = indicator_def.get("type")
+    params = indicator_def.get("params") or {}
+    if indicator_type == "macd":
+        slow = params.get("slow_period", 26)
+        signal = params.get("signal_period", 9)
+        return warmup_factor * (slow + signal)
+    if indicator_type not in _DEFAULT_PERIODS:
+        raise ValueError(f"청크 계산을 지원하지 않는 지표 타입: {indicator_type}")
+
+    period = params.get("period", _DEFAULT_PERIODS[indicator_type])
+    if indicator_type in ("sma", "cci"):
+        return period
+    if indicator_type == "adx":
+        return warmup_factor * 2 * period
+    return warmup_factor * period
+
+
+def chain_warmups(definitions: List[Dict[str, Any]], warmup_factor: int) -> List[int]:
+    """
+    지표별 누적 워밍업 봉 수 (definitions 순서 = 의존 순서)
+
+    source가 앞서 나온 지표의 출력이면 그 지표의 누적 워밍업을 더합니다.
+    예: SMA(50) → SMA(50, source=앞의 SMA)는 100봉 (유한 창 지표는 체인에서도 순차 계산과 같은 값)
+
+    Args:
+        definitions: 내장 지표 정의 목록
+        warmup_factor: 재귀 지표 워밍업 배수
+
+    Returns:
+        List[int]: definitions와 같은 순서의 누적 워밍업 봉 수
+    """
+    column_warmups: Dict[str, int] = {}
+    warmups = []
+    for definition in definitions:
+        source = (definition.get("params") or {}).get("source", "close")
+        warmup = indicator_warmup(definition, warmup_factor) + column_warmups.get(source, 0)
+        for col in builtin_output_columns(definition):
+            column_warmups[col] = warmup
+        warmups.append(warmup)
+    return warmups
+
+
+def builtin_output_columns(indicator_def: Dict[str, Any]) -> List[str]:
+    """내장 지표가 만드는 컬럼명 (MACD는 다중 출력)"""
+    indicator_id = indicator_def["id"]
+    if indicator_def.get("type") == "macd":
+        return [
+            indicator_id,
+            f"{indicator_id}_signal",
+            f"{indicator_id}_histogram",
+            f"{indicator_id}_histogram_direction",
+        ]
+    return [indicator_id]
+
+
+def chunk_bounds(n: int, chunks: int, warmup: int) -> List[Tuple[int, int, int]]:
+    """
+    청크 구간 계산
+
+    Args:
+        n: 전체 봉 수
+        chunks: 청크 수
+        warmup: 워밍업 봉 수
+
+    Returns:
+        List[Tuple]: (계산 시작, 결과 시작, 결과 끝) - 계산은 [계산 시작, 결과 끝),
+            결과로 쓰는 구간은 [결과 시작, 결과 끝)
+    """
+    edges = np.linspace(0, n, chunks + 1).astype(np.int64)
+    return [
+        (max(0, int(start) - warmup), int(start), int(end))
+        for start, end in zip(edges[:-1], edges[1:])
+    ]
+
+
+def _compute_chunk(inputs: Dict[str, np.ndarray], definitions: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """청크 하나 계산 (워커 프로세스에서 실행, 새로 만든 컬럼의 원본 값 반환)"""
+    calc = IndicatorCalculator(pd.DataFrame(inputs, copy=False))
+    columns_before = set(calc.columns)
+    for definition in definitions:
+        calc.calculate_indicator(definition)
+    return {
+        col: np.asarray(calc.get_column(col))
+        for col in calc.columns
+        if col not in columns_before
+    }
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """청크 계산용 프로세스 풀 (spawn, 워커 수가 바뀌면 다시 생성)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                atexit.register(shutdown_chunk_executor)
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown_chunk_executor() -> None:
+    """청크 계산용 프로세스 풀 종료"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        executor, _executor = _executor, None
+        _executor_workers = 0
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def calculate_chunked(
+    calc: IndicatorCalculator,
+    definitions: List[Dict[str, Any]],
+    options: ChunkingOptions,
+    tf: str = "base"
+) -> Optional[Tuple[Dict[str, np.ndarray], ChunkReport]]:
+    """
+    내장 지표를 청크로 나눠 병렬 계산 (calculator에는 저장하지 않음)
+
+    definitions는 의존 순서대로 전달해야 하며, 다른 지표 출력을 source로 쓰는 지표는
+    그 지표가 calculator에 이미 있거나 definitions 앞쪽에 있어야 합니다.
+
+    Args:
+        calc: 입력 컬럼을 가진 IndicatorCalculator
+        definitions: 내장 지표 정의 목록
+        options: 청크 설정
+        tf: 타임프레임 (보고용)
+
+    Returns:
+        Optional[Tuple]: (컬럼 → 이어 붙인 값, 보고), 데이터가 짧아 청크로 나눌
+            이유가 없으면 None
+
+    Raises:
+        ValueError: 내장 지표가 아니거나 지표 계산 오류
+    """
+    if not definitions:
+        return None
+    started = time.perf_counter()
+    n = len(calc.index)
+    warmup = max(chain_warmups(definitions, options.warmup_factor))
+    # 청크 하나가 워밍업보다 짧으면 나누는 의미가 없음
+    chunks = min(options.chunks, n // max(warmup, 1))
+    if chunks < 2:
+        return None
+
+    produced = set()
+    input_columns = [col for col in _PRICE_COLUMNS if col in calc.columns]
+    for definition in definitions:
+        source = (definition.get("params") or {}).get("source", "close")
+        if source not in produced and source not in input_columns:
+            input_columns.append(source)
+        produced.update(builtin_output_columns(definition))
+    inputs = {col: np.asarray(calc.get_column(col), dtype=np.float64) for col in input_columns}
+
+    bounds = chunk_bounds(n, chunks, warmup)
+    executor = _get_executor(chunks)
+    futures = [
+        executor.submit(
+            _compute_chunk,
+            {col: values[compute_start:end] for col, values in inputs.items()},
+            definitions,
+        )
+        for compute_start, _, end in bounds
+    ]
+    parts = [future.result() for future in futures]
+
+    columns: Dict[str, np.ndarray] = {}
+    for col in parts[0]:
+        columns[col] = np.concatenate([
+            part[col][start - compute_start:]
+            for part, (compute_start, start, _) in zip(parts, bounds)
+        ])
+
+    report = ChunkReport(
+        tf=tf,
+        indicator_ids=[definition["id"] for definition in definitions],
+        chunks=chunks,
+        warmup_bars=warmup,
+        seconds=time.perf_counter() - started,
+    )
+    if options.verify:
+        sequential = _compute_chunk(inputs, definitions)
+        for col, values in columns.items():
+            expected = np.asarray(sequential[col], dtype=np.float64)
+            diff = np.abs(np.asarray(values, dtype=np.float64) - expected)
+            valid = ~np.isnan(diff)
+            max_abs = float(diff[valid].max()) if valid.any() else 0.0
+            scale = np.maximum(np.abs(expected[valid]), 1e-12)
+            max_rel = float((diff[valid] / scale).max()) if valid.any() else 0.0
+            report.max_abs_deviation[col] = max_abs
+            report.max_rel_deviation[col] = max_rel
+        logger.info(
+            f"[청크 계산] tf={tf}, 최대 편차: "
+            f"{max(report.max_abs_deviation.values(), default=0.0):.3e}"
+        )
+
+    logger.info(
+        f"[청크 계산] tf={tf}, 지표 {len(definitions)}개, 청크 {chunks}개, "
+        f"워밍업 {warmup}봉, {report.seconds:.3f}초"
+    )
+    return columns, report
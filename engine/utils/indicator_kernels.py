@@ -0,0 +1,557 @@
+"""
+내장 지표 계산 커널 - NumPy 배열 기반
+
+ta 라이브러리(0.11)의 EMA / SMA / RSI / ATR / ADX / MACD / CCI와 같은 값을
+pandas Series 없이 float64 배열로 계산합니다. (허용 오차 1e-9, tests/test_indicator_kernels.py)
+
+- 재귀 필터(EMA, Wilder 평활)는 블록 단위 누적합으로 계산:
+    y[k] = r^k * (y[0] + c * Σ_{j≤k} x[j] * r^-j)
+  블록 길이는 r^-k가 오버플로하지 않도록 제한하고, 블록 경계 값만 순차 전달
+- 이동 평균은 청크 단위 누적합 차분으로 계산 (큰 누적합의 자릿수 손실 방지)
+- fillna 등 ta의 경계 처리(초기 구간 값, inf/NaN 대체)를 그대로 재현
+
+모든 함수는 입력 배열을 변경하지 않으며, 결과는 새 float64 배열입니다.
+"""
+
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# 재귀 필터 블록 길이 상한 / 블록 내 최대 증폭 (r^-k ≤ 1e100)
+_MAX_BLOCK = 4096
+_MAX_GROWTH_LOG10 = 100.0
+
+# 이동 합계 청크 길이
+_ROLLING_CHUNK = 65536
+
+
+# ----------------------------------------------------------------------
+# 공통 연산
+# ----------------------------------------------------------------------
+
+def linear_recursion(
+    x: np.ndarray,
+    decay: float,
+    gain: float,
+    y0: float,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    1차 선형 재귀 y[0] = y0, y[k] = decay * y[k-1] + gain * x[k] (k ≥ 1)
+
+    Args:
+        x: 입력 배열 (x[0]은 사용하지 않음, NaN 없어야 함)
+        decay: 감쇠 계수 (0 ≤ decay < 1)
+        gain: 입력 계수
+        y0: 초기값
+        out: 결과를 쓸 연속 float64 배열 (선택, 길이 len(x))
+
+    Returns:
+        np.ndarray: y (len(x)), out을 주면 out
+    """
+    n = len(x)
+    y = np.empty(n, dtype=np.float64) if out is None else out
+    if n == 0:
+        return y
+    y[0] = y0
+    if n == 1:
+        return y
+    if decay == 0.0:
+        np.multiply(x[1:], gain, out=y[1:])
+        return y
+
+    # 블록 길이: decay^-block ≤ 10^_MAX_GROWTH_LOG10
+    block = int(_MAX_GROWTH_LOG10 / -math.log10(decay)) if decay < 1.0 else _MAX_BLOCK
+    block = max(1, min(_MAX_BLOCK, block, n - 1))
+
+    steps = n - 1
+    n_full = steps // block
+    tail = steps - n_full * block
+    powers = decay ** np.arange(1, block + 1, dtype=np.float64)
+    prev = float(y0)
+
+    if n_full:
+        # y[1:]의 온전한 블록을 행렬로 보고 제자리 연산
+        # 블록 시작값이 0일 때의 블록 내 해 = powers * gain * cumsum(x / powers)
+        blocks = y[1:1 + n_full * block].reshape(n_full, block)
+        np.divide(x[1:1 + n_full * block].reshape(n_full, block), powers, out=blocks)
+        np.cumsum(blocks, axis=1, out=blocks)
+
+        # 블록 경계 전달: 이전 블록 마지막 값의 기여분 decay^k * y_prev
+        starts = np.empty(n_full, dtype=np.float64)
+        last = blocks[:, -1] * (gain * powers[-1])
+        decay_block = powers[-1]
+        for b in range(n_full):
+            starts[b] = prev
+            prev = decay_block * prev + last[b]
+
+        blocks *= gain
+        blocks += starts[:, None]
+        blocks *= powers
+
+    if tail:
+        segment = x[1 + n_full * block:] / powers[:tail]
+        np.cumsum(segment, out=segment)
+        segment *= gain
+        segment += prev
+        segment *= powers[:tail]
+        y[1 + n_full * block:] = segment
+    return y
+
+
+def ewm_mean(
+    values: np.ndarray,
+    alpha: float,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    pandas Series.ewm(alpha=alpha, adjust=False, min_periods=0).mean()과 같은 값
+
+    Args:
+        values: 입력 배열 (NaN 허용)
+        alpha: 평활 계수 (0 < alpha ≤ 1)
+        out: 결과를 쓸 연속 float64 배열 (선택)
+
+    Returns:
+        np.ndarray: 지수 이동 평균 (첫 유효값 이전은 NaN)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(x)
+    first = int(np.argmax(valid)) if valid.any() else len(x)
+    return _ewm_mean_into(x, alpha, first, bool(valid[first:].all()), out)
+
+
+def ewm_mean_family(values: np.ndarray, alphas: Sequence[float]) -> np.ndarray:
+    """
+    ewm_mean을 여러 alpha에 대해 계산 (입력 검사는 한 번만)
+
+    Args:
+        values: 입력 배열 (NaN 허용)
+        alphas: 행별 평활 계수
+
+    Returns:
+        np.ndarray: (len(alphas), len(values)) 배열, 각 행은 연속 메모리
+    """
+    x = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(x)
+    first = int(np.argmax(valid)) if valid.any() else len(x)
+    dense = bool(valid[first:].all())
+    out = np.empty((len(alphas), len(x)), dtype=np.float64)
+    for row, alpha in enumerate(alphas):
+        _ewm_mean_into(x, float(alpha), first, dense, out[row])
+    return out
+
+
+def _ewm_mean_into(
+    x: np.ndarray,
+    alpha: float,
+    first: int,
+    dense: bool,
+    out: Optional[np.ndarray]
+) -> np.ndarray:
+    """ewm_mean 본체 (first: 첫 유효값 위치, dense: first 이후 NaN 없음)"""
+    n = len(x)
+    if out is None:
+        out = np.empty(n, dtype=np.float64)
+    out[:first] = np.nan
+    if first >= n:
+        return out
+
+    if dense:
+        linear_recursion(x[first:], 1.0 - alpha, alpha, x[first], out=out[first:])
+        return out
+
+    # 중간 NaN: pandas와 같이 결측 구간만큼 이전 값의 가중치를 감쇠 (순차 계산)
+    decay = 1.0 - alpha
+    weighted = x[first]
+    old_weight = 1.0
+    out[first] = weighted
+    for i in range(first + 1, n):
+        cur = x[i]
+        old_weight *= decay
+        if cur == cur:
+            if weighted != cur:
+                weighted = (old_weight * weighted + alpha * cur) / (old_weight + alpha)
+            old_weight = 1.0
+        out[i] = weighted
+    return out
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    길이 window의 이동 합계 (초기 구간은 있는 값까지의 합)
+
+    Args:
+        values: 입력 배열 (NaN 없어야 함)
+        window: 구간 길이
+
+    Returns:
+        np.ndarray: out[i] = Σ values[max(0, i-window+1) .. i]
+    """
+    x = np.asarray(values, dtype=np.float64)
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    for start in range(0, n, _ROLLING_CHUNK):
+        end = min(n, start + _ROLLING_CHUNK)
+        lo = max(0, start - window)
+        sums = np.cumsum(x[lo:end])
+        index = np.arange(start, end)
+        lower = index - window - lo
+        out[start:end] = sums[index - lo] - np.where(lower >= 0, sums[np.maximum(lower, 0)], 0.0)
+    return out
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    pandas Series.rolling(window, min_periods=0).mean()과 같은 값
+
+    Args:
+        values: 입력 배열 (NaN은 제외하고 평균)
+        window: 구간 길이
+
+    Returns:
+        np.ndarray: 이동 평균 (구간에 유효값이 없으면 NaN)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(x)
+    if valid.all():
+        counts = np.minimum(np.arange(1, len(x) + 1), window).astype(np.float64)
+        return rolling_sum(x, window) / counts
+
+    counts = rolling_sum(valid.astype(np.float64), window)
+    sums = rolling_sum(np.where(valid, x, 0.0), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(counts > 0, sums / np.where(counts > 0, counts, 1.0), np.nan)
+
+
+def forward_fill(values: np.ndarray, fill_value: float) -> np.ndarray:
+    """
+    ta _check_fillna(value)와 같은 처리: ±inf → NaN, 앞 값으로 채움, 남은 NaN은 fill_value
+
+    Args:
+        values: 입력 배열
+        fill_value: 앞 값이 없는 NaN을 채울 값
+
+    Returns:
+        np.ndarray: 결측 없는 배열
+    """
+    x = np.array(values, dtype=np.float64)
+    missing = ~np.isfinite(x)
+    if not missing.any():
+        return x
+    positions = np.where(missing, 0, np.arange(len(x)))
+    np.maximum.accumulate(positions, out=positions)
+    filled = x[positions]
+    # 앞 값이 전혀 없는 구간 (positions가 0이고 x[0]도 결측)
+    filled[~np.isfinite(filled)] = fill_value
+    return filled
+
+
+def backward_fill(values: np.ndarray) -> np.ndarray:
+    """
+    pandas Series.bfill()과 같은 처리: NaN을 뒤쪽의 첫 유효값으로 채움
+
+    Args:
+        values: 입력 배열
+
+    Returns:
+        np.ndarray: 뒤에 유효값이 없는 NaN은 그대로 남김
+    """
+    x = np.array(values, dtype=np.float64)
+    missing = np.isnan(x)
+    if not missing.any():
+        return x
+    n = len(x)
+    positions = np.where(missing, n - 1, np.arange(n))
+    positions = np.minimum.accumulate(positions[::-1])[::-1]
+    return x[positions]
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True Range: max(high - low, |high - 이전 close|, |low - 이전 close|)
+    (첫 봉은 high - low)
+    """
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+
+# ----------------------------------------------------------------------
+# 지표
+# ----------------------------------------------------------------------
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """EMA (ta EMAIndicator, fillna=True)"""
+    return ewm_mean(values, 2.0 / (period + 1.0))
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """SMA (ta SMAIndicator, fillna=True)"""
+    return rolling_mean(values, period)
+
+
+def rsi(values: np.ndarray, period: int) -> np.ndarray:
+    """RSI - Wilder 평활 (ta RSIIndicator, fillna=True)"""
+    up, down = _gains_losses(values)
+    alpha = 1.0 / period
+    return _rsi_from_averages(ewm_mean(up, alpha), ewm_mean(down, alpha))
+
+
+def _gains_losses(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """RSI 입력: 봉간 상승폭 / 하락폭 (첫 봉은 0)"""
+    x = np.asarray(values, dtype=np.float64)
+    diff = np.empty_like(x)
+    if len(x):
+        diff[0] = np.nan
+        diff[1:] = x[1:] - x[:-1]
+    up = np.where(diff > 0, diff, 0.0)
+    down = -np.where(diff < 0, diff, 0.0)
+    return up, down
+
+
+def _rsi_from_averages(ema_up: np.ndarray, ema_down: np.ndarray) -> np.ndarray:
+    """평활된 상승폭 / 하락폭 → RSI (1차원 또는 행별 2차원)"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = np.where(ema_down == 0, 100.0, 100.0 - (100.0 / (1.0 + ema_up / ema_down)))
+    if result.ndim == 1:
+        return forward_fill(result, 50.0)
+    for row in range(len(result)):
+        result[row] = forward_fill(result[row], 50.0)
+    return result
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    ATR (ta AverageTrueRange, fillna=False)
+
+    첫 period-1개 봉은 0, period번째 봉은 TR 단순 평균, 이후 Wilder 평활
+    """
+    n = len(close)
+    if n < period:
+        raise ValueError(f"ATR 계산에 필요한 봉 수가 부족합니다: {n} < period({period})")
+
+    tr = true_range(high, low, close)
+    out = np.zeros(n, dtype=np.float64)
+    seed = float(np.mean(tr[:period]))
+    linear_recursion(tr[period - 1:], (period - 1.0) / period, 1.0 / period, seed, out=out[period - 1:])
+    return out
+
+
+def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    ADX (ta ADXIndicator, fillna=True)
+
+    ta 구현의 경계 처리를 그대로 따릅니다:
+    - TR / +DM / -DM 합계는 1~period번째 봉 합으로 시작해 Wilder 방식으로 갱신
+      (마지막 원소는 갱신하지 않아 0)
+    - ADX는 처음 2*period-1개 봉이 0, 이후 DX의 한 봉 지연 Wilder 평활
+    """
+    return _adx_from_movements(_directional_movements(high, low, close), period)
+
+
+def _directional_movements(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ADX 입력: (봉 범위, +DM, -DM)"""
+    n = len(close)
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    # np.amax / np.amin (NaN 전파) → 첫 봉은 NaN
+    directional_range = np.maximum(high, prev_close) - np.minimum(low, prev_close)
+
+    diff_up = np.full(n, np.nan)
+    diff_down = np.full(n, np.nan)
+    diff_up[1:] = high[1:] - high[:-1]
+    diff_down[1:] = low[:-1] - low[1:]
+    pos = np.abs(np.where((diff_up > diff_down) & (diff_up > 0), diff_up, 0.0))
+    neg = np.abs(np.where((diff_down > diff_up) & (diff_down > 0), diff_down, 0.0))
+    return directional_range, pos, neg
+
+
+def _adx_from_movements(
+    movements: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    period: int
+) -> np.ndarray:
+    """(봉 범위, +DM, -DM) → ADX"""
+    directional_range, pos, neg = movements
+    n = len(directional_range)
+    w = period
+    length = n - (w - 1)
+    if length <= w:
+        raise ValueError(f"ADX 계산에 필요한 봉 수가 부족합니다: {n} < 2*period({2 * w})")
+
+    def smoothed_sum(series: np.ndarray) -> np.ndarray:
+        # s[0] = series[1..w] 합, s[i] = s[i-1] * (1 - 1/w) + series[w+i] (1 ≤ i ≤ length-2)
+        s = np.zeros(length, dtype=np.float64)
+        seed = float(np.sum(series[1:w + 1]))
+        s[:length - 1] = linear_recursion(series[w:w + length - 1], 1.0 - 1.0 / w, 1.0, seed)
+        return s
+
+    trs = smoothed_sum(directional_range)
+    dip = smoothed_sum(pos)
+    din = smoothed_sum(neg)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        di_pos = np.where(trs != 0, 100.0 * (dip / trs), 0.0)
+        di_neg = np.where(trs != 0, 100.0 * (din / trs), 0.0)
+        di_sum = di_pos + di_neg
+        dx = np.where(di_sum != 0, 100.0 * np.abs((di_pos - di_neg) / di_sum), 0.0)
+
+    adx_values = np.zeros(length, dtype=np.float64)
+    seed = float(np.mean(dx[:w]))
+    # adx[i] = adx[i-1] * (w-1)/w + dx[i-1] / w  (i > w)
+    shifted = np.empty(length - w, dtype=np.float64)
+    shifted[1:] = dx[w:length - 1]
+    shifted[0] = 0.0
+    adx_values[w:] = linear_recursion(shifted, (w - 1.0) / w, 1.0 / w, seed)
+
+    out = np.concatenate((np.zeros(w - 1), adx_values))
+    return forward_fill(out, 20.0)
+
+
+def macd(
+    values: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD (ta MACD, fillna=True)
+
+    Returns:
+        Tuple: (MACD 라인, 시그널 라인, 히스토그램)
+    """
+    macd_line = ema(values, fast_period) - ema(values, slow_period)
+    signal_line = ema(macd_line, signal_period)
+    histogram = macd_line - signal_line
+    return (
+        forward_fill(macd_line, 0.0),
+        forward_fill(signal_line, 0.0),
+        forward_fill(histogram, 0.0),
+    )
+
+
+def cci(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int,
+    constant: float
+) -> np.ndarray:
+    """
+    CCI (ta CCIIndicator, fillna=True)
+
+    평균 절대 편차는 구간마다 구간 평균 기준으로 계산 (초기 구간은 있는 값까지)
+    """
+    return _cci_from_typical((high + low + close) / 3.0, period, constant)
+
+
+def _cci_from_typical(typical: np.ndarray, period: int, constant: float) -> np.ndarray:
+    """대표 가격 (high + low + close) / 3 → CCI"""
+    n = len(typical)
+    means = np.empty(n, dtype=np.float64)
+    mad = np.empty(n, dtype=np.float64)
+
+    head = min(period - 1, n)
+    for i in range(head):
+        window = typical[:i + 1]
+        means[i] = np.mean(window)
+        mad[i] = np.mean(np.abs(window - means[i]))
+
+    if n >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(typical, period)
+        rows = max(1, _ROLLING_CHUNK // period)
+        for start in range(0, len(windows), rows):
+            chunk = windows[start:start + rows]
+            chunk_means = np.mean(chunk, axis=1)
+            means[period - 1 + start:period - 1 + start + len(chunk)] = chunk_means
+            mad[period - 1 + start:period - 1 + start + len(chunk)] = np.mean(
+                np.abs(chunk - chunk_means[:, None]), axis=1
+            )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result = (typical - means) / (constant * mad)
+    return forward_fill(result, 0.0)
+
+
+# ----------------------------------------------------------------------
+# 기간 묶음 (family): 같은 입력, 기간만 다른 지표를 한 번에 계산
+# ----------------------------------------------------------------------
+# 결과는 (기간 수, 봉 수) 배열이며 행 순서는 periods 순서와 같습니다.
+# 입력 변환 / 공통 중간값(TR, 상승폭 등)은 한 번만 계산합니다.
+
+def ema_family(values: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """기간별 EMA"""
+    return ewm_mean_family(values, [2.0 / (period + 1.0) for period in periods])
+
+
+def sma_family(values: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """기간별 SMA"""
+    x = np.asarray(values, dtype=np.float64)
+    out = np.empty((len(periods), len(x)), dtype=np.float64)
+    for row, period in enumerate(periods):
+        out[row] = rolling_mean(x, period)
+    return out
+
+
+def rsi_family(values: np.ndarray, periods: Sequence[int]) -> np.ndarray:
+    """기간별 RSI (상승폭 / 하락폭은 한 번만 계산)"""
+    up, down = _gains_losses(values)
+    alphas = [1.0 / period for period in periods]
+    return _rsi_from_averages(ewm_mean_family(up, alphas), ewm_mean_family(down, alphas))
+
+
+def atr_family(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    periods: Sequence[int]
+) -> np.ndarray:
+    """기간별 ATR (True Range는 한 번만 계산)"""
+    n = len(close)
+    tr = true_range(high, low, close)
+    out = np.zeros((len(periods), n), dtype=np.float64)
+    for row, period in enumerate(periods):
+        if n < period:
+            raise ValueError(f"ATR 계산에 필요한 봉 수가 부족합니다: {n} < period({period})")
+        seed = float(np.mean(tr[:period]))
+        linear_recursion(
+            tr[period - 1:], (period - 1.0) / period, 1.0 / period, seed,
+            out=out[row, period - 1:]
+        )
+    return out
+
+
+def adx_family(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    periods: Sequence[int]
+) -> np.ndarray:
+    """기간별 ADX (봉 범위 / ±DM은 한 번만 계산)"""
+    movements = _directional_movements(high, low, close)
+    out = np.empty((len(periods), len(close)), dtype=np.float64)
+    for row, period in enumerate(periods):
+        out[row] = _adx_from_movements(movements, period)
+    return out
+
+
+def cci_family(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    periods: Sequence[int],
+    constant: float
+) -> np.ndarray:
+    """기간별 CCI (대표 가격은 한 번만 계산)"""
+    typical = (high + low + close) / 3.0
+    out = np.empty((len(periods), len(close)), dtype=np.float64)
+    for row, period in enumerate(periods):
+        out[row] = _cci_from_typical(typical, period, constant)
+    return out
@@ -3,23 +3,126 @@
 
 백테스트 실행 시 데이터베이스에서 커스텀 지표를 읽어와
 IndicatorCalculator에 등록합니다.
+
+컴파일(exec)된 함수는 프로세스 전역 레지스트리에 (지표 타입, 코드 해시) 키로
+보관하여, 같은 코드는 TF / Run / 차트 조회마다 다시 컴파일하지 않습니다.
+- 코드 해시가 키에 포함되므로 다른 프로세스(Run 워커)에서 코드가 수정되어도
+  DB의 현재 코드에 맞는 함수를 사용합니다.
+- 지표 등록 / 수정 / 삭제 시 API 라우터가 invalidate_custom_indicator()로
+  해당 타입의 이전 함수를 제거합니다.
+
+샌드박스 모드(기본, ALGOFORGE_INDICATOR_SANDBOX=1)에서는 이 프로세스에서 코드를
+실행(exec)하지 않고 문법만 검사한 뒤, 워커 프로세스에서 실행하는
+SandboxedIndicator를 등록합니다. (indicator_sandbox 모듈 참고)
 """
 
+import hashlib
 import sqlite3
-from typing import Callable, Dict, Any
+import threading
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
 import pandas as pd
 import numpy as np
 import logging
 
+from .indicator_sandbox import SandboxedIndicator, sandbox_enabled
+
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 컴파일 캐시: (지표 타입, 코드 해시, 샌드박스 여부) → 지표 계산 함수
+_compiled_indicators: Dict[Tuple[str, str, bool], Callable] = {}
+_compiled_lock = threading.Lock()
+
+
+def calculate_code_hash(code: str) -> str:
+    """
+    커스텀 지표 코드 해시 계산
+
+    Args:
+        code: Python 함수 코드
+
+    Returns:
+        str: SHA256 해시 (16진수 문자열)
+    """
+    return hashlib.sha256(code.encode('utf-8')).hexdigest()
+
+
+def get_compiled_indicator(
+    indicator_type: str,
+    code: str,
+    code_hash: Optional[str] = None
+) -> Callable:
+    """
+    커스텀 지표 함수 조회 (레지스트리에 없으면 컴파일 후 등록)
+    
+    같은 타입의 다른 코드 해시 항목(이전 버전)은 새로 컴파일할 때 제거합니다.
+    샌드박스 모드에서는 문법 검사 후 SandboxedIndicator를 반환합니다.
+    (실제 컴파일은 워커 프로세스에서 코드 해시별로 한 번)
+    
+    Args:
+        indicator_type: 지표 타입
+        code: Python 함수 코드
+        code_hash: 코드 해시 (없으면 계산)
+    
+    Returns:
+        Callable: 지표 계산 함수
+    
+    Raises:
+        ValueError: 코드 실행 실패 또는 함수를 찾을 수 없는 경우
+    """
+    sandboxed = sandbox_enabled()
+    key = (indicator_type, code_hash or calculate_code_hash(code), sandboxed)
+    with _compiled_lock:
+        func = _compiled_indicators.get(key)
+    if func is not None:
+        return func
+    
+    if sandboxed:
+        _check_syntax(code)
+        func = SandboxedIndicator(indicator_type, code, key[1])
+    else:
+        func = _create_function_from_code(code)
+    with _compiled_lock:
+        for stale in [k for k in _compiled_indicators if k[0] == indicator_type]:
+            del _compiled_indicators[stale]
+        _compiled_indicators[key] = func
+    logger.debug(f"커스텀 지표 컴파일: {indicator_type} ({key[1][:12]})")
+    return func
+
+
+def invalidate_custom_indicator(indicator_type: Optional[str] = None) -> int:
+    """
+    컴파일 캐시에서 커스텀 지표 제거 (지표 등록 / 수정 / 삭제 시 호출)
+    
+    Args:
+        indicator_type: 제거할 지표 타입 (None이면 전체)
+    
+    Returns:
+        int: 제거된 항목 수
+    """
+    with _compiled_lock:
+        stale = [
+            key for key in _compiled_indicators
+            if indicator_type is None or key[0] == indicator_type
+        ]
+        for key in stale:
+            del _compiled_indicators[key]
+    if stale:
+        logger.info(f"커스텀 지표 컴파일 캐시 제거: {indicator_type or '전체'} ({len(stale)}개)")
+    return len(stale)
+
 
-def load_custom_indicators_from_db(db_path: str) -> Dict[str, Callable]:
+def load_custom_indicators_from_db(
+    db_path: str,
+    code_hashes: Optional[Dict[str, str]] = None,
+    types: Optional[Iterable[str]] = None
+) -> Dict[str, Callable]:
     """
     데이터베이스에서 커스텀 지표를 로드
     
     Args:
         db_path: SQLite 데이터베이스 경로
+        code_hashes: 전달하면 로드된 지표의 코드 해시를 채움 (indicator_type → SHA256)
+        types: 로드할 지표 타입 (None이면 전체, 비어 있으면 DB를 열지 않음)
     
     Returns:
         Dict[str, Callable]: {indicator_type: calculate_function}
@@ -27,21 +130,31 @@ def load_custom_indicators_from_db(db_path: str) -> Dict[str, Callable]:
     Note:
         로드에 실패한 지표는 로그에 기록하고 건너뜁니다.
         전체 로드 실패를 방지하기 위함입니다.
+        이미 컴파일된 코드(같은 타입 / 코드 해시)는 레지스트리의 함수를 재사용합니다.
     """
     indicators = {}
     
+    query = "SELECT type, code, name FROM indicators WHERE implementation_type = 'custom'"
+    query_params: Tuple[str, ...] = ()
+    if types is not None:
+        query_params = tuple(sorted(set(types)))
+        if not query_params:
+            return indicators
+        query += f" AND type IN ({', '.join('?' * len(query_params))})"
+    
     try:
         conn = sqlite3.connect(db_path)
-        cursor = conn.execute(
-            "SELECT type, code, name FROM indicators WHERE implementation_type = 'custom'"
-        )
+        cursor = conn.execute(query, query_params)
         
         for row in cursor.fetchall():
             indicator_type, code, name = row
             
             try:
-                func = _create_function_from_code(code)
+                code_hash = calculate_code_hash(code)
+                func = get_compiled_indicator(indicator_type, code, code_hash)
                 indicators[indicator_type] = func
+                if code_hashes is not None:
+                    code_hashes[indicator_type] = code_hash
                 logger.info(f"커스텀 지표 로드 성공: {indicator_type} ({name})")
             except Exception as e:
                 logger.error(
@@ -58,6 +171,19 @@ def load_custom_indicators_from_db(db_path: str) -> Dict[str, Callable]:
     return indicators
 
 
+def _check_syntax(code: str) -> None:
+    """
+    코드 문법 검사 (실행하지 않음)
+    
+    Raises:
+        ValueError: 문법 오류
+    """
+    try:
+        compile(code, "<custom_indicator>", "exec")
+    except SyntaxError as e:
+        raise ValueError(f"코드 실행 실패: {str(e)}")
+
+
 def _create_function_from_code(code: str) -> Callable:
     """
     코드 문자열에서 함수 객체 생성
@@ -73,8 +199,8 @@ def _create_function_from_code(code: str) -> Callable:
     
     Warning:
         exec 사용은 보안 위험이 있으므로 반드시 코드 검증 필요!
-        개인 사용 MVP이므로 기본 검증만 수행하지만,
-        프로덕션 환경에서는 샌드박스 환경에서 실행 권장
+        샌드박스 모드에서는 워커 프로세스(indicator_sandbox)에서만 호출되며,
+        이 프로세스에서 직접 호출되는 것은 ALGOFORGE_INDICATOR_SANDBOX=0일 때뿐입니다.
     """
     # 안전한 네임스페이스 (허용된 라이브러리만)
     safe_namespace = {
@@ -126,21 +252,29 @@ def _create_function_from_code(code: str) -> Callable:
     raise ValueError("함수를 찾을 수 없습니다. 코드에 함수 정의가 있는지 확인하세요.")
 
 
-def register_custom_indicators(indicator_calc, db_path: str) -> int:
+def register_custom_indicators(
+    indicator_calc,
+    db_path: str,
+    types: Optional[Iterable[str]] = None
+) -> int:
     """
     커스텀 지표를 로드하여 IndicatorCalculator에 등록
     
     Args:
-        indicator_calc: IndicatorCalculator 인스턴스
+        indicator_calc: IndicatorCalculator 인스턴스 (또는 인스턴스 리스트)
         db_path: SQLite 데이터베이스 경로
+        types: 등록할 지표 타입 (None이면 전체)
     
     Returns:
         int: 등록된 지표 개수
     """
-    custom_indicators = load_custom_indicators_from_db(db_path)
+    calcs = indicator_calc if isinstance(indicator_calc, (list, tuple)) else [indicator_calc]
+    code_hashes: Dict[str, str] = {}
+    custom_indicators = load_custom_indicators_from_db(db_path, code_hashes, types=types)
     
-    for name, func in custom_indicators.items():
-        indicator_calc.register_custom_indicator(name, func)
+    for calc in calcs:
+        for name, func in custom_indicators.items():
+            calc.register_custom_indicator(name, func, code_hash=code_hashes.get(name))
     
     logger.info(f"커스텀 지표 {len(custom_indicators)}개 등록 완료")
     
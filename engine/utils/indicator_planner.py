@@ -0,0 +1,278 @@
+"""
+지표 계산 계획(Indicator Planner) 모듈
+
+전략 정의의 indicators를 그대로 모두 계산하지 않고, 실제로 필요한 지표만
+의존 순서대로 한 번씩 계산하도록 계획을 세웁니다.
+
+- 참조 그래프: entry / exit / stop_loss 등 지표 목록 밖의 ref, long_ref,
+  short_ref, atr_indicator_id에서 참조하는 지표만 계산 (참조되지 않은 지표는 생략)
+- 지표 간 의존: params.source가 같은 TF의 다른 지표 출력이면 해당 지표에 의존
+  (예: {"type": "ema", "params": {"source": "rsi_1"}} → RSI의 EMA)
+- 위상 정렬: 의존 대상 지표를 먼저 계산, 순환 참조는 ValueError
+- 중복 제거: (TF, 타입, 정규화 파라미터)가 같은 지표는 한 번만 계산하고
+  나머지 ID는 같은 컬럼을 공유 (aliases)
+
+정규화 파라미터는 source를 의존 대상 지표의 정규화 정의로 치환한 것으로,
+지표 ID와 무관하므로 지표 캐시 키로도 사용합니다.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BASE_TF = "base"
+
+# 지표 source로 쓸 수 있는 OHLCV 컬럼 (다른 지표 참조가 아님)
+PRICE_SOURCES = ("open", "high", "low", "close", "volume", "direction")
+
+# 지표 ID를 참조하는 키 (값이 ref 문법 문자열)
+_REF_KEYS = ("ref", "long_ref", "short_ref")
+
+# 지표 ID를 직접 지정하는 키 (base TF)
+_ID_KEYS = ("atr_indicator_id",)
+
+
+@dataclass
+class PlannedIndicator:
+    """
+    계산 계획의 한 단계
+
+    Attributes:
+        indicator_id: 계산에 사용할 지표 ID (컬럼명 기준)
+        tf: 타임프레임
+        definition: IndicatorCalculator에 전달할 정의 (source는 컬럼명으로 변환)
+        cache_definition: 캐시 키용 정의 (id, type, 정규화 파라미터)
+        aliases: 같은 계산 결과를 공유하는 다른 지표 ID
+        source: 다른 지표 출력을 source로 쓰면 (의존 지표 ID, 컬럼 접미사)
+    """
+    indicator_id: str
+    tf: str
+    definition: Dict[str, Any]
+    cache_definition: Dict[str, Any]
+    aliases: List[str] = field(default_factory=list)
+    source: Optional[Tuple[str, str]] = None
+
+    @property
+    def key(self) -> str:
+        """정규화 키 (TF + 타입 + 정규화 파라미터)"""
+        return json.dumps(
+            {
+                "tf": self.tf,
+                "type": self.cache_definition["type"],
+                "params": self.cache_definition["params"],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+
+
+@dataclass
+class IndicatorPlan:
+    """
+    지표 계산 계획
+
+    Attributes:
+        steps: 계산 단계 (의존 순서)
+        skipped: 참조되지 않아 생략된 (TF, 지표 ID)
+    """
+    steps: List[PlannedIndicator]
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def parse_indicator_ref(ref: str) -> Tuple[str, str]:
+    """
+    지표 참조를 (DataFrame 컬럼명, 타임프레임) 튜플로 변환
+
+    문법:
+      - "ema_1.ema"         → ("ema_1_ema", "base")
+      - "rsi_1h.rsi@1h"     → ("rsi_1h_rsi", "1h")
+      - "ema_1@1d"          → ("ema_1", "1d")
+      - "ema_1"             → ("ema_1", "base")
+    """
+    if "@" in ref:
+        main_ref, tf = ref.rsplit("@", 1)
+        tf = tf.strip()
+    else:
+        main_ref, tf = ref, BASE_TF
+
+    if "." in main_ref:
+        parts = main_ref.rsplit(".", 1)
+        column_name = f"{parts[0]}_{parts[1]}"
+    else:
+        column_name = main_ref
+
+    return column_name, tf
+
+
+def indicator_types(definition: Dict[str, Any]) -> List[str]:
+    """
+    정규화 정의에 포함된 지표 타입 (자신 + source로 쓰인 지표, 재귀)
+
+    Args:
+        definition: cache_definition (type, params)
+
+    Returns:
+        List[str]: 지표 타입 목록
+    """
+    types = [definition.get("type")]
+    source = (definition.get("params") or {}).get("source")
+    if isinstance(source, dict) and isinstance(source.get("indicator"), dict):
+        types.extend(indicator_types(source["indicator"]))
+    return types
+
+
+def build_indicator_plan(
+    definition: Dict[str, Any],
+    prune_unreferenced: bool = True
+) -> IndicatorPlan:
+    """
+    전략 정의로부터 지표 계산 계획 생성
+
+    Args:
+        definition: 전략 정의
+        prune_unreferenced: True면 참조되지 않은 지표 생략
+            (False면 indicators의 모든 지표 계산, 차트 표시 / 캐시 예열용)
+
+    Returns:
+        IndicatorPlan: 계산 계획
+
+    Raises:
+        ValueError: source 순환 참조가 있는 경우
+    """
+    # (tf, id) → 지표 정의 (같은 TF에 같은 ID가 여러 번 나오면 마지막 정의 사용)
+    indicators: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for indicator in definition.get("indicators", []):
+        if not indicator.get("id") or not indicator.get("type"):
+            logger.warning(f"지표 정의가 불완전합니다: {indicator}")
+            continue
+        tf = indicator.get("timeframe", BASE_TF) or BASE_TF
+        indicators[(tf, indicator["id"])] = indicator
+
+    ids_by_tf: Dict[str, List[str]] = {}
+    for tf, indicator_id in indicators:
+        ids_by_tf.setdefault(tf, []).append(indicator_id)
+
+    def resolve(column_name: str, tf: str) -> Optional[Tuple[str, str]]:
+        """컬럼명 → (지표 ID, 컬럼 접미사), 정의된 지표가 아니면 None"""
+        best = None
+        for indicator_id in ids_by_tf.get(tf, []):
+            if column_name == indicator_id or column_name.startswith(indicator_id + "_"):
+                if best is None or len(indicator_id) > len(best):
+                    best = indicator_id
+        if best is None:
+            return None
+        return best, column_name[len(best):]
+
+    # source 의존 관계: (tf, id) → (의존 지표 ID, 컬럼 접미사)
+    sources: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for (tf, indicator_id), indicator in indicators.items():
+        source = (indicator.get("params") or {}).get("source")
+        if not isinstance(source, str) or source in PRICE_SOURCES:
+            continue
+        column_name, source_tf = parse_indicator_ref(source)
+        if source_tf != BASE_TF and source_tf != tf:
+            raise ValueError(
+                f"지표 '{indicator_id}'의 source '{source}'는 같은 타임프레임의 지표여야 합니다"
+            )
+        resolved = resolve(column_name, tf)
+        if resolved is not None:
+            sources[(tf, indicator_id)] = resolved
+
+    # 계산 대상: 참조된 지표 (prune_unreferenced=False면 전체)
+    if prune_unreferenced:
+        roots = []
+        for column_name, tf in _collect_refs(
+            {k: v for k, v in definition.items() if k != "indicators"}
+        ):
+            resolved = resolve(column_name, tf)
+            if resolved is not None and (tf, resolved[0]) not in roots:
+                roots.append((tf, resolved[0]))
+    else:
+        roots = list(indicators)
+
+    # 위상 정렬 (의존 대상 먼저) + 정규화 파라미터 계산
+    ordered: List[Tuple[str, str]] = []
+    canonical: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    visiting: set = set()
+
+    def visit(node: Tuple[str, str]) -> Dict[str, Any]:
+        if node in canonical:
+            return canonical[node]
+        if node in visiting:
+            raise ValueError(f"지표 source 순환 참조: '{node[1]}' (tf='{node[0]}')")
+        visiting.add(node)
+
+        indicator = indicators[node]
+        params = dict(indicator.get("params") or {})
+        if node in sources:
+            source_id, suffix = sources[node]
+            params["source"] = {
+                "indicator": visit((node[0], source_id)),
+                "output": suffix,
+            }
+
+        visiting.discard(node)
+        canonical[node] = {"tf": node[0], "type": indicator["type"], "params": params}
+        ordered.append(node)
+        return canonical[node]
+
+    for node in roots:
+        visit(node)
+
+    # 중복 제거: 같은 정규화 정의는 처음 나온 지표로 한 번만 계산
+    steps: List[PlannedIndicator] = []
+    by_key: Dict[str, PlannedIndicator] = {}
+    for tf, indicator_id in ordered:
+        indicator = indicators[(tf, indicator_id)]
+        compute_definition = dict(indicator)
+        source = sources.get((tf, indicator_id))
+        if source is not None:
+            compute_definition["params"] = dict(
+                indicator.get("params") or {}, source=source[0] + source[1]
+            )
+        step = PlannedIndicator(
+            indicator_id=indicator_id,
+            tf=tf,
+            definition=compute_definition,
+            cache_definition={
+                "id": indicator_id,
+                "type": indicator["type"],
+                "params": canonical[(tf, indicator_id)]["params"],
+            },
+            source=source,
+        )
+        primary = by_key.get(step.key)
+        if primary is not None:
+            primary.aliases.append(indicator_id)
+            continue
+        by_key[step.key] = step
+        steps.append(step)
+
+    skipped = [node for node in indicators if node not in canonical]
+    if skipped:
+        logger.info(f"[지표 계획] 참조되지 않은 지표 생략: {[f'{i}@{tf}' for tf, i in skipped]}")
+    deduped = len(ordered) - len(steps)
+    if deduped:
+        logger.info(f"[지표 계획] 동일 정의 지표 {deduped}개 공유")
+
+    return IndicatorPlan(steps=steps, skipped=skipped)
+
+
+def _collect_refs(node: Any) -> List[Tuple[str, str]]:
+    """정의 트리에서 지표 참조 (컬럼명, 타임프레임) 수집"""
+    refs: List[Tuple[str, str]] = []
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in _REF_KEYS and isinstance(value, str) and value:
+                refs.append(parse_indicator_ref(value))
+            elif key in _ID_KEYS and isinstance(value, str) and value:
+                refs.append((value, BASE_TF))
+            else:
+                refs.extend(_collect_refs(value))
+    elif isinstance(node, list):
+        for item in node:
+            refs.extend(_collect_refs(item))
+    return refs
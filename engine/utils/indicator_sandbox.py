@@ -0,0 +1,662 @@
+"""
+커스텀 지표 샌드박스 모듈
+
+사용자 코드(커스텀 지표)를 엔진 / API 프로세스가 아닌 별도 워커 프로세스 풀에서
+실행합니다. 느리거나 폭주하는 지표가 Run 전체나 API 워커를 멈추지 않도록
+호출마다 CPU 시간 / 메모리 / 실행 시간 한도를 적용합니다.
+
+- 데이터 전달: DataFrame의 숫자 컬럼을 (컬럼 수, 봉 수) float64 블록으로
+  multiprocessing.shared_memory에 한 번 쓰고, 워커는 복사 없이 DataFrame으로 감쌉니다.
+  결과도 워커가 만든 공유 메모리 블록으로 돌려받습니다. (파이프로는 메타데이터만 전송)
+- 한도 (SandboxLimits, 환경변수로 조정):
+    - cpu_seconds: 호출당 CPU 시간 (RLIMIT_CPU, 초과 시 SIGXCPU → 오류)
+    - memory_bytes: 호출당 추가 가상 메모리 (RLIMIT_AS, 초과 시 MemoryError)
+    - timeout_seconds: 호출당 실행 시간 (초과 시 워커 강제 종료 후 교체)
+  한도 초과 / 비정상 종료된 워커는 버리고 다음 호출 때 새로 띄웁니다.
+- 통계: 호출마다 wall_seconds, cpu_seconds, peak_rss_bytes (워커 최대 RSS)
+- 워커는 spawn으로 시작 (API 프로세스의 스레드 상태를 물려받지 않음)하며,
+  컴파일된 함수는 워커 안에서 코드 해시별로 재사용합니다.
+
+환경변수:
+- ALGOFORGE_INDICATOR_SANDBOX: "0"이면 샌드박스 없이 프로세스 안에서 실행 (기본: 사용)
+- ALGOFORGE_SANDBOX_WORKERS: 워커 수 (기본 2, 프로세스마다 따로 생성되므로 Run 실행기 워커 수만큼 곱해짐
+  → apps/api/run_executor.py의 프로세스 수 참고)
+- ALGOFORGE_SANDBOX_CPU_SECONDS / ALGOFORGE_SANDBOX_MEMORY_MB / ALGOFORGE_SANDBOX_TIMEOUT_SECONDS
+"""
+
+import atexit
+import gc
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_ENV = "ALGOFORGE_INDICATOR_SANDBOX"
+SANDBOX_WORKERS_ENV = "ALGOFORGE_SANDBOX_WORKERS"
+SANDBOX_CPU_ENV = "ALGOFORGE_SANDBOX_CPU_SECONDS"
+SANDBOX_MEMORY_ENV = "ALGOFORGE_SANDBOX_MEMORY_MB"
+SANDBOX_TIMEOUT_ENV = "ALGOFORGE_SANDBOX_TIMEOUT_SECONDS"
+
+DEFAULT_SANDBOX_WORKERS = 2
+
+
+def sandbox_enabled() -> bool:
+    """커스텀 지표 샌드박스 사용 여부 (ALGOFORGE_INDICATOR_SANDBOX, 기본 사용)"""
+    return os.getenv(SANDBOX_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"{name}는 숫자여야 합니다: {raw!r}")
+    if value <= 0:
+        raise ValueError(f"{name}는 0보다 커야 합니다: {value}")
+    return value
+
+
+@dataclass(frozen=True)
+class SandboxLimits:
+    """
+    커스텀 지표 호출당 한도
+
+    Attributes:
+        cpu_seconds: CPU 시간 (초)
+        memory_bytes: 호출 시점 대비 추가로 허용하는 가상 메모리 (바이트)
+        timeout_seconds: 실행 시간 (초, 데이터 전송 포함)
+    """
+    cpu_seconds: float = 30.0
+    memory_bytes: int = 2048 * 1024 * 1024
+    timeout_seconds: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "SandboxLimits":
+        """환경변수에서 한도 로드 (없으면 기본값)"""
+        defaults = cls()
+        return cls(
+            cpu_seconds=_env_number(SANDBOX_CPU_ENV, defaults.cpu_seconds),
+            memory_bytes=int(
+                _env_number(SANDBOX_MEMORY_ENV, defaults.memory_bytes / (1024 * 1024)) * 1024 * 1024
+            ),
+            timeout_seconds=_env_number(SANDBOX_TIMEOUT_ENV, defaults.timeout_seconds),
+        )
+
+
+# ----------------------------------------------------------------------
+# 공유 메모리 직렬화
+# ----------------------------------------------------------------------
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    다른 프로세스가 만든 공유 메모리 연결
+
+    spawn 워커는 부모와 같은 resource_tracker를 공유하므로 연결 시 중복 등록은
+    무해하며, 세그먼트는 부모가 unlink할 때 한 번 등록 해제됩니다.
+    (비정상 종료 시에는 tracker가 남은 세그먼트를 정리)
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _close_quietly(shm: shared_memory.SharedMemory, unlink: bool = False) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        # 결과 Series 등이 아직 버퍼를 참조 중 (GC 후 매핑 해제)
+        pass
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _pack_frame(df: pd.DataFrame) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """
+    DataFrame → 공유 메모리 블록 + 메타데이터
+
+    숫자 / bool 컬럼은 float64 블록으로, 인덱스는 int64(날짜는 ns)로 전달하고
+    그 밖의 컬럼 / 인덱스는 메타데이터에 담아 파이프로 전달합니다.
+    """
+    n = len(df)
+    numeric: List[str] = []
+    dtypes: List[str] = []
+    extra_columns: Dict[Any, Any] = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype.kind in "biuf":
+            numeric.append(col)
+            dtypes.append(str(series.dtype))
+        else:
+            extra_columns[col] = series.tolist()
+
+    index = df.index
+    index_meta: Dict[str, Any] = {"name": index.name}
+    index_values: Optional[np.ndarray] = None
+    if isinstance(index, pd.DatetimeIndex):
+        index_meta.update(kind="datetime", tz=str(index.tz) if index.tz is not None else None)
+        index_values = index.asi8
+    elif isinstance(index, pd.RangeIndex):
+        index_meta.update(kind="range", start=index.start, stop=index.stop, step=index.step)
+    elif index.dtype.kind in "iu":
+        index_meta.update(kind="int")
+        index_values = index.to_numpy(dtype=np.int64)
+    else:
+        index_meta.update(kind="list", values=index.tolist())
+
+    rows = len(numeric) + (1 if index_values is not None else 0)
+    shm = shared_memory.SharedMemory(create=True, size=max(8, rows * n * 8))
+    if numeric:
+        block = np.ndarray((len(numeric), n), dtype=np.float64, buffer=shm.buf)
+        for row, col in enumerate(numeric):
+            block[row] = df[col].to_numpy(dtype=np.float64)
+        del block
+    if index_values is not None:
+        index_row = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=len(numeric) * n * 8)
+        index_row[:] = index_values
+        del index_row
+
+    meta = {
+        "shm": shm.name,
+        "n": n,
+        "columns": numeric,
+        "dtypes": dtypes,
+        "extra_columns": extra_columns,
+        "column_order": list(df.columns),
+        "index": index_meta,
+    }
+    return shm, meta
+
+
+def _unpack_frame(shm: shared_memory.SharedMemory, meta: Dict[str, Any]) -> pd.DataFrame:
+    """공유 메모리 블록 → DataFrame (숫자 컬럼은 복사 없이 감쌈)"""
+    n = meta["n"]
+    columns = meta["columns"]
+    index_meta = meta["index"]
+
+    if index_meta["kind"] in ("datetime", "int"):
+        values = np.ndarray((n,), dtype=np.int64, buffer=shm.buf, offset=len(columns) * n * 8)
+        if index_meta["kind"] == "datetime":
+            index = pd.DatetimeIndex(values.view("datetime64[ns]"), name=index_meta["name"])
+            if index_meta["tz"]:
+                index = index.tz_localize("UTC").tz_convert(index_meta["tz"])
+        else:
+            index = pd.Index(values.copy(), name=index_meta["name"])
+    elif index_meta["kind"] == "range":
+        index = pd.RangeIndex(index_meta["start"], index_meta["stop"], index_meta["step"], name=index_meta["name"])
+    else:
+        index = pd.Index(index_meta["values"], name=index_meta["name"])
+
+    block = np.ndarray((len(columns), n), dtype=np.float64, buffer=shm.buf)
+    frame = pd.DataFrame(block.T, index=index, columns=columns, copy=False)
+    for col, dtype in zip(columns, meta["dtypes"]):
+        if dtype != "float64":
+            frame[col] = frame[col].astype(dtype)
+    for col, values in meta["extra_columns"].items():
+        frame[col] = values
+    if list(frame.columns) != meta["column_order"]:
+        frame = frame[meta["column_order"]]
+    return frame
+
+
+# ----------------------------------------------------------------------
+# 워커 프로세스
+# ----------------------------------------------------------------------
+
+class _CpuLimitExceeded(Exception):
+    pass
+
+
+def _on_cpu_limit(signum, frame):
+    raise _CpuLimitExceeded()
+
+
+def _proc_status_bytes(field: str) -> Optional[int]:
+    """/proc/self/status의 kB 값 (Linux 외에는 None)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _reset_peak_rss() -> None:
+    """VmHWM(최대 RSS) 초기화 (Linux 4.0+, 실패하면 프로세스 최대값 사용)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss() -> Optional[int]:
+    peak = _proc_status_bytes("VmHWM")
+    if peak is None and resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return peak
+
+
+def _set_limits(limits: Dict[str, float]) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """호출 전 CPU / 메모리 한도 설정, 이전 한도 반환"""
+    if resource is None:
+        return None
+    previous = (resource.getrlimit(resource.RLIMIT_CPU), resource.getrlimit(resource.RLIMIT_AS))
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_soft = int(math.ceil(usage.ru_utime + usage.ru_stime + limits["cpu_seconds"]))
+    cpu_hard = previous[0][1]
+    if cpu_hard != resource.RLIM_INFINITY:
+        cpu_soft = min(cpu_soft, cpu_hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_soft, cpu_hard))
+
+    vm_size = _proc_status_bytes("VmSize")
+    if vm_size is not None:
+        as_soft = vm_size + int(limits["memory_bytes"])
+        as_hard = previous[1][1]
+        if as_hard != resource.RLIM_INFINITY:
+            as_soft = min(as_soft, as_hard)
+        resource.setrlimit(resource.RLIMIT_AS, (as_soft, as_hard))
+    return previous
+
+
+def _restore_limits(previous) -> None:
+    if resource is None or previous is None:
+        return
+    resource.setrlimit(resource.RLIMIT_CPU, previous[0])
+    resource.setrlimit(resource.RLIMIT_AS, previous[1])
+
+
+def _collect_outputs(result: Any) -> List[Tuple[str, pd.Series]]:
+    """커스텀 함수 반환값 → [(키, Series)] (IndicatorCalculator._calculate_custom과 같은 규칙)"""
+    if isinstance(result, pd.Series):
+        return [("", result)]
+    if isinstance(result, dict):
+        if not result:
+            raise ValueError("반환된 딕셔너리가 비어있습니다")
+        outputs = []
+        for key, series in result.items():
+            if not isinstance(series, pd.Series):
+                raise ValueError(
+                    f"딕셔너리 값은 pd.Series여야 합니다: key={key}, type={type(series)}"
+                )
+            outputs.append((key, series))
+        return outputs
+    raise ValueError(
+        f"커스텀 지표 함수는 pd.Series 또는 Dict[str, pd.Series]를 반환해야 합니다. "
+        f"실제 반환 타입: {type(result)}"
+    )
+
+
+def _pack_outputs(outputs: List[Tuple[str, pd.Series]]) -> Dict[str, Any]:
+    """결과 Series → 공유 메모리 블록 (숫자가 아닌 결과는 값 목록으로 전달)"""
+    numeric: List[Tuple[str, np.ndarray]] = []
+    meta_outputs: List[Dict[str, Any]] = []
+    for key, series in outputs:
+        try:
+            values = np.asarray(series.to_numpy(), dtype=np.float64)
+        except (TypeError, ValueError):
+            meta_outputs.append({"key": key, "values": series.tolist(), "name": series.name})
+            continue
+        meta_outputs.append({"key": key, "row": len(numeric), "length": len(values), "name": series.name})
+        numeric.append((key, values))
+
+    shm_name = None
+    if numeric:
+        size = sum(len(values) for _, values in numeric) * 8
+        shm = shared_memory.SharedMemory(create=True, size=max(8, size))
+        offset = 0
+        for entry in meta_outputs:
+            if "row" not in entry:
+                continue
+            values = numeric[entry["row"]][1]
+            target = np.ndarray((len(values),), dtype=np.float64, buffer=shm.buf, offset=offset)
+            target[:] = values
+            del target
+            entry["offset"] = offset
+            offset += len(values) * 8
+        shm_name = shm.name
+        # 세그먼트 삭제(unlink)는 결과를 읽은 부모 프로세스가 담당
+        _close_quietly(shm)
+    return {"shm": shm_name, "outputs": meta_outputs}
+
+
+def _worker_main(conn) -> None:
+    """
+    샌드박스 워커 진입점
+
+    요청: {"type", "code", "code_hash", "params", "frame": _pack_frame 메타데이터, "limits"}
+    응답: ("ok", {"result": _pack_outputs 메타데이터, "cpu_seconds", "peak_rss_bytes"})
+          ("error", {"message", "recycle"})  recycle=True면 부모가 워커를 교체
+    """
+    from .indicator_loader import _create_function_from_code
+
+    # 부모의 Ctrl+C는 부모가 처리 (워커는 종료 신호로 정리됨)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGXCPU"):
+        signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+    compiled: Dict[str, Callable] = {}
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        shm = None
+        frame = None
+        result = None
+        previous_limits = None
+        recycle = False
+        try:
+            func = compiled.get(request["code_hash"])
+            if func is None:
+                func = _create_function_from_code(request["code"])
+                compiled[request["code_hash"]] = func
+
+            shm = _attach(request["frame"]["shm"])
+            frame = _unpack_frame(shm, request["frame"])
+
+            _reset_peak_rss()
+            cpu_start = time.process_time()
+            previous_limits = _set_limits(request["limits"])
+            try:
+                result = func(frame, request["params"])
+            finally:
+                _restore_limits(previous_limits)
+            cpu_seconds = time.process_time() - cpu_start
+
+            packed = _pack_outputs(_collect_outputs(result))
+            response = ("ok", {
+                "result": packed,
+                "cpu_seconds": cpu_seconds,
+                "peak_rss_bytes": _peak_rss(),
+            })
+        except _CpuLimitExceeded:
+            recycle = True
+            response = ("error", {
+                "message": f"CPU 시간 한도 초과 ({request['limits']['cpu_seconds']}초)",
+                "recycle": True,
+            })
+        except MemoryError:
+            recycle = True
+            response = ("error", {
+                "message": f"메모리 한도 초과 ({int(request['limits']['memory_bytes']) // (1024 * 1024)}MB)",
+                "recycle": True,
+            })
+        except BaseException as e:
+            response = ("error", {"message": f"{type(e).__name__}: {e}", "recycle": False})
+        finally:
+            frame = None
+            result = None
+            gc.collect()
+            if shm is not None:
+                _close_quietly(shm)
+
+        try:
+            conn.send(response)
+        except (EOFError, OSError):
+            break
+        if recycle:
+            break
+
+
+# ----------------------------------------------------------------------
+# 워커 풀
+# ----------------------------------------------------------------------
+
+class _SandboxWorker:
+    """워커 프로세스 + 파이프"""
+
+    def __init__(self, context):
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), daemon=True, name="indicator-sandbox"
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def stop(self, force: bool = False) -> None:
+        try:
+            if not force and self.process.is_alive():
+                self.conn.send(None)
+                self.process.join(timeout=1)
+        except (EOFError, OSError, BrokenPipeError):
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+class IndicatorSandbox:
+    """
+    커스텀 지표 실행용 워커 프로세스 풀
+
+    워커는 첫 호출 때 필요한 만큼 띄우고, 한도 초과 / 비정상 종료 시 교체합니다.
+    여러 스레드에서 동시에 호출할 수 있습니다 (워커 수만큼 병렬 실행).
+
+    Attributes:
+        max_workers: 최대 워커 수
+        limits: 호출당 한도
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SANDBOX_WORKERS, limits: Optional[SandboxLimits] = None):
+        if max_workers < 1:
+            raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
+        self.max_workers = max_workers
+        self.limits = limits or SandboxLimits()
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_SandboxWorker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = 0
+        self._closed = False
+
+    def _acquire(self) -> _SandboxWorker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("샌드박스가 종료되었습니다")
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            if self._started < self.max_workers:
+                self._started += 1
+                spawn = True
+            else:
+                spawn = False
+        if spawn:
+            try:
+                return _SandboxWorker(self._context)
+            except Exception:
+                with self._lock:
+                    self._started -= 1
+                raise
+        return self._idle.get()
+
+    def _release(self, worker: _SandboxWorker, discard: bool) -> None:
+        if discard or self._closed:
+            worker.stop(force=discard)
+            with self._lock:
+                self._started -= 1
+            return
+        self._idle.put(worker)
+
+    def run(
+        self,
+        indicator_type: str,
+        code: str,
+        code_hash: str,
+        df: pd.DataFrame,
+        params: Dict[str, Any]
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        커스텀 지표를 워커 프로세스에서 실행
+
+        Args:
+            indicator_type: 지표 타입 (오류 메시지용)
+            code: Python 함수 코드
+            code_hash: 코드 해시 (워커 내 컴파일 캐시 키)
+            df: 입력 DataFrame
+            params: 지표 파라미터
+
+        Returns:
+            Tuple: (pd.Series 또는 Dict[str, pd.Series], 통계)
+                통계: wall_seconds, cpu_seconds, peak_rss_bytes
+
+        Raises:
+            ValueError: 코드 오류, 한도 초과, 워커 비정상 종료
+        """
+        started = time.perf_counter()
+        shm, frame_meta = _pack_frame(df)
+        worker = self._acquire()
+        discard = False
+        try:
+            request = {
+                "type": indicator_type,
+                "code": code,
+                "code_hash": code_hash,
+                "params": params,
+                "frame": frame_meta,
+                "limits": {
+                    "cpu_seconds": self.limits.cpu_seconds,
+                    "memory_bytes": self.limits.memory_bytes,
+                },
+            }
+            try:
+                worker.conn.send(request)
+                if not worker.conn.poll(self.limits.timeout_seconds):
+                    discard = True
+                    raise ValueError(
+                        f"커스텀 지표 '{indicator_type}' 실행 시간 한도 초과 "
+                        f"({self.limits.timeout_seconds}초)"
+                    )
+                status, payload = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                discard = True
+                raise ValueError(f"커스텀 지표 '{indicator_type}' 샌드박스 프로세스가 종료되었습니다: {e}")
+
+            if status != "ok":
+                discard = bool(payload.get("recycle"))
+                raise ValueError(f"커스텀 지표 '{indicator_type}' 실행 실패: {payload['message']}")
+
+            result = self._unpack_result(payload["result"], df.index)
+            stats = {
+                "wall_seconds": time.perf_counter() - started,
+                "cpu_seconds": payload["cpu_seconds"],
+                "peak_rss_bytes": payload["peak_rss_bytes"],
+            }
+            logger.debug(f"[샌드박스] {indicator_type}: {stats}")
+            return result, stats
+        finally:
+            _close_quietly(shm, unlink=True)
+            self._release(worker, discard)
+
+    @staticmethod
+    def _unpack_result(packed: Dict[str, Any], index: pd.Index) -> Any:
+        """워커 결과 → pd.Series 또는 Dict[str, pd.Series] (길이가 같으면 입력 인덱스 사용)"""
+        shm = _attach(packed["shm"]) if packed["shm"] else None
+        try:
+            outputs: Dict[str, pd.Series] = {}
+            for entry in packed["outputs"]:
+                if "row" in entry:
+                    values = np.ndarray(
+                        (entry["length"],), dtype=np.float64, buffer=shm.buf, offset=entry["offset"]
+                    ).copy()
+                else:
+                    values = entry["values"]
+                outputs[entry["key"]] = pd.Series(
+                    values,
+                    index=index if len(values) == len(index) else None,
+                    name=entry["name"],
+                )
+        finally:
+            if shm is not None:
+                _close_quietly(shm, unlink=True)
+        if list(outputs) == [""]:
+            return outputs[""]
+        return outputs
+
+    def close(self) -> None:
+        """모든 워커 종료"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+            with self._lock:
+                self._started -= 1
+
+
+class SandboxedIndicator:
+    """
+    샌드박스에서 실행되는 커스텀 지표 함수
+
+    IndicatorCalculator에 일반 함수처럼 등록되며(func(df, params)),
+    run_with_stats()로 호출하면 실행 통계도 함께 반환합니다.
+    """
+
+    def __init__(self, indicator_type: str, code: str, code_hash: str):
+        self.indicator_type = indicator_type
+        self.code = code
+        self.code_hash = code_hash
+
+    def run_with_stats(self, df: pd.DataFrame, params: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        return get_indicator_sandbox().run(self.indicator_type, self.code, self.code_hash, df, params)
+
+    def __call__(self, df: pd.DataFrame, params: Dict[str, Any]) -> Any:
+        return self.run_with_stats(df, params)[0]
+
+    def __repr__(self) -> str:
+        return f"SandboxedIndicator({self.indicator_type!r}, {self.code_hash[:12]})"
+
+
+_sandbox: Optional[IndicatorSandbox] = None
+_sandbox_lock = threading.Lock()
+
+
+def get_indicator_sandbox() -> IndicatorSandbox:
+    """프로세스 전역 샌드박스 (첫 호출 시 환경변수 설정으로 생성)"""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            workers = int(_env_number(SANDBOX_WORKERS_ENV, DEFAULT_SANDBOX_WORKERS))
+            _sandbox = IndicatorSandbox(max_workers=workers, limits=SandboxLimits.from_env())
+            atexit.register(_sandbox.close)
+        return _sandbox
+
+
+def shutdown_indicator_sandbox() -> None:
+    """프로세스 전역 샌드박스 종료 (다음 호출 시 새로 생성)"""
+    global _sandbox
+    with _sandbox_lock:
+        sandbox, _sandbox = _sandbox, None
+    if sandbox is not None:
+        sandbox.close()
@@ -1,7 +1,7 @@
 """
 지표(Indicator) 계산 모듈 - DataFrame 기반
 
-pandas DataFrame과 ta 라이브러리를 활용하여 기술적 지표를 계산합니다.
+내장 지표는 indicator_kernels의 NumPy 커널로 계산합니다 (ta 라이브러리와 같은 값).
 모든 계산은 결정적(deterministic)이어야 합니다.
 """
 
@@ -9,32 +9,35 @@ import logging
 import numpy as np
 import pandas as pd
 
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List, Optional
 
-# ta 라이브러리 import
-from ta.momentum import RSIIndicator
-from ta.volatility import AverageTrueRange
-from ta.trend import (
-    MACD,
-    EMAIndicator,
-    SMAIndicator,
-    ADXIndicator,
-    CCIIndicator,
-)
+from . import indicator_kernels as kernels
 
 logger = logging.getLogger(__name__)
 
+# 내장 지표 타입 (같은 이름의 커스텀 지표보다 우선)
+BUILTIN_INDICATOR_TYPES = ("ema", "sma", "rsi", "atr", "adx", "macd", "cci")
+
+# 기간 묶음(family) 계산을 지원하는 내장 지표 타입 (단일 출력, period 파라미터)
+FAMILY_INDICATOR_TYPES = ("ema", "sma", "rsi", "atr", "adx", "cci")
+
 
 class IndicatorCalculator:
     """
     DataFrame 기반 지표 계산기
     
-    pandas DataFrame과 ta 라이브러리를 활용하여 기술적 지표를 계산합니다.
-    전체 데이터에 대해 한 번에 지표를 계산하고, 결과를 DataFrame 컬럼으로 저장합니다.
+    내장 지표는 NumPy 커널(ta 라이브러리와 같은 값)로 계산합니다.
+    전체 데이터에 대해 한 번에 지표를 계산하고, 결과를 컬럼 저장소에 보관합니다.
+    
+    저장 구조:
+    - 입력 OHLCV DataFrame은 복사하지 않고 참조만 합니다 (읽기 전용으로 사용)
+    - 지표 결과는 컬럼명 → 배열 딕셔너리에 보관 (DataFrame 컬럼 insert / 단편화 없음)
+    - self.df는 필요할 때(커스텀 지표 호출, 외부 조회) 입력 + 결과를 한 번의
+      concat으로 만들며, 이후 추가된 컬럼이 없으면 같은 DataFrame을 재사용합니다
     
     특징:
     - 벡터화 연산으로 성능 향상
-    - ta 라이브러리 활용으로 코드 간결화
+    - ta 라이브러리와 같은 값을 pandas 오버헤드 없이 계산
     - 커스텀 지표 등록 가능
     - 결정적 결과 보장
     """
@@ -45,7 +48,9 @@ class IndicatorCalculator:
             df: OHLCV DataFrame (index: DatetimeIndex, columns: open, high, low, close, volume, direction)
         
         Note:
-            원본 DataFrame은 보호하기 위해 복사본을 생성합니다.
+            원본 DataFrame은 복사하지 않고 참조하며 수정하지 않습니다.
+            (없는 기본 컬럼과 지표 결과는 별도 컬럼 저장소에 추가)
+            self.df는 원본과 OHLCV 메모리를 공유할 수 있으므로 값을 직접 수정하지 마세요.
         """
         # df가 리스트 형태로 들어오는 경우 DataFrame으로 변환
         if df is None:
@@ -54,29 +59,48 @@ class IndicatorCalculator:
         if isinstance(df, list):
             if len(df) > 0 and hasattr(df[0], "__dict__"):
                 # Bar 객체 리스트인 경우 필드 추출
-                self.df = pd.DataFrame([b.__dict__ for b in df]).copy()
+                df = pd.DataFrame([b.__dict__ for b in df])
             else:
-                self.df = pd.DataFrame(df).copy()
-        else:
-            self.df = df.copy()
+                df = pd.DataFrame(df)
+        
+        # 입력 DataFrame (참조, self.df 생성 후에는 생성된 DataFrame)
+        self._frame: pd.DataFrame = df
+        # self._frame이 이 calculator가 만든 DataFrame인지 (아니면 호출자 소유)
+        self._owns_frame = False
+        # self._frame 이후 추가된 컬럼: 컬럼명 → 원본 값 (np.ndarray 또는 pd.Series), 추가 순서 유지
+        self._added: Dict[str, Any] = {}
         
         # 필수 컬럼 채우기 (close는 반드시 필요, 나머지는 없는 경우 기본값 사용)
-        if 'close' not in self.df.columns:
+        if 'close' not in df.columns:
             raise ValueError("지표 계산에 필요한 'close' 컬럼이 없습니다")
         
+        n = len(df)
+        close = df['close'].to_numpy()
         defaults = {
-            'open': self.df['close'],
-            'high': self.df['close'],
-            'low': self.df['close'],
-            'volume': 0.0,
-            'direction': 0
+            'open': close,
+            'high': close,
+            'low': close,
+            'volume': np.zeros(n),
+            'direction': np.zeros(n, dtype=np.int64)
         }
         for col, default_val in defaults.items():
-            if col not in self.df.columns:
-                self.df[col] = default_val
+            if col not in df.columns:
+                self._added[col] = default_val
         
         # 커스텀 지표 함수 저장소
         self.custom_indicators: Dict[str, Callable] = {}
+        # 커스텀 지표 코드 해시 (지표 타입 → SHA256, 디스크 캐시 키에 사용)
+        self.custom_indicator_hashes: Dict[str, str] = {}
+        # 샌드박스 실행 통계 (지표 ID → wall_seconds / cpu_seconds / peak_rss_bytes)
+        self.custom_indicator_stats: Dict[str, Dict[str, Any]] = {}
+        
+        # 컬럼 저장소: 컬럼명 → NaN 보정된 연속 float64 배열 (get_value / get_array 조회용)
+        # 지표 계산 시 채워지며, NaN이 없는 결과는 원본 값 배열과 메모리를 공유
+        # 입력 컬럼 / DataFrame에 직접 추가된 컬럼은 첫 조회 시 변환
+        self._columns: Dict[str, np.ndarray] = {}
+        
+        # get_value 호출 수 (프로파일링용)
+        self.get_value_calls = 0
     
     def calculate_indicator(self, indicator_def: Dict[str, Any]) -> None:
         """
@@ -127,6 +151,94 @@ class IndicatorCalculator:
             logger.error(f"지표 계산 실패: {indicator_id}, {e}", exc_info=True)
             raise
     
+    def calculate_indicator_family(
+        self,
+        indicator_type: str,
+        periods: List[int],
+        params: Optional[Dict[str, Any]] = None,
+        indicator_ids: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """
+        같은 타입 / 파라미터에 기간만 다른 지표를 한 번에 계산
+        
+        source 변환과 공통 중간값(TR, 상승/하락폭 등)은 한 번만 계산하고,
+        결과는 (기간 수, 봉 수) 2차원 배열 하나에 저장합니다.
+        각 지표 ID의 컬럼 저장소 값(get_value / get_array)은 이 배열의 행 뷰이며,
+        self.df 컬럼은 calculate_indicator와 같은 값으로 함께 추가됩니다.
+        
+        예:
+            calc.calculate_indicator_family("ema", list(range(5, 201)))
+            calc.calculate_indicator_family("rsi", [7, 14, 21], indicator_ids=["rsi_a", "rsi_b", "rsi_c"])
+        
+        Args:
+            indicator_type: 지표 타입 (FAMILY_INDICATOR_TYPES)
+            periods: 기간 목록
+            params: period를 제외한 공통 파라미터 (source, constant 등)
+            indicator_ids: 기간별 지표 ID (없으면 "{type}_{period}")
+        
+        Returns:
+            np.ndarray: (기간 수, 봉 수) 읽기 전용 float64 배열 (행 순서 = periods 순서)
+        
+        Raises:
+            ValueError: 지원하지 않는 타입이거나 파라미터가 잘못된 경우
+        """
+        if indicator_type not in FAMILY_INDICATOR_TYPES:
+            raise ValueError(f"기간 묶음 계산을 지원하지 않는 지표 타입: {indicator_type}")
+        
+        periods = list(periods)
+        if not periods:
+            raise ValueError("periods가 비어 있습니다")
+        for period in periods:
+            if period <= 0:
+                raise ValueError(f"period는 0보다 커야 합니다: {period}")
+        
+        if indicator_ids is None:
+            indicator_ids = [f"{indicator_type}_{period}" for period in periods]
+        elif len(indicator_ids) != len(periods):
+            raise ValueError(
+                f"indicator_ids 수({len(indicator_ids)})가 periods 수({len(periods)})와 다릅니다"
+            )
+        
+        params = params or {}
+        if indicator_type in ("ema", "sma", "rsi"):
+            source = params.get("source", "close")
+            if source not in self.columns:
+                raise ValueError(f"소스 필드가 없습니다: {source}")
+            family_kernel = getattr(kernels, f"{indicator_type}_family")
+            block = family_kernel(self._source_array(source), periods)
+        else:
+            for col in ("high", "low", "close"):
+                if col not in self.columns:
+                    raise ValueError(
+                        f"{indicator_type.upper()} 계산에 필요한 컬럼이 없습니다: {col}"
+                    )
+            if indicator_type == "cci":
+                block = kernels.cci_family(
+                    *self._hlc_arrays(), periods, params.get("constant", 0.015)
+                )
+            elif indicator_type == "atr":
+                block = kernels.atr_family(*self._hlc_arrays(), periods)
+            else:
+                block = kernels.adx_family(*self._hlc_arrays(), periods)
+        
+        # calculate_indicator와 같은 처리: 원본 값은 bfill 값,
+        # 컬럼 저장소에는 남은 NaN까지 첫 유효값으로 보정한 값
+        missing_rows = np.isnan(block).any(axis=1)
+        frame_values: Dict[int, np.ndarray] = {}
+        for row in np.flatnonzero(missing_rows):
+            block[row] = kernels.backward_fill(block[row])
+            if np.isnan(block[row]).any():
+                frame_values[row] = block[row].copy()
+                block[row] = self._to_column_array(indicator_ids[row], block[row])
+        block.flags.writeable = False
+        
+        for row, indicator_id in enumerate(indicator_ids):
+            self._added[indicator_id] = frame_values.get(row, block[row])
+            self._columns[indicator_id] = block[row]
+        
+        logger.debug(f"지표 묶음 계산: {indicator_type} x {len(periods)} ({indicator_ids[0]} ...)")
+        return block
+    
     def get_value(self, indicator_id: str, bar_index: int) -> float:
         """
         특정 봉에서 지표 값을 반환
@@ -136,36 +248,189 @@ class IndicatorCalculator:
             bar_index: 봉 인덱스 (0부터 시작)
         
         Returns:
-            float: 지표 값
+            float: 지표 값 (초기 NaN은 첫 번째 유효값, 전부 NaN이면 0.0)
         
         Raises:
             ValueError: 지표가 없거나 인덱스가 범위를 벗어난 경우
         """
-        if indicator_id not in self.df.columns:
-            raise ValueError(f"지표 '{indicator_id}'가 계산되지 않았습니다")
+        self.get_value_calls += 1
+        
+        values = self._columns.get(indicator_id)
+        if values is None:
+            values = self.get_array(indicator_id)
         
-        if bar_index < 0 or bar_index >= len(self.df):
+        if bar_index < 0 or bar_index >= len(values):
             raise ValueError(f"bar_index {bar_index}가 범위를 벗어났습니다")
         
-        # iloc를 사용하여 인덱스 기반 접근 (빠름)
-        value = self.df.iloc[bar_index][indicator_id]
+        return float(values[bar_index])
+    
+    def get_array(self, column: str) -> np.ndarray:
+        """
+        지표 컬럼 전체를 배열로 반환 (get_value와 같은 NaN 처리)
+        
+        Args:
+            column: 컬럼명 (지표 ID 또는 다중 출력 컬럼)
+        
+        Returns:
+            np.ndarray: 읽기 전용 float64 배열 (복사 없이 내부 저장소를 반환)
+        
+        Raises:
+            ValueError: 지표가 계산되지 않았거나 숫자로 변환할 수 없는 경우
+        """
+        values = self._columns.get(column)
+        if values is not None:
+            return values
+        
+        # set_column을 거치지 않은 컬럼 (OHLCV, DataFrame에 직접 추가된 컬럼 등)
+        values = self._to_column_array(column, self.get_column(column))
+        self._columns[column] = values
+        return values
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        입력 + 지표 컬럼 DataFrame (첫 조회 / 컬럼 추가 후 조회 시 한 번의 concat으로 생성)
+        
+        생성된 DataFrame에 직접 추가한 컬럼도 이후 조회 / get_array에 반영됩니다.
+        """
+        if self._added or not self._owns_frame:
+            self._materialize()
+        return self._frame
+    
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._frame = value
+        self._owns_frame = True
+        self._added = {}
+        self._columns = {}
+    
+    @property
+    def columns(self) -> List[str]:
+        """컬럼명 목록 (DataFrame을 만들지 않음, self.df.columns와 같은 순서)"""
+        frame_columns = list(self._frame.columns)
+        existing = set(frame_columns)
+        return frame_columns + [col for col in self._added if col not in existing]
+    
+    @property
+    def index(self) -> pd.Index:
+        """입력 DataFrame 인덱스"""
+        return self._frame.index
+    
+    def get_column(self, column: str) -> Any:
+        """
+        컬럼 원본 값 (NaN 보정 전, DataFrame을 만들지 않음)
+        
+        Returns:
+            np.ndarray 또는 pd.Series (숫자가 아닌 커스텀 컬럼)
+        
+        Raises:
+            ValueError: 컬럼이 없는 경우
+        """
+        if column in self._added:
+            return self._added[column]
+        if column not in self._frame.columns:
+            raise ValueError(f"지표 '{column}'가 계산되지 않았습니다")
+        return self._frame[column].to_numpy()
+    
+    def set_column(self, column: str, values: Any) -> None:
+        """
+        지표 컬럼 저장 (컬럼 저장소에 추가, self.df에는 다음 조회 시 반영)
+        
+        Args:
+            column: 컬럼명
+            values: pd.Series(인덱스 기준 정렬), 배열 또는 스칼라 (길이는 DataFrame과 같아야 함)
+        """
+        index = self._frame.index
+        if isinstance(values, pd.Series):
+            if not values.index.equals(index):
+                values = values.reindex(index)
+            if isinstance(values.dtype, np.dtype):
+                values = values.to_numpy()
+        elif np.ndim(values) == 0:
+            values = np.full(len(index), values)
+        else:
+            values = np.asarray(values)
+            if values.ndim != 1 or len(values) != len(index):
+                raise ValueError(
+                    f"컬럼 길이가 DataFrame과 다릅니다: {column}, "
+                    f"expected {len(index)}, got {len(values)}"
+                )
         
-        # NaN 처리 (초기 데이터 부족 시)
-        if pd.isna(value):
-            # 첫 번째 유효한 값으로 대체 (백워드 필)
-            first_valid = self.df[indicator_id].first_valid_index()
-            if first_valid is not None:
-                return self.df.loc[first_valid, indicator_id]
+        self._added[column] = values
+        try:
+            self._columns[column] = self._to_column_array(column, values)
+        except ValueError:
+            # 숫자가 아닌 커스텀 컬럼: 조회 시점에 오류 (기존 동작 유지)
+            self._columns.pop(column, None)
+    
+    def _materialize(self) -> None:
+        """추가된 컬럼을 한 번의 concat으로 DataFrame에 합침 (원본 DataFrame은 수정하지 않음)"""
+        frame = self._frame
+        added = self._added
+        if added:
+            replaced = [col for col in added if col in frame.columns]
+            order = self.columns
+            added_frame = pd.DataFrame(added, index=frame.index, copy=False)
+            frame = pd.concat(
+                [frame.drop(columns=replaced) if replaced else frame, added_frame],
+                axis=1,
+            )
+            if replaced:
+                frame = frame[order]
+        else:
+            # 호출자의 DataFrame에 컬럼이 추가되지 않도록 얕은 복사
+            frame = frame.copy(deep=False)
+        self._frame = frame
+        self._owns_frame = True
+        self._added = {}
+    
+    @staticmethod
+    def _to_column_array(column: str, values: Any) -> np.ndarray:
+        """
+        컬럼을 NaN 보정된 연속 float64 배열로 변환
+        
+        초기 데이터 부족으로 생긴 NaN은 첫 번째 유효한 값으로 대체하고(백워드 필),
+        모든 값이 NaN이면 0.0으로 채웁니다.
+        NaN이 없는 연속 float64 입력은 복사하지 않고 읽기 전용 뷰를 반환합니다.
+        """
+        try:
+            values = np.ascontiguousarray(
+                values.to_numpy() if isinstance(values, pd.Series) else values,
+                dtype=np.float64,
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"지표 '{column}'를 숫자 배열로 변환할 수 없습니다: {e}") from e
+        
+        nan_mask = np.isnan(values)
+        if nan_mask.any():
+            values = values.copy()
+            if nan_mask.all():
+                values[:] = 0.0
             else:
-                # 모든 값이 NaN이면 0 반환
-                return 0.0
+                values[nan_mask] = values[np.argmin(nan_mask)]
+        else:
+            values = values.view()
         
-        return float(value)
+        values.flags.writeable = False
+        return values
+    
+    def _source_array(self, column: str) -> np.ndarray:
+        """지표 계산 입력 컬럼을 float64 배열로 반환 (입력 DataFrame과 메모리 공유 가능, 읽기 전용으로 사용)"""
+        return np.asarray(self.get_column(column), dtype=np.float64)
+    
+    def _hlc_arrays(self) -> tuple:
+        """(high, low, close) float64 배열"""
+        return (
+            self._source_array("high"),
+            self._source_array("low"),
+            self._source_array("close"),
+        )
     
     def register_custom_indicator(
         self, 
         name: str, 
-        func: Callable[[pd.DataFrame, Dict[str, Any]], Any]
+        func: Callable[[pd.DataFrame, Dict[str, Any]], Any],
+        code_hash: Optional[str] = None
     ) -> None:
         """
         커스텀 지표 함수 등록
@@ -175,6 +440,7 @@ class IndicatorCalculator:
             func: 지표 계산 함수
                 입력: (df: DataFrame, params: Dict)
                 출력: pd.Series 또는 Dict[str, pd.Series]
+            code_hash: 지표 코드 해시 (선택, 없으면 디스크 캐시 대상에서 제외)
         
         Examples:
             # 단일 값 반환
@@ -196,11 +462,15 @@ class IndicatorCalculator:
             calculator.register_custom_indicator('custom_macd', custom_macd)
         """
         self.custom_indicators[name] = func
+        if code_hash is not None:
+            self.custom_indicator_hashes[name] = code_hash
+        else:
+            self.custom_indicator_hashes.pop(name, None)
         logger.info(f"커스텀 지표 등록: {name}")
     
     def _calculate_ema(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        EMA (Exponential Moving Average) 계산 - ta 라이브러리 사용
+        EMA (Exponential Moving Average) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -214,16 +484,15 @@ class IndicatorCalculator:
         if period <= 0:
             raise ValueError(f"period는 0보다 커야 합니다: {period}")
         
-        if source not in self.df.columns:
+        if source not in self.columns:
             raise ValueError(f"소스 필드가 없습니다: {source}")
         
-        # ta 라이브러리 사용
-        ema_indicator = EMAIndicator(close=self.df[source], window=period, fillna=True)
-        self.df[indicator_id] = ema_indicator.ema_indicator().bfill()
+        values = kernels.ema(self._source_array(source), period)
+        self.set_column(indicator_id, kernels.backward_fill(values))
     
     def _calculate_sma(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        SMA (Simple Moving Average) 계산 - ta 라이브러리 사용
+        SMA (Simple Moving Average) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -237,16 +506,15 @@ class IndicatorCalculator:
         if period <= 0:
             raise ValueError(f"period는 0보다 커야 합니다: {period}")
         
-        if source not in self.df.columns:
+        if source not in self.columns:
             raise ValueError(f"소스 필드가 없습니다: {source}")
         
-        # ta 라이브러리 사용
-        sma_indicator = SMAIndicator(close=self.df[source], window=period, fillna=True)
-        self.df[indicator_id] = sma_indicator.sma_indicator().bfill()
+        values = kernels.sma(self._source_array(source), period)
+        self.set_column(indicator_id, kernels.backward_fill(values))
     
     def _calculate_rsi(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        RSI (Relative Strength Index) 계산 - ta 라이브러리 사용
+        RSI (Relative Strength Index) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -260,16 +528,15 @@ class IndicatorCalculator:
         if period <= 0:
             raise ValueError(f"period는 0보다 커야 합니다: {period}")
         
-        if source not in self.df.columns:
+        if source not in self.columns:
             raise ValueError(f"소스 필드가 없습니다: {source}")
         
-        # ta 라이브러리 사용
-        rsi_indicator = RSIIndicator(close=self.df[source], window=period, fillna=True)
-        self.df[indicator_id] = rsi_indicator.rsi().bfill()
+        values = kernels.rsi(self._source_array(source), period)
+        self.set_column(indicator_id, kernels.backward_fill(values))
     
     def _calculate_atr(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        ATR (Average True Range) 계산 - ta 라이브러리 사용
+        ATR (Average True Range) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -278,7 +545,7 @@ class IndicatorCalculator:
         
         Note:
             ATR은 high, low, close 세 개의 컬럼을 사용합니다.
-            데이터가 period보다 작으면 사용 가능한 데이터로 계산합니다.
+            데이터가 period보다 작으면 ValueError가 발생합니다.
         """
         period = params.get("period", 14)
         
@@ -288,11 +555,11 @@ class IndicatorCalculator:
         # 필수 컬럼 확인
         required_columns = ['high', 'low', 'close']
         for col in required_columns:
-            if col not in self.df.columns:
+            if col not in self.columns:
                 raise ValueError(f"ATR 계산에 필요한 컬럼이 없습니다: {col}")
         
-        atr_indicator = AverageTrueRange(high=self.df['high'], low=self.df['low'], close=self.df['close'], window=period)
-        self.df[indicator_id] = atr_indicator.average_true_range().bfill()
+        values = kernels.atr(*self._hlc_arrays(), period)
+        self.set_column(indicator_id, kernels.backward_fill(values))
         
     def calculate_atr(self, indicator_id: str, period: int = 14) -> None:
         """
@@ -306,7 +573,7 @@ class IndicatorCalculator:
     
     def _calculate_adx(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        ADX (Average Directional Index) 계산 - ta 라이브러리 사용
+        ADX (Average Directional Index) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -315,7 +582,7 @@ class IndicatorCalculator:
         
         Note:
             ADX은 high, low, close 세 개의 컬럼을 사용합니다.
-            데이터가 period보다 작으면 사용 가능한 데이터로 계산합니다.
+            데이터가 2 * period보다 작으면 ValueError가 발생합니다.
         """
         period = params.get("period", 14)
         
@@ -325,27 +592,22 @@ class IndicatorCalculator:
         # 필수 컬럼 확인
         required_columns = ['high', 'low', 'close']
         for col in required_columns:
-            if col not in self.df.columns:
+            if col not in self.columns:
                 raise ValueError(f"ADX 계산에 필요한 컬럼이 없습니다: {col}")
         
-        # True Range 계산
-        high = self.df['high']
-        low = self.df['low']
-        close = self.df['close']
-        
-        adx_indicator = ADXIndicator(high=high, low=low, close=close, window=period, fillna=True)
-        self.df[indicator_id] = adx_indicator.adx().bfill()
+        values = kernels.adx(*self._hlc_arrays(), period)
+        self.set_column(indicator_id, kernels.backward_fill(values))
     
     def _calculate_macd(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        MACD (Moving Average Convergence Divergence) 계산 - ta 라이브러리 사용
+        MACD (Moving Average Convergence Divergence) 계산
         
         다중 출력 지표: MACD 라인(main), Signal 라인, Histogram, Histogram 방향을 계산합니다.
         커스텀 다중 출력 지표와 동일한 컬럼 네이밍 규약을 따릅니다:
-            - main                → self.df[indicator_id]
-            - signal              → self.df[f"{indicator_id}_signal"]
-            - histogram           → self.df[f"{indicator_id}_histogram"]
-            - histogram_direction → self.df[f"{indicator_id}_histogram_direction"]
+            - main                → indicator_id
+            - signal              → f"{indicator_id}_signal"
+            - histogram           → f"{indicator_id}_histogram"
+            - histogram_direction → f"{indicator_id}_histogram_direction"
         
         histogram_direction 값 정의 (이전 봉의 히스토그램과 비교):
             +1 : 이전보다 증가 (상승 모멘텀 강화)
@@ -379,16 +641,11 @@ class IndicatorCalculator:
                 f"MACD fast_period({fast_period})는 slow_period({slow_period})보다 작아야 합니다"
             )
         
-        if source not in self.df.columns:
+        if source not in self.columns:
             raise ValueError(f"소스 필드가 없습니다: {source}")
         
-        # ta 라이브러리 사용
-        macd_indicator = MACD(
-            close=self.df[source],
-            window_slow=slow_period,
-            window_fast=fast_period,
-            window_sign=signal_period,
-            fillna=True,
+        macd_line, signal_line, histogram = kernels.macd(
+            self._source_array(source), fast_period, slow_period, signal_period
         )
         
         # 다중 출력 저장 (main / signal / histogram)
@@ -397,22 +654,21 @@ class IndicatorCalculator:
         histogram_column = f"{indicator_id}_histogram"
         histogram_direction_column = f"{indicator_id}_histogram_direction"
         
-        self.df[main_column] = macd_indicator.macd().bfill()
-        self.df[signal_column] = macd_indicator.macd_signal().bfill()
-        self.df[histogram_column] = macd_indicator.macd_diff().bfill()
+        self.set_column(main_column, kernels.backward_fill(macd_line))
+        self.set_column(signal_column, kernels.backward_fill(signal_line))
+        self.set_column(histogram_column, kernels.backward_fill(histogram))
         
         # 히스토그램 방향 계산: 현재 봉의 히스토그램이 이전 봉보다 큰지/작은지
         #   +1 = 상승, -1 = 하락, 0 = 동일 또는 첫 봉
         #   np.sign이 NaN을 NaN으로 반환하므로 첫 봉은 0으로 보정
-        histogram_series = self.df[histogram_column]
-        histogram_diff = histogram_series.diff()
-        self.df[histogram_direction_column] = (
-            np.sign(histogram_diff).fillna(0).astype(int)
-        )
+        histogram_diff = np.diff(self.get_column(histogram_column))
+        direction = np.zeros(len(histogram_diff) + 1, dtype=np.int64)
+        direction[1:] = np.nan_to_num(np.sign(histogram_diff), nan=0.0)
+        self.set_column(histogram_direction_column, direction)
     
     def _calculate_cci(self, indicator_id: str, params: Dict[str, Any]) -> None:
         """
-        CCI (Commodity Channel Index) 계산 - ta 라이브러리 사용
+        CCI (Commodity Channel Index) 계산
         
         Args:
             indicator_id: 지표 ID
@@ -435,18 +691,11 @@ class IndicatorCalculator:
         # 필수 컬럼 확인
         required_columns = ["high", "low", "close"]
         for col in required_columns:
-            if col not in self.df.columns:
+            if col not in self.columns:
                 raise ValueError(f"CCI 계산에 필요한 컬럼이 없습니다: {col}")
         
-        cci_indicator = CCIIndicator(
-            high=self.df["high"],
-            low=self.df["low"],
-            close=self.df["close"],
-            window=period,
-            constant=constant,
-            fillna=True,
-        )
-        self.df[indicator_id] = cci_indicator.cci().bfill()
+        values = kernels.cci(*self._hlc_arrays(), period, constant)
+        self.set_column(indicator_id, kernels.backward_fill(values))
     
     def _calculate_custom(
         self, 
@@ -478,20 +727,25 @@ class IndicatorCalculator:
         if indicator_type not in self.custom_indicators:
             raise ValueError(f"등록되지 않은 커스텀 지표: {indicator_type}")
         
-        # 커스텀 함수 호출
+        # 커스텀 함수 호출 (샌드박스 함수는 실행 통계도 기록)
         func = self.custom_indicators[indicator_type]
-        result = func(self.df, params)
+        run_with_stats = getattr(func, "run_with_stats", None)
+        if run_with_stats is not None:
+            result, stats = run_with_stats(self.df, params)
+            self.custom_indicator_stats[indicator_id] = stats
+        else:
+            result = func(self.df, params)
         
         # 결과 타입에 따라 처리
         if isinstance(result, pd.Series):
             # 단일 Series: 기존 방식
-            if len(result) != len(self.df):
+            if len(result) != len(self.index):
                 raise ValueError(
                     f"커스텀 지표 길이가 DataFrame과 다릅니다: "
-                    f"expected {len(self.df)}, got {len(result)}"
+                    f"expected {len(self.index)}, got {len(result)}"
                 )
             
-            self.df[indicator_id] = result
+            self.set_column(indicator_id, result)
             logger.debug(f"커스텀 지표 저장 (단일): {indicator_id}")
             
         elif isinstance(result, dict):
@@ -505,15 +759,15 @@ class IndicatorCalculator:
                         f"딕셔너리 값은 pd.Series여야 합니다: key={key}, type={type(series)}"
                     )
                 
-                if len(series) != len(self.df):
+                if len(series) != len(self.index):
                     raise ValueError(
                         f"지표 길이가 DataFrame과 다릅니다: key={key}, "
-                        f"expected {len(self.df)}, got {len(series)}"
+                        f"expected {len(self.index)}, got {len(series)}"
                     )
                 
                 # 컬럼명 생성: main은 indicator_id, 나머지는 indicator_id_key
                 column_name = indicator_id if key == "main" else f"{indicator_id}_{key}"
-                self.df[column_name] = series
+                self.set_column(column_name, series)
                 logger.info(f"[커스텀 지표] 컬럼 생성: {column_name} (indicator_id={indicator_id}, key={key})")
                 
         else:
@@ -0,0 +1,191 @@
+"""
+파라미터 스윕 그리드 모듈
+
+전략 템플릿 + 파라미터 범위를 조합 목록으로 전개하고, 각 조합을 전략 정의와
+프리셋에 적용합니다.
+
+파라미터 경로 (점 구분):
+  - "indicators.<지표 id>.params.<이름>"  예: "indicators.ema_fast.params.period"
+  - "stop_loss.<필드>"                     예: "stop_loss.multiplier"
+  - "exit.atr_trailing.multiplier" 등 전략 정의 내 임의 경로
+    (리스트는 원소의 "id"로, id가 없으면 정수 인덱스로 지정)
+  - "preset.<필드>"                        예: "preset.risk_reward_ratio"
+    (PRESET_SWEEP_FIELDS만 허용)
+
+값 지정:
+  - 리스트: [5, 10, 20]
+  - 범위: {"start": 5, "stop": 20, "step": 5} (stop 포함)
+
+조합 순서는 param_space의 키 순서 기준 데카르트 곱으로 결정적입니다.
+"""
+
+import copy
+import itertools
+import math
+from typing import Any, Dict, List, Tuple
+
+# 스윕 가능한 프리셋 필드 (포지션 크기 / TP1 / 재평가 주기)
+PRESET_SWEEP_FIELDS = ("risk_percent", "risk_reward_ratio", "rebalance_interval")
+
+# 조합 수 상한 (실수로 수백만 조합을 만드는 것 방지)
+MAX_COMBINATIONS = 100_000
+
+_PRESET_PREFIX = "preset."
+
+
+def expand_values(spec: Any) -> List[Any]:
+    """
+    값 지정 하나를 값 리스트로 전개
+
+    Args:
+        spec: 리스트 또는 {"start", "stop", "step"} 범위
+
+    Returns:
+        List[Any]: 값 리스트
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 비어 있는 경우
+    """
+    if isinstance(spec, list):
+        if not spec:
+            raise ValueError("파라미터 값 리스트가 비어 있습니다")
+        return list(spec)
+
+    if isinstance(spec, dict):
+        missing = [k for k in ("start", "stop", "step") if k not in spec]
+        if missing:
+            raise ValueError(f"범위 지정에 필요한 키가 없습니다: {missing}")
+        start, stop, step = spec["start"], spec["stop"], spec["step"]
+        if step <= 0:
+            raise ValueError(f"step은 0보다 커야 합니다: {step}")
+        if stop < start:
+            raise ValueError(f"stop({stop})은 start({start}) 이상이어야 합니다")
+
+        # 부동소수 누적 오차 없이 개수 계산 (stop 포함)
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        if all(isinstance(v, int) for v in (start, stop, step)):
+            return [start + i * step for i in range(count)]
+        return [round(start + i * step, 10) for i in range(count)]
+
+    raise ValueError(f"파라미터 값은 리스트 또는 범위 객체여야 합니다: {spec!r}")
+
+
+def expand_param_space(
+    param_space: Dict[str, Any],
+    max_combinations: int = MAX_COMBINATIONS
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 공간을 조합 리스트로 전개
+
+    Args:
+        param_space: 경로 → 값 지정
+        max_combinations: 조합 수 상한
+
+    Returns:
+        List[Dict[str, Any]]: 조합 리스트 (각 조합은 경로 → 값)
+
+    Raises:
+        ValueError: 파라미터 공간이 비었거나 조합 수가 상한을 넘는 경우
+    """
+    if not param_space:
+        raise ValueError("param_space가 비어 있습니다")
+
+    paths = list(param_space.keys())
+    value_lists = [expand_values(param_space[path]) for path in paths]
+
+    total = math.prod(len(values) for values in value_lists)
+    if total > max_combinations:
+        raise ValueError(f"조합 수({total})가 상한({max_combinations})을 초과합니다")
+
+    return [dict(zip(paths, combo)) for combo in itertools.product(*value_lists)]
+
+
+def apply_params(
+    definition: Dict[str, Any],
+    preset: Dict[str, Any],
+    params: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    조합 하나를 전략 정의 / 프리셋에 적용 (원본은 변경하지 않음)
+
+    Args:
+        definition: 전략 템플릿
+        preset: 기준 프리셋 (risk_percent, risk_reward_ratio, rebalance_interval)
+        params: 경로 → 값
+
+    Returns:
+        Tuple[Dict, Dict]: (적용된 전략 정의, 적용된 프리셋)
+
+    Raises:
+        ValueError: 경로가 잘못된 경우
+    """
+    new_definition = copy.deepcopy(definition)
+    new_preset = dict(preset)
+
+    for path, value in params.items():
+        if path.startswith(_PRESET_PREFIX):
+            field = path[len(_PRESET_PREFIX):]
+            if field not in PRESET_SWEEP_FIELDS:
+                raise ValueError(
+                    f"스윕할 수 없는 프리셋 필드입니다: {field} (허용: {list(PRESET_SWEEP_FIELDS)})"
+                )
+            new_preset[field] = value
+        else:
+            _set_path(new_definition, path, value)
+
+    return new_definition, new_preset
+
+
+def validate_param_space(definition: Dict[str, Any], param_space: Dict[str, Any]) -> None:
+    """
+    모든 경로가 템플릿에 적용 가능한지 확인 (첫 값으로 시험 적용)
+
+    Args:
+        definition: 전략 템플릿
+        param_space: 경로 → 값 지정
+
+    Raises:
+        ValueError: 경로 또는 값 지정이 잘못된 경우
+    """
+    first = {path: expand_values(spec)[0] for path, spec in param_space.items()}
+    apply_params(definition, {}, first)
+
+
+def _set_path(target: Any, path: str, value: Any) -> None:
+    """점 구분 경로의 마지막 키에 값 설정 (중간 경로는 존재해야 함)"""
+    parts = path.split(".")
+    if not all(parts):
+        raise ValueError(f"잘못된 파라미터 경로입니다: {path!r}")
+
+    node = target
+    for i, part in enumerate(parts[:-1]):
+        node = _child(node, part, ".".join(parts[:i + 1]))
+
+    last = parts[-1]
+    if isinstance(node, dict):
+        node[last] = value
+    elif isinstance(node, list):
+        node[_list_index(node, last, path)] = value
+    else:
+        raise ValueError(f"파라미터 경로가 객체를 가리키지 않습니다: {path!r}")
+
+
+def _child(node: Any, part: str, walked: str) -> Any:
+    """경로 한 단계 이동"""
+    if isinstance(node, dict):
+        if part not in node:
+            raise ValueError(f"전략 정의에 경로가 없습니다: {walked!r}")
+        return node[part]
+    if isinstance(node, list):
+        return node[_list_index(node, part, walked)]
+    raise ValueError(f"전략 정의에 경로가 없습니다: {walked!r}")
+
+
+def _list_index(items: List[Any], part: str, walked: str) -> int:
+    """리스트 원소 위치: "id"가 일치하는 원소 우선, 없으면 정수 인덱스"""
+    for i, item in enumerate(items):
+        if isinstance(item, dict) and item.get("id") == part:
+            return i
+    if part.isdigit() and int(part) < len(items):
+        return int(part)
+    raise ValueError(f"전략 정의에 경로가 없습니다: {walked!r}")
@@ -0,0 +1,121 @@
+"""
+실행 프로파일링 모듈
+
+백테스트 한 번의 단계별 소요 시간(span)과 카운터를 기록합니다.
+결과는 run_artifacts["profile"]에 저장되어 엔진 버전 간 성능 회귀 추적에 사용됩니다.
+
+- span: 단계 이름 → 누적 소요 시간(초), 기록 순서 유지
+- counters: 이름 → 정수 카운터 (봉 수, strategy_func 호출 수, DB 쓰기 수,
+  커스텀 지표 샌드박스 CPU 시간 / 최대 메모리 등)
+- peak_rss_bytes: 프로세스 최대 상주 메모리 (resource 모듈이 없는 플랫폼은 None)
+"""
+
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    현재 프로세스의 최대 상주 메모리(RSS)
+
+    Returns:
+        Optional[int]: 바이트 단위 (측정 불가 플랫폼이면 None)
+
+    Note:
+        프로세스 시작 이후 최대값이므로 워커 프로세스가 여러 Run을 실행하면
+        이전 Run의 사용량도 포함됩니다.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return int(max_rss) if sys.platform == "darwin" else int(max_rss) * 1024
+
+
+class RunProfiler:
+    """
+    단계별 소요 시간 / 카운터 기록기
+
+    Attributes:
+        spans: 단계 이름 → 누적 소요 시간(초)
+        counters: 카운터 이름 → 값
+    """
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        단계 소요 시간 측정 (같은 이름은 누적, 예외가 나도 기록)
+
+        Args:
+            name: 단계 이름
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + (time.perf_counter() - start)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        카운터 증가
+
+        Args:
+            name: 카운터 이름
+            value: 증가량
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe_max(self, name: str, value: int) -> None:
+        """
+        카운터를 최대값으로 갱신 (샌드박스 워커 최대 메모리 등)
+
+        Args:
+            name: 카운터 이름
+            value: 관측값
+        """
+        self.counters[name] = max(self.counters.get(name, value), value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON 직렬화 가능한 프로파일 생성
+
+        Returns:
+            Dict: spans(초), counters, total_seconds, bars_per_second, peak_rss_bytes
+                bars_per_second는 "bars" 카운터와 "engine_run" 단계가 있을 때만 계산
+        """
+        engine_seconds = self.spans.get("engine_run")
+        bars = self.counters.get("bars")
+        bars_per_second = None
+        if engine_seconds and bars:
+            bars_per_second = round(bars / engine_seconds, 1)
+
+        return {
+            "spans": {name: round(seconds, 6) for name, seconds in self.spans.items()},
+            "counters": dict(self.counters),
+            "total_seconds": round(time.perf_counter() - self._started, 6),
+            "bars_per_second": bars_per_second,
+            "peak_rss_bytes": peak_rss_bytes(),
+        }
+
+
+def span_of(profiler: Optional[RunProfiler], name: str) -> ContextManager[None]:
+    """
+    profiler가 있으면 span, 없으면 아무것도 하지 않는 컨텍스트
+
+    Args:
+        profiler: RunProfiler (선택)
+        name: 단계 이름
+    """
+    return profiler.span(name) if profiler is not None else nullcontext()
@@ -0,0 +1,141 @@
+"""
+구간 최소/최대 탐색(Range Query) 모듈
+
+"start 이후 처음으로 값이 임계값 이하(또는 이상)가 되는 인덱스"를
+O(log n)으로 찾습니다. 포지션 보유 중 SL / TP1 도달 봉을 봉 단위 반복 없이
+찾는 데 사용합니다.
+
+구조:
+  - 값 배열을 BLOCK_SIZE 단위 블록으로 나눈 블록 최소값
+  - 블록 최소값 위의 sparse table (table[k][b] = min(block[b : b + 2^k]))
+  - 탐색: 시작 블록 내부 스캔 → sparse table binary lifting으로 첫 후보 블록 → 블록 내부 스캔
+
+비교는 원본 값에 대해 그대로 수행하므로 봉 단위 비교(bar.low <= stop_loss)와
+결과가 정확히 같습니다.
+"""
+
+from typing import List
+
+import numpy as np
+
+
+BLOCK_SIZE = 64
+
+
+class BlockMinIndex:
+    """
+    블록 최소값 + sparse table 기반 "첫 임계값 이하 인덱스" 탐색기
+
+    Attributes:
+        values: 원본 값 배열 (float64)
+        block_size: 블록 크기
+    """
+
+    def __init__(self, values: np.ndarray, block_size: int = BLOCK_SIZE):
+        """
+        Args:
+            values: 1차원 값 배열 (NaN 없음 전제)
+            block_size: 블록 크기 (기본 64)
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size는 1 이상이어야 합니다: {block_size}")
+
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.block_size = block_size
+        self.n = len(self.values)
+
+        n_blocks = (self.n + block_size - 1) // block_size
+        self.n_blocks = n_blocks
+
+        # 마지막 블록은 +inf로 채워 길이를 맞춤
+        padded = np.full(n_blocks * block_size, np.inf, dtype=np.float64)
+        padded[:self.n] = self.values
+        block_min = padded.reshape(n_blocks, block_size).min(axis=1) if n_blocks else padded
+
+        # sparse table: levels[k][b] = min(block_min[b : b + 2^k])
+        self.levels: List[np.ndarray] = [block_min]
+        span = 1
+        while span * 2 <= n_blocks:
+            prev = self.levels[-1]
+            self.levels.append(np.minimum(prev[:-span], prev[span:]))
+            span *= 2
+
+    def find_first_le(self, start: int, threshold: float) -> int:
+        """
+        start 이상에서 values[j] <= threshold 인 첫 j
+
+        Args:
+            start: 탐색 시작 인덱스
+            threshold: 임계값
+
+        Returns:
+            인덱스, 없으면 n
+        """
+        n = self.n
+        if start >= n:
+            return n
+        start = max(start, 0)
+        size = self.block_size
+
+        # 1) 시작 블록 내부
+        block = start // size
+        block_end = min((block + 1) * size, n)
+        hit = self._scan(start, block_end, threshold)
+        if hit is not None:
+            return hit
+
+        # 2) 다음 블록부터 block_min <= threshold 인 첫 블록 (binary lifting)
+        b = block + 1
+        n_blocks = self.n_blocks
+        for k in range(len(self.levels) - 1, -1, -1):
+            level = self.levels[k]
+            if b < len(level) and level[b] > threshold:
+                b += 1 << k
+        if b >= n_blocks:
+            return n
+
+        # 3) 해당 블록 내부
+        hit = self._scan(b * size, min((b + 1) * size, n), threshold)
+        return n if hit is None else hit
+
+    def _scan(self, lo: int, hi: int, threshold: float):
+        """values[lo:hi]에서 threshold 이하인 첫 인덱스 (없으면 None)"""
+        if lo >= hi:
+            return None
+        hits = np.flatnonzero(self.values[lo:hi] <= threshold)
+        if len(hits) == 0:
+            return None
+        return lo + int(hits[0])
+
+
+class PriceRangeIndex:
+    """
+    OHLC 저가/고가 배열에 대한 SL / TP1 도달 봉 탐색기
+
+    - first_low_at_or_below: low[j] <= price 인 첫 j (LONG SL, SHORT TP1)
+    - first_high_at_or_above: high[j] >= price 인 첫 j (SHORT SL, LONG TP1)
+    """
+
+    def __init__(self, low: np.ndarray, high: np.ndarray, block_size: int = BLOCK_SIZE):
+        """
+        Args:
+            low: 저가 배열
+            high: 고가 배열
+            block_size: 블록 크기
+        """
+        if len(low) != len(high):
+            raise ValueError("low와 high의 길이가 다릅니다")
+        self._low = BlockMinIndex(low, block_size)
+        # high >= price  <=>  -high <= -price (부호 반전은 오차 없음)
+        self._neg_high = BlockMinIndex(-np.asarray(high, dtype=np.float64), block_size)
+
+    def __len__(self) -> int:
+        return self._low.n
+
+    def first_low_at_or_below(self, start: int, price: float) -> int:
+        """start 이상에서 low <= price 인 첫 인덱스 (없으면 len)"""
+        return self._low.find_first_le(start, price)
+
+    def first_high_at_or_above(self, start: int, price: float) -> int:
+        """start 이상에서 high >= price 인 첫 인덱스 (없으면 len)"""
+        return self._neg_high.find_first_le(start, -price)
@@ -0,0 +1,421 @@
+"""
+신호 컴파일러(Signal Compiler) 모듈
+
+Strategy JSON의 entry / exit.indicator_based / stop_loss 정의를
+봉 루프 시작 전에 NumPy 배열로 한 번에 평가합니다.
+
+StrategyParser.create_strategy_function()이 봉마다 조건 dict를 다시 해석하고
+IndicatorCalculator.get_value()를 호출하던 경로를 대체하며,
+결과는 기존 경로와 비트 단위로 동일해야 합니다 (결정성).
+
+규칙 (기존 StrategyParser 동작과 1:1 대응):
+  - ref 값: 지표 컬럼의 NaN은 첫 유효값으로 대체 (전부 NaN이면 0.0)
+  - HTF ref: htf_index_map이 -1인 봉(닫힌 HTF 봉 없음)은 값 없음 → 조건 False
+  - cross_above / cross_below: 한 칸 시프트한 배열 비교, 첫 봉은 항상 False
+  - long / short 동시 신호는 진입 안 함
+  - 손절가 계산 실패(None)는 NaN으로 표현
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+import logging
+
+import numpy as np
+
+from ..models.bar_array import BarArray
+from .strategy_parser import BASE_TF
+
+if TYPE_CHECKING:
+    from .strategy_parser import StrategyParser
+
+logger = logging.getLogger(__name__)
+
+
+# 값 배열과 유효 마스크 (유효하지 않은 봉 = 기존 경로에서 None)
+CompiledValue = Tuple[np.ndarray, np.ndarray]
+
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class CompiledSignals:
+    """
+    컴파일된 전략 신호
+
+    Attributes:
+        long_mask: 롱 진입 조건 충족 여부 (bool)
+        short_mask: 숏 진입 조건 충족 여부 (bool)
+        stop_loss_long: 롱 진입 시 손절가 (계산 불가 = NaN)
+        stop_loss_short: 숏 진입 시 손절가 (계산 불가 = NaN)
+        exit_long_mask: 롱 포지션 지표 기반 진출 조건 (비활성화면 None)
+        exit_short_mask: 숏 포지션 지표 기반 진출 조건 (비활성화면 None)
+        atr_values: ATR Trailing용 ATR 값 (비활성화 또는 지표 없음이면 None)
+        signal_direction: strategy_func 반환값의 방향
+            (1=LONG, -1=SHORT, 0=신호 없음)
+    """
+    long_mask: np.ndarray
+    short_mask: np.ndarray
+    stop_loss_long: np.ndarray
+    stop_loss_short: np.ndarray
+    exit_long_mask: Optional[np.ndarray] = None
+    exit_short_mask: Optional[np.ndarray] = None
+    atr_values: Optional[np.ndarray] = None
+    signal_direction: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        """데이터 검증 및 신호 방향 계산"""
+        n = len(self.long_mask)
+        for name in ("short_mask", "stop_loss_long", "stop_loss_short"):
+            if len(getattr(self, name)) != n:
+                raise ValueError(f"{name}의 길이가 long_mask와 다릅니다")
+
+        # strategy_func와 동일한 규칙:
+        # 동시 신호 → None, 손절가 계산 실패 → None
+        only_long = self.long_mask & ~self.short_mask
+        only_short = self.short_mask & ~self.long_mask
+        direction = np.zeros(n, dtype=np.int8)
+        direction[only_long & ~np.isnan(self.stop_loss_long)] = 1
+        direction[only_short & ~np.isnan(self.stop_loss_short)] = -1
+        self.signal_direction = direction
+        self._candidate_indices: Optional[np.ndarray] = None
+        self._signal_indices: Dict[str, np.ndarray] = {}
+
+    def signal_indices(self, direction: str) -> np.ndarray:
+        """
+        해당 방향 진입 신호가 있는 봉 인덱스 (오름차순)
+
+        포지션 보유 중 반대 방향 신호(Reverse) 탐색에 사용합니다.
+        """
+        key = "LONG" if direction == "LONG" else "SHORT"
+        if key not in self._signal_indices:
+            value = 1 if key == "LONG" else -1
+            self._signal_indices[key] = np.flatnonzero(self.signal_direction == value)
+        return self._signal_indices[key]
+
+    def exit_indices(self, direction: str) -> Optional[np.ndarray]:
+        """
+        해당 방향 포지션의 지표 기반 진출 조건이 충족된 봉 인덱스 (비활성화면 None)
+        """
+        mask = self.exit_long_mask if direction == "LONG" else self.exit_short_mask
+        if mask is None:
+            return None
+        key = f"exit_{direction}"
+        if key not in self._signal_indices:
+            self._signal_indices[key] = np.flatnonzero(mask)
+        return self._signal_indices[key]
+
+    @property
+    def candidate_indices(self) -> np.ndarray:
+        """
+        진입 신호가 있는 봉 인덱스 (오름차순)
+
+        포지션이 없는 구간에서 엔진은 이 인덱스 사이의 봉을 건너뜁니다.
+        """
+        if self._candidate_indices is None:
+            self._candidate_indices = np.flatnonzero(self.signal_direction)
+        return self._candidate_indices
+
+    def __len__(self) -> int:
+        return len(self.long_mask)
+
+    def signal_at(self, bar_index: int) -> Optional[Dict[str, Any]]:
+        """
+        strategy_func(bar)와 동일한 형식의 신호 반환
+
+        Args:
+            bar_index: 봉 인덱스
+
+        Returns:
+            None 또는 {'direction': 'LONG'|'SHORT', 'stop_loss': float}
+        """
+        direction = self.signal_direction[bar_index]
+        if direction == 1:
+            return {"direction": "LONG", "stop_loss": float(self.stop_loss_long[bar_index])}
+        if direction == -1:
+            return {"direction": "SHORT", "stop_loss": float(self.stop_loss_short[bar_index])}
+        return None
+
+    def exit_at(self, bar_index: int, direction: str) -> bool:
+        """
+        exit_checker(bar_index, direction)와 동일한 결과 반환
+        """
+        mask = self.exit_long_mask if direction == "LONG" else self.exit_short_mask
+        if mask is None:
+            return False
+        return bool(mask[bar_index])
+
+
+class SignalCompiler:
+    """
+    Strategy JSON → CompiledSignals 변환기
+
+    StrategyParser가 계산해 둔 지표 컬럼과 HTF 인덱스 매핑을 그대로 사용합니다.
+    """
+
+    def __init__(self, parser: "StrategyParser"):
+        """
+        Args:
+            parser: 지표 계산이 끝난 StrategyParser
+        """
+        self.parser = parser
+        self.n = len(parser.bars)
+        # (tf, column) -> NaN 처리된 float64 배열
+        self._column_cache: Dict[Tuple[str, str], Optional[np.ndarray]] = {}
+        # price field -> float64 배열
+        self._price_cache: Dict[str, np.ndarray] = {}
+
+    def compile(self) -> CompiledSignals:
+        """
+        전략 전체를 컴파일합니다.
+
+        Returns:
+            CompiledSignals
+        """
+        definition = self.parser.definition
+        entry_def = definition.get("entry", {})
+
+        long_mask = self._compile_conditions(entry_def.get("long", {}))
+        short_mask = self._compile_conditions(entry_def.get("short", {}))
+
+        stop_loss_long = self._compile_stop_loss("LONG")
+        stop_loss_short = self._compile_stop_loss("SHORT")
+
+        exit_long_mask = None
+        exit_short_mask = None
+        if self.parser.has_indicator_based_exit():
+            indicator_based = definition.get("exit", {}).get("indicator_based", {})
+            exit_long_mask = self._compile_conditions(indicator_based.get("long", {}))
+            exit_short_mask = self._compile_conditions(indicator_based.get("short", {}))
+
+        atr_values = None
+        atr_config = self.parser.get_atr_trailing_config()
+        if atr_config and atr_config.get("atr_indicator_id"):
+            atr_values = self._column(BASE_TF, atr_config["atr_indicator_id"])
+
+        compiled = CompiledSignals(
+            long_mask=long_mask,
+            short_mask=short_mask,
+            stop_loss_long=stop_loss_long,
+            stop_loss_short=stop_loss_short,
+            exit_long_mask=exit_long_mask,
+            exit_short_mask=exit_short_mask,
+            atr_values=atr_values,
+        )
+        logger.info(
+            f"[신호 컴파일] bars={self.n}, long={int(long_mask.sum())}, "
+            f"short={int(short_mask.sum())}, "
+            f"signals={int(np.count_nonzero(compiled.signal_direction))}"
+        )
+        return compiled
+
+    # ------------------------------------------------------------------
+    # 조건식
+    # ------------------------------------------------------------------
+
+    def _compile_conditions(self, conditions: Dict[str, Any]) -> np.ndarray:
+        """_evaluate_entry_conditions의 배열 버전 (AND 결합)"""
+        result = np.zeros(self.n, dtype=bool)
+        if not conditions:
+            return result
+
+        and_conditions = conditions.get("and", [])
+        if not and_conditions:
+            return result
+
+        result[:] = True
+        for condition in and_conditions:
+            result &= self._compile_single_condition(condition)
+        return result
+
+    def _compile_single_condition(self, condition: Dict[str, Any]) -> np.ndarray:
+        """_evaluate_single_condition의 배열 버전"""
+        false_mask = np.zeros(self.n, dtype=bool)
+
+        left_def = condition.get("left", {})
+        op = condition.get("op")
+        right_def = condition.get("right", {})
+
+        if not op:
+            logger.warning(f"조건에 op가 없습니다: {condition}")
+            return false_mask
+
+        left, left_valid = self._compile_value(left_def)
+        right, right_valid = self._compile_value(right_def)
+        valid = left_valid & right_valid
+
+        if op == ">":
+            return valid & (left > right)
+        elif op == "<":
+            return valid & (left < right)
+        elif op == ">=":
+            return valid & (left >= right)
+        elif op == "<=":
+            return valid & (left <= right)
+        elif op == "==":
+            return valid & (np.abs(left - right) < 1e-9)
+        elif op in ("cross_above", "cross_below"):
+            result = false_mask.copy()
+            if self.n < 2:
+                return result
+            # 이전 봉과 현재 봉 값이 모두 있어야 판정 (첫 봉은 항상 False)
+            both_valid = valid[1:] & valid[:-1]
+            if op == "cross_above":
+                crossed = (left[:-1] <= right[:-1]) & (left[1:] > right[1:])
+            else:
+                crossed = (left[:-1] >= right[:-1]) & (left[1:] < right[1:])
+            result[1:] = both_valid & crossed
+            return result
+        else:
+            logger.warning(f"지원하지 않는 연산자: {op}")
+            return false_mask
+
+    # ------------------------------------------------------------------
+    # 값 정의
+    # ------------------------------------------------------------------
+
+    def _compile_value(self, value_def: Dict[str, Any]) -> CompiledValue:
+        """_get_value의 배열 버전. (values, valid_mask) 반환"""
+        invalid = (np.zeros(self.n, dtype=np.float64), np.zeros(self.n, dtype=bool))
+
+        if "ref" in value_def:
+            column_name, tf = self.parser._parse_indicator_ref(value_def["ref"])
+            values = self._column(tf, column_name)
+            if values is None:
+                return invalid
+
+            if tf == BASE_TF:
+                return values, np.ones(self.n, dtype=bool)
+
+            # HTF: base 인덱스 → 이미 닫힌 HTF 봉 인덱스로 gather
+            # (-1은 clip으로 0번 값을 가져오되 valid=False로 무시)
+            mapping = self.parser.htf_index_maps[tf]
+            valid = mapping >= 0
+            gathered = np.take(values, mapping, mode="clip") if len(values) else invalid[0]
+            return gathered, valid
+
+        elif "value" in value_def:
+            constant = float(value_def["value"])
+            return np.full(self.n, constant, dtype=np.float64), np.ones(self.n, dtype=bool)
+
+        elif "price" in value_def:
+            price_field = value_def["price"]
+            if price_field not in PRICE_FIELDS:
+                logger.warning(f"지원하지 않는 가격 필드: {price_field}")
+                return invalid
+            return self._price(price_field), np.ones(self.n, dtype=bool)
+
+        logger.warning(f"값 정의를 해석할 수 없습니다: {value_def}")
+        return invalid
+
+    def _column(self, tf: str, column_name: str) -> Optional[np.ndarray]:
+        """
+        IndicatorCalculator.get_value와 동일한 값의 배열 반환
+
+        Returns:
+            NaN 처리된 float64 배열, 지표/TF가 없으면 None
+        """
+        key = (tf, column_name)
+        if key in self._column_cache:
+            return self._column_cache[key]
+
+        values = None
+        calc = self.parser.indicator_calcs.get(tf)
+        if calc is None:
+            logger.warning(
+                f"지표 참조 '{column_name}' — 타임프레임 '{tf}' 데이터가 없습니다. "
+                f"사용 가능: {list(self.parser.indicator_calcs.keys())}"
+            )
+        elif tf != BASE_TF and tf not in self.parser.htf_index_maps:
+            values = None
+        elif column_name not in calc.columns:
+            logger.warning(f"지표 '{column_name}'가 계산되지 않았습니다 (tf='{tf}')")
+        else:
+            values = calc.get_array(column_name)
+
+        self._column_cache[key] = values
+        return values
+
+    def _price(self, price_field: str) -> np.ndarray:
+        """base 봉의 가격 필드 배열 (Bar 값 그대로)"""
+        if price_field not in self._price_cache:
+            bars = self.parser.bars
+            if isinstance(bars, BarArray):
+                self._price_cache[price_field] = getattr(bars, price_field)
+                return self._price_cache[price_field]
+            self._price_cache[price_field] = np.array(
+                [getattr(bar, price_field) for bar in self.parser.bars],
+                dtype=np.float64,
+            )
+        return self._price_cache[price_field]
+
+    # ------------------------------------------------------------------
+    # 손절가
+    # ------------------------------------------------------------------
+
+    def _compile_stop_loss(self, direction: str) -> np.ndarray:
+        """_calculate_stop_loss의 배열 버전 (실패 = NaN)"""
+        nan_array = np.full(self.n, np.nan, dtype=np.float64)
+        stop_loss_def = self.parser.definition.get("stop_loss", {})
+        sl_type = stop_loss_def.get("type")
+        close = self._price("close")
+
+        if sl_type == "fixed_percent":
+            percent = stop_loss_def.get("percent", 2.0)
+            if direction == "LONG":
+                return close * (1 - percent / 100)
+            return close * (1 + percent / 100)
+
+        elif sl_type == "fixed_points":
+            points = stop_loss_def.get("points", 100)
+            if direction == "LONG":
+                return close - points
+            return close + points
+
+        elif sl_type == "atr_based":
+            atr_indicator_id = stop_loss_def.get("atr_indicator_id")
+            multiplier = stop_loss_def.get("multiplier", 2.0)
+
+            if not atr_indicator_id:
+                logger.error("ATR 기반 손절에는 atr_indicator_id가 필요합니다")
+                return nan_array
+
+            atr = self._column(BASE_TF, atr_indicator_id)
+            if atr is None:
+                return nan_array
+
+            if direction == "LONG":
+                stop_loss = close - (atr * multiplier)
+            else:
+                stop_loss = close + (atr * multiplier)
+            # ATR 값이 0 이하이면 손절가 계산 불가
+            return np.where(atr <= 0, np.nan, stop_loss)
+
+        elif sl_type == "indicator_level":
+            ref = stop_loss_def.get("long_ref" if direction == "LONG" else "short_ref")
+            if not ref:
+                logger.error(f"indicator_level 손절에 {direction} 참조가 없습니다")
+                return nan_array
+
+            values, valid = self._compile_value({"ref": ref})
+            ok = valid & np.isfinite(values) & (values > 0)
+            if direction == "LONG":
+                ok &= values < close
+            else:
+                ok &= values > close
+            return np.where(ok, values, np.nan)
+
+        logger.error(f"지원하지 않는 손절 타입: {sl_type}")
+        return nan_array
+
+
+def compile_strategy_signals(parser: "StrategyParser") -> CompiledSignals:
+    """
+    StrategyParser의 전략을 CompiledSignals로 컴파일
+
+    Args:
+        parser: 지표 계산이 끝난 StrategyParser
+
+    Returns:
+        CompiledSignals
+    """
+    return SignalCompiler(parser).compile()
@@ -9,17 +9,30 @@ Strategy JSON을 파싱하여 신호를 생성합니다.
   - HTF 값은 "이미 닫힌 마지막 HTF 봉" 기준 — look-ahead 구조적 차단
 """
 
-from typing import Dict, Any, List, Optional, Callable, Tuple
+from typing import Dict, Any, List, Optional, Callable, Tuple, TYPE_CHECKING
+import json
+import numpy as np
 import pandas as pd
 from ..models.bar import Bar
-from .indicators import IndicatorCalculator
-from .htf_mapper import build_htf_index_map, interval_to_seconds
+from ..models.bar_array import BarArray
+from .indicators import BUILTIN_INDICATOR_TYPES, FAMILY_INDICATOR_TYPES, IndicatorCalculator
+from .htf_mapper import get_htf_index_map, interval_to_seconds
+from .indicator_chunking import ChunkingOptions, ChunkReport, builtin_output_columns, calculate_chunked
+from .indicator_planner import (
+    BASE_TF,
+    IndicatorPlan,
+    PlannedIndicator,
+    build_indicator_plan,
+    parse_indicator_ref,
+)
+from .profiling import RunProfiler, span_of
 import logging
 
-logger = logging.getLogger(__name__)
-
+if TYPE_CHECKING:
+    from .signal_compiler import CompiledSignals
+    from .indicator_cache import IndicatorCache, PersistentIndicatorCache
 
-BASE_TF = "base"
+logger = logging.getLogger(__name__)
 
 
 class StrategyParser:
@@ -33,23 +46,52 @@ class StrategyParser:
     def __init__(
         self,
         strategy_definition: Dict[str, Any],
-        bars: List[Bar],
+        bars: List[Bar] | BarArray,
         df: Optional[pd.DataFrame] = None,
-        htf_data: Optional[Dict[str, Tuple[List[Bar], pd.DataFrame]]] = None,
+        htf_data: Optional[Dict[str, Tuple[List[Bar] | BarArray, pd.DataFrame]]] = None,
+        indicator_cache: Optional["IndicatorCache | PersistentIndicatorCache"] = None,
+        profiler: Optional[RunProfiler] = None,
+        prune_unreferenced_indicators: bool = True,
+        indicator_chunking: Optional[ChunkingOptions] = None,
+        dataset_hashes: Optional[Dict[str, str]] = None,
     ):
         """
         Args:
             strategy_definition: 전략 정의 JSON
-            bars: 베이스 타임프레임 봉 리스트
+            bars: 베이스 타임프레임 봉 리스트 또는 BarArray
             df: 베이스 OHLCV DataFrame (지표 계산용). 없으면 bars에서 자동 생성
             htf_data: 상위 타임프레임 데이터 (선택)
                 key: 타임프레임 문자열 (예: "1h", "1d")
                 value: (bars, df) 튜플
+            indicator_cache: 지표 계산 결과 캐시 (선택)
+                같은 데이터셋으로 여러 전략 변형을 평가할 때 동일 (TF, 타입, 파라미터)
+                지표를 한 번만 계산하도록 공유하거나, PersistentIndicatorCache로
+                Run / 재실행 간 디스크에 저장된 지표를 재사용
+            profiler: 단계별 소요 시간 기록기 (선택)
+                custom_indicator_load / indicator_calculation 단계와
+                커스텀 지표별 실행 시간(custom_indicator:{ID}) / 샌드박스 통계를 기록
+            prune_unreferenced_indicators: True면 entry / exit / stop_loss 등에서
+                참조하지 않는 지표는 계산하지 않음 (False면 전체 계산, 차트 표시용)
+            indicator_chunking: 내장 지표 청크 병렬 계산 설정 (선택)
+                min_bars 이상인 TF의 내장 지표를 워밍업을 겹친 청크로 나눠
+                프로세스 풀에서 계산 (결과 보고는 indicator_chunk_reports)
+            dataset_hashes: 타임프레임 → 데이터셋 해시 ({"base": ..., "1h": ...}, 선택)
+                주어지면 HTF 인덱스 매핑을 (베이스 해시, HTF 해시, 길이)로 재사용
         """
         self.definition = strategy_definition
+        self.prune_unreferenced_indicators = prune_unreferenced_indicators
+        # 참조되지 않아 계산을 생략한 지표 ID
+        self.skipped_indicators: List[str] = []
+        self.indicator_cache = indicator_cache
+        self.profiler = profiler
+        self.indicator_chunking = indicator_chunking
+        # 청크 계산 보고 (TF별, verify 모드면 순차 계산과의 최대 편차 포함)
+        self.indicator_chunk_reports: List[ChunkReport] = []
         self.bars = bars
         # df가 없으면 bars로부터 DataFrame 생성 (테스트 호환성)
-        if df is None:
+        if df is None and isinstance(bars, BarArray):
+            self.df = bars.to_dataframe()
+        elif df is None:
             self.df = pd.DataFrame(
                 {
                     'open': [b.open for b in bars],
@@ -65,7 +107,10 @@ class StrategyParser:
             self.df = df
 
         # 베이스 TF의 timestamp -> index 매핑
-        self.timestamp_to_index = {bar.timestamp: i for i, bar in enumerate(bars)}
+        if isinstance(bars, BarArray):
+            self.timestamp_to_index = dict(zip(bars.timestamps.tolist(), range(len(bars))))
+        else:
+            self.timestamp_to_index = {bar.timestamp: i for i, bar in enumerate(bars)}
 
         # ----- MTF 구조 -----
         # 타임프레임별 IndicatorCalculator 보관. key="base" 는 항상 존재.
@@ -75,13 +120,17 @@ class StrategyParser:
         # 타임프레임별 봉 리스트 (HTF 값 조회 시 사용)
         self.tf_bars: Dict[str, List[Bar]] = {BASE_TF: bars}
         # base_bar_index -> htf_bar_index 매핑 (look-ahead 차단 보장)
-        self.htf_index_maps: Dict[str, List[int]] = {}
+        # (int32 배열, 데이터셋 해시가 있으면 프로세스 내 캐시와 공유되는 읽기 전용 배열)
+        self.htf_index_maps: Dict[str, np.ndarray] = {}
+        hashes = dataset_hashes or {}
 
         if htf_data:
             for tf, (htf_bars, htf_df) in htf_data.items():
                 if tf == BASE_TF:
                     raise ValueError(f"'base'는 htf_data의 키로 사용할 수 없습니다")
-                if htf_df is None:
+                if htf_df is None and isinstance(htf_bars, BarArray):
+                    htf_df = htf_bars.to_dataframe()
+                elif htf_df is None:
                     htf_df = pd.DataFrame(
                         {
                             'open': [b.open for b in htf_bars],
@@ -95,10 +144,12 @@ class StrategyParser:
                     )
                 self.indicator_calcs[tf] = IndicatorCalculator(htf_df)
                 self.tf_bars[tf] = htf_bars
-                self.htf_index_maps[tf] = build_htf_index_map(
+                self.htf_index_maps[tf] = get_htf_index_map(
                     base_bars=bars,
                     htf_bars=htf_bars,
                     htf_interval_sec=interval_to_seconds(tf),
+                    base_hash=hashes.get(BASE_TF),
+                    htf_hash=hashes.get(tf),
                 )
                 logger.info(
                     f"[MTF] HTF '{tf}' 등록: {len(htf_bars)} bars, "
@@ -108,18 +159,54 @@ class StrategyParser:
         # 하위호환: 기존 코드가 self.indicator_calc (단수)를 참조할 수 있음
         self.indicator_calc = self.indicator_calcs[BASE_TF]
 
-        # 커스텀 지표 동적 로드 (모든 TF의 calculator에 등록)
-        self._load_custom_indicators()
+        # 지표 계산 계획 (계산 순서 / 생략 / 중복 제거, 커스텀 지표 로드 대상)
+        self.indicator_plan = self._build_indicator_plan()
+
+        # 커스텀 지표 동적 로드 (계획에 포함된 타입만, 모든 TF의 calculator에 등록)
+        with span_of(profiler, "custom_indicator_load"):
+            self._load_custom_indicators()
 
         # 지표 계산
-        self._calculate_indicators()
+        with span_of(profiler, "indicator_calculation"):
+            self._calculate_indicators()
 
         # 이전 지표 값 (cross 판정용)
         self.prev_indicator_values: Dict[str, float] = {}
     
+    def get_value_call_count(self) -> int:
+        """
+        모든 TF calculator의 get_value 호출 수 합계 (프로파일링용)
+
+        Returns:
+            int: get_value 호출 수
+        """
+        return sum(calc.get_value_calls for calc in self.indicator_calcs.values())
+
+    def _build_indicator_plan(self) -> IndicatorPlan:
+        """
+        전략 정의로부터 지표 계산 계획 생성 (build_indicator_plan)
+
+        Raises:
+            RuntimeError: source 순환 참조 등 계획을 세울 수 없는 경우
+        """
+        try:
+            plan = build_indicator_plan(
+                self.definition,
+                prune_unreferenced=self.prune_unreferenced_indicators
+            )
+        except ValueError as e:
+            logger.error(f"지표 계산 계획 실패: {e}")
+            raise RuntimeError(f"지표 계산 계획 실패: {e}") from e
+
+        self.skipped_indicators = [indicator_id for _, indicator_id in plan.skipped]
+        return plan
+
     def _load_custom_indicators(self) -> None:
         """
-        데이터베이스에서 커스텀 지표를 로드하여 각 TF의 calculator에 등록
+        계산 계획에 포함된 커스텀 지표만 데이터베이스에서 로드하여 각 TF의 calculator에 등록
+
+        DB 조회는 파서당 한 번이며, 컴파일된 함수는 indicator_loader의
+        프로세스 전역 레지스트리((타입, 코드 해시) 키)에서 재사용합니다.
 
         Note:
             DB 파일이 없거나 로드 실패 시에도 백테스트는 계속 진행됩니다.
@@ -127,6 +214,14 @@ class StrategyParser:
         from pathlib import Path
         from .indicator_loader import register_custom_indicators
 
+        types = sorted(
+            {step.definition.get("type") for step in self.indicator_plan.steps}
+            - set(BUILTIN_INDICATOR_TYPES)
+        )
+        if not types:
+            logger.debug("참조하는 커스텀 지표가 없습니다")
+            return
+
         db_path = Path("db/algoforge.db")
 
         if not db_path.exists():
@@ -135,31 +230,38 @@ class StrategyParser:
 
         try:
             # 모든 TF의 calculator에 동일한 커스텀 지표 등록
-            total = 0
-            for tf, calc in self.indicator_calcs.items():
-                count = register_custom_indicators(calc, str(db_path))
-                total = count  # count는 DB의 지표 수이므로 TF마다 동일
-            logger.debug(f"커스텀 지표 {total}개 로드 완료 (TF 수: {len(self.indicator_calcs)})")
+            total = register_custom_indicators(
+                list(self.indicator_calcs.values()), str(db_path), types=types
+            )
+            logger.debug(
+                f"커스텀 지표 {total}개 로드 완료 (요청: {types}, TF 수: {len(self.indicator_calcs)})"
+            )
         except Exception as e:
             logger.warning(f"커스텀 지표 로드 실패: {e}")
 
     def _calculate_indicators(self) -> None:
         """
-        전략에 정의된 모든 지표를 해당 TF의 calculator에서 사전 계산합니다.
+        전략에서 참조하는 지표를 해당 TF의 calculator에서 사전 계산합니다.
 
         인디케이터 JSON의 "timeframe" 필드로 대상 TF 선택 (없으면 "base").
+        계산 순서 / 생략 / 중복 제거는 build_indicator_plan()을 따릅니다.
         """
-        indicators = self.definition.get("indicators", [])
-        logger.info(f"[전략 파싱] 지표 계산 시작: {len(indicators)}개")
+        plan = self.indicator_plan
+        logger.info(
+            f"[전략 파싱] 지표 계산 시작: {len(plan.steps)}개 "
+            f"(생략 {len(plan.skipped)}개)"
+        )
 
-        for indicator in indicators:
-            if not indicator.get("id") or not indicator.get("type"):
-                logger.warning(f"지표 정의가 불완전합니다: {indicator}")
-                continue
+        # 대용량 TF의 내장 지표는 청크 병렬 계산, 나머지 중 기간만 다른 지표는 묶어서 먼저 계산
+        precomputed = self._calculate_chunked_indicators(plan.steps)
+        precomputed.update(self._calculate_indicator_families(
+            [step for step in plan.steps if step.key not in precomputed]
+        ))
 
-            indicator_id = indicator.get('id')
-            indicator_type = indicator.get('type')
-            tf = indicator.get('timeframe', BASE_TF) or BASE_TF
+        for step in plan.steps:
+            indicator_id = step.indicator_id
+            indicator_type = step.definition.get('type')
+            tf = step.tf
 
             if tf not in self.indicator_calcs:
                 raise RuntimeError(
@@ -170,25 +272,234 @@ class StrategyParser:
 
             logger.info(
                 f"[전략 파싱] 지표 계산: id={indicator_id}, type={indicator_type}, tf={tf}"
+                + (f", 공유={step.aliases}" if step.aliases else "")
             )
 
-            try:
-                self.indicator_calcs[tf].calculate_indicator(indicator)
-            except Exception as e:
-                error_message = (
-                    f"지표 계산 실패 - ID: '{indicator_id}', Type: '{indicator_type}', "
-                    f"TF: '{tf}', 에러: {str(e)}"
-                )
-                logger.error(error_message, exc_info=True)
-                raise RuntimeError(error_message) from e
+            calc = self.indicator_calcs[tf]
+            cache = self.indicator_cache
+            columns_before = set(calc.columns)
+            if step.key in precomputed:
+                columns_before.difference_update(precomputed[step.key])
+            elif cache is None or not cache.restore(calc, tf, step.cache_definition):
+                self._calculate_step(calc, step, columns_before)
+
+            if step.aliases:
+                self._share_indicator_columns(calc, step, columns_before)
 
         # 계산 완료 후 base DataFrame 컬럼 출력
         indicator_columns = [
-            col for col in self.df.columns
+            col for col in self.indicator_calc.columns
             if col not in ['open', 'high', 'low', 'close', 'volume', 'direction']
         ]
         logger.info(f"[전략 파싱] base 지표 컬럼: {indicator_columns}")
     
+    def _calculate_step(
+        self,
+        calc: IndicatorCalculator,
+        step: PlannedIndicator,
+        columns_before: set
+    ) -> None:
+        """계획 단계 하나를 계산하고 캐시에 저장 (실패 시 RuntimeError)"""
+        try:
+            if step.definition.get("type") in BUILTIN_INDICATOR_TYPES:
+                calc.calculate_indicator(step.definition)
+            else:
+                self._calculate_custom_step(calc, step)
+            if self.indicator_cache is not None:
+                self.indicator_cache.capture(calc, step.tf, step.cache_definition, columns_before)
+        except Exception as e:
+            error_message = (
+                f"지표 계산 실패 - ID: '{step.indicator_id}', "
+                f"Type: '{step.definition.get('type')}', "
+                f"TF: '{step.tf}', 에러: {str(e)}"
+            )
+            logger.error(error_message, exc_info=True)
+            raise RuntimeError(error_message) from e
+
+    def _calculate_custom_step(self, calc: IndicatorCalculator, step: PlannedIndicator) -> None:
+        """커스텀 지표 계산 + 지표별 실행 시간 / 샌드박스 통계 기록"""
+        label = step.indicator_id if step.tf == BASE_TF else f"{step.indicator_id}@{step.tf}"
+        with span_of(self.profiler, f"custom_indicator:{label}"):
+            calc.calculate_indicator(step.definition)
+        if self.profiler is None:
+            return
+        self.profiler.count("custom_indicator_calls")
+        stats = calc.custom_indicator_stats.get(step.indicator_id)
+        if stats is not None:
+            self.profiler.count("sandbox_cpu_ms", int(round(stats["cpu_seconds"] * 1000)))
+            if stats.get("peak_rss_bytes") is not None:
+                self.profiler.observe_max("sandbox_peak_rss_bytes", stats["peak_rss_bytes"])
+
+    def _calculate_chunked_indicators(self, steps: List[PlannedIndicator]) -> Dict[str, List[str]]:
+        """
+        봉 수가 많은 TF의 내장 지표를 청크 병렬 계산 (indicator_chunking 설정 시)
+
+        대상: 내장 지표 중 source가 입력 컬럼이거나 앞서 청크 계산한 지표의 출력인 것.
+        캐시 키에는 청크 설정을 포함하여 순차 계산 결과와 섞이지 않도록 합니다.
+        청크 계산이 실패하면 경고를 남기고 일반 계산으로 진행합니다.
+
+        Args:
+            steps: 지표 계산 계획 단계
+
+        Returns:
+            Dict: 계산(또는 캐시 복원)이 끝난 단계의 정규화 키 → 출력 컬럼
+        """
+        options = self.indicator_chunking
+        done: Dict[str, List[str]] = {}
+        if options is None:
+            return done
+
+        cache = self.indicator_cache
+        for tf, calc in self.indicator_calcs.items():
+            if len(calc.index) < options.min_bars:
+                continue
+            available = set(calc.columns)
+            batch: List[Tuple[PlannedIndicator, Dict[str, Any]]] = []
+            for step in steps:
+                params = step.definition.get("params") or {}
+                if (
+                    step.tf != tf
+                    or step.definition.get("type") not in BUILTIN_INDICATOR_TYPES
+                    or params.get("source", "close") not in available
+                ):
+                    continue
+                cache_definition = dict(step.cache_definition, chunking=options.cache_tag)
+                outputs = builtin_output_columns(step.definition)
+                if cache is not None and cache.restore(calc, tf, cache_definition):
+                    done[step.key] = outputs
+                else:
+                    batch.append((step, cache_definition))
+                available.update(outputs)
+            if not batch:
+                continue
+
+            try:
+                with span_of(self.profiler, "indicator_chunked"):
+                    result = calculate_chunked(
+                        calc, [step.definition for step, _ in batch], options, tf=tf
+                    )
+            except Exception as e:
+                logger.warning(f"[전략 파싱] 청크 계산 실패, 일반 계산으로 진행 (tf={tf}): {e}")
+                continue
+            if result is None:
+                continue
+
+            columns, report = result
+            self.indicator_chunk_reports.append(report)
+            if self.profiler is not None:
+                self.profiler.count("indicator_chunked_steps", len(batch))
+            for step, cache_definition in batch:
+                outputs = builtin_output_columns(step.definition)
+                for col in outputs:
+                    calc.set_column(col, columns[col])
+                if cache is not None:
+                    cache.capture(calc, tf, cache_definition, set(calc.columns) - set(outputs))
+                done[step.key] = outputs
+        return done
+
+    def _calculate_indicator_families(self, steps: List[PlannedIndicator]) -> Dict[str, List[str]]:
+        """
+        기간만 다른 내장 지표를 IndicatorCalculator.calculate_indicator_family로 묶어 계산
+
+        묶음 조건: 같은 TF / 타입 (FAMILY_INDICATOR_TYPES), period를 제외한 파라미터가
+        같고, source가 가격 컬럼(다른 지표 출력이 아님)이며, 캐시에 없는 지표가 2개 이상.
+        묶음 계산이 실패하면(데이터 부족 등) 해당 단계를 하나씩 계산해 같은 오류를 냅니다.
+
+        Args:
+            steps: 지표 계산 계획 단계
+
+        Returns:
+            Dict: 계산(또는 캐시 복원)이 끝난 단계의 정규화 키 → 출력 컬럼
+        """
+        groups: Dict[Tuple[str, str, str], List[PlannedIndicator]] = {}
+        for step in steps:
+            indicator_type = step.definition.get("type")
+            params = step.definition.get("params") or {}
+            period = params.get("period")
+            if (
+                indicator_type not in FAMILY_INDICATOR_TYPES
+                or step.source is not None
+                or step.tf not in self.indicator_calcs
+                or not isinstance(period, int)
+                or isinstance(period, bool)
+                or period <= 0
+                or params.get("source", "close") not in self.indicator_calcs[step.tf].columns
+            ):
+                continue
+            shared = {key: value for key, value in params.items() if key != "period"}
+            group_key = (step.tf, indicator_type, json.dumps(shared, sort_keys=True, default=str))
+            groups.setdefault(group_key, []).append(step)
+
+        done: Dict[str, List[str]] = {}
+        cache = self.indicator_cache
+        for (tf, indicator_type, _), group in groups.items():
+            if len(group) < 2:
+                continue
+            calc = self.indicator_calcs[tf]
+
+            pending = []
+            for step in group:
+                if cache is not None and cache.restore(calc, tf, step.cache_definition):
+                    done[step.key] = [step.indicator_id]
+                else:
+                    pending.append(step)
+            if len(pending) == 1:
+                # 캐시 복원을 이미 시도했으므로 여기서 바로 계산
+                self._calculate_step(calc, pending[0], set(calc.columns))
+                done[pending[0].key] = [pending[0].indicator_id]
+            if len(pending) < 2:
+                continue
+
+            params = pending[0].definition.get("params") or {}
+            try:
+                calc.calculate_indicator_family(
+                    indicator_type,
+                    [step.definition["params"]["period"] for step in pending],
+                    params={key: value for key, value in params.items() if key != "period"},
+                    indicator_ids=[step.indicator_id for step in pending],
+                )
+            except Exception as e:
+                logger.info(f"[전략 파싱] 지표 묶음 계산 불가, 개별 계산: {indicator_type}@{tf}: {e}")
+                for step in pending:
+                    self._calculate_step(calc, step, set(calc.columns))
+                    done[step.key] = [step.indicator_id]
+                continue
+
+            logger.info(
+                f"[전략 파싱] 지표 묶음 계산: type={indicator_type}, tf={tf}, "
+                f"ids={[step.indicator_id for step in pending]}"
+            )
+            for step in pending:
+                if cache is not None:
+                    columns_before = set(calc.columns)
+                    columns_before.discard(step.indicator_id)
+                    cache.capture(calc, tf, step.cache_definition, columns_before)
+                done[step.key] = [step.indicator_id]
+        return done
+
+    def _share_indicator_columns(
+        self,
+        calc: IndicatorCalculator,
+        step: PlannedIndicator,
+        columns_before: set
+    ) -> None:
+        """
+        동일 정의 지표(aliases)에 계산된 컬럼을 지표 ID만 바꿔 공유
+
+        지표 ID로 시작하지 않는 컬럼을 만든 지표(비정형 커스텀 지표)는
+        컬럼 이름을 바꿀 수 없으므로 alias마다 따로 계산합니다.
+        """
+        indicator_id = step.indicator_id
+        produced = [col for col in calc.columns if col not in columns_before]
+        if produced and all(str(col).startswith(indicator_id) for col in produced):
+            for alias in step.aliases:
+                for col in produced:
+                    calc.set_column(alias + str(col)[len(indicator_id):], calc.get_column(col))
+            return
+
+        for alias in step.aliases:
+            calc.calculate_indicator(dict(step.definition, id=alias))
+
     def create_strategy_function(self) -> Callable[[Bar], Optional[Dict[str, Any]]]:
         """
         백테스트 엔진이 사용할 전략 함수를 생성합니다.
@@ -347,21 +658,7 @@ class StrategyParser:
 
         @ 기호가 ref 내부에 이미 등장할 수 없다는 전제 (지표 ID는 영숫자+언더스코어).
         """
-        # @ 접미사 분리 (있으면 HTF, 없으면 base)
-        if "@" in ref:
-            main_ref, tf = ref.rsplit("@", 1)
-            tf = tf.strip()
-        else:
-            main_ref, tf = ref, BASE_TF
-
-        # 점(.) → 언더스코어(_) 변환 (기존 규칙)
-        if "." in main_ref:
-            parts = main_ref.rsplit(".", 1)
-            column_name = f"{parts[0]}_{parts[1]}"
-        else:
-            column_name = main_ref
-
-        return column_name, tf
+        return parse_indicator_ref(ref)
 
     def _resolve_tf_index(self, tf: str, base_index: int) -> Optional[int]:
         """base_index에서 TF별 유효 인덱스로 변환.
@@ -378,7 +675,7 @@ class StrategyParser:
             return None
         if base_index < 0 or base_index >= len(mapping):
             return None
-        htf_idx = mapping[base_index]
+        htf_idx = int(mapping[base_index])
         if htf_idx < 0:
             return None
         return htf_idx
@@ -425,7 +722,7 @@ class StrategyParser:
                 return value
             except ValueError as e:
                 available = [
-                    col for col in calc.df.columns
+                    col for col in calc.columns
                     if col not in ['open', 'high', 'low', 'close', 'volume', 'direction']
                 ]
                 logger.warning(
@@ -793,3 +1090,17 @@ class StrategyParser:
         
         return exit_checker
 
+
+    def compile_signals(self) -> "CompiledSignals":
+        """
+        진입/진출 조건과 손절가를 봉 루프 전에 배열로 미리 평가합니다.
+
+        create_strategy_function() / create_exit_checker()와 동일한 결과를
+        NumPy 마스크로 반환하므로, 엔진은 봉마다 조건 JSON을 해석하지 않습니다.
+
+        Returns:
+            CompiledSignals: BacktestEngine(compiled_signals=...)에 전달
+        """
+        from .signal_compiler import compile_strategy_signals
+
+        return compile_strategy_signals(self)
@@ -0,0 +1,84 @@
+"""
+테스트 공용 데이터 생성
+
+seed로 고정된 랜덤워크 OHLCV를 한 곳에서 생성합니다.
+- random_walk_frame: 지표 계산용 DataFrame (open, high, low, close, volume, direction)
+- random_walk_bars: 백테스트용 Bar 리스트 (같은 seed면 random_walk_frame과 같은 값)
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from engine.models.bar import Bar
+
+
+def random_walk_frame(
+    n: int,
+    seed: int = 7,
+    start_ts: int = 1_700_000_000,
+    step: int = 300,
+    volatility: float = 0.01
+) -> pd.DataFrame:
+    """
+    결정적 랜덤워크 OHLCV 생성 (기하 랜덤워크라 봉 수와 관계없이 가격은 항상 양수)
+
+    Args:
+        n: 봉 수
+        seed: 난수 seed
+        start_ts: 첫 봉 timestamp (Unix 초)
+        step: 봉 간격 (초)
+        volatility: 봉당 종가 로그 수익률 표준편차
+
+    Returns:
+        index: DatetimeIndex (BarArray.to_dataframe과 동일), columns: open, high, low, close, volume, direction
+        open은 직전 종가, high/low는 open/close를 감싸므로 Bar 검증을 통과합니다.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, volatility, n)))
+    open_ = np.concatenate(([100.0], close[:-1]))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, volatility / 2, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, volatility / 2, n)))
+    timestamps = start_ts + np.arange(n, dtype=np.int64) * step
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.uniform(100, 1000, n),
+            "direction": np.sign(close - open_).astype(np.int64),
+        },
+        index=pd.to_datetime(timestamps, unit="s"),
+    )
+
+
+def random_walk_bars(
+    n: int,
+    seed: int = 7,
+    start_ts: int = 1_700_000_000,
+    step: int = 300
+) -> List[Bar]:
+    """
+    random_walk_frame과 같은 값의 Bar 리스트
+
+    Args:
+        n: 봉 수
+        seed: 난수 seed
+        start_ts: 첫 봉 timestamp (Unix 초)
+        step: 봉 간격 (초)
+
+    Returns:
+        List[Bar]: timestamp 오름차순 봉 리스트
+    """
+    frame = random_walk_frame(n, seed=seed, start_ts=start_ts, step=step)
+    timestamps = start_ts + np.arange(n, dtype=np.int64) * step
+    return [
+        Bar(timestamp=int(ts), open=float(o), high=float(h), low=float(l),
+            close=float(c), volume=float(v), direction=int(d))
+        for ts, o, h, l, c, v, d in zip(
+            timestamps, frame["open"], frame["high"], frame["low"],
+            frame["close"], frame["volume"], frame["direction"]
+        )
+    ]
@@ -14,6 +14,8 @@ import shutil
 
 from apps.api.main import app
 from apps.api.db.database import Database
+from apps.api.routers import datasets as datasets_router
+from apps.api.routers import runs as runs_router
 
 
 class TestAPI:
@@ -37,6 +39,14 @@ class TestAPI:
             # 정리
             del test_db
     
+    @pytest.fixture(autouse=True)
+    def isolated_storage(self, tmp_path_factory, monkeypatch):
+        """업로드 CSV / 디스크 지표 캐시를 임시 디렉토리에 저장 (작업 트리의 datasets/에 쓰지 않음)"""
+        storage = tmp_path_factory.mktemp("storage")
+        monkeypatch.setattr(datasets_router, "DATASET_DIR", storage / "datasets")
+        monkeypatch.setattr(runs_router, "INDICATOR_CACHE_DIR", storage / "indicator_cache")
+        (storage / "datasets").mkdir()
+    
     @pytest.fixture
     def test_data_dir(self):
         """테스트 데이터 디렉토리"""
@@ -151,7 +161,90 @@ class TestAPI:
         # 삭제 확인
         get_response = client.get(f"/api/datasets/{dataset_id}")
         assert get_response.status_code == 404
-    
+
+    def test_dataset_ingest_job(self, client, test_data_dir):
+        """비동기 업로드 수집 작업 테스트"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            response = client.post(
+                "/api/datasets/ingest",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        # TestClient는 응답 전에 백그라운드 작업을 실행
+        job = client.get(f"/api/datasets/ingest/jobs/{job_id}").json()
+        assert job["status"] == "COMPLETED"
+        assert job["bytes_processed"] == job["bytes_total"] == csv_file.stat().st_size
+        assert job["rows_processed"] == job["bars_count"] > 0
+
+        dataset = client.get(f"/api/datasets/{job['dataset_id']}").json()
+        assert dataset["bars_count"] == job["bars_count"]
+
+        # 같은 파일을 다시 올리면 POST /datasets처럼 중복(409)으로 실패
+        with open(csv_file, "rb") as f:
+            response = client.post(
+                "/api/datasets/ingest",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Duplicate"}
+            )
+        duplicate = client.get(f"/api/datasets/ingest/jobs/{response.json()['job_id']}").json()
+        assert duplicate["status"] == "FAILED"
+        assert duplicate["status_code"] == 409
+        assert duplicate["details"] == {"existing_dataset_id": job["dataset_id"]}
+        assert duplicate["dataset_id"] is None
+        assert not list(datasets_router.DATASET_DIR.glob("temp_ingest_*"))
+
+        assert client.get("/api/datasets/ingest/jobs/unknown").status_code == 404
+
+    def test_dataset_ingest_job_cleans_up_when_register_fails(self, client, test_data_dir, monkeypatch):
+        """파일 이동 후 DB 등록이 실패하면 CSV / 사이드카를 남기지 않음"""
+        def fail_create(self, **kwargs):
+            raise RuntimeError("db is locked")
+
+        monkeypatch.setattr(datasets_router.DatasetRepository, "create", fail_create)
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            response = client.post(
+                "/api/datasets/ingest",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        job = client.get(f"/api/datasets/ingest/jobs/{response.json()['job_id']}").json()
+        assert job["status"] == "FAILED"
+        assert "db is locked" in job["error"]
+        assert list(datasets_router.DATASET_DIR.iterdir()) == []
+
+    def test_dataset_ingest_job_evicts_finished_jobs(self, client, test_data_dir, monkeypatch):
+        """보관 기간이 지난 끝난 작업은 새 작업 생성 시 정리"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            response = client.post(
+                "/api/datasets/ingest",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+        old_job_id = response.json()["job_id"]
+        assert client.get(f"/api/datasets/ingest/jobs/{old_job_id}").json()["status"] == "COMPLETED"
+
+        monkeypatch.setattr(datasets_router, "INGEST_JOB_RETENTION_SECONDS", -1)
+        with open(csv_file, "rb") as f:
+            response = client.post(
+                "/api/datasets/ingest",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Duplicate"}
+            )
+
+        assert client.get(f"/api/datasets/ingest/jobs/{old_job_id}").status_code == 404
+        assert client.get(f"/api/datasets/ingest/jobs/{response.json()['job_id']}").status_code == 200
+
     def test_strategy_create(self, client):
         """전략 생성 테스트"""
         strategy_data = {
@@ -344,6 +437,313 @@ class TestAPI:
         assert data["dataset_id"] == dataset_id
         assert data["strategy_id"] == strategy_id
 
+    def test_run_result_cache(self, client, test_data_dir):
+        """동일 입력 Run은 이전 결과를 복제하여 완료"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            dataset_response = client.post(
+                "/api/datasets",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        dataset_id = dataset_response.json()["dataset_id"]
+
+        strategy_data = {
+            "name": "Cache Strategy",
+            "definition": {
+                "indicators": [
+                    {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 3}}
+                ],
+                "entry": {
+                    "long": {"and": [
+                        {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+                    ]},
+                    "short": {"and": []}
+                },
+                "stop_loss": {"type": "fixed_percent", "percent": 1.5}
+            }
+        }
+        strategy_id = client.post("/api/strategies", json=strategy_data).json()["strategy_id"]
+
+        run_data = {"dataset_id": dataset_id, "strategy_id": strategy_id}
+        first_id = client.post("/api/runs", json=run_data).json()["run_id"]
+        second_id = client.post("/api/runs", json=run_data).json()["run_id"]
+
+        first = client.get(f"/api/runs/{first_id}").json()
+        second = client.get(f"/api/runs/{second_id}").json()
+
+        assert first["status"] == "COMPLETED"
+        assert "cache_hit" not in first["run_artifacts"]
+        assert second["status"] == "COMPLETED"
+        assert second["run_artifacts"]["cache_hit"] is True
+        assert second["run_artifacts"]["cached_from_run_id"] == first_id
+        assert second["progress_percent"] == 100.0
+
+        # trades / metrics가 원본과 동일
+        def strip_ids(trades):
+            return [
+                {k: v for k, v in t.items() if k not in ("trade_id", "run_id", "legs")}
+                | {"legs": [{k: v for k, v in leg.items() if k not in ("leg_id", "trade_id")}
+                            for leg in t["legs"]]}
+                for t in trades
+            ]
+
+        first_trades = client.get(f"/api/runs/{first_id}/trades").json()["trades"]
+        second_trades = client.get(f"/api/runs/{second_id}/trades").json()["trades"]
+        assert len(first_trades) > 0
+        assert strip_ids(second_trades) == strip_ids(first_trades)
+
+        first_metrics = client.get(f"/api/runs/{first_id}/metrics").json()
+        second_metrics = client.get(f"/api/runs/{second_id}/metrics").json()
+        for metrics in (first_metrics, second_metrics):
+            metrics.pop("run_id")
+            metrics.pop("metric_id")
+        assert second_metrics == first_metrics
+
+    def test_run_queue(self, client):
+        """Run 실행 대기열 조회 테스트"""
+        response = client.get("/api/runs/queue")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        # TestClient는 startup 이벤트를 실행하지 않으므로 실행기 비활성화 상태
+        assert data["executor_enabled"] is False
+        assert data["max_workers"] == 0
+        assert isinstance(data["running"], list)
+        assert isinstance(data["pending"], list)
+
+    def test_param_sweep(self, client, test_data_dir):
+        """파라미터 스윕: 조합 전개, 결과 저장, top-K 조회"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            dataset_response = client.post(
+                "/api/datasets",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        dataset_id = dataset_response.json()["dataset_id"]
+        template = {
+            "indicators": [
+                {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 3}}
+            ],
+            "entry": {
+                "long": {"and": [
+                    {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+                ]},
+                "short": {"and": []}
+            },
+            "stop_loss": {"type": "fixed_percent", "percent": 1.5}
+        }
+
+        # 존재하지 않는 경로는 400
+        response = client.post("/api/sweeps", json={
+            "dataset_id": dataset_id,
+            "strategy_template": template,
+            "param_space": {"indicators.missing.params.period": [3]}
+        })
+        assert response.status_code == 400
+
+        response = client.post("/api/sweeps", json={
+            "name": "EMA sweep",
+            "dataset_id": dataset_id,
+            "strategy_template": template,
+            "param_space": {
+                "indicators.ema_fast.params.period": {"start": 2, "stop": 4, "step": 1},
+                "preset.risk_reward_ratio": [1.5, 2.0]
+            }
+        })
+        assert response.status_code == 201
+        sweep_id = response.json()["sweep_id"]
+        assert response.json()["total_combinations"] == 6
+
+        sweep = client.get(f"/api/sweeps/{sweep_id}").json()
+        assert sweep["status"] == "COMPLETED", sweep["error"]
+        assert sweep["completed_combinations"] == 6
+
+        data = client.get(f"/api/sweeps/{sweep_id}/results?top_k=3&order_by=total_pnl").json()
+        results = data["results"]
+        assert len(results) == 3
+        pnls = [r["total_pnl"] for r in results]
+        assert pnls == sorted(pnls, reverse=True)
+        assert all(r["error"] is None for r in results)
+        assert set(results[0]["params"]) == {
+            "indicators.ema_fast.params.period", "preset.risk_reward_ratio"
+        }
+
+        assert client.get(f"/api/sweeps/{sweep_id}/results?order_by=bogus").status_code == 400
+        assert client.delete(f"/api/sweeps/{sweep_id}").status_code == 204
+        assert client.get(f"/api/sweeps/{sweep_id}").status_code == 404
+
+    def test_run_reprice(self, client, test_data_dir):
+        """완료된 Run을 다른 리스크 설정으로 재계산 (같은 설정이면 원래 Metrics와 동일)"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            dataset_response = client.post(
+                "/api/datasets",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        dataset_id = dataset_response.json()["dataset_id"]
+        strategy_data = {
+            "name": "Reprice Strategy",
+            "definition": {
+                "indicators": [
+                    {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 3}}
+                ],
+                "entry": {
+                    "long": {"and": [
+                        {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+                    ]},
+                    "short": {"and": []}
+                },
+                "stop_loss": {"type": "fixed_percent", "percent": 1.5}
+            }
+        }
+        strategy_id = client.post("/api/strategies", json=strategy_data).json()["strategy_id"]
+        run_id = client.post(
+            "/api/runs", json={"dataset_id": dataset_id, "strategy_id": strategy_id}
+        ).json()["run_id"]
+
+        run = client.get(f"/api/runs/{run_id}").json()
+        assert run["status"] == "COMPLETED"
+        preset = client.get(f"/api/presets/{run['preset_id']}").json()
+        metrics = client.get(f"/api/runs/{run_id}/metrics").json()
+
+        response = client.post(f"/api/runs/{run_id}/reprice", json={"variants": [
+            {"risk_percent": preset["risk_percent"], "rebalance_interval": preset["rebalance_interval"]},
+            {"risk_percent": 0.05, "rebalance_interval": 1, "initial_balance": 5000.0},
+        ]})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["trades_count"] == metrics["trades_count"]
+
+        same, other = data["results"]
+        assert same["error"] is None
+        assert same["initial_balance"] == run["initial_balance"]
+        for key, value in same["metrics"].items():
+            assert metrics[key] == value, key
+        assert other["metrics"]["trades_count"] == metrics["trades_count"]
+        assert other["metrics"]["win_rate"] == metrics["win_rate"]
+
+        # 원래 Run 결과는 변경되지 않음
+        assert client.get(f"/api/runs/{run_id}/metrics").json() == metrics
+
+        assert client.post(f"/api/runs/{run_id}/reprice", json={"variants": []}).status_code == 422
+        assert client.post("/api/runs/999999/reprice", json={"variants": [
+            {"risk_percent": 0.02, "rebalance_interval": 50}
+        ]}).status_code == 404
+
+    def test_run_profile(self, client, test_data_dir):
+        """Run 실행 프로파일: 단계별 시간, 카운터, bars/sec"""
+        csv_file = test_data_dir / "test_data_A.csv"
+
+        with open(csv_file, "rb") as f:
+            dataset_response = client.post(
+                "/api/datasets",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            )
+
+        dataset_id = dataset_response.json()["dataset_id"]
+        strategy_data = {
+            "name": "Profile Strategy",
+            "definition": {
+                "indicators": [
+                    {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 4}}
+                ],
+                "entry": {
+                    "long": {"and": [
+                        {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+                    ]},
+                    "short": {"and": []}
+                },
+                "stop_loss": {"type": "fixed_percent", "percent": 1.5}
+            }
+        }
+        strategy_id = client.post("/api/strategies", json=strategy_data).json()["strategy_id"]
+        run_data = {"dataset_id": dataset_id, "strategy_id": strategy_id}
+        run_id = client.post("/api/runs", json=run_data).json()["run_id"]
+
+        response = client.get(f"/api/runs/{run_id}/profile")
+        assert response.status_code == 200
+        profile = response.json()
+
+        assert profile["cache_hit"] is False
+        for span in ("load_csv", "custom_indicator_load", "indicator_calculation",
+                     "signal_compile", "engine_run", "persist_trades", "metrics"):
+            assert profile["spans"][span] >= 0, span
+
+        run = client.get(f"/api/runs/{run_id}").json()
+        counters = profile["counters"]
+        assert counters["bars"] == run["total_bars"]
+        assert 0 < counters["processed_bars"] <= counters["bars"]
+        # 컴파일된 신호를 사용하므로 strategy_func는 호출되지 않음
+        assert counters["strategy_func_calls"] == 0
+        assert counters["trades"] == run["run_artifacts"]["trades_count"]
+        assert counters["db_writes"] > counters["trades"]
+        assert profile["bars_per_second"] > 0
+        assert profile["total_seconds"] >= profile["spans"]["engine_run"]
+
+        # 캐시 적중 Run은 캐시 조회 / 복제 단계만 기록
+        cached_id = client.post("/api/runs", json=run_data).json()["run_id"]
+        cached = client.get(f"/api/runs/{cached_id}/profile").json()
+        assert cached["cache_hit"] is True
+        assert set(cached["spans"]) == {"cache_lookup", "clone_results"}
+
+        assert client.get("/api/runs/999999/profile").status_code == 404
+
+    def test_indicator_disk_cache(self, client, test_data_dir, tmp_path, monkeypatch):
+        """디스크 지표 캐시: 다른 전략이라도 같은 데이터셋 / 지표면 재사용"""
+        monkeypatch.setattr(runs_router, "INDICATOR_CACHE_DIR", tmp_path)
+
+        csv_file = test_data_dir / "test_data_A.csv"
+        with open(csv_file, "rb") as f:
+            dataset_id = client.post(
+                "/api/datasets",
+                files={"file": ("test_data_A.csv", f, "text/csv")},
+                data={"name": "Test Dataset A"}
+            ).json()["dataset_id"]
+
+        def create_run(stop_percent):
+            strategy_id = client.post("/api/strategies", json={
+                "name": f"Disk Cache Strategy {stop_percent}",
+                "definition": {
+                    "indicators": [
+                        {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 4}}
+                    ],
+                    "entry": {
+                        "long": {"and": [
+                            {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+                        ]},
+                        "short": {"and": []}
+                    },
+                    "stop_loss": {"type": "fixed_percent", "percent": stop_percent}
+                }
+            }).json()["strategy_id"]
+            run_id = client.post(
+                "/api/runs", json={"dataset_id": dataset_id, "strategy_id": strategy_id}
+            ).json()["run_id"]
+            return client.get(f"/api/runs/{run_id}/profile").json()["counters"]
+
+        first = create_run(1.5)
+        assert (first["indicator_cache_hits"], first["indicator_cache_misses"]) == (0, 1)
+        assert len([p for p in tmp_path.iterdir() if p.is_dir()]) == 1
+
+        # 전략 해시가 달라 결과 캐시는 미스지만 지표는 디스크에서 재사용
+        second = create_run(2.0)
+        assert (second["indicator_cache_hits"], second["indicator_cache_misses"]) == (1, 0)
+
+        monkeypatch.setenv("ALGOFORGE_INDICATOR_CACHE_MB", "0")
+        disabled = create_run(2.5)
+        assert "indicator_cache_hits" not in disabled
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
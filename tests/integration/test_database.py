@@ -17,11 +17,15 @@ from apps.api.db.repositories import (
     RunRepository,
     TradeRepository,
     TradeLegRepository,
-    MetricsRepository
+    MetricsRepository,
+    SweepRepository,
+    SweepResultRepository
 )
 from apps.api.db.utils import (
     calculate_dataset_hash,
     calculate_strategy_hash,
+    calculate_leverage_table_hash,
+    calculate_run_cache_key,
     load_bars_from_csv,
     validate_bars,
     save_bars_to_csv,
@@ -490,6 +494,28 @@ class TestRepositories:
         assert db_metrics['win_rate'] == 0.7
         assert db_metrics['grade'] == 'A'
 
+    def test_sweep_result_top_skips_missing_metrics(self, temp_db):
+        """SweepResultRepository.get_top: 지표 값이 없는 결과는 정렬 방향과 무관하게 맨 뒤"""
+        dataset_id = DatasetRepository(temp_db).create(
+            name="Test", dataset_hash="hash", file_path="/path",
+            bars_count=100, start_timestamp=1000, end_timestamp=2000
+        )
+        sweep_id = SweepRepository(temp_db).create(
+            dataset_id=dataset_id, strategy_template={}, param_space={},
+            initial_balance=1000.0, engine_version="1.0.0", total_combinations=3
+        )
+        result_repo = SweepResultRepository(temp_db)
+        result_repo.add_batch(sweep_id, [
+            {"combo_index": 0, "params": {}, "metrics": {"trades_count": 0}, "error": None},
+            {"combo_index": 1, "params": {}, "metrics": {"trades_count": 5, "max_drawdown": 30.0, "score": 1.0}, "error": None},
+            {"combo_index": 2, "params": {}, "metrics": {"trades_count": 5, "max_drawdown": 10.0, "score": 2.0}, "error": None},
+        ])
+
+        by_drawdown = result_repo.get_top(sweep_id, order_by="max_drawdown")
+        assert [r["combo_index"] for r in by_drawdown] == [2, 1, 0]
+        by_score = result_repo.get_top(sweep_id, order_by="score")
+        assert [r["combo_index"] for r in by_score] == [2, 1, 0]
+
 
 class TestUtils:
     """유틸리티 함수 테스트"""
@@ -544,6 +570,52 @@ class TestUtils:
         hash3 = calculate_strategy_hash(def3)
         assert hash1 != hash3
     
+    def test_calculate_run_cache_key(self):
+        """Run 결과 캐시 키 계산 테스트"""
+        brackets = [
+            {'bracket_id': 2, 'bracket_min': 5000.0, 'bracket_max': 10000.0,
+             'max_leverage': 50.0, 'm_margin_rate': 0.01, 'm_amount': 25.0, 'created_at': 2},
+            {'bracket_id': 1, 'bracket_min': 0.0, 'bracket_max': 5000.0,
+             'max_leverage': 75.0, 'm_margin_rate': 0.005, 'm_amount': 0.0, 'created_at': 1},
+        ]
+        # bracket_id / created_at / 순서와 무관
+        reordered = [dict(b, bracket_id=b['bracket_id'] + 10, created_at=0) for b in reversed(brackets)]
+        assert calculate_leverage_table_hash(brackets) == calculate_leverage_table_hash(reordered)
+
+        preset = {'risk_percent': 0.02, 'risk_reward_ratio': 1.5, 'rebalance_interval': 50,
+                  'name': 'Default', 'preset_id': 1}
+        base_args = dict(
+            dataset_hashes={'base': 'ds_hash', '1h': 'htf_hash'},
+            strategy_hash='strat_hash',
+            preset=preset,
+            initial_balance=1000.0,
+            leverage_table_hash=calculate_leverage_table_hash(brackets),
+            engine_version='1.0.0'
+        )
+        key = calculate_run_cache_key(**base_args)
+
+        # 리스크 파라미터 외 프리셋 필드는 키에 영향 없음
+        assert calculate_run_cache_key(**dict(base_args, preset=dict(preset, name='Other', preset_id=2))) == key
+
+        # 결과에 영향을 주는 입력이 다르면 다른 키
+        changed = [
+            dict(base_args, dataset_hashes={'base': 'ds_hash'}),
+            dict(base_args, strategy_hash='other'),
+            dict(base_args, preset=dict(preset, risk_percent=0.01)),
+            dict(base_args, initial_balance=2000.0),
+            dict(base_args, leverage_table_hash='other'),
+            dict(base_args, engine_version='1.0.1'),
+            dict(base_args, custom_indicator_hashes={'my_ind': 'code_v1'}),
+        ]
+        for args in changed:
+            assert calculate_run_cache_key(**args) != key
+
+        # 커스텀 지표 코드가 바뀌면 다른 키 (커스텀 지표가 없으면 기존 키 유지)
+        assert calculate_run_cache_key(**dict(base_args, custom_indicator_hashes={})) == key
+        v1 = calculate_run_cache_key(**dict(base_args, custom_indicator_hashes={'my_ind': 'code_v1'}))
+        v2 = calculate_run_cache_key(**dict(base_args, custom_indicator_hashes={'my_ind': 'code_v2'}))
+        assert v1 != v2
+
     def test_validate_bars(self):
         """봉 데이터 검증 테스트"""
         # 정상 케이스
@@ -0,0 +1,298 @@
+"""
+Run 실행기(프로세스 풀) 통합 테스트
+
+검증 포인트:
+  1) 대기열 순서: priority 내림차순 → queued_at → run_id
+  2) claim_for_execution은 PENDING Run에 대해 한 번만 성공
+  3) 워커 프로세스에서 대기열의 Run이 모두 완료되고, 대기 중 취소된 Run은 실행되지 않음
+  4) RUNNING으로 남은 Run / 스윕은 시작 시 복구되어 다시 실행됨
+     (스윕은 결과가 없는 조합만 같은 워커 풀에서 평가)
+  5) 리더 잠금을 잡은 프로세스만 실행기를 실행 (대기 모드는 복구하지 않고 잠금 해제 시 승계)
+  6) API로 만든 스윕의 조합 청크가 여러 워커 프로세스에 나뉘어 평가됨
+"""
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.api.db.database import Database, get_database
+from apps.api.db.repositories import (
+    DatasetRepository,
+    StrategyRepository,
+    RunRepository,
+    SweepRepository,
+    SweepResultRepository,
+    TradeRepository
+)
+from apps.api.db.utils import load_bars_from_csv, calculate_dataset_hash
+from apps.api import run_executor
+from apps.api.main import app
+from apps.api.run_executor import (
+    ExecutorLeaderLock,
+    RunExecutor,
+    DEFAULT_RUN_WORKERS,
+    get_configured_workers,
+    get_run_executor,
+    run_executor_enabled,
+    start_run_executor,
+    stop_run_executor,
+    RUN_WORKERS_ENV
+)
+
+
+FIXTURE_CSV = Path(__file__).parent.parent / "fixtures" / "test_data_A.csv"
+
+STRATEGY_DEFINITION = {
+    "indicators": [
+        {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 3}}
+    ],
+    "entry": {
+        "long": {"and": [
+            {"left": {"price": "close"}, "op": ">", "right": {"ref": "ema_fast"}}
+        ]},
+        "short": {"and": []}
+    },
+    "stop_loss": {"type": "fixed_percent", "percent": 1.5}
+}
+
+
+@pytest.fixture
+def temp_db():
+    """임시 데이터베이스 생성"""
+    temp_dir = tempfile.mkdtemp()
+    db = Database(str(Path(temp_dir) / "test.db"))
+    yield db
+    shutil.rmtree(temp_dir)
+
+
+def _create_dataset_and_strategy(db: Database):
+    # 실행 시 사이드카가 CSV 옆에 생성되므로 픽스처 대신 임시 디렉토리의 복사본 사용
+    csv_path = Path(db.db_path).parent / FIXTURE_CSV.name
+    shutil.copyfile(FIXTURE_CSV, csv_path)
+    bars, _ = load_bars_from_csv(str(csv_path))
+    dataset_id = DatasetRepository(db).create(
+        name="Test", dataset_hash=calculate_dataset_hash(bars), file_path=str(csv_path),
+        bars_count=len(bars), start_timestamp=bars[0].timestamp, end_timestamp=bars[-1].timestamp
+    )
+    strategy_id = StrategyRepository(db).create(
+        name="Test", strategy_hash="strat_hash", definition=STRATEGY_DEFINITION
+    )
+    return dataset_id, strategy_id
+
+
+def _wait_for_status(repo, ids, statuses, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        rows = [repo.get_by_id(row_id) for row_id in ids]
+        if all(row["status"] in statuses for row in rows):
+            return rows
+        time.sleep(0.1)
+    raise AssertionError(f"완료 대기 시간 초과: {[repo.get_by_id(i)['status'] for i in ids]}")
+
+
+@pytest.mark.unit
+def test_pending_queue_order_and_claim(temp_db):
+    dataset_id, strategy_id = _create_dataset_and_strategy(temp_db)
+    run_repo = RunRepository(temp_db)
+
+    def create(priority):
+        return run_repo.create(
+            dataset_id=dataset_id, strategy_id=strategy_id,
+            engine_version="1.0.0", initial_balance=1000.0, priority=priority
+        )
+
+    low, high, normal_a, normal_b = create(-1), create(5), create(0), create(0)
+    queue = [run["run_id"] for run in run_repo.get_pending_queue()]
+    assert queue == [high, normal_a, normal_b, low]
+    assert [run["run_id"] for run in run_repo.get_pending_queue(limit=2)] == [high, normal_a]
+
+    # 재실행은 같은 우선순위의 맨 뒤로
+    temp_db.execute_update("UPDATE runs SET queued_at = 0 WHERE run_id = ?", (normal_b,))
+    assert [run["run_id"] for run in run_repo.get_pending_queue()][1] == normal_b
+    run_repo.reset_for_rerun(normal_b)
+    assert [run["run_id"] for run in run_repo.get_pending_queue()][1:3] == [normal_a, normal_b]
+
+    # PENDING → RUNNING 전환은 한 번만 성공
+    assert run_repo.claim_for_execution(high, started_at=1) is True
+    assert run_repo.claim_for_execution(high, started_at=2) is False
+    assert run_repo.get_by_id(high)["status"] == "RUNNING"
+    assert run_repo.get_by_id(high)["started_at"] == 1
+    assert high not in [run["run_id"] for run in run_repo.get_pending_queue()]
+
+
+@pytest.mark.unit
+def test_configured_workers(monkeypatch):
+    monkeypatch.setenv(RUN_WORKERS_ENV, "3")
+    assert get_configured_workers() == 3
+    monkeypatch.setenv(RUN_WORKERS_ENV, "0")
+    assert get_configured_workers() == 0
+    monkeypatch.setenv(RUN_WORKERS_ENV, "-1")
+    with pytest.raises(ValueError):
+        get_configured_workers()
+    monkeypatch.delenv(RUN_WORKERS_ENV)
+    assert get_configured_workers() == min(DEFAULT_RUN_WORKERS, os.cpu_count() or 1)
+
+
+@pytest.mark.unit
+def test_leader_lock_is_exclusive(temp_db):
+    first = ExecutorLeaderLock(temp_db.db_path)
+    second = ExecutorLeaderLock(temp_db.db_path)
+
+    assert first.try_acquire() is True
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+
+    first.release()
+    assert second.try_acquire() is True
+    second.release()
+
+
+@pytest.mark.unit
+def test_standby_process_leaves_runs_to_leader(temp_db, monkeypatch):
+    monkeypatch.setattr(run_executor, "LEADER_RETRY_SECONDS", 0.05)
+    dataset_id, strategy_id = _create_dataset_and_strategy(temp_db)
+    run_repo = RunRepository(temp_db)
+    run_id = run_repo.create(dataset_id=dataset_id, strategy_id=strategy_id,
+                             engine_version="1.0.0", initial_balance=1000.0)
+    run_repo.claim_for_execution(run_id, started_at=int(time.time()))
+
+    # 다른 API 프로세스가 리더인 상태
+    leader = ExecutorLeaderLock(temp_db.db_path)
+    assert leader.try_acquire()
+    try:
+        assert start_run_executor(temp_db.db_path, max_workers=1) is None
+        assert run_executor_enabled() is True
+        assert get_run_executor() is None
+        # 리더가 실행 중인 Run을 대기 모드 프로세스가 되돌리지 않음
+        assert run_repo.get_by_id(run_id)["status"] == "RUNNING"
+
+        run_repo.update_status(run_id, status="CANCELLED")
+        leader.release()
+
+        # 리더 종료 후 잠금 승계
+        deadline = time.time() + 10
+        while get_run_executor() is None and time.time() < deadline:
+            time.sleep(0.05)
+        assert get_run_executor() is not None
+        assert leader.try_acquire() is False
+    finally:
+        stop_run_executor(wait=True)
+        run_executor._leader_lock.release()
+        leader.release()
+
+    assert run_executor_enabled() is False
+
+
+@pytest.mark.slow
+def test_executor_runs_queue_in_worker_processes(temp_db, monkeypatch):
+    # 워커 프로세스는 환경변수를 물려받으므로 디스크 지표 캐시(datasets/ 아래)를 끔
+    monkeypatch.setenv("ALGOFORGE_INDICATOR_CACHE_MB", "0")
+    dataset_id, strategy_id = _create_dataset_and_strategy(temp_db)
+    run_repo = RunRepository(temp_db)
+
+    run_ids = [
+        run_repo.create(dataset_id=dataset_id, strategy_id=strategy_id,
+                        engine_version="1.0.0", initial_balance=balance)
+        for balance in (1000.0, 2000.0, 3000.0)
+    ]
+    cancelled_id = run_repo.create(dataset_id=dataset_id, strategy_id=strategy_id,
+                                   engine_version="1.0.0", initial_balance=4000.0)
+    run_repo.update_status(cancelled_id, status="CANCELLED")
+
+    # 이전 프로세스가 실행 도중 종료된 Run (부분 저장된 trade 포함)
+    interrupted_id = run_repo.create(dataset_id=dataset_id, strategy_id=strategy_id,
+                                     engine_version="1.0.0", initial_balance=5000.0)
+    run_repo.claim_for_execution(interrupted_id, started_at=int(time.time()))
+    temp_db.execute_insert(
+        "INSERT INTO trades (run_id, direction, entry_timestamp, entry_price, position_size, "
+        "initial_risk, stop_loss, take_profit_1) VALUES (?, 'LONG', 0, 1.0, 1.0, 1.0, 0.5, 2.0)",
+        (interrupted_id,)
+    )
+
+    # 대기 중인 스윕과 이전 프로세스가 실행 도중 종료된 스윕 (조합 결과 일부 저장)
+    sweep_repo = SweepRepository(temp_db)
+    sweep_ids = [
+        sweep_repo.create(
+            dataset_id=dataset_id, strategy_template=STRATEGY_DEFINITION,
+            param_space={"indicators.ema_fast.params.period": [2, 3, 4]},
+            initial_balance=1000.0, engine_version="1.0.0", total_combinations=3
+        )
+        for _ in range(2)
+    ]
+    sweep_repo.claim_for_execution(sweep_ids[1], started_at=int(time.time()))
+    SweepResultRepository(temp_db).add_batch(sweep_ids[1], [
+        {"combo_index": 0, "params": {"indicators.ema_fast.params.period": 2}, "metrics": None, "error": None}
+    ])
+
+    executor = RunExecutor(temp_db.db_path, max_workers=2)
+    try:
+        executor.start()
+        runs = _wait_for_status(run_repo, run_ids + [interrupted_id], {"COMPLETED", "FAILED"})
+        sweeps = _wait_for_status(sweep_repo, sweep_ids, {"COMPLETED", "FAILED"})
+    finally:
+        executor.shutdown(wait=True)
+
+    for sweep in sweeps:
+        assert sweep["status"] == "COMPLETED", sweep["error"]
+        assert sweep["completed_combinations"] == 3
+        result_repo = SweepResultRepository(temp_db)
+        assert result_repo.get_combo_indices(sweep["sweep_id"]) == [0, 1, 2]
+        # 중단된 스윕은 저장된 조합(0번, Metrics 없음)을 다시 평가하지 않음
+        results = result_repo.get_top(sweep["sweep_id"], top_k=10)
+        expected = [1, 2] if sweep["sweep_id"] == sweep_ids[1] else [0, 1, 2]
+        assert sorted(r["combo_index"] for r in results) == expected
+        assert all(r["error"] is None and r["total_pnl"] is not None for r in results)
+
+    for run in runs:
+        assert run["status"] == "COMPLETED", run["run_artifacts"]
+        assert run["progress_percent"] == 100.0
+        trades = TradeRepository(temp_db).get_by_run(run["run_id"])
+        assert len(trades) == run["run_artifacts"]["trades_count"]
+
+    assert run_repo.get_by_id(cancelled_id)["status"] == "CANCELLED"
+    assert executor.status()["running_run_ids"] == []
+    assert executor.status()["running_sweep_ids"] == []
+
+
+@pytest.mark.slow
+def test_api_sweep_runs_on_multiple_worker_processes(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("ALGOFORGE_INDICATOR_CACHE_MB", "0")
+    monkeypatch.setenv("ALGOFORGE_TEST_DB_PATH", str(tmp_path / "api.db"))
+    db = get_database()
+    dataset_id, _ = _create_dataset_and_strategy(db)
+
+    caplog.set_level(logging.INFO, logger=run_executor.__name__)
+    start_run_executor(db.db_path, max_workers=2)
+    try:
+        response = TestClient(app).post("/api/sweeps", json={
+            "dataset_id": dataset_id,
+            "strategy_template": STRATEGY_DEFINITION,
+            "param_space": {
+                "indicators.ema_fast.params.period": {"start": 2, "stop": 9, "step": 1},
+                "preset.risk_reward_ratio": [1.5, 2.0]
+            }
+        })
+        assert response.status_code == 201
+        sweep_id = response.json()["sweep_id"]
+        sweep = _wait_for_status(SweepRepository(db), [sweep_id], {"COMPLETED", "FAILED"})[0]
+    finally:
+        stop_run_executor(wait=True)
+        run_executor._leader_lock.release()
+
+    assert sweep["status"] == "COMPLETED", sweep["error"]
+    assert sweep["completed_combinations"] == 16
+
+    pattern = re.compile(rf"Sweep chunk finished: sweep_id={sweep_id}, .*worker_pid=(\d+)")
+    pids = {
+        int(match.group(1))
+        for record in caplog.records
+        if (match := pattern.search(record.getMessage()))
+    }
+    assert len(pids) > 1
@@ -0,0 +1,226 @@
+"""
+BarArray(컬럼형 봉 배열) 단위 테스트
+
+핵심 검증 포인트:
+  1) Bar.__post_init__과 동일한 검증 규칙/메시지 (벡터화)
+  2) List[Bar] 호환 접근 (인덱스, 음수 인덱스, 슬라이스, 순회)
+  3) DataFrame 뷰가 OHLCV 배열을 복사 없이 공유
+  4) load_bars_from_csv → BarArray, 기존 결과와 동일
+  5) load_dataset_bars: 사이드카 백필 / memmap 재사용 / CSV 변경 시 재생성
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.db import utils as db_utils
+from apps.api.db.utils import (
+    dataset_sidecar_path,
+    load_bars_from_csv,
+    load_dataset_bars,
+    remove_dataset_sidecar,
+    save_bars_to_csv,
+    validate_bars,
+)
+from engine.models import Bar, BarArray
+from engine.models.bar_array import find_invalid_bar
+
+
+def _bars(n: int = 5):
+    return [
+        Bar(timestamp=1000 + i * 60, open=100.0 + i, high=102.0 + i,
+            low=99.0 + i, close=101.0 + i, volume=10.0 * i, direction=1)
+        for i in range(n)
+    ]
+
+
+@pytest.mark.unit
+def test_from_bars_roundtrip():
+    bars = _bars()
+    arr = BarArray.from_bars(bars)
+
+    assert len(arr) == len(bars)
+    assert arr.to_bars() == bars
+    assert arr[0] == bars[0]
+    assert arr[-1] == bars[-1]
+    assert list(arr[1:3]) == bars[1:3]
+    assert arr.timestamps.dtype == np.int64
+    assert arr.ohlcv.dtype == np.float64
+    assert arr.direction.dtype == np.int8
+
+
+@pytest.mark.unit
+def test_index_out_of_range():
+    arr = BarArray.from_bars(_bars(2))
+    with pytest.raises(IndexError):
+        arr[2]
+    with pytest.raises(IndexError):
+        arr[-3]
+
+
+@pytest.mark.unit
+def test_arrays_are_read_only():
+    arr = BarArray.from_bars(_bars())
+    with pytest.raises(ValueError):
+        arr.close[0] = 1.0
+
+
+@pytest.mark.unit
+def test_dataframe_view_shares_ohlcv_memory():
+    arr = BarArray.from_bars(_bars())
+    df = arr.to_dataframe()
+
+    assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume', 'direction']
+    for col in ('open', 'high', 'low', 'close', 'volume'):
+        assert np.shares_memory(df[col].to_numpy(), arr.ohlcv)
+    assert df['direction'].dtype == np.int64
+    assert df.index[0].value == 1000 * 10**9
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("timestamp", -1),
+        ("high", 98.0),
+        ("open", 200.0),
+        ("close", 50.0),
+        ("volume", -1.0),
+        ("direction", 2),
+    ],
+)
+def test_vectorized_validation_matches_bar(field, value):
+    """벡터화 검증 메시지가 Bar.__post_init__과 동일"""
+    kwargs = dict(timestamp=1000, open=100.0, high=102.0, low=99.0,
+                  close=101.0, volume=1.0, direction=1)
+    kwargs[field] = value
+    with pytest.raises(ValueError) as bar_error:
+        Bar(**kwargs)
+
+    good = _bars(3)
+    columns = {
+        "timestamp": [b.timestamp for b in good] + [kwargs["timestamp"]],
+        "open": [b.open for b in good] + [kwargs["open"]],
+        "high": [b.high for b in good] + [kwargs["high"]],
+        "low": [b.low for b in good] + [kwargs["low"]],
+        "close": [b.close for b in good] + [kwargs["close"]],
+        "volume": [b.volume for b in good] + [kwargs["volume"]],
+        "direction": [b.direction for b in good] + [kwargs["direction"]],
+    }
+    invalid = find_invalid_bar(
+        np.asarray(columns["timestamp"]),
+        np.array([columns[c] for c in ("open", "high", "low", "close", "volume")]),
+        np.asarray(columns["direction"]),
+    )
+    assert invalid == (3, str(bar_error.value))
+
+    with pytest.raises(ValueError, match="index 3"):
+        BarArray(
+            columns["timestamp"], columns["open"], columns["high"], columns["low"],
+            columns["close"], columns["volume"], columns["direction"],
+        )
+
+
+@pytest.mark.unit
+def test_sorted_by_timestamp_is_stable():
+    bars = _bars(4)
+    shuffled = BarArray.from_bars([bars[2], bars[0], bars[3], bars[1]])
+    assert shuffled.sorted_by_timestamp().to_bars() == bars
+    ordered = BarArray.from_bars(bars)
+    assert ordered.sorted_by_timestamp() is ordered
+
+
+@pytest.mark.unit
+def test_load_bars_from_csv_returns_bar_array(tmp_path):
+    bars = _bars(10)
+    csv_path = tmp_path / "bars.csv"
+    save_bars_to_csv(bars, str(csv_path))
+
+    loaded, df, metadata = load_bars_from_csv(str(csv_path), include_df=True)
+
+    assert isinstance(loaded, BarArray)
+    assert loaded.to_bars() == bars
+    assert np.shares_memory(df['close'].to_numpy(), loaded.ohlcv)
+    assert metadata == {
+        'bars_count': 10,
+        'start_timestamp': bars[0].timestamp,
+        'end_timestamp': bars[-1].timestamp,
+    }
+    assert validate_bars(loaded) == (True, [])
+
+
+@pytest.mark.unit
+def test_load_bars_from_csv_reports_csv_row(tmp_path):
+    """검증 오류 행 번호는 헤더 포함 CSV 행 기준 (기존과 동일)"""
+    csv_path = tmp_path / "bad.csv"
+    csv_path.write_text(
+        "dt,do,dh,dl,dc,dv,dd\n"
+        "2024-01-01 09:00:00,100,102,99,101,1,1\n"
+        "2024-01-01 09:01:00,100,98,99,101,1,1\n"
+        "2024-01-01 09:02:00,abc,102,99,101,1,1\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match=r"행 3\): high는 low보다"):
+        load_bars_from_csv(str(csv_path))
+
+
+@pytest.mark.unit
+def test_load_bars_from_csv_reports_parse_error_row(tmp_path):
+    csv_path = tmp_path / "bad.csv"
+    csv_path.write_text(
+        "dt,do,dh,dl,dc,dv,dd\n"
+        "2024-01-01 09:00:00,100,102,99,101,1,1\n"
+        "2024-01-01 09:02:00,abc,102,99,101,1,1\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(ValueError, match=r"행 3\)"):
+        load_bars_from_csv(str(csv_path))
+
+
+@pytest.mark.unit
+def test_load_dataset_bars_backfills_and_reuses_sidecar(tmp_path, monkeypatch):
+    bars = _bars(10)
+    csv_path = tmp_path / "abc123.csv"
+    save_bars_to_csv(bars, str(csv_path))
+    sidecar = dataset_sidecar_path(csv_path)
+    assert sidecar == tmp_path / "abc123.bars"
+
+    # 첫 로드: CSV 파싱 후 사이드카 백필
+    first, df, metadata = load_dataset_bars(str(csv_path), include_df=True)
+    assert sidecar.is_dir()
+    assert first.to_bars() == bars
+    assert metadata == load_bars_from_csv(str(csv_path))[1]
+
+    # 두 번째 로드: CSV를 읽지 않고 memmap으로 열기
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("CSV 파싱 불필요")
+
+    monkeypatch.setattr(db_utils, "load_bars_from_csv", fail_parse)
+    second, df2, metadata2 = load_dataset_bars(str(csv_path), include_df=True)
+    assert isinstance(second.ohlcv, np.memmap)
+    assert second.to_bars() == bars
+    assert metadata2 == metadata
+    pd.testing.assert_frame_equal(df2, df)
+
+
+@pytest.mark.unit
+def test_load_dataset_bars_rebuilds_stale_sidecar(tmp_path):
+    csv_path = tmp_path / "abc123.csv"
+    save_bars_to_csv(_bars(10), str(csv_path))
+    load_dataset_bars(str(csv_path))
+
+    # CSV가 바뀌면(크기 / 수정 시각 불일치) 사이드카를 다시 생성
+    save_bars_to_csv(_bars(6), str(csv_path))
+    bars, metadata = load_dataset_bars(str(csv_path))
+    assert len(bars) == 6 and metadata["bars_count"] == 6
+
+    remove_dataset_sidecar(csv_path)
+    assert not dataset_sidecar_path(csv_path).exists()
@@ -0,0 +1,99 @@
+"""
+CSV 로더 벡터화 경로 동등성 테스트
+
+핵심 검증 포인트:
+  1) tests/fixtures의 CSV: 벡터화 로더와 행 단위 참조 로더(csv.DictReader + Bar)의 배열 / 메타데이터가 비트 단위로 동일
+  2) 잘못된 CSV: 두 로더가 같은 예외 타입 / 메시지 / 행 번호
+  3) 정상 CSV는 행 단위 파서를 거치지 않음
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.db import utils as db_utils
+from apps.api.db.utils import load_bars_from_csv, load_bars_from_csv_reference
+from engine.models.bar_array import BarArray
+
+FIXTURES = sorted((project_root / "tests" / "fixtures").glob("*.csv"))
+
+HEADER = "dt,do,dh,dl,dc,dv,dd\n"
+GOOD_ROW = "2024-01-01 09:00:00,100,102,99,101,1,1\n"
+
+
+def _assert_same_bars(path: Path):
+    bars, df, metadata = load_bars_from_csv(str(path), include_df=True)
+    ref_bar_list, ref_df, ref_metadata = load_bars_from_csv_reference(str(path), include_df=True)
+    ref_bars = BarArray.from_bars(ref_bar_list)
+
+    np.testing.assert_array_equal(bars.timestamps, ref_bars.timestamps)
+    assert bars.ohlcv.tobytes() == ref_bars.ohlcv.tobytes()
+    np.testing.assert_array_equal(bars.direction, ref_bars.direction)
+    assert metadata == ref_metadata
+    assert df.equals(ref_df)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_fixture_parity(path, monkeypatch):
+    _assert_same_bars(path)
+
+    # 정상 CSV는 벡터화 경로만 사용
+    def fail_rows(*args, **kwargs):
+        raise AssertionError("행 단위 파서 불필요")
+
+    monkeypatch.setattr(db_utils, "_parse_csv_rows", fail_rows)
+    load_bars_from_csv(str(path))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("body", [
+    # 정렬되지 않은 행 (두 로더 모두 안정 정렬)
+    "2024-01-01 09:05:00,100,102,99,101,1,-1\n" + GOOD_ROW,
+    # float()가 허용하는 표기 / 1988년 이전 KST (행 단위 파서로 처리)
+    "2024-01-01 09:00:00, 1e2 ,102,99,101.5,0,0\n",
+    "1987-07-01 09:00:00,100,102,99,101,1,1\n",
+    " 2024-01-01 09:00:00,100,102,99,101,1,1\n",
+    "2024-1-1 9:0:0,100,102,99,101,1,1\n",
+    # 헤더보다 필드가 많은 행 (DictReader는 초과 필드 무시)
+    GOOD_ROW + "2024-01-01 09:01:00,100,102,99,101,1,1,9\n",
+    # 빈 행 (DictReader는 건너뜀), CRLF 줄바꿈
+    GOOD_ROW + "\n2024-01-01 09:01:00,100,102,99,101,1,1\n\n",
+    "2024-01-01 09:00:00,100,102,99,101,1,1\r\n2024-01-01 09:01:00,100,102,99,101,1,1\r\n",
+])
+def test_edge_case_values_parity(tmp_path, body):
+    path = tmp_path / "edge.csv"
+    path.write_text(HEADER + body, encoding="utf-8")
+    _assert_same_bars(path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", [
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,100,98,99,101,1,1\n",   # high < low
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,103,102,99,101,1,1\n",  # open 범위 밖
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,100,102,99,101,-5,1\n",  # volume < 0
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,100,102,99,101,1,2\n",   # direction
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,abc,102,99,101,1,1\n",   # 숫자 변환 실패
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,,102,99,101,1,1\n",      # 빈 값
+    HEADER + GOOD_ROW + "2024-01-01 09:01:00,100,102,99,101,1,1.0\n",  # int() 불가
+    HEADER + GOOD_ROW + "2024-01-01T09:01:00,100,102,99,101,1,1\n",   # dt 형식
+    HEADER + GOOD_ROW + "   \n" + GOOD_ROW,                             # 공백만 있는 행
+    # 앞선 행의 검증 오류가 뒤 행의 파싱 오류보다 우선
+    HEADER + "2024-01-01 09:00:00,100,98,99,101,1,1\n" + "x,1,1,1,1,1,1\n",
+    HEADER,                                                           # 데이터 없음
+    "dt,open,high,low,close\n" + GOOD_ROW,                            # 헤더 오류
+])
+def test_error_parity(tmp_path, content):
+    path = tmp_path / "bad.csv"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(Exception) as expected:
+        load_bars_from_csv_reference(str(path))
+    with pytest.raises(type(expected.value)) as actual:
+        load_bars_from_csv(str(path))
+    assert str(actual.value) == str(expected.value)
@@ -0,0 +1,157 @@
+"""
+커스텀 지표 컴파일 레지스트리 테스트
+
+핵심 검증 포인트:
+  1) 같은 (타입, 코드 해시)는 로드 / TF / 파서가 달라도 한 번만 컴파일
+  2) 코드가 바뀌면 다시 컴파일하고 이전 버전은 제거, invalidate로 명시적 제거
+  3) StrategyParser는 계획에 포함된 커스텀 타입만 로드 (없으면 DB를 열지 않음)
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.utils import indicator_loader
+from engine.utils.indicator_loader import (
+    invalidate_custom_indicator,
+    load_custom_indicators_from_db,
+)
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+
+DOUBLE_CLOSE = """
+def double_close(df, params):
+    return df['close'] * params.get('factor', 2)
+"""
+
+HALF_CLOSE = """
+def half_close(df, params):
+    return df['close'] / 2
+"""
+
+
+def _create_db(path: Path, indicators):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE indicators (type TEXT, code TEXT, name TEXT, implementation_type TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO indicators VALUES (?, ?, ?, 'custom')",
+        [(indicator_type, code, indicator_type) for indicator_type, code in indicators],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _set_code(path: Path, indicator_type: str, code: str):
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE indicators SET code = ? WHERE type = ?", (code, indicator_type))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def compile_calls(monkeypatch):
+    """컴파일 캐시를 비우고 _create_function_from_code 호출 기록 (프로세스 내 실행 모드)"""
+    monkeypatch.setenv("ALGOFORGE_INDICATOR_SANDBOX", "0")
+    invalidate_custom_indicator()
+    calls = []
+    original = indicator_loader._create_function_from_code
+
+    def counting(code):
+        calls.append(code)
+        return original(code)
+
+    monkeypatch.setattr(indicator_loader, "_create_function_from_code", counting)
+    yield calls
+    invalidate_custom_indicator()
+
+
+@pytest.mark.unit
+def test_same_code_compiled_once(tmp_path, compile_calls):
+    db_path = tmp_path / "algoforge.db"
+    _create_db(db_path, [("dbl", DOUBLE_CLOSE), ("half", HALF_CLOSE)])
+
+    first = load_custom_indicators_from_db(str(db_path))
+    second = load_custom_indicators_from_db(str(db_path))
+    assert set(first) == {"dbl", "half"}
+    assert len(compile_calls) == 2
+    assert first["dbl"] is second["dbl"]
+
+    # 코드 변경 → 재컴파일 (이전 버전 제거)
+    _set_code(db_path, "dbl", DOUBLE_CLOSE.replace("2)", "3)"))
+    hashes = {}
+    third = load_custom_indicators_from_db(str(db_path), hashes)
+    assert len(compile_calls) == 3
+    assert third["dbl"] is not first["dbl"]
+    assert hashes["dbl"] == indicator_loader.calculate_code_hash(DOUBLE_CLOSE.replace("2)", "3)"))
+    assert sum(1 for key in indicator_loader._compiled_indicators if key[0] == "dbl") == 1
+
+    # 명시적 무효화 → 다음 로드에서 재컴파일
+    assert invalidate_custom_indicator("half") == 1
+    load_custom_indicators_from_db(str(db_path), types=["half"])
+    assert len(compile_calls) == 4
+
+
+@pytest.mark.unit
+def test_types_filter(tmp_path, compile_calls):
+    db_path = tmp_path / "algoforge.db"
+    _create_db(db_path, [("dbl", DOUBLE_CLOSE), ("half", HALF_CLOSE)])
+
+    loaded = load_custom_indicators_from_db(str(db_path), types=["half", "missing"])
+    assert set(loaded) == {"half"}
+    assert compile_calls == [HALF_CLOSE]
+
+    # 빈 목록이면 DB를 열지 않음 (존재하지 않는 경로도 오류 없음)
+    assert load_custom_indicators_from_db(str(tmp_path / "nope.db"), types=[]) == {}
+
+
+@pytest.mark.unit
+def test_parser_loads_only_referenced_custom_types_once(tmp_path, monkeypatch, compile_calls):
+    _create_db(tmp_path / "db" / "algoforge.db", [("dbl", DOUBLE_CLOSE), ("half", HALF_CLOSE)])
+    monkeypatch.chdir(tmp_path)
+
+    base = random_walk_bars(240, step=300)
+    htf = random_walk_bars(20, step=3600)
+    definition = {
+        "indicators": [
+            {"id": "dbl_base", "type": "dbl", "params": {}},
+            {"id": "dbl_1h", "type": "dbl", "params": {}, "timeframe": "1h"},
+            {"id": "unused", "type": "half", "params": {}},
+        ],
+        "entry": {
+            "long": {"and": [{"left": {"ref": "dbl_base"}, "op": ">", "right": {"ref": "dbl_1h@1h"}}]},
+            "short": {"and": []},
+        },
+    }
+
+    for _ in range(2):
+        parser = StrategyParser(definition, bars=base, htf_data={"1h": (htf, None)})
+    # 두 TF / 두 파서에서 dbl 한 번만 컴파일, 참조되지 않은 half는 로드하지 않음
+    assert compile_calls == [DOUBLE_CLOSE]
+    for calc in parser.indicator_calcs.values():
+        assert set(calc.custom_indicators) == {"dbl"}
+    np.testing.assert_allclose(
+        parser.indicator_calc.get_array("dbl_base"), parser.indicator_calc.get_array("close") * 2
+    )
+
+    # 커스텀 지표를 참조하지 않는 전략은 DB를 열지 않음
+    def fail_connect(*args, **kwargs):
+        raise AssertionError("DB 연결 불필요")
+
+    monkeypatch.setattr(indicator_loader.sqlite3, "connect", fail_connect)
+    StrategyParser(
+        {
+            "indicators": [{"id": "ema_1", "type": "ema", "params": {"period": 5}}],
+            "entry": {"long": {"and": [{"left": {"ref": "ema_1"}, "op": ">", "right": {"value": 0}}]},
+                      "short": {"and": []}},
+        },
+        bars=base,
+    )
@@ -0,0 +1,81 @@
+"""
+dataset_hash 스트리밍 계산 테스트
+
+핵심 검증 포인트:
+  1) 기존 구현(전체 텍스트 생성 후 해시)과 hex digest가 동일 — 저장된 dataset_hash 유효성
+  2) 청크 경계 / 정렬되지 않은 입력 / 표기가 까다로운 실수 값에서도 동일
+  3) Bar 리스트의 int 필드 표기 유지
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.db import utils as db_utils
+from apps.api.db.utils import calculate_dataset_hash, load_bars_from_csv
+from engine.models import Bar, BarArray
+from tests.helpers import random_walk_frame
+
+FIXTURES = sorted((project_root / "tests" / "fixtures").glob("*.csv"))
+
+
+def _reference_hash(bars) -> str:
+    """변경 전 calculate_dataset_hash 구현"""
+    sorted_bars = sorted(bars, key=lambda b: b.timestamp)
+    data_str = ""
+    for bar in sorted_bars:
+        data_str += f"{bar.timestamp},{bar.open},{bar.high},{bar.low},{bar.close},{bar.volume},{bar.direction}|"
+    return hashlib.sha256(data_str.encode('utf-8')).hexdigest()
+
+
+def _random_bars(n: int, seed: int = 0) -> BarArray:
+    frame = random_walk_frame(n, seed=seed)
+    rng = np.random.default_rng(seed)
+    # 문자열 표현이 다양한 값 (소수 자릿수, 근접 값, 지수 표기, 0 / -0 / NaN)
+    close = np.round(frame["close"].to_numpy(), 2)
+    open_ = np.roll(close, 1)
+    high = np.maximum(open_, close) + np.round(rng.random(n), 3)
+    low = np.minimum(open_, close) - rng.random(n) * 1e-5
+    volume = rng.random(n) * 10.0 ** rng.integers(-6, 18, n)
+    volume[::97] = 0.0
+    volume[::89] = -0.0
+    volume[::83] = 1e16
+    volume[::79] = np.nan
+    timestamps = np.arange(n, dtype=np.int64) * 60
+    direction = rng.integers(-1, 2, n)
+    return BarArray(timestamps, open_, high, low, close, volume, direction)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_fixture_hash_unchanged(path):
+    bars, _ = load_bars_from_csv(str(path))
+    assert calculate_dataset_hash(bars) == _reference_hash(bars)
+    assert calculate_dataset_hash(bars.to_bars()) == _reference_hash(bars)
+
+
+@pytest.mark.unit
+def test_chunked_hash_matches_reference(monkeypatch):
+    monkeypatch.setattr(db_utils, "_DATASET_HASH_CHUNK", 37)
+    bars = _random_bars(500)
+    expected = _reference_hash(bars)
+
+    assert calculate_dataset_hash(bars) == expected
+    # 정렬되지 않은 입력도 timestamp 순으로 해시
+    shuffled = BarArray.from_bars([bars[i] for i in np.random.default_rng(1).permutation(500)])
+    assert calculate_dataset_hash(shuffled) == expected
+    assert calculate_dataset_hash(bars.to_bars()) == expected
+
+
+@pytest.mark.unit
+def test_bar_list_keeps_field_notation():
+    # int 가격은 "100"으로 표기 (BarArray로 바꾸면 "100.0"이 되므로 리스트는 그대로 처리)
+    bars = [Bar(timestamp=0, open=100, high=101, low=99, close=100, volume=0, direction=0)]
+    assert calculate_dataset_hash(bars) == _reference_hash(bars)
+    assert calculate_dataset_hash([]) == _reference_hash([])
@@ -0,0 +1,126 @@
+"""
+데이터셋 CSV 스트리밍 수집 테스트
+
+핵심 검증 포인트:
+  1) 작은 청크 / 배치로 나눠 넣어도 해시 / 메타데이터 / 사이드카가 전체 로드 결과와 동일
+  2) 정렬되지 않은 CSV는 전체 로드 경로로 처리 (결과 동일)
+  3) 배치 경계를 넘어가도 오류 메시지 / 행 번호가 load_bars_from_csv와 동일
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from apps.api.db.dataset_ingest import BarValidationError, CsvDatasetIngestor
+from apps.api.db.utils import (
+    calculate_dataset_hash,
+    dataset_sidecar_path,
+    load_bars_from_csv,
+    load_dataset_bars,
+    validate_bars,
+)
+
+FIXTURES = sorted((project_root / "tests" / "fixtures").glob("*.csv"))
+
+HEADER = "dt,do,dh,dl,dc,dv,dd\n"
+
+
+def _rows(count: int, start_minute: int = 0) -> str:
+    return "".join(
+        f"2024-01-01 {9 + (m // 60) % 10:02d}:{m % 60:02d}:00,100,102,99,101.{m % 7},{m},1\n"
+        for m in range(start_minute, start_minute + count)
+    )
+
+
+def _ingest(tmp_path: Path, content: bytes, chunk: int = 7, batch_bytes: int = 64) -> CsvDatasetIngestor:
+    ingestor = CsvDatasetIngestor(tmp_path / "upload.csv", batch_bytes=batch_bytes)
+    for i in range(0, len(content), chunk):
+        ingestor.feed(content[i:i + chunk])
+    return ingestor
+
+
+def _assert_matches_full_load(tmp_path: Path, content: bytes):
+    ingestor = _ingest(tmp_path, content)
+    result = ingestor.finish()
+
+    bars, metadata = load_bars_from_csv(str(ingestor.temp_path))
+    assert result.dataset_hash == calculate_dataset_hash(bars)
+    assert result.bars_count == metadata["bars_count"]
+    assert result.start_timestamp == metadata["start_timestamp"]
+    assert result.end_timestamp == metadata["end_timestamp"]
+
+    final_path = tmp_path / f"{result.dataset_hash}.csv"
+    ingestor.temp_path.rename(final_path)
+    ingestor.write_sidecar(final_path)
+    assert dataset_sidecar_path(final_path).is_dir()
+    assert not (tmp_path / "upload.csv.parts").exists()
+
+    loaded = load_dataset_bars(str(final_path))[0]
+    np.testing.assert_array_equal(loaded.timestamps, bars.timestamps)
+    assert loaded.ohlcv.tobytes() == bars.ohlcv.tobytes()
+    np.testing.assert_array_equal(loaded.direction, bars.direction)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", FIXTURES, ids=lambda p: p.name)
+def test_fixture_stream_matches_full_load(tmp_path, path):
+    bars, _ = load_bars_from_csv(str(path))
+    if not validate_bars(bars)[0]:
+        pytest.skip("validate_bars 실패 픽스처")
+    _assert_matches_full_load(tmp_path, path.read_bytes())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", [
+    HEADER + _rows(40),
+    # CRLF / 마지막 줄바꿈 없음
+    (HEADER + _rows(40)).replace("\n", "\r\n"),
+    HEADER + _rows(40).rstrip("\n"),
+    # 정렬되지 않은 행 (배치 경계 너머) → 전체 로드
+    HEADER + _rows(20, start_minute=20) + _rows(20),
+    # 벡터화 파서가 처리하지 않는 값 → 전체 로드
+    HEADER + _rows(30) + "2024-01-01 11:00:00, 1e2 ,102,99,101,0,0\n",
+    # 따옴표 헤더 → 전체 로드
+    '"dt","do","dh","dl","dc","dv","dd"\n' + _rows(10),
+])
+def test_stream_edge_cases_match_full_load(tmp_path, content):
+    _assert_matches_full_load(tmp_path, content.encode("utf-8"))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", [
+    HEADER + _rows(30) + "2024-01-01 11:00:00,100,98,99,101,1,1\n" + _rows(5, start_minute=200),
+    HEADER + _rows(30) + "2024-01-01 11:00:00,abc,102,99,101,1,1\n",
+    HEADER + _rows(30) + "2024-01-01 11:00:00,100,102,99,101,1,2\n",
+    HEADER,
+    "\n" + HEADER + _rows(3),
+    "dt,open,high,low,close\n" + _rows(3),
+])
+def test_stream_error_parity(tmp_path, content):
+    reference_path = tmp_path / "reference.csv"
+    reference_path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError) as expected:
+        load_bars_from_csv(str(reference_path))
+
+    with pytest.raises(ValueError) as actual:
+        ingestor = _ingest(tmp_path, content.encode("utf-8"))
+        ingestor.finish()
+    assert str(actual.value) == str(expected.value)
+
+
+@pytest.mark.unit
+def test_duplicate_timestamp_raises_validation_error(tmp_path):
+    content = HEADER + _rows(30) + _rows(1, start_minute=29)
+    ingestor = _ingest(tmp_path, content.encode("utf-8"))
+    with pytest.raises(BarValidationError) as exc_info:
+        ingestor.finish()
+    assert exc_info.value.errors
+
+    ingestor.abort()
+    assert not ingestor.temp_path.exists()
+    assert not (tmp_path / "upload.csv.parts").exists()
@@ -12,12 +12,16 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
 import pytest
 
 from engine.models.bar import Bar
+from engine.models.bar_array import BarArray
 from engine.utils.htf_mapper import (
     INTERVAL_SECONDS,
     build_htf_index_map,
+    clear_htf_index_map_cache,
+    get_htf_index_map,
     interval_to_seconds,
     resolve_htf_index,
 )
@@ -59,11 +63,11 @@ def test_interval_to_seconds_invalid():
 
 @pytest.mark.unit
 def test_empty_inputs():
-    assert build_htf_index_map([], [], 3600) == []
+    assert build_htf_index_map([], [], 3600).tolist() == []
     base = _mk_bars([0, 300, 600])
-    assert build_htf_index_map(base, [], 3600) == [-1, -1, -1]
+    assert build_htf_index_map(base, [], 3600).tolist() == [-1, -1, -1]
     htf = _mk_bars([0, 3600])
-    assert build_htf_index_map([], htf, 3600) == []
+    assert build_htf_index_map([], htf, 3600).tolist() == []
 
 
 @pytest.mark.unit
@@ -82,7 +86,7 @@ def test_5m_base_with_1h_htf_basic():
     # base[12] = 11:00. HTF[0].open_time+3600 = 11:00 <= 11:00 → j=0 닫힘
     # base[13] = 11:05. HTF[1] open+3600 = 12:00 > 11:05 → j=0 유지
     expected = [-1] * 12 + [0, 0]
-    assert mapping == expected
+    assert mapping.tolist() == expected
 
 
 @pytest.mark.unit
@@ -98,7 +102,7 @@ def test_look_ahead_blocked_strict_inequality():
     # 10:00, 10:30, 10:59 → HTF[0] (10:00 open)는 11:00에 닫힘 → 아직 안 닫힘 → -1
     # 11:00 → HTF[0] 가 지금 "막 닫힘" → j=0 사용 가능 (<=로 허용)
     # 11:01 → HTF[0] 여전히 사용 가능, HTF[1]은 12:00에 닫히므로 아직 -1
-    assert mapping == [-1, -1, -1, 0, 0]
+    assert mapping.tolist() == [-1, -1, -1, 0, 0]
 
 
 @pytest.mark.unit
@@ -115,7 +119,7 @@ def test_htf_starts_before_base():
     # 9:55 → 여전히 j=0
     # 10:00 → HTF[1] closes at 10:00 ≤ 10:00 ✓ → j=1
     # 10:05 → HTF[2] closes at 11:00 > 10:05 → j=1 유지
-    assert mapping == [0, 0, 1, 1]
+    assert mapping.tolist() == [0, 0, 1, 1]
 
 
 @pytest.mark.unit
@@ -134,7 +138,7 @@ def test_htf_daily_with_5m_base():
     # day 0 11:55 → HTF[0] closes at day 1 00:00 > 11:55 → -1
     # day 1 00:00 → HTF[0] closes at day 1 00:00 ≤ day 1 00:00 → j=0
     # day 1 00:05 → HTF[1] closes at day 2 > day 1 00:05 → j=0 유지
-    assert mapping == [-1, 0, 0]
+    assert mapping.tolist() == [-1, 0, 0]
 
 
 @pytest.mark.unit
@@ -152,7 +156,7 @@ def test_htf_4h_with_1m_base_sequence():
     # 7:59 → HTF[1] closes at 8:00 > 7:59 → j=0
     # 8:00 → HTF[1] closes at 8:00 ≤ 8:00 → j=1
     # 8:01 → j=1 유지
-    assert mapping == [-1, 0, 0, 1, 1]
+    assert mapping.tolist() == [-1, 0, 0, 1, 1]
 
 
 # ---------------------------------------------------------------------------
@@ -166,7 +170,7 @@ def test_deterministic_same_inputs_same_output():
     htf = _mk_bars([i * 3600 for i in range(10)])
     a = build_htf_index_map(base, htf, 3600)
     b = build_htf_index_map(base, htf, 3600)
-    assert a == b
+    assert np.array_equal(a, b)
 
 
 @pytest.mark.unit
@@ -180,6 +184,44 @@ def test_mapping_monotonic_non_decreasing():
             f"monotonic violation at i={i}: {mapping[i-1]} -> {mapping[i]}"
 
 
+@pytest.mark.unit
+def test_vectorized_matches_two_pointer_reference():
+    """searchsorted 결과가 투포인터 정의와 동일 (불규칙 간격 / 결측 봉 포함), int32 반환."""
+    rng = np.random.default_rng(7)
+    base_ts = np.cumsum(rng.integers(1, 4, size=2000) * 300)
+    htf_ts = np.unique(base_ts // 3600 * 3600)[::2]  # 결측 HTF 봉
+    base = BarArray.from_bars(_mk_bars(base_ts.tolist()))
+    htf = BarArray.from_bars(_mk_bars(htf_ts.tolist()))
+
+    mapping = build_htf_index_map(base, htf, 3600)
+
+    expected, j = [], -1
+    for ts in base_ts.tolist():
+        while j + 1 < len(htf_ts) and htf_ts[j + 1] + 3600 <= ts:
+            j += 1
+        expected.append(j)
+    assert mapping.dtype == np.int32
+    assert mapping.tolist() == expected
+
+
+@pytest.mark.unit
+def test_get_htf_index_map_cached_by_dataset_hashes():
+    clear_htf_index_map_cache()
+    base = _mk_bars([i * 300 for i in range(48)])
+    htf = _mk_bars([i * 3600 for i in range(4)])
+
+    first = get_htf_index_map(base, htf, 3600, base_hash="b", htf_hash="h")
+    assert get_htf_index_map(base, htf, 3600, base_hash="b", htf_hash="h") is first
+    assert not first.flags.writeable
+    # 키 구성 요소가 하나라도 다르면 새로 계산
+    assert get_htf_index_map(base, htf, 4 * 3600, base_hash="b", htf_hash="h") is not first
+    assert get_htf_index_map(base, htf, 3600, base_hash="b", htf_hash="other") is not first
+    # 해시가 없으면 캐시하지 않음
+    assert get_htf_index_map(base, htf, 3600) is not get_htf_index_map(base, htf, 3600)
+    np.testing.assert_array_equal(first, build_htf_index_map(base, htf, 3600))
+    clear_htf_index_map_cache()
+
+
 # ---------------------------------------------------------------------------
 # resolve_htf_index
 # ---------------------------------------------------------------------------
@@ -0,0 +1,152 @@
+"""
+청크 병렬 지표 계산 테스트
+
+핵심 검증 포인트:
+  1) 청크 구간은 전체를 빠짐없이 덮고 워밍업만큼 앞쪽을 겹침
+  2) SMA / CCI는 순차 계산과 같은 값, 재귀 지표는 워밍업 후 편차가 매우 작음 (verify 보고)
+  3) StrategyParser 통합: 대용량 TF만 청크 계산, 캐시 키는 순차 계산과 분리
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.models.bar_array import BarArray
+from engine.utils.indicator_cache import IndicatorCache
+from engine.utils.indicator_chunking import (
+    ChunkingOptions,
+    calculate_chunked,
+    chain_warmups,
+    chunk_bounds,
+    indicator_warmup,
+)
+from engine.utils.indicators import IndicatorCalculator
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars, random_walk_frame
+
+DEFINITIONS = [
+    {"id": "ema_10", "type": "ema", "params": {"period": 10}},
+    {"id": "ema_50", "type": "ema", "params": {"period": 50}},
+    {"id": "rsi_1", "type": "rsi", "params": {"period": 14}},
+    {"id": "atr_1", "type": "atr", "params": {"period": 14}},
+    {"id": "adx_1", "type": "adx", "params": {"period": 14}},
+    {"id": "macd_1", "type": "macd", "params": {}},
+    {"id": "sma_1", "type": "sma", "params": {"period": 30}},
+    {"id": "cci_1", "type": "cci", "params": {"period": 20}},
+    {"id": "rsi_ema", "type": "ema", "params": {"period": 9, "source": "rsi_1"}},
+]
+
+# 유한 창 지표 체인 (워밍업은 체인을 따라 누적되어야 함)
+CHAINED_DEFINITIONS = [
+    {"id": "s1", "type": "sma", "params": {"period": 50}},
+    {"id": "s2", "type": "sma", "params": {"period": 50, "source": "s1"}},
+    {"id": "cci_1", "type": "cci", "params": {"period": 20}},
+    {"id": "cci_sma", "type": "sma", "params": {"period": 30, "source": "cci_1"}},
+]
+
+
+@pytest.mark.unit
+def test_chunk_bounds_and_warmup():
+    bounds = chunk_bounds(1000, 3, 50)
+    assert bounds[0] == (0, 0, 333)
+    assert [start for _, start, _ in bounds] == [0, 333, 666]
+    assert [compute_start for compute_start, _, _ in bounds[1:]] == [283, 616]
+    assert bounds[-1][2] == 1000
+
+    assert indicator_warmup({"type": "ema", "params": {"period": 20}}, 10) == 200
+    assert indicator_warmup({"type": "adx", "params": {}}, 10) == 280
+    assert indicator_warmup({"type": "macd", "params": {}}, 5) == 175
+    assert indicator_warmup({"type": "sma", "params": {"period": 30}}, 10) == 30
+    with pytest.raises(ValueError, match="지원하지 않는"):
+        indicator_warmup({"type": "custom", "params": {}}, 10)
+    assert chain_warmups(CHAINED_DEFINITIONS, 10) == [50, 100, 20, 50]
+    assert chain_warmups(DEFINITIONS, 10)[-1] == 140 + 90
+    with pytest.raises(ValueError, match="2 이상"):
+        ChunkingOptions(chunks=1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("definitions, chunks", [
+    (DEFINITIONS, 3),
+    (CHAINED_DEFINITIONS, 4),
+], ids=["builtin", "chained"])
+def test_chunked_matches_sequential(definitions, chunks):
+    df = random_walk_frame(12_000, seed=3)
+    calc = IndicatorCalculator(df)
+    options = ChunkingOptions(chunks=chunks, warmup_factor=10, min_bars=0, verify=True)
+    columns, report = calculate_chunked(calc, definitions, options)
+
+    sequential = IndicatorCalculator(df)
+    for definition in definitions:
+        sequential.calculate_indicator(definition)
+
+    assert report.chunks == chunks
+    assert report.warmup_bars == max(chain_warmups(definitions, 10))
+    assert set(columns) == set(report.max_abs_deviation)
+    for col, values in columns.items():
+        expected = sequential.get_column(col)
+        assert len(values) == len(df)
+        np.testing.assert_allclose(values, expected, rtol=1e-9, atol=1e-9)
+        assert report.max_abs_deviation[col] == pytest.approx(
+            np.max(np.abs(values - expected)), abs=1e-15
+        )
+    np.testing.assert_array_equal(columns["cci_1"], sequential.get_column("cci_1"))
+    if "macd_1_histogram_direction" in columns:
+        np.testing.assert_array_equal(
+            columns["macd_1_histogram_direction"], sequential.get_column("macd_1_histogram_direction")
+        )
+
+    # 워밍업보다 짧은 데이터는 나누지 않음
+    assert calculate_chunked(IndicatorCalculator(random_walk_frame(300, seed=3)), DEFINITIONS, options) is None
+
+
+@pytest.mark.unit
+def test_parser_chunked_indicators_and_cache_separation():
+    definition = {
+        "indicators": DEFINITIONS + [
+            {"id": "ema_1h", "type": "ema", "params": {"period": 5}, "timeframe": "1h"},
+        ],
+        "entry": {
+            "long": {"and": [
+                {"left": {"ref": d["id"]}, "op": ">", "right": {"value": 0}} for d in DEFINITIONS
+            ] + [{"left": {"ref": "ema_1h@1h"}, "op": ">", "right": {"value": 0}}]},
+            "short": {"and": []},
+        },
+    }
+    bars = BarArray.from_bars(random_walk_bars(6000, step=300))
+    htf = random_walk_bars(500, step=3600)
+    cache = IndicatorCache()
+    options = ChunkingOptions(chunks=2, min_bars=1000, verify=True)
+
+    chunked = StrategyParser(
+        definition, bars=bars, htf_data={"1h": (htf, None)},
+        indicator_cache=cache, indicator_chunking=options,
+    )
+    sequential = StrategyParser(
+        definition, bars=bars, htf_data={"1h": (htf, None)}, indicator_cache=cache,
+    )
+
+    # base TF만 청크 계산 (1h는 min_bars 미만)
+    assert [report.tf for report in chunked.indicator_chunk_reports] == ["base"]
+    assert chunked.indicator_chunk_reports[0].indicator_ids == [d["id"] for d in DEFINITIONS]
+    for col in ("ema_50", "rsi_ema", "macd_1_signal", "sma_1"):
+        np.testing.assert_allclose(
+            chunked.indicator_calc.get_array(col), sequential.indicator_calc.get_array(col),
+            rtol=1e-7, atol=1e-7,
+        )
+    # 청크 계산 결과는 순차 계산 캐시 항목과 섞이지 않음 (1h 지표만 공유)
+    assert cache.hits == 1
+
+    again = StrategyParser(
+        definition, bars=bars, htf_data={"1h": (htf, None)},
+        indicator_cache=cache, indicator_chunking=options,
+    )
+    assert again.indicator_chunk_reports == []
+    np.testing.assert_array_equal(
+        again.indicator_calc.get_array("ema_10"), chunked.indicator_calc.get_array("ema_10")
+    )
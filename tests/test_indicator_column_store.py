@@ -0,0 +1,159 @@
+"""
+IndicatorCalculator 컬럼 저장소 테스트
+
+핵심 검증 포인트:
+  1) get_value / get_array가 기존 DataFrame 조회(iloc + 첫 유효값 대체)와 같은 값을 반환
+  2) get_array는 복사 없이 읽기 전용 배열을 반환
+  3) DataFrame에 직접 추가된 컬럼, 오류 경로 유지
+  4) 입력 DataFrame은 복사 / 수정하지 않고, self.df는 필요할 때 한 번만 생성
+"""
+
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.utils.indicators import IndicatorCalculator
+from tests.helpers import random_walk_frame
+
+
+def _legacy_get_value(df: pd.DataFrame, column: str, bar_index: int) -> float:
+    """컬럼 저장소 도입 전 get_value 동작"""
+    value = df.iloc[bar_index][column]
+    if pd.isna(value):
+        first_valid = df[column].first_valid_index()
+        return df.loc[first_valid, column] if first_valid is not None else 0.0
+    return float(value)
+
+
+@pytest.mark.unit
+def test_get_value_matches_dataframe_lookup():
+    calc = IndicatorCalculator(random_walk_frame(300))
+
+    def gappy(df, params):
+        # 초기 NaN + 중간 NaN
+        series = df['close'].rolling(window=10).mean()
+        series.iloc[50:55] = np.nan
+        return {'main': series, 'empty': pd.Series(np.nan, index=df.index)}
+
+    calc.register_custom_indicator('gappy', gappy)
+    for indicator in [
+        {'id': 'ema_1', 'type': 'ema', 'params': {'period': 20}},
+        {'id': 'rsi_1', 'type': 'rsi', 'params': {'period': 14}},
+        {'id': 'adx_1', 'type': 'adx', 'params': {'period': 14}},
+        {'id': 'macd_1', 'type': 'macd', 'params': {}},
+        {'id': 'gap_1', 'type': 'gappy', 'params': {}},
+    ]:
+        calc.calculate_indicator(indicator)
+
+    columns = [
+        'ema_1', 'rsi_1', 'adx_1', 'macd_1', 'macd_1_signal',
+        'macd_1_histogram', 'macd_1_histogram_direction',
+        'gap_1', 'gap_1_empty', 'close',
+    ]
+    for column in columns:
+        array = calc.get_array(column)
+        assert array.dtype == np.float64
+        for i in range(len(calc.df)):
+            expected = _legacy_get_value(calc.df, column, i)
+            assert calc.get_value(column, i) == expected
+            assert array[i] == expected
+
+    assert calc.get_value('gap_1', 52) == calc.get_value('gap_1', 9)
+    assert calc.get_value('gap_1_empty', 0) == 0.0
+
+
+@pytest.mark.unit
+def test_get_array_is_cached_and_read_only():
+    calc = IndicatorCalculator(random_walk_frame(300))
+    calc.calculate_indicator({'id': 'sma_1', 'type': 'sma', 'params': {'period': 5}})
+
+    array = calc.get_array('sma_1')
+    assert calc.get_array('sma_1') is array
+    with pytest.raises(ValueError):
+        array[0] = 1.0
+
+    # 같은 ID로 다시 계산하면 저장소도 갱신
+    calc.calculate_indicator({'id': 'sma_1', 'type': 'sma', 'params': {'period': 50}})
+    assert calc.get_array('sma_1') is not array
+    assert calc.get_value('sma_1', 100) == pytest.approx(calc.df['close'].iloc[51:101].mean())
+
+
+@pytest.mark.unit
+def test_lookup_errors():
+    calc = IndicatorCalculator(random_walk_frame(50))
+    calc.calculate_indicator({'id': 'ema_1', 'type': 'ema', 'params': {'period': 5}})
+
+    with pytest.raises(ValueError, match="계산되지 않았습니다"):
+        calc.get_value('missing', 0)
+    with pytest.raises(ValueError, match="계산되지 않았습니다"):
+        calc.get_array('missing')
+    with pytest.raises(ValueError, match="범위를 벗어났습니다"):
+        calc.get_value('ema_1', 50)
+    with pytest.raises(ValueError, match="범위를 벗어났습니다"):
+        calc.get_value('ema_1', -1)
+
+    calc.df['label'] = 'x'
+    with pytest.raises(ValueError, match="숫자 배열로 변환할 수 없습니다"):
+        calc.get_value('label', 0)
+
+
+@pytest.mark.unit
+def test_input_frame_is_referenced_not_copied():
+    df = random_walk_frame(400).drop(columns=['direction'])
+    original_columns = list(df.columns)
+    calc = IndicatorCalculator(df)
+    for period in range(2, 150):
+        calc.calculate_indicator({'id': f'ema_{period}', 'type': 'ema', 'params': {'period': period}})
+    calc.calculate_indicator({'id': 'macd_1', 'type': 'macd', 'params': {}})
+
+    # OHLCV는 복사하지 않고, 지표는 DataFrame 없이 저장
+    assert np.shares_memory(calc.get_array('close'), df['close'].to_numpy())
+    assert calc._owns_frame is False
+    assert list(df.columns) == original_columns
+    assert calc.columns[:len(original_columns)] == original_columns
+    assert calc.columns[-1] == 'macd_1_histogram_direction'
+    assert 'direction' in calc.columns and 'direction' not in df.columns
+
+    # self.df는 한 번의 concat으로 생성 (단편화 경고 없음), 추가 컬럼이 없으면 재사용
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        frame = calc.df
+        frame['label'] = 'x'
+    assert calc.df is frame
+    assert list(frame.columns) == calc.columns
+    assert 'label' not in df.columns
+    np.testing.assert_array_equal(frame['ema_20'], calc.get_array('ema_20'))
+
+    # 이후 추가된 지표는 다음 조회 시 반영 (직접 추가한 컬럼 유지)
+    calc.calculate_indicator({'id': 'rsi_1', 'type': 'rsi', 'params': {'period': 14}})
+    assert 'rsi_1' not in frame.columns
+    assert list(calc.df.columns[-2:]) == ['label', 'rsi_1']
+
+
+@pytest.mark.unit
+def test_set_column_alignment_and_replacement():
+    df = random_walk_frame(50).set_index(pd.date_range('2024-01-01', periods=50, freq='h'))
+    calc = IndicatorCalculator(df)
+
+    # Series는 인덱스 기준 정렬 (기존 df[col] = series 동작)
+    calc.set_column('shifted', df['close'].iloc[10:])
+    assert np.isnan(calc.get_column('shifted')[:10]).all()
+    assert calc.get_value('shifted', 0) == df['close'].iloc[10]
+
+    calc.set_column('flag', 1)
+    assert calc.get_value('flag', 49) == 1.0
+    with pytest.raises(ValueError, match="길이가 DataFrame과 다릅니다"):
+        calc.set_column('short', np.zeros(10))
+
+    # 입력 컬럼을 덮어써도 원본은 그대로, 컬럼 순서 유지
+    calc.set_column('close', np.zeros(50))
+    assert list(calc.df.columns[:len(df.columns)]) == list(df.columns)
+    assert (calc.df['close'] == 0).all()
+    assert (df['close'] != 0).any()
@@ -0,0 +1,148 @@
+"""
+디스크 지표 캐시(PersistentIndicatorCache) 테스트
+
+핵심 검증 포인트:
+  1) 다른 인스턴스(다른 Run)에서 같은 값으로 복원 (지표 ID 무관)
+  2) 키: 데이터셋 해시 / 파라미터 / 커스텀 지표 코드 해시가 다르면 미스
+  3) 크기 상한 초과 시 가장 오래 사용하지 않은 엔트리부터 삭제
+  4) 손상된 엔트리는 미스 처리 후 삭제
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.models.bar_array import BarArray
+from engine.utils.indicator_cache import PersistentIndicatorCache
+from engine.utils.indicators import IndicatorCalculator
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+
+INDICATORS = [
+    {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 9}},
+    {"id": "rsi_1", "type": "rsi", "params": {"period": 14}},
+    {"id": "macd_1", "type": "macd", "params": {}},
+]
+
+
+def _parse(bars, cache, indicators=INDICATORS):
+    return StrategyParser(
+        {"indicators": indicators}, bars=bars, indicator_cache=cache,
+        prune_unreferenced_indicators=False,
+    )
+
+
+def _entries(directory: Path):
+    return sorted(p for p in directory.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+
+@pytest.mark.unit
+def test_roundtrip_across_instances(tmp_path):
+    bars = BarArray.from_bars(random_walk_bars(400))
+    uncached = _parse(bars, None)
+
+    first = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"})
+    _parse(bars, first)
+    assert (first.hits, first.misses, first.writes) == (0, 3, 3)
+    assert len(_entries(tmp_path)) == 3
+
+    # 지표 ID가 달라도 (타입, 파라미터)가 같으면 적중
+    renamed = [dict(ind, id=f"x_{ind['id']}") for ind in INDICATORS]
+    second = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"})
+    parser = _parse(bars, second, renamed)
+    assert (second.hits, second.misses, second.writes) == (3, 0, 0)
+
+    for column in ["ema_fast", "rsi_1", "macd_1", "macd_1_signal",
+                   "macd_1_histogram", "macd_1_histogram_direction"]:
+        np.testing.assert_array_equal(
+            parser.indicator_calc.get_array(f"x_{column}"),
+            uncached.indicator_calc.get_array(column),
+        )
+
+
+@pytest.mark.unit
+def test_key_includes_dataset_params_and_code_hash(tmp_path):
+    bars = BarArray.from_bars(random_walk_bars(200))
+    _parse(bars, PersistentIndicatorCache(tmp_path, {"base": "dataset-a"}))
+
+    other_dataset = PersistentIndicatorCache(tmp_path, {"base": "dataset-b"})
+    _parse(bars, other_dataset)
+    assert other_dataset.hits == 0
+
+    other_params = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"})
+    _parse(bars, other_params, [{"id": "ema_fast", "type": "ema", "params": {"period": 10}}])
+    assert other_params.hits == 0
+
+    # HTF 데이터셋 해시가 없는 TF는 캐시하지 않음
+    calc = IndicatorCalculator(bars.to_dataframe())
+    cache = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"})
+    assert cache.make_key(calc, "1h", INDICATORS[0]) is None
+
+    # 커스텀 지표: 코드 해시가 없으면 캐시 제외, 코드가 바뀌면 다른 키
+    def double_close(df, params):
+        return df["close"] * 2
+
+    custom = {"id": "dc", "type": "double_close", "params": {}}
+    assert cache.make_key(calc, "base", custom) is None
+    calc.register_custom_indicator("double_close", double_close, code_hash="v1")
+    key_v1 = cache.make_key(calc, "base", custom)
+    calc.register_custom_indicator("double_close", double_close, code_hash="v2")
+    assert key_v1 is not None
+    assert cache.make_key(calc, "base", custom) not in (None, key_v1)
+    # 내장 지표 타입은 같은 이름의 커스텀 코드와 무관
+    builtin_key = cache.make_key(calc, "base", INDICATORS[0])
+    calc.register_custom_indicator("ema", double_close, code_hash="v3")
+    assert cache.make_key(calc, "base", INDICATORS[0]) == builtin_key
+
+
+@pytest.mark.unit
+def test_lru_eviction(tmp_path):
+    bars = BarArray.from_bars(random_walk_bars(1000))
+    entry_bytes = 1000 * 8
+
+    cache = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"}, max_bytes=10 * entry_bytes)
+    for period in (5, 6):
+        _parse(bars, cache, [{"id": "e", "type": "ema", "params": {"period": period}}])
+    old_entries = _entries(tmp_path)
+    assert len(old_entries) == 2
+
+    # period=5 엔트리를 오래된 것으로 만든 뒤 period=6 재사용
+    for i, entry in enumerate(old_entries):
+        os.utime(entry / "index.json", (1_000_000 + i, 1_000_000 + i))
+    _parse(bars, cache, [{"id": "e", "type": "ema", "params": {"period": 6}}])
+    assert cache.hits == 1
+    (period_6,) = [
+        entry for entry in old_entries
+        if json.loads((entry / "index.json").read_text())["params"]["period"] == 6
+    ]
+
+    cache.max_bytes = 2 * entry_bytes + 2000
+    _parse(bars, cache, [{"id": "e", "type": "ema", "params": {"period": 7}}])
+    remaining = _entries(tmp_path)
+    assert len(remaining) == 2
+    assert period_6 in remaining
+    assert cache.evictions == 1
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+@pytest.mark.unit
+def test_corrupted_entry_is_removed(tmp_path):
+    bars = BarArray.from_bars(random_walk_bars(200))
+    indicators = [INDICATORS[0]]
+    _parse(bars, PersistentIndicatorCache(tmp_path, {"base": "dataset-a"}), indicators)
+    (entry,) = _entries(tmp_path)
+    (entry / "0.npy").write_bytes(b"not a numpy file")
+
+    cache = PersistentIndicatorCache(tmp_path, {"base": "dataset-a"})
+    parser = _parse(bars, cache, indicators)
+    assert (cache.hits, cache.misses, cache.writes) == (0, 1, 1)
+    expected = _parse(bars, None, indicators).indicator_calc.get_array("ema_fast")
+    np.testing.assert_array_equal(parser.indicator_calc.get_array("ema_fast"), expected)
+    assert len(_entries(tmp_path)) == 1
@@ -0,0 +1,133 @@
+"""
+기간 묶음(family) 지표 계산 테스트
+
+핵심 검증 포인트:
+  1) calculate_indicator_family 결과 = 기간별 calculate_indicator 결과 (DataFrame / 컬럼 저장소)
+  2) 지표 ID별 컬럼 저장소 값은 (기간 수, 봉 수) 배열의 읽기 전용 행 뷰
+  3) StrategyParser는 기간만 다른 지표를 묶어 계산하고, 캐시 저장 / 복원은 지표별로 동일
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.models.bar_array import BarArray
+from engine.utils.indicator_cache import IndicatorCache
+from engine.utils.indicators import IndicatorCalculator
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars, random_walk_frame
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("indicator_type,periods,params", [
+    ("ema", [1, 5, 20, 200], {}),
+    ("sma", [3, 10, 50], {"source": "open"}),
+    ("rsi", [7, 14, 21], {}),
+    ("atr", [5, 14], {}),
+    ("adx", [7, 14], {}),
+    ("cci", [10, 20], {"constant": 0.02}),
+])
+def test_family_matches_individual_calculation(indicator_type, periods, params):
+    df = random_walk_frame(600, seed=11)
+    family_calc = IndicatorCalculator(df)
+    block = family_calc.calculate_indicator_family(indicator_type, periods, params=params)
+
+    single_calc = IndicatorCalculator(df)
+    for period in periods:
+        single_calc.calculate_indicator({
+            "id": f"{indicator_type}_{period}",
+            "type": indicator_type,
+            "params": dict(params, period=period),
+        })
+
+    assert block.shape == (len(periods), len(df))
+    assert not block.flags.writeable
+    for row, period in enumerate(periods):
+        column = f"{indicator_type}_{period}"
+        values = family_calc.get_array(column)
+        np.testing.assert_array_equal(values, single_calc.get_array(column))
+        np.testing.assert_array_equal(family_calc.df[column], single_calc.df[column])
+        assert np.shares_memory(values, block)
+        assert family_calc.get_value(column, 100) == single_calc.get_value(column, 100)
+
+
+@pytest.mark.unit
+def test_family_with_leading_nan_source_and_custom_ids():
+    df = random_walk_frame(600, seed=11)
+    df["smoothed"] = df["close"].rolling(15).mean()  # 앞 14개 NaN
+
+    family_calc = IndicatorCalculator(df)
+    family_calc.calculate_indicator_family(
+        "ema", [3, 8], params={"source": "smoothed"}, indicator_ids=["fast", "slow"]
+    )
+    single_calc = IndicatorCalculator(df)
+    single_calc.calculate_indicator({"id": "fast", "type": "ema", "params": {"source": "smoothed", "period": 3}})
+    single_calc.calculate_indicator({"id": "slow", "type": "ema", "params": {"source": "smoothed", "period": 8}})
+
+    for column in ("fast", "slow"):
+        np.testing.assert_array_equal(family_calc.get_array(column), single_calc.get_array(column))
+        np.testing.assert_array_equal(family_calc.df[column], single_calc.df[column])
+
+
+@pytest.mark.unit
+def test_family_validation_errors():
+    calc = IndicatorCalculator(random_walk_frame(50, seed=11))
+    with pytest.raises(ValueError, match="지원하지 않는"):
+        calc.calculate_indicator_family("macd", [12, 26])
+    with pytest.raises(ValueError, match="비어 있습니다"):
+        calc.calculate_indicator_family("ema", [])
+    with pytest.raises(ValueError, match="0보다 커야"):
+        calc.calculate_indicator_family("ema", [5, 0])
+    with pytest.raises(ValueError, match="소스 필드가 없습니다"):
+        calc.calculate_indicator_family("ema", [5, 10], params={"source": "missing"})
+    with pytest.raises(ValueError, match="indicator_ids"):
+        calc.calculate_indicator_family("ema", [5, 10], indicator_ids=["only_one"])
+    with pytest.raises(ValueError, match="봉 수가 부족"):
+        calc.calculate_indicator_family("adx", [14, 30])
+
+
+@pytest.mark.unit
+def test_parser_batches_periods_and_uses_cache():
+    periods = [5, 8, 13, 21, 34]
+    definition = {
+        "indicators": [
+            {"id": f"ema_{p}", "type": "ema", "params": {"period": p}} for p in periods
+        ] + [
+            {"id": "rsi_fast", "type": "rsi", "params": {"period": 7}},
+            {"id": "rsi_slow", "type": "rsi", "params": {"period": 21}},
+        ],
+        "entry": {
+            "long": {"and": [
+                {"left": {"ref": f"ema_{a}"}, "op": ">", "right": {"ref": f"ema_{b}"}}
+                for a, b in zip(periods, periods[1:])
+            ] + [{"left": {"ref": "rsi_fast"}, "op": ">", "right": {"ref": "rsi_slow"}}]},
+            "short": {"and": []},
+        },
+    }
+    bars = BarArray.from_bars(random_walk_bars(400))
+    cache = IndicatorCache()
+    parser = StrategyParser(definition, bars=bars, indicator_cache=cache)
+    calc = parser.indicator_calc
+
+    # 같은 묶음의 지표는 하나의 2차원 배열을 공유
+    assert calc.get_array("ema_5").base is calc.get_array("ema_34").base is not None
+    assert calc.get_array("rsi_fast").base is calc.get_array("rsi_slow").base is not None
+    assert len(cache) == 7 and cache.misses == 7
+
+    reference = IndicatorCalculator(parser.df)
+    for p in periods:
+        reference.calculate_indicator({"id": f"ema_{p}", "type": "ema", "params": {"period": p}})
+        np.testing.assert_array_equal(calc.get_array(f"ema_{p}"), reference.get_array(f"ema_{p}"))
+
+    # 두 번째 파서는 모두 캐시에서 복원
+    restored = StrategyParser(definition, bars=bars, indicator_cache=cache)
+    assert cache.hits == 7
+    for p in periods:
+        np.testing.assert_array_equal(
+            restored.indicator_calc.get_array(f"ema_{p}"), calc.get_array(f"ema_{p}")
+        )
@@ -0,0 +1,172 @@
+"""
+지표 계산 계획(build_indicator_plan) 테스트
+
+핵심 검증 포인트:
+  1) entry / exit / stop_loss 등에서 참조되지 않는 지표는 계산하지 않음
+  2) 같은 (TF, 타입, 파라미터) 지표는 한 번만 계산하고 컬럼 공유
+  3) 다른 지표 출력을 source로 쓰는 지표는 의존 순서대로 계산 (순환 참조는 오류)
+  4) 캐시 키는 source 지표의 정의까지 포함 (지표 ID 무관)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from ta.trend import EMAIndicator
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.models.bar_array import BarArray
+from engine.utils.indicator_cache import IndicatorCache
+from engine.utils.indicator_planner import build_indicator_plan
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+from tests.test_signal_compiler import RSI_ATR_STRATEGY
+
+
+def _strategy(indicators, long_conditions, **extra):
+    return {
+        "indicators": indicators,
+        "entry": {"long": {"and": long_conditions}, "short": {"and": []}},
+        **extra,
+    }
+
+
+@pytest.mark.unit
+def test_prunes_unreferenced_indicators():
+    definition = dict(RSI_ATR_STRATEGY, indicators=RSI_ATR_STRATEGY["indicators"] + [
+        {"id": "unused_ema", "type": "ema", "params": {"period": 50}},
+        {"id": "ema_1h", "type": "ema", "params": {"period": 20}, "timeframe": "1h"},
+        {"id": "level", "type": "sma", "params": {"period": 30}},
+    ])
+    definition["entry"] = {
+        "long": {"and": [{"left": {"ref": "rsi_14"}, "op": "<", "right": {"ref": "ema_1h@1h"}}]},
+        "short": {"and": []},
+    }
+    definition["stop_loss"] = {"type": "indicator_level", "long_ref": "level", "short_ref": "level"}
+
+    plan = build_indicator_plan(definition)
+    planned = {(step.tf, step.indicator_id) for step in plan.steps}
+    # rsi_14: entry / exit, atr_14: atr_trailing, ema_1h: HTF ref, level: long_ref
+    assert planned == {("base", "rsi_14"), ("base", "atr_14"), ("1h", "ema_1h"), ("base", "level")}
+    assert sorted(plan.skipped) == [("base", "sma_10"), ("base", "unused_ema")]
+
+    everything = build_indicator_plan(definition, prune_unreferenced=False)
+    assert len(everything.steps) == 6 and everything.skipped == []
+
+    bars = BarArray.from_bars(random_walk_bars(300))
+    parser = StrategyParser(RSI_ATR_STRATEGY | {"indicators": definition["indicators"][:4]}, bars=bars)
+    assert "unused_ema" not in parser.indicator_calc.df.columns
+    assert parser.skipped_indicators == ["unused_ema"]
+
+
+@pytest.mark.unit
+def test_identical_definitions_computed_once():
+    definition = _strategy(
+        [
+            {"id": "fast", "type": "macd", "params": {"fast_period": 6, "slow_period": 13}},
+            {"id": "fast_copy", "type": "macd", "params": {"slow_period": 13, "fast_period": 6}},
+            {"id": "slow", "type": "macd", "params": {"fast_period": 12, "slow_period": 26}},
+        ],
+        [
+            {"left": {"ref": "fast"}, "op": ">", "right": {"ref": "fast_copy.signal"}},
+            {"left": {"ref": "slow"}, "op": ">", "right": {"value": 0}},
+        ],
+    )
+    plan = build_indicator_plan(definition)
+    assert [(step.indicator_id, step.aliases) for step in plan.steps] == [
+        ("fast", ["fast_copy"]), ("slow", []),
+    ]
+
+    cache = IndicatorCache()
+    parser = StrategyParser(
+        definition, bars=BarArray.from_bars(random_walk_bars(300)), indicator_cache=cache
+    )
+    assert (cache.misses, len(cache)) == (2, 2)
+    calc = parser.indicator_calc
+    for suffix in ("", "_signal", "_histogram", "_histogram_direction"):
+        np.testing.assert_array_equal(calc.get_array("fast" + suffix), calc.get_array("fast_copy" + suffix))
+
+
+@pytest.mark.unit
+def test_indicator_on_indicator_in_dependency_order():
+    # 의존 지표가 뒤에 정의되어도 먼저 계산
+    definition = _strategy(
+        [
+            {"id": "rsi_smooth", "type": "ema", "params": {"source": "rsi_1", "period": 5}},
+            {"id": "signal_sma", "type": "sma", "params": {"source": "macd_1.signal", "period": 3}},
+            {"id": "rsi_1", "type": "rsi", "params": {"period": 14}},
+            {"id": "macd_1", "type": "macd", "params": {}},
+        ],
+        [
+            {"left": {"ref": "rsi_smooth"}, "op": ">", "right": {"value": 50}},
+            {"left": {"ref": "signal_sma"}, "op": ">", "right": {"value": 0}},
+        ],
+    )
+    plan = build_indicator_plan(definition)
+    order = [step.indicator_id for step in plan.steps]
+    assert order.index("rsi_1") < order.index("rsi_smooth")
+    assert order.index("macd_1") < order.index("signal_sma")
+
+    parser = StrategyParser(definition, bars=BarArray.from_bars(random_walk_bars(300)))
+    df = parser.indicator_calc.df
+    expected_ema = EMAIndicator(close=df["rsi_1"], window=5, fillna=True).ema_indicator().bfill()
+    np.testing.assert_allclose(df["rsi_smooth"].to_numpy(), expected_ema.to_numpy(), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(
+        df["signal_sma"].to_numpy()[10:],
+        pd.Series(df["macd_1_signal"]).rolling(3).mean().to_numpy()[10:],
+    )
+
+
+@pytest.mark.unit
+def test_cache_key_follows_source_definition():
+    def with_rsi_period(period):
+        return _strategy(
+            [
+                {"id": "rsi_1", "type": "rsi", "params": {"period": period}},
+                {"id": "smooth", "type": "ema", "params": {"source": "rsi_1", "period": 5}},
+            ],
+            [{"left": {"ref": "smooth"}, "op": ">", "right": {"value": 50}}],
+        )
+
+    bars = BarArray.from_bars(random_walk_bars(300))
+    cache = IndicatorCache()
+    shared_14 = StrategyParser(with_rsi_period(14), bars=bars, indicator_cache=cache)
+    shared_21 = StrategyParser(with_rsi_period(21), bars=bars, indicator_cache=cache)
+    alone_21 = StrategyParser(with_rsi_period(21), bars=bars)
+
+    assert len(cache) == 4
+    np.testing.assert_array_equal(
+        shared_21.indicator_calc.get_array("smooth"), alone_21.indicator_calc.get_array("smooth")
+    )
+    assert not np.array_equal(
+        shared_14.indicator_calc.get_array("smooth"), shared_21.indicator_calc.get_array("smooth")
+    )
+
+
+@pytest.mark.unit
+def test_invalid_sources():
+    cyclic = _strategy(
+        [
+            {"id": "a", "type": "ema", "params": {"source": "b", "period": 5}},
+            {"id": "b", "type": "sma", "params": {"source": "a", "period": 5}},
+        ],
+        [{"left": {"ref": "a"}, "op": ">", "right": {"value": 0}}],
+    )
+    with pytest.raises(ValueError, match="순환 참조"):
+        build_indicator_plan(cyclic)
+    with pytest.raises(RuntimeError, match="순환 참조"):
+        StrategyParser(cyclic, bars=BarArray.from_bars(random_walk_bars(50)))
+
+    cross_tf = _strategy(
+        [
+            {"id": "rsi_1h", "type": "rsi", "params": {}, "timeframe": "1h"},
+            {"id": "smooth", "type": "ema", "params": {"source": "rsi_1h@1h"}},
+        ],
+        [{"left": {"ref": "smooth"}, "op": ">", "right": {"value": 0}}],
+    )
+    with pytest.raises(ValueError, match="같은 타임프레임"):
+        build_indicator_plan(cross_tf)
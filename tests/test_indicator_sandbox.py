@@ -0,0 +1,148 @@
+"""
+커스텀 지표 샌드박스 테스트
+
+핵심 검증 포인트:
+  1) 샌드박스 실행 결과 = 프로세스 내 실행 결과 (단일 Series / 다중 출력 딕셔너리)
+  2) 실행 시간 / CPU 시간 / 메모리 한도 초과 시 ValueError, 이후 호출은 새 워커로 정상 처리
+  3) 호출별 통계(wall / cpu / peak RSS)가 calculator와 RunProfiler에 기록
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.utils import indicator_loader
+from engine.utils.indicator_loader import calculate_code_hash, invalidate_custom_indicator
+from engine.utils.indicator_sandbox import IndicatorSandbox, SandboxedIndicator, SandboxLimits
+from engine.utils.indicators import IndicatorCalculator
+from engine.utils.profiling import RunProfiler
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars, random_walk_frame
+
+BANDS = """
+def bands(df, params):
+    mid = df['close'].rolling(params.get('period', 20)).mean()
+    width = df['high'] - df['low']
+    return {'main': mid, 'upper': mid + width, 'lower': mid - width}
+"""
+
+MOMENTUM = """
+def momentum(df, params):
+    return df['close'].diff(params.get('period', 3)) * (df['direction'] + 1)
+"""
+
+SPIN = """
+def spin(df, params):
+    while True:
+        pass
+"""
+
+BURN = """
+def burn(df, params):
+    total = 0
+    while True:
+        total += 1
+"""
+
+HOG = """
+def hog(df, params):
+    blocks = [np.ones(64 * 1024 * 1024) for _ in range(64)]
+    return df['close']
+"""
+
+
+@pytest.fixture
+def sandbox():
+    box = IndicatorSandbox(
+        max_workers=1,
+        limits=SandboxLimits(cpu_seconds=2, memory_bytes=512 * 1024 * 1024, timeout_seconds=20),
+    )
+    yield box
+    box.close()
+
+
+@pytest.mark.unit
+def test_sandbox_matches_in_process(sandbox):
+    df = random_walk_frame(500, seed=5)
+    for code, params in [(MOMENTUM, {"period": 5}), (BANDS, {"period": 10})]:
+        expected = indicator_loader._create_function_from_code(code)(df, params)
+        actual, stats = sandbox.run("custom", code, calculate_code_hash(code), df, params)
+        if isinstance(expected, dict):
+            assert list(actual) == list(expected)
+            for key in expected:
+                pd.testing.assert_series_equal(actual[key], expected[key], check_names=False)
+        else:
+            pd.testing.assert_series_equal(actual, expected, check_names=False)
+        assert stats["wall_seconds"] > 0
+        assert stats["cpu_seconds"] >= 0
+        assert stats["peak_rss_bytes"] > 0
+
+
+@pytest.mark.unit
+def test_sandbox_limits_recycle_worker(sandbox):
+    df = random_walk_frame(100, seed=5)
+    with pytest.raises(ValueError, match="CPU 시간 한도"):
+        sandbox.run("burn", BURN, calculate_code_hash(BURN), df, {})
+    with pytest.raises(ValueError, match="메모리 한도"):
+        sandbox.run("hog", HOG, calculate_code_hash(HOG), df, {})
+    with pytest.raises(ValueError, match="함수를 찾을 수 없습니다"):
+        sandbox.run("empty", "x = 1", calculate_code_hash("x = 1"), df, {})
+
+    # 실행 시간 한도 (CPU 한도보다 짧게)
+    fast_timeout = IndicatorSandbox(max_workers=1, limits=SandboxLimits(timeout_seconds=1))
+    try:
+        with pytest.raises(ValueError, match="실행 시간 한도"):
+            fast_timeout.run("spin", SPIN, calculate_code_hash(SPIN), df, {})
+    finally:
+        fast_timeout.close()
+
+    # 한도 초과 후에도 다음 호출은 정상
+    result, _ = sandbox.run("momentum", MOMENTUM, calculate_code_hash(MOMENTUM), df, {})
+    assert len(result) == len(df)
+
+
+@pytest.mark.unit
+def test_parser_records_sandbox_stats(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALGOFORGE_INDICATOR_SANDBOX", "1")
+    invalidate_custom_indicator()
+    db_path = tmp_path / "db" / "algoforge.db"
+    db_path.parent.mkdir()
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE indicators (type TEXT, code TEXT, name TEXT, implementation_type TEXT)")
+    conn.execute("INSERT INTO indicators VALUES ('bands', ?, 'bands', 'custom')", (BANDS,))
+    conn.commit()
+    conn.close()
+    monkeypatch.chdir(tmp_path)
+
+    definition = {
+        "indicators": [{"id": "bb", "type": "bands", "params": {"period": 10}}],
+        "entry": {
+            "long": {"and": [{"left": {"ref": "close"}, "op": ">", "right": {"ref": "bb_upper"}}]},
+            "short": {"and": []},
+        },
+    }
+    profiler = RunProfiler()
+    try:
+        parser = StrategyParser(definition, bars=random_walk_bars(300), profiler=profiler)
+    finally:
+        invalidate_custom_indicator()
+
+    calc = parser.indicator_calc
+    assert isinstance(calc.custom_indicators["bands"], SandboxedIndicator)
+    reference = IndicatorCalculator(parser.df)
+    reference.register_custom_indicator("bands", indicator_loader._create_function_from_code(BANDS))
+    reference.calculate_indicator(definition["indicators"][0])
+    for column in ("bb", "bb_upper", "bb_lower"):
+        np.testing.assert_array_equal(calc.get_array(column), reference.get_array(column))
+
+    assert set(calc.custom_indicator_stats) == {"bb"}
+    assert "custom_indicator:bb" in profiler.spans
+    assert profiler.counters["custom_indicator_calls"] == 1
+    assert profiler.counters["sandbox_peak_rss_bytes"] > 0
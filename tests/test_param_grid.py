@@ -0,0 +1,95 @@
+"""
+파라미터 스윕 그리드(param_grid) 단위 테스트
+
+핵심 검증 포인트:
+  1) 리스트 / 범위(stop 포함) 전개, 부동소수 범위 누적 오차 없음
+  2) 데카르트 곱 순서가 param_space 키 순서로 결정적
+  3) apply_params가 원본을 바꾸지 않고 지표(id) / 리스트 인덱스 / 프리셋 경로에 적용
+  4) 잘못된 경로 / 값 / 조합 수 초과는 ValueError
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.utils.param_grid import (
+    apply_params,
+    expand_param_space,
+    expand_values,
+    validate_param_space,
+)
+
+
+TEMPLATE = {
+    "indicators": [
+        {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 5}},
+        {"id": "ema_slow", "type": "ema", "params": {"source": "close", "period": 20}},
+    ],
+    "stop_loss": {"type": "fixed_percent", "percent": 1.5},
+}
+
+PRESET = {"risk_percent": 0.02, "risk_reward_ratio": 1.5, "rebalance_interval": 50}
+
+
+@pytest.mark.unit
+def test_expand_values():
+    assert expand_values([3, 1, 2]) == [3, 1, 2]
+    assert expand_values({"start": 5, "stop": 20, "step": 5}) == [5, 10, 15, 20]
+    assert expand_values({"start": 5, "stop": 19, "step": 5}) == [5, 10, 15]
+    assert expand_values({"start": 0.1, "stop": 0.3, "step": 0.1}) == [0.1, 0.2, 0.3]
+
+    for bad in ([], {"start": 1, "stop": 2}, {"start": 1, "stop": 2, "step": 0},
+                {"start": 3, "stop": 2, "step": 1}, 5):
+        with pytest.raises(ValueError):
+            expand_values(bad)
+
+
+@pytest.mark.unit
+def test_expand_param_space_order_and_limit():
+    combos = expand_param_space({"a": [1, 2], "b": ["x", "y", "z"]})
+    assert len(combos) == 6
+    assert combos[0] == {"a": 1, "b": "x"}
+    assert combos[1] == {"a": 1, "b": "y"}
+    assert combos[-1] == {"a": 2, "b": "z"}
+
+    with pytest.raises(ValueError):
+        expand_param_space({})
+    with pytest.raises(ValueError):
+        expand_param_space({"a": [1, 2, 3], "b": [1, 2]}, max_combinations=5)
+
+
+@pytest.mark.unit
+def test_apply_params():
+    definition, preset = apply_params(TEMPLATE, PRESET, {
+        "indicators.ema_slow.params.period": 50,
+        "indicators.0.params.source": "open",
+        "stop_loss.percent": 2.0,
+        "preset.risk_reward_ratio": 3.0,
+    })
+
+    assert definition["indicators"][1]["params"]["period"] == 50
+    assert definition["indicators"][0]["params"]["source"] == "open"
+    assert definition["stop_loss"]["percent"] == 2.0
+    assert preset["risk_reward_ratio"] == 3.0
+
+    # 원본 불변
+    assert TEMPLATE["indicators"][1]["params"]["period"] == 20
+    assert TEMPLATE["stop_loss"]["percent"] == 1.5
+    assert PRESET["risk_reward_ratio"] == 1.5
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", [
+    "indicators.missing.params.period",
+    "indicators.5.params.period",
+    "exit.atr_trailing.multiplier",
+    "stop_loss..percent",
+    "preset.initial_balance",
+])
+def test_invalid_paths(path):
+    with pytest.raises(ValueError):
+        validate_param_space(TEMPLATE, {path: [1]})
@@ -0,0 +1,131 @@
+"""
+파라미터 스윕 실행기(ParamSweepRunner) 테스트
+
+핵심 검증 포인트:
+  1) 공유 지표 캐시를 사용한 스윕 결과가 조합별 단독 평가와 동일
+  2) 지표는 (TF, 타입, 파라미터)별로 한 번만 계산
+  3) BarArray / IndicatorCache save → load(memmap) 왕복 보존
+  4) 워커 프로세스 병렬 실행 결과가 순차 실행과 동일
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.core.param_sweep import ParamSweepRunner, evaluate_combination
+from engine.models.bar_array import BarArray
+from engine.utils.indicator_cache import IndicatorCache
+from engine.utils.param_grid import apply_params, expand_param_space
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+from tests.test_signal_compiler import RSI_ATR_STRATEGY
+
+
+PRESET = {"risk_percent": 0.02, "risk_reward_ratio": 1.5, "rebalance_interval": 50}
+
+PARAM_SPACE = {
+    "indicators.rsi_14.params.period": [7, 14],
+    "stop_loss.multiplier": {"start": 1.0, "stop": 2.0, "step": 0.5},
+    "preset.risk_reward_ratio": [1.5, 2.0],
+}
+
+
+def _tasks():
+    combos = expand_param_space(PARAM_SPACE)
+    return [(i, *apply_params(RSI_ATR_STRATEGY, PRESET, c)) for i, c in enumerate(combos)]
+
+
+def _run(runner, tasks):
+    results = {}
+    finished = runner.run(
+        tasks, lambda batch: results.update({r["combo_index"]: r for r in batch})
+    )
+    assert finished is True
+    return results
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return BarArray.from_bars(random_walk_bars(1500, seed=11))
+
+
+@pytest.mark.unit
+def test_sweep_matches_individual_evaluation(bars):
+    tasks = _tasks()
+    runner = ParamSweepRunner(bars, 10000.0, max_workers=1, chunk_size=5)
+    results = _run(runner, tasks)
+
+    assert sorted(results) == list(range(len(tasks)))
+    for combo_index, definition, preset in tasks:
+        assert results[combo_index]["error"] is None
+        assert results[combo_index]["metrics"] == evaluate_combination(
+            definition, preset, 10000.0, bars
+        )
+
+    # 고유 지표: rsi(7), rsi(14), atr(14), sma(10) — 미리 계산할 때만 미스
+    assert len(runner.indicator_cache) == 4
+    assert runner.indicator_cache.misses == 4
+    assert runner.indicator_cache.hits == len(tasks) * 3
+
+
+@pytest.mark.unit
+def test_sweep_records_combination_errors(bars):
+    definition, preset = apply_params(RSI_ATR_STRATEGY, PRESET, {})
+    broken = apply_params(RSI_ATR_STRATEGY, PRESET, {"indicators.sma_10.type": "no_such_indicator"})
+    runner = ParamSweepRunner(bars, 10000.0)
+    results = _run(runner, [(0, definition, preset), (1, *broken)])
+
+    assert results[0]["error"] is None
+    assert results[1]["metrics"] is None
+    assert results[1]["error"]
+
+
+@pytest.mark.unit
+def test_sweep_stops_when_requested(bars):
+    runner = ParamSweepRunner(bars, 10000.0, chunk_size=4)
+    batches = []
+    finished = runner.run(_tasks(), batches.append, should_stop=lambda: len(batches) >= 1)
+
+    assert finished is False
+    assert len(batches) == 1
+
+
+@pytest.mark.unit
+def test_bar_array_and_indicator_cache_roundtrip(bars, tmp_path):
+    bars.save(tmp_path / "bars")
+    loaded = BarArray.load(tmp_path / "bars")
+    assert np.array_equal(loaded.timestamps, bars.timestamps)
+    assert np.array_equal(loaded.ohlcv, bars.ohlcv)
+    assert np.array_equal(loaded.direction, bars.direction)
+
+    cache = IndicatorCache()
+    parser = StrategyParser(RSI_ATR_STRATEGY, bars=bars, indicator_cache=cache)
+    assert len(cache) == 3
+
+    cache.save(str(tmp_path / "indicators"))
+    loaded_cache = IndicatorCache.load(str(tmp_path / "indicators"))
+    renamed = dict(RSI_ATR_STRATEGY["indicators"][0], id="rsi_other")
+    other = StrategyParser(
+        {"indicators": [renamed]}, bars=loaded, indicator_cache=loaded_cache,
+        prune_unreferenced_indicators=False,
+    )
+    assert loaded_cache.hits == 1
+    assert np.array_equal(
+        other.indicator_calc.df["rsi_other"].to_numpy(),
+        parser.indicator_calc.df["rsi_14"].to_numpy(),
+        equal_nan=True,
+    )
+
+
+@pytest.mark.slow
+def test_parallel_sweep_matches_sequential(bars):
+    tasks = _tasks()
+    sequential = _run(ParamSweepRunner(bars, 10000.0, max_workers=1), tasks)
+    parallel = _run(ParamSweepRunner(bars, 10000.0, max_workers=2, chunk_size=3), tasks)
+
+    assert parallel == sequential
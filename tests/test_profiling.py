@@ -0,0 +1,76 @@
+"""
+실행 프로파일링 단위 테스트
+
+핵심 검증 포인트:
+  1) RunProfiler span 누적 / 카운터 / bars_per_second
+  2) BacktestEngine.stats: strategy_func 호출과 compiled_signals 조회를 구분해 집계
+  3) IndicatorCalculator.get_value 호출 수 집계
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.core.backtest_engine import BacktestEngine
+from engine.models.bar_array import BarArray
+from engine.utils.profiling import RunProfiler, span_of
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+from tests.test_signal_compiler import EMA_CROSS_STRATEGY
+
+
+@pytest.mark.unit
+def test_profiler_spans_and_counters():
+    profiler = RunProfiler()
+    with profiler.span("engine_run"):
+        time.sleep(0.01)
+    with profiler.span("engine_run"):
+        pass
+    with pytest.raises(RuntimeError):
+        with profiler.span("metrics"):
+            raise RuntimeError("boom")
+    with span_of(None, "ignored"):
+        pass
+
+    profiler.count("bars", 1000)
+    profiler.count("db_writes")
+    profiler.count("db_writes", 2)
+
+    profile = profiler.to_dict()
+    assert list(profile["spans"]) == ["engine_run", "metrics"]
+    assert profile["spans"]["engine_run"] >= 0.01
+    assert profile["counters"] == {"bars": 1000, "db_writes": 3}
+    assert profile["bars_per_second"] == pytest.approx(1000 / profile["spans"]["engine_run"], rel=1e-3)
+    assert profile["total_seconds"] >= profile["spans"]["engine_run"]
+    if sys.platform != "win32":
+        assert profile["peak_rss_bytes"] > 0
+
+
+@pytest.mark.unit
+def test_engine_stats_and_get_value_calls():
+    bars = BarArray.from_bars(random_walk_bars(500))
+    profiler = RunProfiler()
+
+    parser = StrategyParser(EMA_CROSS_STRATEGY, bars=bars, profiler=profiler)
+    assert {"custom_indicator_load", "indicator_calculation"} <= set(profiler.spans)
+
+    legacy = BacktestEngine(1000.0, parser.create_strategy_function())
+    legacy.run(bars)
+    assert legacy.stats["processed_bars"] == len(bars)
+    assert legacy.stats["strategy_func_calls"] > 0
+    assert legacy.stats["compiled_signal_lookups"] == 0
+    assert parser.get_value_call_count() > 0
+
+    compiled = BacktestEngine(
+        1000.0, parser.create_strategy_function(), compiled_signals=parser.compile_signals()
+    )
+    compiled.run(bars)
+    assert compiled.stats["strategy_func_calls"] == 0
+    # 신호 후보가 없는 봉은 건너뛰므로 조회 수는 legacy 호출 수 이하
+    assert 0 < compiled.stats["compiled_signal_lookups"] <= legacy.stats["strategy_func_calls"]
+    assert compiled.stats["processed_bars"] <= len(bars)
@@ -0,0 +1,54 @@
+"""
+구간 최소/최대 탐색(PriceRangeIndex) 단위 테스트
+
+브루트포스 선형 탐색 결과와 모든 경계에서 일치해야 함.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from engine.utils.range_query import BlockMinIndex, PriceRangeIndex
+
+
+def _brute_first_le(values, start, threshold):
+    for j in range(max(start, 0), len(values)):
+        if values[j] <= threshold:
+            return j
+    return len(values)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n,block_size", [(0, 64), (1, 64), (63, 64), (64, 64),
+                                          (65, 64), (1000, 64), (1000, 7), (257, 1)])
+def test_block_min_index_matches_brute_force(n, block_size):
+    rng = np.random.default_rng(n + block_size)
+    values = rng.normal(100.0, 5.0, size=n)
+    index = BlockMinIndex(values, block_size=block_size)
+
+    thresholds = [-np.inf, np.inf, 90.0, 95.0, 100.0]
+    thresholds += [float(v) for v in values[:: max(1, n // 10)]]
+    for start in list(range(0, n + 2, max(1, n // 37))) + [n - 1, n]:
+        for t in thresholds:
+            assert index.find_first_le(start, t) == _brute_first_le(values, start, t)
+
+
+@pytest.mark.unit
+def test_price_range_index_high_and_low():
+    low = np.array([10.0, 9.0, 8.0, 9.5, 7.0, 11.0])
+    high = np.array([12.0, 11.0, 13.0, 10.0, 14.0, 15.0])
+    index = PriceRangeIndex(low, high, block_size=2)
+
+    assert index.first_low_at_or_below(0, 8.0) == 2
+    assert index.first_low_at_or_below(3, 8.0) == 4
+    assert index.first_low_at_or_below(5, 8.0) == 6
+    assert index.first_high_at_or_above(0, 13.0) == 2
+    assert index.first_high_at_or_above(3, 14.5) == 5
+    assert index.first_high_at_or_above(0, 100.0) == 6
+
+
+@pytest.mark.unit
+def test_price_range_index_length_mismatch():
+    with pytest.raises(ValueError):
+        PriceRangeIndex(np.zeros(3), np.zeros(4))
@@ -0,0 +1,120 @@
+"""
+포지션 크기 재계산(repricer) 단위 테스트
+
+핵심 검증 포인트:
+  1) RiskManager.calculate_position_sizes가 원소별 calculate_position_size와 동일
+  2) 다른 리스크 설정으로 재계산한 거래 / Metrics가 같은 설정의 전체 재실행과 동일
+  3) 잔고 소진 설정은 엔진과 마찬가지로 실패
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.core.backtest_engine import BacktestEngine
+from engine.core.metrics_calculator import MetricsCalculator
+from engine.core.repricer import reprice_trades
+from engine.core.risk_manager import RiskManager
+from engine.models.bar_array import BarArray
+from engine.utils.leverage_loader import LeverageBracket
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+from tests.test_signal_compiler import RSI_ATR_STRATEGY
+
+
+BRACKETS = [
+    LeverageBracket(0, 10000, 75, 0.005, 0),
+    LeverageBracket(10000, 20000, 50, 0.0065, 15),
+    LeverageBracket(20000, 1e12, 20, 0.01, 85),
+]
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return BarArray.from_bars(random_walk_bars(4000, seed=5))
+
+
+def _run(bars, initial_balance, risk_percent, rebalance_interval, leverage_brackets=None):
+    parser = StrategyParser(RSI_ATR_STRATEGY, bars=bars)
+    engine = BacktestEngine(
+        initial_balance=initial_balance,
+        strategy_func=parser.create_strategy_function(),
+        risk_percent=risk_percent,
+        rebalance_interval=rebalance_interval,
+        exit_checker=parser.create_exit_checker(),
+        atr_trailing_config=parser.get_atr_trailing_config(),
+        atr_value_getter=parser.get_atr_value,
+        timestamp_to_index=parser.timestamp_to_index,
+        compiled_signals=parser.compile_signals(),
+        leverage_brackets=leverage_brackets,
+    )
+    return engine.run(bars)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("balance", [1000.0, 37.5, -50.0])
+def test_position_sizes_match_scalar(balance):
+    rng = np.random.default_rng(3)
+    entries = rng.uniform(0.5, 200.0, 500)
+    stops = entries * rng.uniform(0.9, 1.1, 500)
+    stops[::50] = entries[::50]  # risk == 0
+
+    for brackets in (None, BRACKETS):
+        manager = RiskManager(1000.0, risk_percent=0.03, leverage_brackets=brackets)
+        manager.update_balance(balance)
+        sizes, risks, leverages = manager.calculate_position_sizes(entries, stops)
+        expected = [
+            manager.calculate_position_size(float(e), float(s), return_leverage=True)
+            for e, s in zip(entries, stops)
+        ]
+        assert sizes.tolist() == [x[0] for x in expected]
+        assert risks.tolist() == [x[1] for x in expected]
+        assert leverages.tolist() == [x[2] for x in expected]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("leverage_brackets", [None, BRACKETS])
+@pytest.mark.parametrize("initial_balance,risk_percent,rebalance_interval", [
+    (1000.0, 0.02, 50),
+    (5000.0, 0.05, 7),
+    (2500.0, 0.01, 1),
+])
+def test_reprice_matches_full_rerun(bars, leverage_brackets, initial_balance,
+                                    risk_percent, rebalance_interval):
+    base = _run(bars, 1000.0, 0.02, 50, leverage_brackets)
+    expected = _run(bars, initial_balance, risk_percent, rebalance_interval, leverage_brackets)
+
+    repriced = reprice_trades(
+        base, initial_balance, risk_percent, rebalance_interval, leverage_brackets
+    )
+
+    assert len(base) > 50
+    assert repriced == expected
+    assert MetricsCalculator().calculate(repriced) == MetricsCalculator().calculate(expected)
+
+
+@pytest.mark.unit
+def test_reprice_fails_when_balance_is_exhausted(bars):
+    base = _run(bars, 1000.0, 0.02, 50)
+
+    with pytest.raises(ValueError):
+        _run(bars, 300.0, 0.3, 1)
+    with pytest.raises(ValueError, match="포지션 크기"):
+        reprice_trades(base, 300.0, 0.3, 1)
+
+
+@pytest.mark.unit
+def test_reprice_rejects_invalid_path(bars):
+    base = _run(bars, 1000.0, 0.02, 50)
+    base[3].is_closed = False
+
+    with pytest.raises(ValueError):
+        reprice_trades(base, 1000.0, 0.02, 50)
+    with pytest.raises(ValueError):
+        reprice_trades(base[:1], 1000.0, 0.02, 0)
+    assert reprice_trades([], 1000.0, 0.02, 50) == []
@@ -0,0 +1,345 @@
+"""
+신호 컴파일러(CompiledSignals) 단위 테스트
+
+핵심 검증 포인트:
+  1) 봉마다 strategy_func / exit_checker를 호출한 결과와 배열 결과가 동일
+  2) 컴파일 경로 백테스트의 거래 결과가 기존 경로와 완전히 동일 (결정성)
+  3) HTF 참조의 look-ahead 차단이 컴파일 경로에서도 유지
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.core.backtest_engine import BacktestEngine
+from engine.models.bar import Bar
+from engine.utils.strategy_parser import StrategyParser
+from tests.helpers import random_walk_bars
+
+
+def _trade_signature(trades):
+    """거래 결과 비교용 튜플"""
+    return [
+        (
+            t.trade_id, t.direction, t.entry_price, t.entry_timestamp,
+            t.position_size, t.initial_risk, t.stop_loss, t.take_profit_1,
+            t.balance_at_entry, t.leverage, t.is_closed,
+            tuple((l.exit_type, l.exit_timestamp, l.exit_price, l.qty_ratio, l.pnl)
+                  for l in t.legs),
+        )
+        for t in trades
+    ]
+
+
+def _run_both(definition, bars, htf_data=None):
+    """기존 경로와 컴파일 경로로 각각 백테스트 실행"""
+    parser = StrategyParser(definition, bars, htf_data=htf_data)
+
+    exit_checker = parser.create_exit_checker() if parser.has_indicator_based_exit() else None
+    atr_config = parser.get_atr_trailing_config() if parser.has_atr_trailing() else None
+    atr_getter = parser.get_atr_value if parser.has_atr_trailing() else None
+
+    legacy = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=parser.create_strategy_function(),
+        exit_checker=exit_checker,
+        atr_trailing_config=atr_config,
+        atr_value_getter=atr_getter,
+        timestamp_to_index=parser.timestamp_to_index,
+    )
+    compiled = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=parser.create_strategy_function(),
+        exit_checker=exit_checker,
+        atr_trailing_config=atr_config,
+        atr_value_getter=atr_getter,
+        timestamp_to_index=parser.timestamp_to_index,
+        compiled_signals=parser.compile_signals(),
+    )
+    return parser, legacy.run(bars), compiled.run(bars)
+
+
+EMA_CROSS_STRATEGY = {
+    "indicators": [
+        {"id": "ema_fast", "type": "ema", "params": {"source": "close", "period": 5}},
+        {"id": "ema_slow", "type": "ema", "params": {"source": "close", "period": 20}},
+    ],
+    "entry": {
+        "long": {"and": [{"left": {"ref": "ema_fast"}, "op": "cross_above",
+                          "right": {"ref": "ema_slow"}}]},
+        "short": {"and": [{"left": {"ref": "ema_fast"}, "op": "cross_below",
+                           "right": {"ref": "ema_slow"}}]},
+    },
+    "stop_loss": {"type": "fixed_percent", "percent": 1.5},
+}
+
+RSI_ATR_STRATEGY = {
+    "indicators": [
+        {"id": "rsi_14", "type": "rsi", "params": {"source": "close", "period": 14}},
+        {"id": "atr_14", "type": "atr", "params": {"period": 14}},
+        {"id": "sma_10", "type": "sma", "params": {"source": "close", "period": 10}},
+    ],
+    "entry": {
+        "long": {"and": [
+            {"left": {"ref": "rsi_14"}, "op": "<", "right": {"value": 40}},
+            {"left": {"price": "close"}, "op": ">", "right": {"ref": "sma_10"}},
+        ]},
+        "short": {"and": [
+            {"left": {"ref": "rsi_14"}, "op": ">=", "right": {"value": 60}},
+        ]},
+    },
+    "stop_loss": {"type": "atr_based", "atr_indicator_id": "atr_14", "multiplier": 1.5},
+    "exit": {
+        "indicator_based": {
+            "enabled": True,
+            "long": {"and": [{"left": {"ref": "rsi_14"}, "op": ">", "right": {"value": 65}}]},
+            "short": {"and": [{"left": {"ref": "rsi_14"}, "op": "<", "right": {"value": 35}}]},
+        },
+        "atr_trailing": {"enabled": True, "atr_indicator_id": "atr_14", "multiplier": 2.0},
+    },
+}
+
+INDICATOR_LEVEL_STRATEGY = {
+    "indicators": [
+        {"id": "sma_5", "type": "sma", "params": {"source": "close", "period": 5}},
+        {"id": "ema_30", "type": "ema", "params": {"source": "close", "period": 30}},
+    ],
+    "entry": {
+        "long": {"and": [{"left": {"price": "close"}, "op": ">", "right": {"ref": "sma_5"}}]},
+        "short": {"and": [{"left": {"price": "close"}, "op": "<", "right": {"ref": "sma_5"}}]},
+    },
+    "stop_loss": {"type": "indicator_level", "long_ref": "ema_30", "short_ref": "ema_30"},
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "definition",
+    [EMA_CROSS_STRATEGY, RSI_ATR_STRATEGY, INDICATOR_LEVEL_STRATEGY],
+    ids=["ema_cross", "rsi_atr", "indicator_level"],
+)
+def test_compiled_signals_match_strategy_func(definition):
+    """모든 봉에서 signal_at(i) == strategy_func(bar)"""
+    bars = random_walk_bars(400)
+    parser = StrategyParser(definition, bars)
+    strategy_func = parser.create_strategy_function()
+    compiled = parser.compile_signals()
+
+    assert len(compiled) == len(bars)
+    for i, bar in enumerate(bars):
+        expected = strategy_func(bar)
+        actual = compiled.signal_at(i)
+        if expected is None:
+            assert actual is None, f"i={i}"
+        else:
+            assert actual is not None, f"i={i}"
+            assert actual["direction"] == expected["direction"]
+            assert actual["stop_loss"] == expected["stop_loss"]
+
+    if parser.has_indicator_based_exit():
+        exit_checker = parser.create_exit_checker()
+        for i in range(len(bars)):
+            for direction in ("LONG", "SHORT"):
+                assert compiled.exit_at(i, direction) == exit_checker(i, direction)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "definition",
+    [EMA_CROSS_STRATEGY, RSI_ATR_STRATEGY, INDICATOR_LEVEL_STRATEGY],
+    ids=["ema_cross", "rsi_atr", "indicator_level"],
+)
+def test_compiled_engine_matches_legacy_engine(definition):
+    """컴파일 경로 백테스트 결과가 기존 경로와 비트 단위로 동일"""
+    bars = random_walk_bars(600, seed=12)
+    _, legacy_trades, compiled_trades = _run_both(definition, bars)
+
+    assert len(legacy_trades) > 0
+    assert _trade_signature(compiled_trades) == _trade_signature(legacy_trades)
+
+
+@pytest.mark.unit
+def test_compiled_htf_reference_blocks_look_ahead():
+    """HTF 봉이 닫히기 전 구간은 컴파일 경로에서도 신호 없음"""
+    hour = 3600
+    base = random_walk_bars(48, start_ts=10 * hour, step=300)
+    htf = [
+        Bar(timestamp=10 * hour + k * hour, open=90.0, high=91.0, low=89.0,
+            close=90.0, volume=1.0, direction=0)
+        for k in range(4)
+    ]
+    definition = {
+        "indicators": [
+            {"id": "ema_1h", "type": "ema", "timeframe": "1h",
+             "params": {"source": "close", "period": 2}},
+        ],
+        "entry": {
+            "long": {"and": [{"left": {"price": "close"}, "op": ">",
+                              "right": {"ref": "ema_1h@1h"}}]},
+            "short": {"and": []},
+        },
+        "stop_loss": {"type": "fixed_percent", "percent": 2.0},
+    }
+    parser = StrategyParser(definition, base, htf_data={"1h": (htf, None)})
+    strategy_func = parser.create_strategy_function()
+    compiled = parser.compile_signals()
+
+    for i in range(12):
+        assert compiled.signal_at(i) is None
+    for i, bar in enumerate(base):
+        expected = strategy_func(bar)
+        actual = compiled.signal_at(i)
+        assert (expected is None) == (actual is None), f"i={i}"
+
+
+@pytest.mark.unit
+def test_compiled_stop_loss_failure_is_nan():
+    """ATR 지표가 없으면 손절가 계산 실패 → 신호 없음"""
+    bars = random_walk_bars(50)
+    definition = {
+        "indicators": [],
+        "entry": {
+            "long": {"and": [{"left": {"price": "close"}, "op": ">", "right": {"value": 0}}]},
+            "short": {"and": []},
+        },
+        "stop_loss": {"type": "atr_based", "atr_indicator_id": "missing_atr"},
+    }
+    parser = StrategyParser(definition, bars)
+    compiled = parser.compile_signals()
+
+    assert compiled.long_mask.all()
+    assert all(math.isnan(v) for v in compiled.stop_loss_long)
+    assert all(compiled.signal_at(i) is None for i in range(len(bars)))
+
+
+@pytest.mark.unit
+def test_engine_rejects_compiled_signals_length_mismatch():
+    bars = random_walk_bars(30)
+    parser = StrategyParser(EMA_CROSS_STRATEGY, bars)
+    compiled = parser.compile_signals()
+    engine = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=parser.create_strategy_function(),
+        compiled_signals=compiled,
+    )
+    with pytest.raises(ValueError):
+        engine.run(bars[:20])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("n_bars", [250, 1000, 1234])
+def test_flat_fast_forward_keeps_progress_and_results(n_bars):
+    """무포지션 구간 건너뛰기: 진행률 콜백 순서/거래/경고가 기존 경로와 동일"""
+    bars = random_walk_bars(n_bars, seed=3)
+    parser = StrategyParser(EMA_CROSS_STRATEGY, bars)
+
+    def run(compiled):
+        calls = []
+        engine = BacktestEngine(
+            initial_balance=10000.0,
+            strategy_func=parser.create_strategy_function(),
+            progress_callback=lambda processed, total: calls.append((processed, total)),
+            compiled_signals=compiled,
+        )
+        processed_bars = []
+        original = engine._process_bar
+
+        def counting_process_bar(bar, bar_index=None):
+            processed_bars.append(bar_index)
+            original(bar, bar_index)
+
+        engine._process_bar = counting_process_bar
+        trades = engine.run(bars)
+        return trades, calls, engine.warnings, processed_bars
+
+    legacy_trades, legacy_calls, legacy_warnings, legacy_processed = run(None)
+    fast_trades, fast_calls, fast_warnings, fast_processed = run(parser.compile_signals())
+
+    assert _trade_signature(fast_trades) == _trade_signature(legacy_trades)
+    assert fast_calls == legacy_calls
+    assert fast_warnings == legacy_warnings
+    assert len(legacy_processed) == n_bars
+    assert len(fast_processed) < n_bars
+
+
+@pytest.mark.unit
+def test_flat_fast_forward_without_any_signal():
+    """신호가 전혀 없으면 봉을 하나도 처리하지 않고 진행률만 보고"""
+    bars = random_walk_bars(300)
+    definition = dict(EMA_CROSS_STRATEGY)
+    definition["entry"] = {"long": {"and": []}, "short": {"and": []}}
+    parser = StrategyParser(definition, bars)
+
+    calls = []
+    engine = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=parser.create_strategy_function(),
+        progress_callback=lambda processed, total: calls.append(processed),
+        compiled_signals=parser.compile_signals(),
+    )
+    assert engine.run(bars) == []
+    assert calls == list(range(3, 301, 3))
+
+
+LONG_HOLD_STRATEGY = {
+    "indicators": [
+        {"id": "sma_50", "type": "sma", "params": {"source": "close", "period": 50}},
+    ],
+    "entry": {
+        "long": {"and": [{"left": {"price": "close"}, "op": "cross_above",
+                          "right": {"ref": "sma_50"}}]},
+        "short": {"and": [{"left": {"price": "close"}, "op": "cross_below",
+                           "right": {"ref": "sma_50"}}]},
+    },
+    "stop_loss": {"type": "fixed_points", "points": 8},
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "definition,n_bars",
+    [(LONG_HOLD_STRATEGY, 3000), (EMA_CROSS_STRATEGY, 3000),
+     (RSI_ATR_STRATEGY, 3000), (INDICATOR_LEVEL_STRATEGY, 600)],
+    ids=["long_hold", "ema_cross", "rsi_atr", "indicator_level"],
+)
+def test_in_position_fast_forward_matches_legacy(definition, n_bars):
+    """포지션 보유 구간 건너뛰기(SL/TP1 구간 탐색) 결과가 봉 단위 처리와 동일"""
+    from engine.models import BarArray
+
+    bars = BarArray.from_bars(random_walk_bars(n_bars, seed=21))
+    _, legacy_trades, compiled_trades = _run_both(definition, bars)
+
+    assert len(legacy_trades) > 0
+    assert _trade_signature(compiled_trades) == _trade_signature(legacy_trades)
+
+
+@pytest.mark.unit
+def test_in_position_fast_forward_skips_holding_bars():
+    """보유 중에도 이벤트가 없는 봉은 처리하지 않음"""
+    bars = random_walk_bars(3000, seed=21)
+    parser = StrategyParser(LONG_HOLD_STRATEGY, bars)
+    engine = BacktestEngine(
+        initial_balance=10000.0,
+        strategy_func=parser.create_strategy_function(),
+        compiled_signals=parser.compile_signals(),
+    )
+    processed = []
+    original = engine._process_bar
+
+    def counting_process_bar(bar, bar_index=None):
+        processed.append(bar_index)
+        original(bar, bar_index)
+
+    engine._process_bar = counting_process_bar
+    trades = engine.run(bars)
+
+    # 진입 봉 + 청산/TP1 봉 + 후보 봉 정도만 처리
+    assert len(trades) > 0
+    assert len(processed) < len(bars) // 4